@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Guardado automático en segundo plano
+Simula una ráfaga de ediciones del controlador y compara guardar tras cada
+cambio (bloquea al controlador) con el autoguardado, que coalesce la ráfaga y
+escribe en otro hilo. Se mide el peor tiempo de una edición vista por el
+controlador y la cantidad de escrituras
+
+Uso: python bench_autoguardado.py [cantidad] [ediciones]   (por defecto 100.000 y 200)
+"""
+
+import os
+import sys
+import time
+
+from utilidades import generar_archivo_json
+from models.tarea_repository import TareaRepository
+from controllers.autoguardado import AutoGuardado
+
+
+def rafaga(repositorio: TareaRepository, ediciones: int, despues=None) -> list:
+    """Edita tareas con una pausa corta entre cambios; devuelve la latencia de cada edición"""
+    latencias = []
+    for i in range(ediciones):
+        inicio = time.perf_counter()
+        with repositorio.bloqueo:
+            repositorio.obtener_tarea_por_id(i + 1).registrar_tiempo_real(1)
+        if despues:
+            despues()
+        latencias.append(time.perf_counter() - inicio)
+        time.sleep(0.001)
+    return latencias
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    ediciones = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+
+    try:
+        repositorio = TareaRepository(ruta)
+        repositorio.guardar_datos()  # fragmentos en caché para ambos escenarios
+
+        inicio = time.perf_counter()
+        latencias = rafaga(repositorio, ediciones, repositorio.guardar_datos)
+        total = time.perf_counter() - inicio
+        print(f"guardar en cada cambio:  peor edición {max(latencias) * 1e3:9.2f} ms, "
+              f"{ediciones} escrituras, {total:6.2f} s en total")
+
+        autoguardado = AutoGuardado(repositorio, retardo=0.05, espera_maxima=0.5)
+        autoguardado.iniciar()
+        inicio = time.perf_counter()
+        latencias = rafaga(repositorio, ediciones)
+        total = time.perf_counter() - inicio
+        autoguardado.detener()
+        metricas = autoguardado.metricas()
+        print(f"autoguardado:            peor edición {max(latencias) * 1e3:9.2f} ms, "
+              f"{metricas['guardados']} escrituras, {total:6.2f} s en total "
+              f"(último guardado {metricas['ultima_latencia_ms']} ms)")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Índice invertido de búsqueda
+Compara buscar_tareas original (lower() + subcadena por tarea) contra el índice
+"""
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+CONSULTAS = ["tarea 4242", "número 99999", "designer", "infra", "inexistente"]
+
+
+def buscar_lineal(tareas, criterio):
+    """Implementación original"""
+    criterio = criterio.lower().strip()
+    return [t for t in tareas
+            if criterio in t.titulo.lower()
+            or criterio in t.descripcion.lower()
+            or criterio in t.usuario_asignado.lower()]
+
+
+def main():
+    print(f"{'tareas':>10} {'consulta':>14} {'resultados':>11} {'lineal (ms)':>12} {'índice (ms)':>12}")
+    
+    for tamano in TAMANOS:
+        repositorio = poblar_repositorio(crear_repositorio_vacio(), tamano)
+        tareas = repositorio.obtener_todas_tareas()
+        
+        for consulta in CONSULTAS:
+            resultados = repositorio.buscar_tareas(consulta)
+            assert len(resultados) == len(buscar_lineal(tareas, consulta))
+            
+            tiempo_lineal = medir(lambda: buscar_lineal(tareas, consulta))
+            tiempo_indice = medir(lambda: repositorio.buscar_tareas(consulta), repeticiones=5)
+            print(f"{tamano:>10} {consulta:>14} {len(resultados):>11} "
+                  f"{tiempo_lineal * 1e3:>12.1f} {tiempo_indice * 1e3:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
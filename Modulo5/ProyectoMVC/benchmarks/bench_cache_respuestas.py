@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Caché de respuestas web
+Compara renderizar el dashboard y las listas en cada llamada (caché invalidada)
+con servirlos desde la caché mientras la versión del repositorio no cambia
+
+Uso: python bench_cache_respuestas.py [cantidad]   (por defecto 10.000)
+"""
+
+import sys
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from controllers.web_controller import WebController
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    repositorio = poblar_repositorio(crear_repositorio_vacio(), cantidad)
+    controller = WebController(repositorio)
+
+    casos = {
+        "dashboard": controller.respuesta_dashboard,
+        "lista urgentes": lambda: controller.respuesta_lista("urgentes"),
+        "api dashboard": lambda: controller.respuesta_api("dashboard"),
+    }
+    for nombre, responder in casos.items():
+        def sin_cache():
+            controller.cache.invalidar()
+            responder()
+
+        renderizado = medir(sin_cache, repeticiones=5)
+        responder()
+        cacheado = medir(responder, repeticiones=1000)
+        print(f"{nombre:15} render {renderizado * 1e3:9.2f} ms   caché {cacheado * 1e6:7.2f} µs "
+              f"({renderizado / cacheado:,.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
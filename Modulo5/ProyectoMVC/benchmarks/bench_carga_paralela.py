@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Carga y guardado en paralelo
+Carga un archivo de datos grande (una tarea por línea) con 1, 2, 4... procesos
+hasta la cantidad de núcleos, y mide el guardado JSON en frío (sin fragmentos
+en caché) con la misma cantidad de procesos
+El proceso principal sigue reconstruyendo las tareas recibidas y los índices
+secundarios, así que esa parte no escala con los núcleos
+
+Uso: python bench_carga_paralela.py [cantidad] [backend]   (por defecto 500.000, memoria)
+"""
+
+import os
+import sys
+import time
+
+from utilidades import archivo_temporal, generar_registros
+from models.repositorios import crear_repositorio
+from models.persistencia_wal import escribir_instantanea
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+    backend = sys.argv[2] if len(sys.argv) > 2 else "memoria"
+    ruta = archivo_temporal()
+    escribir_instantanea(ruta, generar_registros(cantidad), {"siguiente_id": cantidad + 1})
+    print(f"{cantidad} tareas, {os.path.getsize(ruta) / 2**20:.0f} MB, {os.cpu_count()} núcleos")
+
+    niveles = [1]
+    while niveles[-1] * 2 <= max(os.cpu_count() or 1, 2):
+        niveles.append(niveles[-1] * 2)
+
+    base_carga = base_guardado = None
+    copia = archivo_temporal()
+    try:
+        for procesos in niveles:
+            inicio = time.perf_counter()
+            repositorio = crear_repositorio(ruta, backend, "json", "lote", procesos)
+            carga = time.perf_counter() - inicio
+            assert len(repositorio) == cantidad and repositorio.siguiente_id == cantidad + 1
+
+            repositorio._fragmentos.clear()
+            repositorio.archivo_datos = copia
+            inicio = time.perf_counter()
+            repositorio.guardar_datos()
+            guardado = time.perf_counter() - inicio
+            if hasattr(repositorio, "cerrar"):
+                repositorio.cerrar()
+            for archivo in (os.path.splitext(ruta)[0] + ".db", os.path.splitext(copia)[0] + ".db"):
+                if os.path.exists(archivo):
+                    os.remove(archivo)
+
+            base_carga = base_carga or carga
+            base_guardado = base_guardado or guardado
+            print(f"{procesos:2} procesos   carga {carga:7.2f} s ({base_carga / carga:4.1f}x)   "
+                  f"guardado {guardado:7.2f} s ({base_guardado / guardado:4.1f}x)")
+    finally:
+        os.remove(ruta)
+        os.remove(copia)
+
+
+if __name__ == "__main__":
+    main()
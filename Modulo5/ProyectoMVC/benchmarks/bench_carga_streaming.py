@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Carga en streaming
+Compara el pico de memoria de json.load + from_dict (carga anterior) contra
+el lector incremental LectorTareasJSON, relativo al tamaño final del modelo
+
+Uso: python bench_carga_streaming.py [cantidad]   (por defecto 1.000.000)
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import tracemalloc
+
+from utilidades import generar_archivo_json
+from models.tarea import Tarea
+from models.lector_json import LectorTareasJSON
+
+
+def carga_completa(ruta: str):
+    """Carga anterior: documento completo en memoria y luego las tareas"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [Tarea.from_dict(d) for d in data.get("tareas", [])]
+
+
+def carga_streaming(ruta: str):
+    """Carga incremental: cada tarea se construye al decodificarse"""
+    return [Tarea.from_dict(d) for d in LectorTareasJSON(ruta)]
+
+
+def medir_carga(funcion, ruta: str):
+    """Devuelve (segundos, bytes finales, bytes pico)"""
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    tareas = funcion(ruta)
+    segundos = time.perf_counter() - inicio
+    final, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tareas
+    return segundos, final, pico
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    print(f"Archivo: {os.path.getsize(ruta) / 2**20:.1f} MiB")
+    
+    try:
+        print(f"{'modo':<12} {'tiempo (s)':>11} {'final (MiB)':>12} {'pico (MiB)':>11} {'pico/final':>11}")
+        for nombre, funcion in (("completa", carga_completa), ("streaming", carga_streaming)):
+            segundos, final, pico = medir_carga(funcion, ruta)
+            print(f"{nombre:<12} {segundos:>11.2f} {final / 2**20:>12.1f} "
+                  f"{pico / 2**20:>11.1f} {pico / final:>10.2f}x")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
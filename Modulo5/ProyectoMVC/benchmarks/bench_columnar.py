@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Backend columnar vs. backend en memoria
+Compara tiempo de carga, memoria y consultas analíticas de ambos backends
+
+Uso: python bench_columnar.py [cantidad]   (por defecto 1.000.000)
+"""
+
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+from utilidades import generar_archivo_json, medir
+from models.repositorios import BACKENDS
+
+CONSULTAS = {
+    "contar_tareas_por_estado": lambda r: r.contar_tareas_por_estado(),
+    "contar_tareas_por_usuario": lambda r: r.contar_tareas_por_usuario(),
+    "obtener_estadisticas_generales": lambda r: r.obtener_estadisticas_generales(),
+    "obtener_tareas_vencidas": lambda r: r.obtener_tareas_vencidas(),
+    "obtener_tareas_por_fecha_creacion": lambda r: r.obtener_tareas_por_fecha_creacion(
+        __import__("datetime").date(2025, 1, 10), __import__("datetime").date(2025, 1, 12)),
+}
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    
+    try:
+        for nombre, clase in BACKENDS.items():
+            gc.collect()
+            tracemalloc.start()
+            inicio = time.perf_counter()
+            repositorio = clase(ruta)
+            carga = time.perf_counter() - inicio
+            memoria, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            print(f"\n📦 Backend '{nombre}': carga {carga:.2f} s, "
+                  f"{memoria / cantidad:.0f} bytes/tarea")
+            for consulta, funcion in CONSULTAS.items():
+                tiempo = medir(lambda: funcion(repositorio), repeticiones=3)
+                print(f"   {consulta:<36} {tiempo * 1e3:>10.2f} ms")
+            
+            del repositorio
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
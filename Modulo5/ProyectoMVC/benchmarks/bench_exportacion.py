@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Exportación de tareas
+Compara la exportación original (json.dumps de la lista de to_dict() de todas
+las tareas en una sola cadena, escrita después al archivo) con exportar_a_archivo
+en cada formato: tiempo y pico de memoria de Python (tracemalloc) durante la
+exportación, que en streaming no depende de la cantidad de tareas
+
+Uso: python bench_exportacion.py [cantidad]   (por defecto 100.000)
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from utilidades import archivo_temporal, crear_repositorio_vacio, poblar_repositorio
+
+
+def exportar_original(repositorio, f):
+    """Exportación JSON como la hacían TareaRepository y AplicacionMVC.exportar_datos"""
+    f.write(json.dumps([tarea.to_dict() for tarea in repositorio.tareas.values()],
+                       indent=2, ensure_ascii=False))
+
+
+def medir_exportacion(exportar, ruta: str):
+    """
+    (segundos, pico de memoria en bytes, tamaño del archivo) de una exportación
+    El pico se mide en una segunda pasada: tracemalloc hace más lenta la asignación
+    """
+    resultados = []
+    for medir_memoria in (False, True):
+        with open(ruta, 'w', encoding='utf-8', newline='') as f:
+            if medir_memoria:
+                tracemalloc.start()
+            inicio = time.perf_counter()
+            exportar(f)
+            resultados.append(time.perf_counter() - inicio)
+            if medir_memoria:
+                resultados[-1] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+    return resultados[0], resultados[1], os.path.getsize(ruta)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repositorio = poblar_repositorio(crear_repositorio_vacio(), cantidad)
+    ruta = archivo_temporal()
+
+    casos = {
+        "original (json en memoria)": lambda f: exportar_original(repositorio, f),
+        "streaming json": lambda f: repositorio.exportar_a_archivo(f, "json"),
+        "streaming jsonl (en frío)": lambda f: repositorio.exportar_a_archivo(f, "jsonl"),
+        "streaming csv": lambda f: repositorio.exportar_a_archivo(f, "csv"),
+    }
+    try:
+        for nombre, exportar in casos.items():
+            segundos, pico, tamano = medir_exportacion(exportar, ruta)
+            print(f"{nombre:28} {segundos * 1e3:9.1f} ms   {cantidad / segundos:10,.0f} tareas/s   "
+                  f"pico {pico / 2**20:8.2f} MB   archivo {tamano / 2**20:7.1f} MB")
+
+        # Con los fragmentos ya cacheados (p. ej. tras guardar) JSON Lines no codifica nada
+        repositorio.guardar_datos()
+        segundos, pico, _ = medir_exportacion(lambda f: repositorio.exportar_a_archivo(f, "jsonl"), ruta)
+        print(f"{'streaming jsonl (en caliente)':28} {segundos * 1e3:9.1f} ms   "
+              f"{cantidad / segundos:10,.0f} tareas/s   pico {pico / 2**20:8.2f} MB")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Guardado incremental
+Mide guardar_datos completo (primera vez, todas las tareas se codifican) frente
+a guardados posteriores con pocas tareas modificadas (fragmentos reutilizados)
+
+Uso: python bench_guardado_incremental.py [cantidad]   (por defecto 200.000)
+"""
+
+import os
+import sys
+
+from utilidades import generar_archivo_json, medir
+from models.tarea_repository import TareaRepository
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    
+    try:
+        repositorio = TareaRepository(ruta)
+        completo = medir(repositorio.guardar_datos)
+        print(f"guardado completo:            {completo * 1e3:10.1f} ms")
+        
+        for cambios in (1, 100, 10_000):
+            def modificar_y_guardar():
+                for tarea_id in range(1, min(cambios, cantidad) + 1):
+                    repositorio.obtener_tarea_por_id(tarea_id).registrar_tiempo_real(1)
+                repositorio.guardar_datos()
+            
+            tiempo = medir(modificar_y_guardar, repeticiones=3)
+            print(f"guardado con {cambios:>6} cambios:   {tiempo * 1e3:10.1f} ms "
+                  f"({completo / tiempo:.1f}x)")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Importación masiva de tareas
+Compara, en cada backend con escritura (y en modo WAL), cargar registros como
+hasta ahora (crear_tarea y luego agregar_etiqueta / establecer_fecha_vencimiento
+una por una: cada llamada reindexa, avisa el cambio y en modo WAL escribe un
+registro en el log) con importar_tareas leyendo el mismo archivo JSON Lines:
+lotes validados, IDs por bloque, un solo reindexado y una sola instantánea
+
+Uso: python bench_importacion.py [cantidad]   (por defecto 100.000)
+"""
+
+import datetime
+import glob
+import json
+import os
+import sys
+import time
+
+from utilidades import archivo_temporal, generar_registros
+from models.repositorios import crear_repositorio
+from models.tarea import PrioridadTarea
+from models.importacion import leer_registros
+
+# (backend, modo de persistencia)
+CASOS = (("memoria", "json"), ("memoria", "wal"), ("columnar", "json"),
+         ("sqlite", "json"), ("sqlite", "wal"))
+
+
+def importar_original(repositorio, ruta: str):
+    """Carga registro por registro con la API de tareas"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            registro = json.loads(linea)
+            tarea = repositorio.crear_tarea(registro["titulo"], registro["descripcion"],
+                                            registro["usuario_asignado"],
+                                            PrioridadTarea(registro["prioridad"]))
+            for etiqueta in registro["etiquetas"]:
+                tarea.agregar_etiqueta(etiqueta)
+            if registro["fecha_vencimiento"]:
+                tarea.establecer_fecha_vencimiento(
+                    datetime.datetime.fromisoformat(registro["fecha_vencimiento"]))
+
+
+def repositorio_vacio(backend: str, persistencia: str):
+    """Repositorio sin tareas del backend y modo indicados (y la base de su archivo)"""
+    ruta = archivo_temporal()
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump({"tareas": [], "siguiente_id": 1}, f)
+    return crear_repositorio(ruta, backend, persistencia), os.path.splitext(ruta)[0]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Generando {cantidad} registros sintéticos...")
+    ruta = archivo_temporal(".jsonl")
+    with open(ruta, 'w', encoding='utf-8') as f:
+        for registro in generar_registros(cantidad):
+            f.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+    try:
+        for backend, persistencia in CASOS:
+            tiempos = {}
+            for nombre, importar in (("original", importar_original),
+                                     ("importar_tareas",
+                                      lambda repo, ruta: repo.importar_tareas(leer_registros(ruta)))):
+                repositorio, base = repositorio_vacio(backend, persistencia)
+                inicio = time.perf_counter()
+                importar(repositorio, ruta)
+                repositorio.guardar_datos()
+                tiempos[nombre] = time.perf_counter() - inicio
+                assert len(repositorio) == cantidad
+                if hasattr(repositorio, "cerrar"):
+                    repositorio.cerrar()
+                for archivo in glob.glob(base + "*"):
+                    os.remove(archivo)
+
+            original, masiva = tiempos["original"], tiempos["importar_tareas"]
+            print(f"{backend:8} {persistencia:4} original {original:7.2f} s ({cantidad / original:9,.0f} tareas/s)   "
+                  f"importar_tareas {masiva:7.2f} s ({cantidad / masiva:9,.0f} tareas/s)   "
+                  f"{original / masiva:5.1f}x")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
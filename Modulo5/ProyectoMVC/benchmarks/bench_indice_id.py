@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Índice primario por ID
+Compara los recorridos lineales originales con el índice id → Tarea al buscar,
+actualizar (reemplazando el objeto, lo que reindexa la tarea) y eliminar
+definitivamente. Hay un usuario y una etiqueta distintos cada TAREAS_POR_VALOR
+tareas, para que el costo de los índices secundarios dependa del tamaño como
+en datos reales. Con millones de tareas, lo que queda al actualizar o eliminar
+es el desplazamiento de las listas de las vistas ordenadas (IndiceOrdenado)
+"""
+
+import random
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from models.tarea import Tarea
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+CONSULTAS = 1_000
+TAREAS_POR_VALOR = 10
+
+
+def buscar_lineal(tareas, tarea_id):
+    """Búsqueda original: recorre toda la lista"""
+    for tarea in tareas:
+        if tarea.id == tarea_id:
+            return tarea
+    return None
+
+
+def actualizar_lineal(tareas, tarea):
+    """Actualización original: busca la posición y reemplaza"""
+    for i, t in enumerate(tareas):
+        if t.id == tarea.id:
+            tareas[i] = tarea
+            return True
+    return False
+
+
+def eliminar_lineal(tareas, tarea_id):
+    """Eliminación original: busca la posición y borra de la lista"""
+    for i, tarea in enumerate(tareas):
+        if tarea.id == tarea_id:
+            del tareas[i]
+            return True
+    return False
+
+
+def fila(tamano, operacion, lineal, indice):
+    print(f"{tamano:>10} {operacion:>12} {lineal * 1e6:>14.2f} {indice * 1e6:>14.3f} "
+          f"{lineal / indice:>9.0f}x")
+
+
+def main():
+    print(f"{'tareas':>10} {'operación':>12} {'lineal (µs)':>14} {'índice (µs)':>14} {'speedup':>10}")
+    
+    for tamano in TAMANOS:
+        distintos = tamano // TAREAS_POR_VALOR
+        repositorio = poblar_repositorio(
+            crear_repositorio_vacio(), tamano,
+            usuarios=[f"usuario{i}" for i in range(distintos)],
+            etiquetas=[f"etiqueta{i}" for i in range(distintos)])
+        lista = repositorio.obtener_todas_tareas()
+        ids = random.sample(range(1, tamano + 1), CONSULTAS)
+        
+        # Los recorridos lineales son muy lentos en tamaños grandes: usar menos operaciones
+        ids_lineales = ids[:max(10, CONSULTAS * 10_000 // tamano)]
+        
+        lineal = medir(lambda: [buscar_lineal(lista, i) for i in ids_lineales]) / len(ids_lineales)
+        indice = medir(lambda: [repositorio.obtener_tarea_por_id(i) for i in ids]) / len(ids)
+        fila(tamano, "obtener", lineal, indice)
+        
+        # Objetos sustitutos (mismos datos): el repositorio quita el anterior y los indexa
+        sustitutos = [Tarea.from_dict(repositorio.obtener_tarea_por_id(i).to_dict()) for i in ids]
+        lineal = medir(lambda: [actualizar_lineal(lista, t) for t in sustitutos[:len(ids_lineales)]])
+        lineal /= len(ids_lineales)
+        indice = medir(lambda: [repositorio.actualizar_tarea(t) for t in sustitutos]) / len(ids)
+        fila(tamano, "actualizar", lineal, indice)
+        
+        lineal = medir(lambda: [eliminar_lineal(lista, i) for i in ids_lineales]) / len(ids_lineales)
+        indice = medir(lambda: [repositorio.eliminar_definitivamente(i) for i in ids]) / len(ids)
+        fila(tamano, "eliminar", lineal, indice)
+
+
+if __name__ == "__main__":
+    main()
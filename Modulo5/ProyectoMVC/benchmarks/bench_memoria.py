@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Memoria por tarea
+Mide con tracemalloc los bytes retenidos por tarea al cargar un archivo de datos.
+Compara la representación anterior (instancias con __dict__, listas vacías
+propias y cadenas sin internar) contra la Tarea compacta actual.
+
+Uso: python bench_memoria.py [cantidad]   (por defecto 1.000.000)
+"""
+
+import gc
+import os
+import sys
+import json
+import datetime
+import tracemalloc
+
+from utilidades import generar_archivo_json
+from models.tarea import Tarea
+from models.tarea_repository import TareaRepository
+
+
+class TareaConDict:
+    """Réplica de la representación anterior: mismos atributos en un __dict__"""
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TareaConDict':
+        tarea = cls()
+        tarea.id = data["id"]
+        tarea.titulo = data["titulo"]
+        tarea.descripcion = data["descripcion"]
+        tarea.usuario_asignado = data["usuario_asignado"]
+        tarea.prioridad = data["prioridad"]
+        tarea.estado = data["estado"]
+        tarea.fecha_creacion = datetime.datetime.fromisoformat(data["fecha_creacion"])
+        tarea.fecha_inicio = None
+        tarea.fecha_completado = None
+        tarea.fecha_vencimiento = None
+        tarea.usuario_creador = data.get("usuario_creador", data["usuario_asignado"])
+        tarea.etiquetas = data.get("etiquetas", [])
+        tarea.comentarios = []
+        tarea.tiempo_estimado_horas = data.get("tiempo_estimado_horas")
+        tarea.tiempo_real_horas = data.get("tiempo_real_horas")
+        
+        for campo in ("fecha_inicio", "fecha_completado", "fecha_vencimiento"):
+            if data.get(campo):
+                setattr(tarea, campo, datetime.datetime.fromisoformat(data[campo]))
+        
+        for comentario_data in data.get("comentarios", []):
+            comentario = comentario_data.copy()
+            comentario["fecha"] = datetime.datetime.fromisoformat(comentario["fecha"])
+            tarea.comentarios.append(comentario)
+        
+        return tarea
+
+
+def bytes_retenidos(construir) -> int:
+    """Memoria viva tras construir, descontando lo liberado"""
+    gc.collect()
+    tracemalloc.start()
+    resultado = construir()
+    gc.collect()
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del resultado
+    return actual
+
+
+def cargar_tareas(ruta: str, clase):
+    """Carga el archivo y construye las tareas sin conservar el JSON"""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [clase.from_dict(d) for d in data["tareas"]]
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    
+    try:
+        antes = bytes_retenidos(lambda: cargar_tareas(ruta, TareaConDict))
+        despues = bytes_retenidos(lambda: cargar_tareas(ruta, Tarea))
+        repositorio = bytes_retenidos(lambda: TareaRepository(ruta))
+        
+        print(f"{'representación':<32} {'bytes/tarea':>12}")
+        print(f"{'Tarea con __dict__ (anterior)':<32} {antes / cantidad:>12.0f}")
+        print(f"{'Tarea compacta (__slots__)':<32} {despues / cantidad:>12.0f}")
+        print(f"{'TareaRepository.cargar_datos':<32} {repositorio / cantidad:>12.0f}"
+              f"   (incluye índices)")
+        print(f"Ahorro en el modelo: {(1 - despues / antes) * 100:.1f}%")
+    finally:
+        os.remove(ruta)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Repositorio mapeado en memoria
+Compara, para distintos tamaños, el arranque del repositorio en memoria con el
+del repositorio mmap de solo lectura, y lo que cuesta el primer acceso típico
+de un dashboard (len, primera página, una tarea por ID)
+
+Uso: python bench_mmap.py [cantidad máxima]   (por defecto 1.000.000)
+"""
+
+import os
+import sys
+
+from utilidades import generar_archivo_json, medir
+from models.tarea_repository import TareaRepository, ruta_instantanea_lectura
+from models.tarea_repository_mmap import TareaRepositoryMmap
+
+
+def main():
+    maximo = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tamanos = [t for t in (10_000, 100_000, 1_000_000) if t <= maximo] or [maximo]
+    
+    print(f"{'tareas':>10} {'memoria':>12} {'mmap':>12} {'len+página':>12} {'por ID':>12}")
+    for tamano in tamanos:
+        ruta = generar_archivo_json(tamano)
+        ruta_binaria = ruta_instantanea_lectura(ruta, "json")
+        try:
+            memoria_s = medir(lambda: TareaRepository(ruta))
+            
+            # La primera apertura genera la instantánea; se mide la siguiente
+            TareaRepositoryMmap(ruta).cerrar()
+            mmap_s = medir(lambda: TareaRepositoryMmap(ruta).cerrar(), repeticiones=5)
+            
+            repositorio = TareaRepositoryMmap(ruta)
+            pagina_s = medir(lambda: (len(repositorio), repositorio.obtener_tareas_pagina(0, 10)),
+                             repeticiones=100)
+            por_id_s = medir(lambda: repositorio.obtener_tarea_por_id(tamano // 2),
+                             repeticiones=1000)
+            repositorio.cerrar()
+            
+            print(f"{tamano:>10} {memoria_s * 1e3:>10.1f}ms {mmap_s * 1e3:>10.3f}ms "
+                  f"{pagina_s * 1e3:>10.3f}ms {por_id_s * 1e6:>10.1f}µs")
+        finally:
+            os.remove(ruta)
+            if os.path.exists(ruta_binaria):
+                os.remove(ruta_binaria)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Paginación de listas
+Compara, en cada backend, pedir una página profunda por desplazamiento (desde)
+y por cursor (IDs mayores que el último visto), y en la vista web renderizar
+la lista completa frente a una página de ITEMS_PER_PAGE tarjetas
+
+Uso: python bench_paginacion.py [cantidad]   (por defecto 100.000)
+"""
+
+import glob
+import os
+import sys
+
+from utilidades import generar_archivo_json, medir
+from models.repositorios import crear_repositorio, BACKENDS
+from controllers.web_controller import WebController
+
+POR_PAGINA = 100
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    base = os.path.splitext(ruta)[0]
+
+    try:
+        for backend in BACKENDS:
+            repositorio = crear_repositorio(ruta, backend)
+            desde = cantidad - POR_PAGINA
+            cursor = repositorio.obtener_tareas_pagina(desde - 1, 1)[0].id
+            por_desplazamiento = medir(lambda: repositorio.obtener_tareas_pagina(desde, POR_PAGINA),
+                                       repeticiones=20)
+            por_cursor = medir(lambda: repositorio.obtener_tareas_despues_de(cursor, POR_PAGINA),
+                               repeticiones=20)
+            print(f"{backend:9} última página: desde {por_desplazamiento * 1e3:8.3f} ms   "
+                  f"cursor {por_cursor * 1e3:8.3f} ms")
+            if hasattr(repositorio, "cerrar"):
+                repositorio.cerrar()
+
+        controller = WebController(crear_repositorio(ruta))
+
+        def renderizar(pagina):
+            controller.cache.invalidar()
+            controller.respuesta_lista("todas", pagina)
+
+        completa = medir(lambda: renderizar(None), repeticiones=3)
+        pagina = medir(lambda: renderizar(2), repeticiones=3)
+        print(f"lista web: completa {completa * 1e3:9.1f} ms   página {pagina * 1e3:9.1f} ms "
+              f"({completa / pagina:,.0f}x)")
+    finally:
+        for archivo in glob.glob(base + "*"):
+            os.remove(archivo)
+
+
+if __name__ == "__main__":
+    main()
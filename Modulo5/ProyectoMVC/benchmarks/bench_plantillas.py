@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Plantillas precompiladas
+Compara la tarjeta de tarea original (f-string con todo el HTML, codificada
+a UTF-8 para enviarla) con la plantilla precompilada de TareaWebView, que une
+tramos ya codificados y escapa los textos; informa tarjetas por segundo
+
+Uso: python bench_plantillas.py [cantidad]   (por defecto 10.000)
+"""
+
+import sys
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from views.web.tarea_web_view import TareaWebView
+
+
+def tarjeta_original(vista, tarea) -> str:
+    """Implementación original: una f-string por tarjeta, sin escapar los textos"""
+    
+    # Colores y estilos
+    color_estado = vista.colores_estado[tarea.estado]
+    color_prioridad = vista.colores_prioridad[tarea.prioridad]
+    icono_estado = vista.iconos_estado[tarea.estado]
+    icono_prioridad = vista.iconos_prioridad[tarea.prioridad]
+    
+    # Fecha de vencimiento
+    fecha_venc_html = ""
+    if tarea.fecha_vencimiento:
+        dias_restantes = tarea.dias_para_vencimiento()
+        if dias_restantes is not None:
+            if dias_restantes < 0:
+                fecha_venc_html = f'<span class="text-danger"><i class="fas fa-exclamation-triangle me-1"></i>Vencida hace {abs(dias_restantes)} días</span>'
+            elif dias_restantes == 0:
+                fecha_venc_html = f'<span class="text-warning"><i class="fas fa-clock me-1"></i>Vence hoy</span>'
+            elif dias_restantes <= 3:
+                fecha_venc_html = f'<span class="text-warning"><i class="fas fa-calendar me-1"></i>Vence en {dias_restantes} días</span>'
+            else:
+                fecha_venc_html = f'<span class="text-success"><i class="fas fa-calendar me-1"></i>Vence en {dias_restantes} días</span>'
+    
+    # Etiquetas
+    etiquetas_html = ""
+    if tarea.etiquetas:
+        etiquetas_html = "".join([
+            f'<span class="badge bg-secondary me-1">#{etiqueta}</span>'
+            for etiqueta in tarea.etiquetas[:3]  # Máximo 3 etiquetas
+        ])
+    
+    return f"""
+    <div class="card task-card" style="border-left-color: {color_estado};">
+        <div class="card-body">
+            <div class="d-flex justify-content-between align-items-start mb-2">
+                <h6 class="card-title mb-0">{tarea.titulo}</h6>
+                <div class="task-actions">
+                    <button class="btn btn-sm btn-outline-primary me-1" title="Editar">
+                        <i class="fas fa-edit"></i>
+                    </button>
+                    <button class="btn btn-sm btn-outline-danger" title="Eliminar">
+                        <i class="fas fa-trash"></i>
+                    </button>
+                </div>
+            </div>
+            
+            <p class="card-text text-muted small mb-3">
+                {tarea.descripcion[:100]}{'...' if len(tarea.descripcion) > 100 else ''}
+            </p>
+            
+            <div class="d-flex justify-content-between align-items-center mb-2">
+                <span class="status-badge text-white" style="background-color: {color_estado};">
+                    {icono_estado} {tarea.estado.value.title()}
+                </span>
+                <span class="priority-badge text-white" style="background-color: {color_prioridad};">
+                    {icono_prioridad} {tarea.prioridad.value.title()}
+                </span>
+            </div>
+            
+            <div class="d-flex justify-content-between align-items-center mb-2">
+                <small class="text-muted">
+                    <i class="fas fa-user me-1"></i>
+                    {tarea.usuario_asignado}
+                </small>
+                <small class="text-muted">
+                    ID: {tarea.id}
+                </small>
+            </div>
+            
+            {f'<div class="mb-2">{fecha_venc_html}</div>' if fecha_venc_html else ''}
+            
+            {f'<div class="mb-2">{etiquetas_html}</div>' if etiquetas_html else ''}
+            
+            {f'<div><small class="text-muted"><i class="fas fa-comments me-1"></i>{len(tarea.comentarios)} comentarios</small></div>' if tarea.comentarios else ''}
+        </div>
+    </div>
+    """
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    tareas = poblar_repositorio(crear_repositorio_vacio(), cantidad).obtener_todas_tareas()
+    vista = TareaWebView()
+
+    original = medir(lambda: [tarjeta_original(vista, t).encode("utf-8") for t in tareas], repeticiones=3)
+    plantilla = medir(lambda: [vista._generar_tarea_card_html(t) for t in tareas], repeticiones=3)
+    print(f"f-string original:     {cantidad / original:12,.0f} tarjetas/s")
+    print(f"plantilla compilada:   {cantidad / plantilla:12,.0f} tarjetas/s ({original / plantilla:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Render de la lista web completa por bloques
+Compara armar la página entera antes de enviarla con generarla por bloques
+(como /tareas/<filtro>?pagina=todas): tiempo hasta el primer byte y pico
+de memoria durante el render, para varios tamaños de lista
+
+Uso: python bench_render_streaming.py [cantidad...]   (por defecto 1.000 10.000 50.000)
+"""
+
+import sys
+import threading
+import time
+import tracemalloc
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio
+from controllers.web_controller import WebController
+from controllers.servidor_web import en_bloques
+
+
+def medir_render(generar) -> tuple:
+    """Devuelve (segundos hasta el primer bloque, segundos totales, pico de memoria en MB)"""
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    primer_byte = None
+    for _ in generar():
+        if primer_byte is None:
+            primer_byte = time.perf_counter() - inicio
+    total = time.perf_counter() - inicio
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return primer_byte, total, pico / 2**20
+
+
+def main():
+    cantidades = [int(valor) for valor in sys.argv[1:]] or [1_000, 10_000, 50_000]
+    bloqueo = threading.RLock()
+
+    for cantidad in cantidades:
+        controller = WebController(poblar_repositorio(crear_repositorio_vacio(), cantidad))
+        casos = {
+            "página completa": lambda: [controller._renderizar_lista("todas")],
+            "por bloques": lambda: en_bloques(controller.flujo_lista("todas"), bloqueo),
+        }
+        for nombre, generar in casos.items():
+            primer_byte, total, pico = medir_render(generar)
+            print(f"{cantidad:7} tareas, {nombre:16} primer byte {primer_byte * 1e3:9.1f} ms   "
+                  f"total {total * 1e3:9.1f} ms   pico {pico:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
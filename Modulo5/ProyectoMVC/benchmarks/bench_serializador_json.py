@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Serialización JSON de la API de tareas
+Compara la respuesta original (to_dict() de cada tarea y json.dumps con
+indent=2 y default=str) con el serializador de la API: en frío (fragmentos
+aún sin cachear), en caliente (fragmentos del repositorio ya codificados)
+y escribiendo el arreglo por bloques a un archivo
+
+Uso: python bench_serializador_json.py [cantidad]   (por defecto 50.000)
+"""
+
+import json
+import sys
+import tempfile
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from views.web.serializador_json import SerializadorTareasJSON
+
+
+def json_original(tareas) -> str:
+    """Respuesta como la generaba TareaWebView.generar_json_api antes del serializador"""
+    return json.dumps([tarea.to_dict() for tarea in tareas], indent=2, ensure_ascii=False, default=str)
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    repositorio = poblar_repositorio(crear_repositorio_vacio(), cantidad)
+    tareas = repositorio.obtener_todas_tareas()
+    serializador = SerializadorTareasJSON(repositorio.fragmento_json)
+
+    def en_frio():
+        repositorio._fragmentos.clear()
+        serializador.serializar(tareas)
+
+    with tempfile.TemporaryFile() as destino:
+        def a_archivo():
+            destino.seek(0)
+            serializador.escribir(tareas, destino)
+
+        casos = {
+            "original (to_dict + indent=2)": lambda: json_original(tareas),
+            "serializador en frío": en_frio,
+            "serializador en caliente": lambda: serializador.serializar(tareas),
+            "escribir a archivo": a_archivo,
+        }
+        base = None
+        for nombre, funcion in casos.items():
+            segundos = medir(funcion, repeticiones=3)
+            base = base or segundos
+            print(f"{nombre:30} {segundos * 1e3:9.1f} ms   {cantidad / segundos:12,.0f} tareas/s   "
+                  f"({base / segundos:5.1f}x)")
+
+    tamano_original = len(json_original(tareas).encode("utf-8"))
+    tamano_nuevo = len(serializador.serializar(tareas))
+    print(f"tamaño: original {tamano_original / 2**20:.1f} MB   compacto {tamano_nuevo / 2**20:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Prueba de carga del servidor HTTP
+Lanza el servidor en un proceso aparte (o usa uno ya levantado con --url) y lo
+carga desde varios hilos, cada uno con su conexión keep-alive; informa
+peticiones por segundo y latencias p50/p99. Con --sin-keepalive cada petición
+abre una conexión nueva, para comparar. --inactivas abre además N conexiones
+keep-alive que no piden nada y se informa cuántos hilos usa el servidor
+
+Uso: python bench_servidor_http.py [--servidor hilos|async] [--tareas 2000]
+                                   [--conexiones 8] [--segundos 5] [--inactivas 0]
+                                   [--ruta /api/dashboard] [--url http://host:puerto]
+"""
+
+import argparse
+import asyncio
+import http.client
+import multiprocessing
+import os
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+from utilidades import generar_archivo_json
+
+
+def servir(ruta_datos: str, tipo: str, cola: multiprocessing.Queue):
+    """Proceso servidor: repositorio en memoria + servidor en un puerto libre"""
+    from models.tarea_repository import TareaRepository
+    from controllers.web_controller import WebController
+    from controllers.servidor_web import ServidorTareas
+    from controllers.servidor_async import ServidorTareasAsync
+
+    controller = WebController(TareaRepository(ruta_datos))
+    if tipo == "async":
+        async def principal():
+            servidor = ServidorTareasAsync(controller, puerto=0, timeout_keepalive=600)
+            await servidor.iniciar()
+            cola.put(servidor.url)
+            await servidor.servir()
+        asyncio.run(principal())
+    else:
+        servidor = ServidorTareas(controller, puerto=0, timeout_keepalive=600)
+        cola.put(servidor.url)
+        servidor.serve_forever()
+
+
+def abrir_inactivas(host: str, puerto: int, cantidad: int) -> list:
+    """Conexiones keep-alive que hacen una petición y quedan abiertas sin usar"""
+    sockets = []
+    for _ in range(cantidad):
+        conexion = socket.create_connection((host, puerto))
+        conexion.sendall(b"HEAD /api/dashboard HTTP/1.1\r\nHost: bench\r\n\r\n")
+        sockets.append(conexion)
+    for conexion in sockets:
+        conexion.recv(4096)
+    return sockets
+
+
+def hilos_del_proceso(pid: int) -> str:
+    """Cantidad de hilos del proceso servidor (Linux)"""
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for linea in f:
+                if linea.startswith("Threads:"):
+                    return linea.split()[1]
+    except OSError:
+        pass
+    return "?"
+
+
+def cliente(host: str, puerto: int, ruta: str, fin: float, keepalive: bool,
+            latencias: list, errores: list):
+    """Repite la petición hasta el instante `fin` y acumula latencias"""
+    conexion = http.client.HTTPConnection(host, puerto, timeout=30)
+    cabeceras = {} if keepalive else {"Connection": "close"}
+    propias = []
+    fallos = 0
+    while time.perf_counter() < fin:
+        inicio = time.perf_counter()
+        try:
+            conexion.request("GET", ruta, headers=cabeceras)
+            respuesta = conexion.getresponse()
+            respuesta.read()
+            if respuesta.status != 200:
+                fallos += 1
+            if not keepalive:
+                conexion.close()
+        except (OSError, http.client.HTTPException):
+            fallos += 1
+            conexion.close()
+        propias.append(time.perf_counter() - inicio)
+    conexion.close()
+    latencias.extend(propias)
+    errores.append(fallos)
+
+
+def percentil(ordenadas: list, p: float) -> float:
+    return ordenadas[min(len(ordenadas) - 1, int(len(ordenadas) * p))]
+
+
+def cargar(url: str, ruta: str, conexiones: int, segundos: float, keepalive: bool):
+    """Ejecuta una ronda de carga e imprime el resumen"""
+    destino = urlsplit(url)
+    latencias, errores = [], []
+    fin = time.perf_counter() + segundos
+    hilos = [threading.Thread(target=cliente, args=(destino.hostname, destino.port, ruta, fin,
+                                                    keepalive, latencias, errores))
+             for _ in range(conexiones)]
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+
+    latencias.sort()
+    modo = "keep-alive" if keepalive else "conexión nueva"
+    print(f"{ruta} ({modo}, {conexiones} conexiones): {len(latencias) / duracion:9.1f} req/s, "
+          f"p50 {percentil(latencias, 0.50) * 1e3:7.2f} ms, "
+          f"p99 {percentil(latencias, 0.99) * 1e3:7.2f} ms, errores {sum(errores)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prueba de carga del servidor HTTP")
+    parser.add_argument("--servidor", choices=("hilos", "async"), default="hilos")
+    parser.add_argument("--tareas", type=int, default=2000)
+    parser.add_argument("--inactivas", type=int, default=0,
+                        help="conexiones keep-alive abiertas sin tráfico")
+    parser.add_argument("--conexiones", type=int, default=8)
+    parser.add_argument("--segundos", type=float, default=5.0)
+    parser.add_argument("--ruta", default=None, help="ruta a cargar (por defecto varias)")
+    parser.add_argument("--url", default=None, help="servidor ya levantado")
+    parser.add_argument("--sin-keepalive", action="store_true")
+    argumentos = parser.parse_args()
+
+    rutas = [argumentos.ruta] if argumentos.ruta else ["/api/dashboard", "/tareas/urgentes", "/"]
+    proceso = None
+    ruta_datos = None
+    url = argumentos.url
+    if url is None:
+        print(f"Generando {argumentos.tareas} tareas sintéticas...")
+        ruta_datos = generar_archivo_json(argumentos.tareas)
+        cola = multiprocessing.Queue()
+        proceso = multiprocessing.Process(target=servir, args=(ruta_datos, argumentos.servidor, cola),
+                                          daemon=True)
+        proceso.start()
+        url = cola.get(timeout=120)
+        print(f"Servidor ({argumentos.servidor}) en {url}")
+
+    inactivas = []
+    try:
+        if argumentos.inactivas:
+            destino = urlsplit(url)
+            inactivas = abrir_inactivas(destino.hostname, destino.port, argumentos.inactivas)
+            print(f"{len(inactivas)} conexiones inactivas abiertas")
+        for ruta in rutas:
+            cargar(url, ruta, argumentos.conexiones, argumentos.segundos,
+                   keepalive=not argumentos.sin_keepalive)
+        if proceso is not None:
+            print(f"Hilos del proceso servidor: {hilos_del_proceso(proceso.pid)}")
+    finally:
+        for conexion in inactivas:
+            conexion.close()
+        if proceso is not None:
+            proceso.terminate()
+            proceso.join()
+        if ruta_datos is not None:
+            os.remove(ruta_datos)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Instantánea binaria
+Compara la carga de tareas desde JSON (LectorTareasJSON + Tarea.from_dict)
+con la instantánea binaria (struct + tabla de cadenas), y la carga completa
+del repositorio en ambos modos de persistencia
+
+Uso: python bench_snapshot_binario.py [cantidad]   (por defecto 1.000.000)
+"""
+
+import os
+import sys
+import time
+
+from utilidades import generar_archivo_json
+from models.tarea import Tarea
+from models.tarea_repository import TareaRepository
+from models.lector_json import LectorTareasJSON
+from models.snapshot_binario import escribir_snapshot_binario, leer_snapshot_binario
+
+
+def cronometrar(funcion) -> tuple:
+    """Devuelve (resultado, segundos)"""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    ruta_binaria = os.path.splitext(ruta)[0] + ".bin"
+
+    try:
+        tareas, json_s = cronometrar(
+            lambda: [Tarea.from_dict(d) for d in LectorTareasJSON(ruta)])
+        _, escritura_s = cronometrar(
+            lambda: escribir_snapshot_binario(ruta_binaria, tareas, cantidad + 1))
+        del tareas
+        _, binario_s = cronometrar(lambda: leer_snapshot_binario(ruta_binaria))
+
+        print(f"tamaño JSON / binario:     {os.path.getsize(ruta) / 2**20:8.1f} / "
+              f"{os.path.getsize(ruta_binaria) / 2**20:.1f} MiB")
+        print(f"escritura binaria:         {escritura_s:8.2f} s")
+        print(f"decodificación JSON:       {json_s:8.2f} s")
+        print(f"decodificación binaria:    {binario_s:8.2f} s   ({json_s / binario_s:.1f}x)")
+
+        # Carga completa del repositorio (incluye la reconstrucción de índices)
+        _, repo_json_s = cronometrar(lambda: TareaRepository(ruta))
+        _, repo_binario_s = cronometrar(lambda: TareaRepository(ruta, "binario"))
+        print(f"repositorio JSON:          {repo_json_s:8.2f} s")
+        print(f"repositorio binario:       {repo_binario_s:8.2f} s   "
+              f"({repo_json_s / repo_binario_s:.1f}x)")
+    finally:
+        os.remove(ruta)
+        if os.path.exists(ruta_binaria):
+            os.remove(ruta_binaria)
+
+
+if __name__ == "__main__":
+    main()
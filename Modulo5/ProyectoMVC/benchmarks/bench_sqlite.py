@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Backend SQLite
+Compara el repositorio en memoria (archivo JSON) con el repositorio SQLite:
+carga, reapertura y las consultas que usan los controladores
+
+Uso: python bench_sqlite.py [cantidad]   (por defecto 1.000.000)
+"""
+
+import os
+import sys
+import datetime
+import time
+
+from utilidades import generar_archivo_json, medir
+from models.tarea import EstadoTarea, PrioridadTarea
+from models.tarea_repository import TareaRepository
+from models.tarea_repository_sqlite import TareaRepositorySQLite
+
+CONSULTAS = {
+    "por_id": lambda r: [r.obtener_tarea_por_id(i) for i in range(1, 1001)],
+    "por_estado": lambda r: r.obtener_tareas_por_estado(EstadoTarea.EN_PROGRESO),
+    "por_prioridad": lambda r: r.obtener_tareas_por_prioridad(PrioridadTarea.CRITICA),
+    "por_usuario": lambda r: r.obtener_tareas_por_usuario("qa1"),
+    "por_etiqueta": lambda r: r.obtener_tareas_por_etiqueta("infra"),
+    "vencidas": lambda r: r.obtener_tareas_vencidas(),
+    "proximas": lambda r: r.obtener_tareas_con_vencimiento_proximo(30),
+    "buscar": lambda r: r.buscar_tareas("tarea 4242"),
+    "creacion_1_dia": lambda r: r.obtener_tareas_por_fecha_creacion(
+        datetime.date(2025, 1, 2), datetime.date(2025, 1, 2)),
+    "contar_usuario": lambda r: r.contar_tareas_por_usuario(),
+    "estadisticas": lambda r: r.obtener_estadisticas_generales(),
+    "ordenar_prio": lambda r: r.ordenar_por_prioridad(),
+}
+
+
+def cronometrar(funcion) -> tuple:
+    """Devuelve (resultado, segundos)"""
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    ruta = generar_archivo_json(cantidad)
+    ruta_bd = os.path.splitext(ruta)[0] + ".db"
+
+    try:
+        memoria, segundos = cronometrar(lambda: TareaRepository(ruta))
+        print(f"carga JSON (memoria):      {segundos:8.2f} s")
+
+        sqlite, segundos = cronometrar(lambda: TareaRepositorySQLite(ruta))
+        print(f"importación a SQLite:      {segundos:8.2f} s")
+        sqlite.cerrar()
+
+        sqlite, segundos = cronometrar(lambda: TareaRepositorySQLite(ruta))
+        print(f"reapertura SQLite:         {segundos:8.4f} s")
+        print(f"tamaño JSON / SQLite:      {os.path.getsize(ruta) / 2**20:8.1f} / "
+              f"{os.path.getsize(ruta_bd) / 2**20:.1f} MiB")
+
+        print(f"\n{'consulta':<16} {'memoria (ms)':>13} {'sqlite (ms)':>12} {'resultados':>11}")
+        for nombre, consulta in CONSULTAS.items():
+            tiempo_memoria = medir(lambda: consulta(memoria), 3)
+            tiempo_sqlite = medir(lambda: consulta(sqlite), 3)
+            resultado = consulta(sqlite)
+            tamano = len(resultado) if hasattr(resultado, "__len__") else 1
+            print(f"{nombre:<16} {tiempo_memoria * 1e3:>13.2f} {tiempo_sqlite * 1e3:>12.2f} "
+                  f"{tamano:>11}")
+
+        sqlite.cerrar()
+    finally:
+        os.remove(ruta)
+        if os.path.exists(ruta_bd):
+            os.remove(ruta_bd)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Índice de vencimientos
+Compara las consultas del dashboard (vencidas, urgentes, próximas) recorriendo
+todas las tareas contra las consultas por rango del índice
+"""
+
+import datetime
+import random
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from models.tarea import EstadoTarea
+
+TAMANOS = [10_000, 100_000, 1_000_000]
+
+
+def consultas_lineales(tareas):
+    """Implementación original: una llamada a datetime.now() por tarea"""
+    vencidas = [t for t in tareas if t.esta_vencida()]
+    urgentes = [t for t in tareas if t.necesita_atencion()]
+    proximas = [t for t in tareas
+                if t.estado in [EstadoTarea.PENDIENTE, EstadoTarea.EN_PROGRESO]
+                and t.dias_para_vencimiento() is not None
+                and 0 <= t.dias_para_vencimiento() <= 3]
+    return vencidas, urgentes, proximas
+
+
+def consultas_indexadas(repositorio):
+    """Consultas por rango sobre el índice de vencimientos"""
+    return (repositorio.obtener_tareas_vencidas(),
+            repositorio.obtener_tareas_urgentes(),
+            repositorio.obtener_tareas_con_vencimiento_proximo(3))
+
+
+def main():
+    print(f"{'tareas':>10} {'lineal (ms)':>12} {'índice (ms)':>12} {'speedup':>9}")
+    
+    for tamano in TAMANOS:
+        repositorio = poblar_repositorio(crear_repositorio_vacio(), tamano)
+        aleatorio = random.Random(7)
+        ahora = datetime.datetime.now()
+        
+        # 10% de las tareas con vencimiento en los próximos 60 días
+        for tarea in aleatorio.sample(repositorio.obtener_todas_tareas(), tamano // 10):
+            tarea.establecer_fecha_vencimiento(
+                ahora + datetime.timedelta(hours=aleatorio.randint(1, 60 * 24)))
+        
+        tareas = repositorio.obtener_todas_tareas()
+        tiempo_lineal = medir(lambda: consultas_lineales(tareas))
+        tiempo_indice = medir(lambda: consultas_indexadas(repositorio), repeticiones=5)
+        
+        print(f"{tamano:>10} {tiempo_lineal * 1e3:>12.1f} {tiempo_indice * 1e3:>12.2f} "
+              f"{tiempo_lineal / tiempo_indice:>8.0f}x")
+
+
+if __name__ == "__main__":
+    main()
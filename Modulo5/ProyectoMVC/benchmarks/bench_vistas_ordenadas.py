@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Vistas ordenadas
+Compara ordenar todas las tareas en cada consulta (implementación original)
+contra leer el orden que el repositorio mantiene con bisect: lista completa,
+una página de la lista por prioridad, y las primeras K de un subconjunto con
+un heap. También mide cuánto cuesta mantener los órdenes al cambiar tareas
+
+Uso: python bench_vistas_ordenadas.py [cantidad]   (por defecto 100.000)
+"""
+
+import datetime
+import random
+import sys
+
+from utilidades import crear_repositorio_vacio, poblar_repositorio, medir
+from models.tarea import PrioridadTarea
+
+POR_PAGINA = 20
+CAMBIOS = 10_000
+
+
+def ordenar_por_prioridad_original(tareas):
+    """Implementación original: arma el dict de rangos y ordena la lista entera"""
+    orden_prioridad = {
+        PrioridadTarea.CRITICA: 0,
+        PrioridadTarea.ALTA: 1,
+        PrioridadTarea.MEDIA: 2,
+        PrioridadTarea.BAJA: 3
+    }
+    return sorted(tareas, key=lambda t: orden_prioridad[t.prioridad])
+
+
+def ordenar_por_vencimiento_original(tareas):
+    """Implementación original: dos copias filtradas y un sort"""
+    con_vencimiento = [t for t in tareas if t.fecha_vencimiento is not None]
+    sin_vencimiento = [t for t in tareas if t.fecha_vencimiento is None]
+    con_vencimiento.sort(key=lambda t: t.fecha_vencimiento)
+    return con_vencimiento + sin_vencimiento
+
+
+def fila(nombre, original, nuevo):
+    print(f"{nombre:34} {original * 1e3:10.2f} ms {nuevo * 1e3:10.3f} ms {original / nuevo:9,.0f}x")
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repositorio = poblar_repositorio(crear_repositorio_vacio(), cantidad)
+    aleatorio = random.Random(7)
+    ahora = datetime.datetime.now()
+    tareas = repositorio.obtener_todas_tareas()
+    for tarea in aleatorio.sample(tareas, cantidad // 3):
+        tarea.establecer_fecha_vencimiento(ahora + datetime.timedelta(hours=aleatorio.randint(1, 2000)))
+
+    print(f"{cantidad} tareas")
+    print(f"{'consulta':34} {'original':>13} {'vista':>13} {'speedup':>10}")
+
+    fila("lista por prioridad",
+         medir(lambda: ordenar_por_prioridad_original(repositorio.obtener_todas_tareas()), 5),
+         medir(lambda: repositorio.ordenar_por_prioridad(), 5))
+    fila("lista por vencimiento",
+         medir(lambda: ordenar_por_vencimiento_original(repositorio.obtener_todas_tareas()), 5),
+         medir(lambda: repositorio.ordenar_por_fecha_vencimiento(), 5))
+
+    desde = 10 * POR_PAGINA
+    fila(f"página 11 por prioridad ({POR_PAGINA})",
+         medir(lambda: ordenar_por_prioridad_original(
+             repositorio.obtener_todas_tareas())[desde:desde + POR_PAGINA], 5),
+         medir(lambda: repositorio.obtener_tareas_ordenadas("prioridad", desde, POR_PAGINA), 100))
+
+    subconjunto = repositorio.obtener_tareas_por_usuario("admin")
+    fila(f"primeras {POR_PAGINA} de un usuario (heap)",
+         medir(lambda: ordenar_por_prioridad_original(subconjunto)[:POR_PAGINA], 5),
+         medir(lambda: repositorio.obtener_primeras(POR_PAGINA, "prioridad", subconjunto), 5))
+
+    # Mantener las vistas: cada cambio reubica la tarea con bisect
+    prioridades = list(PrioridadTarea)
+    muestra = aleatorio.sample(tareas, CAMBIOS)
+    costo = medir(lambda: [t.cambiar_prioridad(aleatorio.choice(prioridades)) for t in muestra])
+    print(f"\n{CAMBIOS} cambios de prioridad (con vistas al día): {costo * 1e3:.1f} ms "
+          f"({costo / CAMBIOS * 1e6:.1f} µs por cambio)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+⏱️ BENCHMARK: Persistencia WAL
+Costo de persistir una edición de un campo: reescritura completa del JSON
+(guardar_datos en modo "json") contra un registro en el log por cada política de fsync
+
+Uso: python bench_wal.py [cantidad]   (por defecto 100.000)
+"""
+
+import os
+import sys
+import shutil
+
+from utilidades import generar_archivo_json, medir
+from models.tarea import PrioridadTarea
+from models.tarea_repository import TareaRepository
+
+EDICIONES = 200
+PRIORIDADES = list(PrioridadTarea)
+
+
+def editar(repositorio: TareaRepository, i: int):
+    """Edición de un solo campo sobre una tarea existente"""
+    tarea = repositorio.obtener_tarea_por_id(i % len(repositorio) + 1)
+    tarea.cambiar_prioridad(PRIORIDADES[i % len(PRIORIDADES)])
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"Generando {cantidad} tareas sintéticas...")
+    original = generar_archivo_json(cantidad)
+
+    try:
+        print(f"{'modo':<14} {'edición + guardado (ms)':>24}")
+
+        # Modo JSON: cada guardado reescribe todo el archivo (pocas repeticiones)
+        ruta = original + ".json"
+        shutil.copy(original, ruta)
+        repositorio = TareaRepository(ruta)
+        repeticiones = 3
+        contador = iter(range(repeticiones))
+        tiempo = medir(lambda: (editar(repositorio, next(contador)), repositorio.guardar_datos()),
+                       repeticiones)
+        print(f"{'json':<14} {tiempo * 1e3:>24.2f}")
+        os.remove(ruta)
+
+        for politica in ("siempre", "lote", "nunca"):
+            ruta = original + "." + politica
+            shutil.copy(original, ruta)
+            repositorio = TareaRepository(ruta, "wal", politica)
+            repositorio._wal.umbral_compactacion = EDICIONES + 1
+            contador = iter(range(EDICIONES))
+            tiempo = medir(lambda: editar(repositorio, next(contador)), EDICIONES)
+            print(f"{'wal/' + politica:<14} {tiempo * 1e3:>24.3f}")
+
+            if politica == "nunca":
+                tiempo = medir(repositorio.compactar)
+                print(f"{'compactación':<14} {tiempo * 1e3:>24.2f}")
+
+            repositorio._wal.cerrar()
+            os.remove(ruta)
+            os.remove(ruta + ".wal")
+    finally:
+        os.remove(original)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+⏱️ BENCHMARKS: Utilidades compartidas
+Genera repositorios sintéticos y mide tiempos
+"""
+
+import os
+import datetime
+import sys
+import json
+import random
+import tempfile
+import time
+
+# Agregar el directorio del proyecto al path para imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.tarea import PrioridadTarea
+from models.tarea_repository import TareaRepository
+
+USUARIOS = ["usuario1", "admin", "dev1", "dev2", "designer1", "qa1"]
+ETIQUETAS = ["backend", "frontend", "qa", "docs", "infra", "bug", "feature"]
+
+
+def archivo_temporal(sufijo: str = ".json") -> str:
+    """Crea un archivo temporal vacío y devuelve su ruta"""
+    descriptor, ruta = tempfile.mkstemp(suffix=sufijo)
+    os.close(descriptor)
+    return ruta
+
+
+def crear_repositorio_vacio(clase=TareaRepository) -> TareaRepository:
+    """Crea un repositorio sin los datos de ejemplo"""
+    ruta = archivo_temporal()
+    with open(ruta, 'w', encoding='utf-8') as f:
+        json.dump({"tareas": [], "siguiente_id": 1}, f)
+    return clase(ruta)
+
+
+def poblar_repositorio(repositorio: TareaRepository, cantidad: int, semilla: int = 42,
+                       usuarios=USUARIOS, etiquetas=()):
+    """
+    Crea `cantidad` tareas sintéticas en el repositorio
+    Los usuarios se eligen de `usuarios`; con `etiquetas`, cada tarea recibe una
+    """
+    aleatorio = random.Random(semilla)
+    prioridades = list(PrioridadTarea)
+    
+    for i in range(cantidad):
+        tarea = repositorio.crear_tarea(
+            titulo=f"Tarea {i} {aleatorio.choice(ETIQUETAS)}",
+            descripcion=f"Descripción sintética número {i}",
+            usuario_asignado=aleatorio.choice(usuarios),
+            prioridad=aleatorio.choice(prioridades)
+        )
+        if etiquetas:
+            tarea.agregar_etiqueta(aleatorio.choice(etiquetas))
+    
+    return repositorio
+
+
+def medir(funcion, repeticiones: int = 1) -> float:
+    """Devuelve el tiempo medio en segundos de `repeticiones` llamadas"""
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def generar_registros(cantidad: int, semilla: int = 42):
+    """Genera diccionarios de tareas con el formato de Tarea.to_dict"""
+    aleatorio = random.Random(semilla)
+    prioridades = [p.value for p in PrioridadTarea]
+    estados = ["pendiente", "en_progreso", "completada", "cancelada"]
+    base = datetime.datetime(2025, 1, 1)
+    
+    for i in range(1, cantidad + 1):
+        usuario = aleatorio.choice(USUARIOS)
+        creacion = base + datetime.timedelta(minutes=i)
+        estado = aleatorio.choice(estados)
+        inicio = creacion + datetime.timedelta(hours=1) if estado != "pendiente" else None
+        completado = inicio + datetime.timedelta(hours=5) if estado == "completada" else None
+        vencimiento = None
+        if aleatorio.random() < 0.3:
+            vencimiento = creacion + datetime.timedelta(days=aleatorio.randint(1, 400))
+        
+        etiquetas = []
+        if aleatorio.random() < 0.2:
+            etiquetas = aleatorio.sample(ETIQUETAS, aleatorio.randint(1, 3))
+        
+        comentarios = []
+        if aleatorio.random() < 0.05:
+            comentarios = [{"id": 1, "texto": "Revisado", "usuario": usuario,
+                            "fecha": creacion.isoformat()}]
+        
+        yield {
+            "id": i,
+            "titulo": f"Tarea {i} {aleatorio.choice(ETIQUETAS)}",
+            "descripcion": f"Descripción sintética número {i}",
+            "usuario_asignado": usuario,
+            "usuario_creador": usuario,
+            "prioridad": aleatorio.choice(prioridades),
+            "estado": estado,
+            "fecha_creacion": creacion.isoformat(),
+            "fecha_inicio": inicio.isoformat() if inicio else None,
+            "fecha_completado": completado.isoformat() if completado else None,
+            "fecha_vencimiento": vencimiento.isoformat() if vencimiento else None,
+            "etiquetas": etiquetas,
+            "comentarios": comentarios,
+            "tiempo_estimado_horas": None,
+            "tiempo_real_horas": None
+        }
+
+
+def generar_archivo_json(cantidad: int, ruta: str = None) -> str:
+    """Escribe un archivo de datos con `cantidad` tareas sintéticas"""
+    ruta = ruta or archivo_temporal()
+    with open(ruta, 'w', encoding='utf-8') as f:
+        f.write('{"tareas": [')
+        for i, registro in enumerate(generar_registros(cantidad)):
+            if i:
+                f.write(', ')
+            json.dump(registro, f, ensure_ascii=False)
+        f.write(f'], "siguiente_id": {cantidad + 1}}}')
+    return ruta
@@ -18,6 +18,45 @@ class Settings:
     DATA_DIR = os.path.join(BASE_DIR, "data")
     DEFAULT_DATA_FILE = os.path.join(DATA_DIR, "tareas.json")
     
+    # Backend del repositorio: "memoria" (objetos + índices), "columnar" (analítica),
+    # "sqlite" (base de datos junto al archivo de datos, consultas en SQL)
+    # o "mmap" (instantánea binaria mapeada, solo lectura)
+    REPOSITORY_BACKEND = "memoria"
+    # Backend de la versión web (None = el mismo que la consola); "mmap" abre la
+    # instantánea binaria en solo lectura y arranca sin leer todas las tareas
+    WEB_REPOSITORY_BACKEND = None
+    
+    # Persistencia: "json" (reescribe el archivo completo), "wal" (instantánea + log)
+    # o "binario" (instantánea compacta tareas.bin; JSON solo para exportar)
+    PERSISTENCE_MODE = "json"
+    # Sincronización del log WAL: "siempre", "lote" o "nunca"
+    WAL_FSYNC_POLICY = "lote"
+    # Procesos para decodificar/codificar archivos de datos JSON grandes (una tarea
+    # por línea, de 32 MB en adelante): 1 = secuencial, None = uno por núcleo
+    DATA_PROCESSES = 1
+    
+    # Guardado automático en segundo plano: espera AUTOSAVE_DELAY segundos sin
+    # cambios nuevos (como máximo AUTOSAVE_MAX_WAIT) y guarda la ráfaga de una vez
+    AUTOSAVE_ENABLED = True
+    AUTOSAVE_DELAY = 2.0
+    AUTOSAVE_MAX_WAIT = 10.0
+    
+    # Servidor HTTP de la versión web (main_web.py --servidor)
+    WEB_HOST = "127.0.0.1"
+    WEB_PORT = 8000
+    WEB_KEEPALIVE_TIMEOUT = 15.0  # Segundos que una conexión inactiva sigue abierta
+    WEB_LOG_REQUESTS = False
+    # Servidor asyncio (main_web.py --async): hilos de render y peticiones en espera
+    WEB_ASYNC_WORKERS = 4
+    WEB_ASYNC_MAX_PENDING = 64
+    # Caché de respuestas web: se invalida al cambiar la versión del repositorio;
+    # las páginas que dependen del reloj vencen antes (segundos)
+    WEB_CACHE_TTL_SHORT = 5.0
+    WEB_CACHE_TTL_LONG = 60.0
+    WEB_CACHE_MAX_ENTRIES = 256
+    # Listas completas (/tareas/<filtro>?pagina=todas): bloques de la respuesta fragmentada
+    WEB_STREAM_CHUNK_SIZE = 16 * 1024
+    
     # Configuración de usuario
     DEFAULT_USER = "usuario1"
     AVAILABLE_USERS = ["usuario1", "admin", "dev1", "dev2", "designer1", "qa1"]
@@ -29,7 +68,9 @@ class Settings:
     DEFAULT_UPCOMING_DAYS = 3  # Días para considerar tareas próximas a vencer
     
     # Configuración de interfaz
-    ITEMS_PER_PAGE = 10
+    ITEMS_PER_PAGE = 10  # Tarjetas por página en las listas web
+    API_PAGE_SIZE = 100  # Tareas por página en /api/tareas (parámetro limite)
+    API_MAX_PAGE_SIZE = 1000
     DATE_FORMAT = "%d/%m/%Y"
     DATETIME_FORMAT = "%d/%m/%Y %H:%M"
     
@@ -0,0 +1,146 @@
+"""
+🎮 CONTROLADOR: Guardado automático en segundo plano
+Un hilo guarda el repositorio cuando hay cambios, sin bloquear al controlador
+"""
+
+import time
+import datetime
+import threading
+from typing import Any, Dict, Optional
+from models.tarea_repository import TareaRepository
+
+class AutoGuardado:
+    """
+    Guardado automático con coalescencia de cambios
+    - El repositorio avisa cada cambio; el aviso solo marca trabajo pendiente
+    - Tras el primer aviso se espera `retardo` segundos sin cambios nuevos
+      (como máximo `espera_maxima`) y se guarda una sola vez toda la ráfaga
+    - La captura se toma con el bloqueo del repositorio y la escritura ocurre
+      en este hilo, fuera del bloqueo (ver TareaRepository.preparar_guardado)
+    """
+
+    def __init__(self, repository: TareaRepository, retardo: float = 2.0,
+                 espera_maxima: float = 10.0):
+        if retardo <= 0 or espera_maxima < retardo:
+            raise ValueError("Se requiere 0 < retardo <= espera_maxima")
+
+        self.repository = repository
+        self.retardo = retardo
+        self.espera_maxima = espera_maxima
+
+        self._condicion = threading.Condition()
+        self._hilo: Optional[threading.Thread] = None
+        self._detenido = False
+
+        # Avisos acumulados desde el último guardado y sus instantes (monotónicos)
+        self._avisos = 0
+        self._primer_aviso = 0.0
+        self._ultimo_aviso = 0.0
+
+        # Métricas
+        self._guardados = 0
+        self._errores = 0
+        self._ultima_latencia: Optional[float] = None
+        self._ultimo_guardado: Optional[datetime.datetime] = None
+
+        repository.suscribir_cambios(self.avisar)
+
+    # ========== CICLO DE VIDA ==========
+
+    def iniciar(self):
+        """Arranca el hilo de guardado (idempotente)"""
+        if self._hilo is not None and self._hilo.is_alive():
+            return
+        self._detenido = False
+        self._hilo = threading.Thread(target=self._ejecutar, name="autoguardado", daemon=True)
+        self._hilo.start()
+
+    def detener(self, timeout: Optional[float] = None) -> bool:
+        """
+        Detiene el hilo guardando antes los cambios pendientes
+        Devuelve False si el hilo no terminó dentro del timeout
+        """
+        with self._condicion:
+            self._detenido = True
+            self._condicion.notify()
+        if self._hilo is None:
+            return True
+        self._hilo.join(timeout)
+        return not self._hilo.is_alive()
+
+    @property
+    def activo(self) -> bool:
+        """Indica si el hilo de guardado está corriendo"""
+        return self._hilo is not None and self._hilo.is_alive()
+
+    # ========== AVISOS ==========
+
+    def avisar(self):
+        """Registra un cambio; no bloquea más que lo que tarda en tomar la condición"""
+        ahora = time.monotonic()
+        with self._condicion:
+            if self._avisos == 0:
+                self._primer_aviso = ahora
+                self._condicion.notify()
+            self._avisos += 1
+            self._ultimo_aviso = ahora
+
+    def _ejecutar(self):
+        """Ciclo del hilo: espera una ráfaga de cambios, la deja asentar y guarda"""
+        while True:
+            with self._condicion:
+                while not self._avisos and not self._detenido:
+                    self._condicion.wait()
+                if not self._avisos:
+                    return
+
+                # Coalescer: cada aviso nuevo extiende la espera hasta el máximo
+                while not self._detenido:
+                    limite = min(self._ultimo_aviso + self.retardo,
+                                 self._primer_aviso + self.espera_maxima)
+                    restante = limite - time.monotonic()
+                    if restante <= 0:
+                        break
+                    self._condicion.wait(restante)
+
+                self._avisos = 0
+
+            self._guardar()
+
+    def _guardar(self):
+        """Captura (con bloqueo) y escribe (sin bloqueo), registrando la latencia"""
+        inicio = time.perf_counter()
+        try:
+            exito = self.repository.preparar_guardado()()
+        except Exception as e:
+            print(f"Error al guardar datos: {e}")
+            exito = False
+        latencia = time.perf_counter() - inicio
+
+        with self._condicion:
+            self._ultima_latencia = latencia
+            if exito:
+                self._guardados += 1
+                self._ultimo_guardado = datetime.datetime.now()
+            else:
+                self._errores += 1
+                # Los cambios siguen pendientes: reintentar tras otro retardo
+                if not self._detenido and not self._avisos:
+                    self._avisos = 1
+                    self._primer_aviso = self._ultimo_aviso = time.monotonic()
+
+    # ========== MÉTRICAS ==========
+
+    def metricas(self) -> Dict[str, Any]:
+        """Latencia del último guardado, cambios en cola y contadores"""
+        with self._condicion:
+            return {
+                "activo": self.activo,
+                "ultima_latencia_ms": (None if self._ultima_latencia is None
+                                       else round(self._ultima_latencia * 1000, 3)),
+                "ultimo_guardado": self._ultimo_guardado,
+                "avisos_en_cola": self._avisos,
+                "cambios_en_cola": self.repository.cambios_pendientes,
+                "guardados": self._guardados,
+                "errores": self._errores
+            }
@@ -0,0 +1,102 @@
+"""
+🌐 CONTROLADOR WEB: Caché de respuestas renderizadas
+Guarda el HTML/JSON ya generado mientras la versión del repositorio no cambie
+y no venza su TTL; cada respuesta lleva un ETag para responder 304
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
+
+# Cabeceras HTTP adicionales de una respuesta (paginación, totales)
+Cabeceras = Tuple[Tuple[str, str], ...]
+Cuerpo = Union[str, bytes]
+
+
+class EntradaCache:
+    """Respuesta renderizada: cuerpo en UTF-8, cabeceras propias, ETag y validez"""
+
+    __slots__ = ("datos", "cabeceras", "etag", "version", "expira")
+
+    def __init__(self, datos: bytes, version: int, expira: float, cabeceras: Cabeceras = ()):
+        self.datos = datos
+        self.cabeceras = cabeceras
+        self.version = version
+        self.expira = expira
+        # El ETag depende solo del contenido: si al vencer el TTL se genera lo
+        # mismo, el cliente sigue recibiendo 304
+        self.etag = f'"{hashlib.blake2b(datos, digest_size=16).hexdigest()}"'
+
+    @property
+    def texto(self) -> str:
+        return self.datos.decode("utf-8")
+
+
+def etag_coincide(si_no_coincide: Optional[str], etag: str) -> bool:
+    """Evalúa la cabecera If-None-Match (lista de ETags, débiles o '*') contra un ETag"""
+    if not si_no_coincide:
+        return False
+    for candidato in si_no_coincide.split(","):
+        candidato = candidato.strip()
+        if candidato == "*":
+            return True
+        if candidato.startswith("W/"):
+            candidato = candidato[2:]
+        if candidato == etag:
+            return True
+    return False
+
+
+class CacheRespuestas:
+    """
+    Caché LRU de respuestas por clave (endpoint, filtro, usuario)
+    Una entrada sirve mientras coincida la versión del repositorio y no haya
+    vencido su TTL (las páginas que dependen del reloj usan uno corto)
+    """
+
+    def __init__(self, max_entradas: int = 256):
+        self.max_entradas = max_entradas
+        self._entradas: 'OrderedDict[Hashable, EntradaCache]' = OrderedDict()
+        self._bloqueo = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave: Hashable, version: int, ttl: float,
+                generar: Callable[[], Union[Cuerpo, Tuple[Cuerpo, Cabeceras]]]) -> EntradaCache:
+        """
+        Devuelve la entrada vigente o la genera con `generar` y la guarda
+        `generar` devuelve el cuerpo (texto o bytes UTF-8) o (cuerpo, cabeceras adicionales)
+        """
+        ahora = time.monotonic()
+        with self._bloqueo:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada.version == version and ahora < entrada.expira:
+                self._entradas.move_to_end(clave)
+                self.aciertos += 1
+                return entrada
+            self.fallos += 1
+
+        generado = generar()
+        cuerpo, cabeceras = generado if isinstance(generado, tuple) else (generado, ())
+        if isinstance(cuerpo, str):
+            cuerpo = cuerpo.encode("utf-8")
+        entrada = EntradaCache(cuerpo, version, ahora + ttl, cabeceras)
+        with self._bloqueo:
+            self._entradas[clave] = entrada
+            self._entradas.move_to_end(clave)
+            while len(self._entradas) > self.max_entradas:
+                self._entradas.popitem(last=False)
+        return entrada
+
+    def invalidar(self):
+        """Descarta todas las entradas"""
+        with self._bloqueo:
+            self._entradas.clear()
+
+    def metricas(self) -> Dict[str, int]:
+        """Entradas, aciertos y fallos"""
+        with self._bloqueo:
+            return {"entradas": len(self._entradas), "aciertos": self.aciertos,
+                    "fallos": self.fallos}
@@ -0,0 +1,208 @@
+"""
+🌐 CONTROLADOR WEB: Servidor HTTP sobre asyncio
+Las conexiones (incluidas las keep-alive inactivas) viven en el bucle de
+eventos, sin un hilo por conexión; el render y la serialización, que usan
+CPU, se delegan a un pool de hilos acotado (bloque a bloque en las respuestas
+fragmentadas)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Iterator, Optional, Tuple
+
+from controllers.web_controller import WebController
+from controllers.servidor_web import (resolver_peticion, cabeceras_respuesta, bloque_fragmentado,
+                                     Respuesta, TIPO_JSON, FIN_FRAGMENTADO)
+
+# Tope de la cabecera de una petición (línea inicial + campos)
+MAX_CABECERA = 64 * 1024
+
+
+class ServidorTareasAsync:
+    """
+    Servidor HTTP/1.1 con asyncio y las mismas rutas que ServidorTareas
+    - Cada conexión es una corrutina: miles de clientes inactivos solo ocupan sockets
+    - A lo sumo `trabajadores` renders a la vez y `max_pendientes` esperando turno;
+      el resto de las peticiones aguarda en el bucle sin encolar trabajo
+    """
+
+    def __init__(self, controller: WebController, host: str = "127.0.0.1", puerto: int = 8000,
+                 trabajadores: int = 4, max_pendientes: int = 64,
+                 timeout_keepalive: float = 15.0):
+        if trabajadores < 1 or max_pendientes < trabajadores:
+            raise ValueError("Se requiere 1 <= trabajadores <= max_pendientes")
+
+        self.controller = controller
+        self.bloqueo = controller.repository.bloqueo
+        self.host = host
+        self.puerto = puerto
+        self.timeout_keepalive = timeout_keepalive
+        self._trabajadores = trabajadores
+        self._max_pendientes = max_pendientes
+
+        self._ejecutor: Optional[ThreadPoolExecutor] = None
+        self._cupos: Optional[asyncio.Semaphore] = None
+        self._servidor: Optional[asyncio.AbstractServer] = None
+        self.conexiones_abiertas = 0
+
+    @property
+    def url(self) -> str:
+        """URL base en la que escucha el servidor (con el puerto real si se pidió el 0)"""
+        return f"http://{self.host}:{self.puerto}"
+
+    # ========== CICLO DE VIDA ==========
+
+    async def iniciar(self):
+        """Abre el socket y empieza a aceptar conexiones"""
+        self._ejecutor = ThreadPoolExecutor(self._trabajadores, thread_name_prefix="render")
+        self._cupos = asyncio.Semaphore(self._max_pendientes)
+        self._servidor = await asyncio.start_server(
+            self._atender, self.host, self.puerto, limit=MAX_CABECERA, backlog=1024)
+        self.puerto = self._servidor.sockets[0].getsockname()[1]
+
+    async def servir(self):
+        """Atiende peticiones hasta que se cancele la tarea"""
+        if self._servidor is None:
+            await self.iniciar()
+        try:
+            await self._servidor.serve_forever()
+        finally:
+            await self.detener()
+
+    async def detener(self):
+        """Deja de aceptar conexiones y libera el pool de render"""
+        if self._servidor is not None:
+            self._servidor.close()
+            await self._servidor.wait_closed()
+            self._servidor = None
+        if self._ejecutor is not None:
+            self._ejecutor.shutdown(wait=False)
+            self._ejecutor = None
+
+    # ========== CONEXIONES ==========
+
+    async def _atender(self, lector: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Atiende peticiones sucesivas de una conexión mientras siga viva"""
+        self.conexiones_abiertas += 1
+        try:
+            while True:
+                peticion = await self._leer_peticion(lector)
+                if peticion is None:
+                    break
+                metodo, objetivo, version, mantener, si_no_coincide = peticion
+
+                if metodo not in ("GET", "HEAD"):
+                    respuesta = (HTTPStatus.METHOD_NOT_ALLOWED, TIPO_JSON,
+                                 b'{"error": "Metodo no permitido"}', None, ())
+                else:
+                    respuesta = await self._resolver(objetivo, si_no_coincide)
+
+                estado, tipo, datos, etag, extra = respuesta
+                if not isinstance(datos, bytes) and version != "HTTP/1.1":
+                    # HTTP/1.0 no admite fragmentos: se arma el cuerpo completo
+                    datos = await asyncio.get_running_loop().run_in_executor(
+                        self._ejecutor, b"".join, datos)
+                    respuesta = estado, tipo, datos, etag, extra
+
+                escritor.write(self._serializar(respuesta, metodo == "HEAD", mantener))
+                await escritor.drain()
+                if not isinstance(datos, bytes) and metodo != "HEAD":
+                    if not await self._enviar_fragmentado(escritor, datos):
+                        break
+                if not mantener:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.conexiones_abiertas -= 1
+            escritor.close()
+
+    async def _leer_peticion(self, lector: asyncio.StreamReader
+                             ) -> Optional[Tuple[str, str, str, bool, Optional[str]]]:
+        """
+        Lee una petición; devuelve (método, objetivo, versión, keep-alive, If-None-Match)
+        o None si el cliente cerró, quedó inactivo más del timeout o envió algo inválido
+        """
+        try:
+            cabecera = await asyncio.wait_for(lector.readuntil(b"\r\n\r\n"),
+                                              self.timeout_keepalive)
+        except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            return None
+
+        lineas = cabecera.decode("latin-1").split("\r\n")
+        partes = lineas[0].split()
+        if len(partes) != 3 or not partes[2].startswith("HTTP/"):
+            return None
+        metodo, objetivo, version = partes
+
+        campos: Dict[str, str] = {}
+        for linea in lineas[1:]:
+            nombre, separador, valor = linea.partition(":")
+            if separador:
+                campos[nombre.strip().lower()] = valor.strip()
+
+        # Un cuerpo en GET no se usa, pero hay que consumirlo para la próxima petición
+        try:
+            longitud = int(campos.get("content-length", "0") or 0)
+        except ValueError:
+            return None
+        if longitud > 0:
+            await lector.readexactly(longitud)
+
+        conexion = campos.get("connection", "").lower()
+        if version == "HTTP/1.1":
+            mantener = conexion != "close"
+        else:
+            mantener = conexion == "keep-alive"
+        return metodo, objetivo, version, mantener, campos.get("if-none-match")
+
+    async def _resolver(self, objetivo: str, si_no_coincide: Optional[str]) -> Respuesta:
+        """Render en el pool acotado; el bucle sigue atendiendo otras conexiones"""
+        async with self._cupos:
+            bucle = asyncio.get_running_loop()
+            return await bucle.run_in_executor(self._ejecutor, resolver_peticion,
+                                               self.controller, self.bloqueo, objetivo,
+                                               si_no_coincide)
+
+    async def _enviar_fragmentado(self, escritor: asyncio.StreamWriter,
+                                  bloques: Iterator[bytes]) -> bool:
+        """
+        Genera cada bloque en el pool y lo escribe en cuanto está listo
+        Devuelve False si el render falló y la conexión debe cerrarse
+        """
+        bucle = asyncio.get_running_loop()
+        async with self._cupos:
+            try:
+                while True:
+                    bloque = await bucle.run_in_executor(self._ejecutor, next, bloques, None)
+                    if bloque is None:
+                        break
+                    escritor.write(bloque_fragmentado(bloque))
+                    await escritor.drain()
+            except ConnectionError:
+                raise
+            except Exception as e:
+                # Las cabeceras ya salieron: solo queda cerrar sin el bloque final
+                print(f"Error al enviar una respuesta fragmentada: {e}")
+                return False
+        escritor.write(FIN_FRAGMENTADO)
+        await escritor.drain()
+        return True
+
+    @staticmethod
+    def _serializar(respuesta: Respuesta, solo_cabecera: bool, mantener: bool) -> bytes:
+        """
+        Línea de estado, cabeceras y cuerpo en un único bloque de bytes
+        (sin cuerpo si este se envía fragmentado)
+        """
+        estado, tipo, datos, etag, extra = respuesta
+        estado = HTTPStatus(estado)
+        lineas = [f"HTTP/1.1 {estado.value} {estado.phrase}", "Server: TareasMVC/1.0"]
+        lineas.extend(f"{nombre}: {valor}" for nombre, valor
+                      in cabeceras_respuesta(estado, tipo, datos, etag, extra))
+        lineas.append(f"Connection: {'keep-alive' if mantener else 'close'}")
+        cabecera = ("\r\n".join(lineas) + "\r\n\r\n").encode("latin-1")
+        if solo_cabecera or not isinstance(datos, bytes):
+            return cabecera
+        return cabecera + datos
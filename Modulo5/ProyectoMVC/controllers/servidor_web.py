@@ -0,0 +1,290 @@
+"""
+🌐 CONTROLADOR WEB: Servidor HTTP persistente
+Atiende las vistas web y la API JSON sobre un único repositorio en memoria,
+sin regenerar archivos ni relanzar el proceso en cada petición. Las respuestas
+salen de la caché del controlador con su ETag (If-None-Match → 304); las listas
+completas se envían por bloques (Transfer-Encoding: chunked) mientras se generan
+"""
+
+import json
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlsplit
+
+from controllers.web_controller import WebController, FILTROS_WEB, ENDPOINTS_API
+from controllers.cache_respuestas import etag_coincide, EntradaCache, Cabeceras
+from config.settings import Settings
+
+TIPO_HTML = "text/html; charset=utf-8"
+TIPO_JSON = "application/json; charset=utf-8"
+
+# Una ruta recibe el controlador, los segmentos restantes del path y los
+# parámetros de la consulta; devuelve (estado, tipo de contenido, cuerpo, ETag,
+# cabeceras adicionales). El cuerpo son bytes o, si se genera por partes, un
+# iterador de bloques que se envía fragmentado
+Cuerpo = Union[bytes, Iterator[bytes]]
+Respuesta = Tuple[int, str, Cuerpo, Optional[str], Cabeceras]
+
+# Último bloque de una respuesta fragmentada
+FIN_FRAGMENTADO = b"0\r\n\r\n"
+Ruta = Callable[[WebController, List[str], Dict[str, str]], Respuesta]
+
+
+def _error(estado: int, mensaje: str) -> Respuesta:
+    return (estado, TIPO_JSON,
+            json.dumps({"error": mensaje}, ensure_ascii=False).encode("utf-8"), None, ())
+
+
+def _no_encontrado(mensaje: str) -> Respuesta:
+    return _error(HTTPStatus.NOT_FOUND, mensaje)
+
+
+def _desde_cache(entrada: EntradaCache, tipo: str) -> Respuesta:
+    return HTTPStatus.OK, tipo, entrada.datos, entrada.etag, entrada.cabeceras
+
+
+def _entero(parametros: Dict[str, str], nombre: str, defecto: Optional[int],
+            minimo: int) -> Optional[int]:
+    """Parámetro entero de la consulta; ValueError si no es un número >= minimo"""
+    valor = parametros.get(nombre)
+    if valor is None:
+        return defecto
+    try:
+        numero = int(valor)
+    except ValueError:
+        raise ValueError(nombre) from None
+    if numero < minimo:
+        raise ValueError(nombre)
+    return numero
+
+
+def _ruta_dashboard(controller: WebController, segmentos: List[str],
+                    parametros: Dict[str, str]) -> Respuesta:
+    """GET / y /dashboard"""
+    if segmentos:
+        return _no_encontrado("Ruta no encontrada")
+    return _desde_cache(controller.respuesta_dashboard(), TIPO_HTML)
+
+
+def _ruta_tareas(controller: WebController, segmentos: List[str],
+                 parametros: Dict[str, str]) -> Respuesta:
+    """
+    GET /tareas, /tareas/<filtro> o /tareas?filtro=<filtro>, paginadas con ?pagina=N
+    ?pagina=todas envía la lista completa por bloques, sin caché ni ETag
+    """
+    filtro = segmentos[0] if segmentos else parametros.get("filtro", "todas")
+    if len(segmentos) > 1 or filtro not in FILTROS_WEB:
+        return _no_encontrado(f"Filtro no encontrado: {filtro}")
+    if parametros.get("pagina") == "todas":
+        return HTTPStatus.OK, TIPO_HTML, controller.flujo_lista(filtro), None, ()
+    try:
+        pagina = _entero(parametros, "pagina", 1, minimo=1)
+    except ValueError:
+        return _error(HTTPStatus.BAD_REQUEST, "Página inválida")
+    return _desde_cache(controller.respuesta_lista(filtro, pagina), TIPO_HTML)
+
+
+def _ruta_api(controller: WebController, segmentos: List[str],
+              parametros: Dict[str, str]) -> Respuesta:
+    """
+    GET /api/<endpoint>
+    /api/tareas se pagina con ?limite=N y ?cursor=<último id> (o ?desde=N);
+    ?limite=todas envía todas las tareas por bloques, sin caché ni ETag
+    """
+    if len(segmentos) != 1 or segmentos[0] not in ENDPOINTS_API:
+        return _no_encontrado("Endpoint no encontrado")
+    if segmentos[0] != "tareas":
+        return _desde_cache(controller.respuesta_api(segmentos[0]), TIPO_JSON)
+    if parametros.get("limite") == "todas":
+        bloques, cabeceras = controller.flujo_api_tareas()
+        return HTTPStatus.OK, TIPO_JSON, bloques, None, cabeceras
+    try:
+        limite = _entero(parametros, "limite", Settings.API_PAGE_SIZE, minimo=1)
+        desde = _entero(parametros, "desde", 0, minimo=0)
+        cursor = _entero(parametros, "cursor", None, minimo=0)
+    except ValueError as e:
+        return _error(HTTPStatus.BAD_REQUEST, f"Parámetro inválido: {e}")
+    return _desde_cache(controller.respuesta_api_tareas(limite, desde, cursor), TIPO_JSON)
+
+
+# Primer segmento del path → ruta
+RUTAS: Dict[str, Ruta] = {
+    "": _ruta_dashboard,
+    "dashboard": _ruta_dashboard,
+    "tareas": _ruta_tareas,
+    "api": _ruta_api
+}
+
+
+def en_bloques(fragmentos: Iterable[bytes], bloqueo,
+               tamano: int = Settings.WEB_STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Agrupa los fragmentos de la vista en bloques de unos `tamano` bytes
+    Cada bloque se genera con el bloqueo del repositorio, que se suelta
+    mientras el bloque anterior viaja por la red
+    """
+    iterador = iter(fragmentos)
+    while True:
+        partes, acumulado = [], 0
+        with bloqueo:
+            for fragmento in iterador:
+                partes.append(fragmento)
+                acumulado += len(fragmento)
+                if acumulado >= tamano:
+                    break
+        if partes:
+            yield b"".join(partes)
+        if acumulado < tamano:
+            return
+
+
+def bloque_fragmentado(datos: bytes) -> bytes:
+    """Un bloque de Transfer-Encoding: chunked (tamaño en hexadecimal y datos)"""
+    return b"%x\r\n%s\r\n" % (len(datos), datos)
+
+
+def resolver_peticion(controller: WebController, bloqueo, objetivo: str,
+                      si_no_coincide: Optional[str] = None) -> Respuesta:
+    """
+    Resuelve la ruta de `objetivo` (path + consulta); si el cliente ya tiene la
+    versión vigente (If-None-Match) responde 304 sin cuerpo
+    El repositorio se lee con su bloqueo: nadie lo modifica a medias (los
+    cuerpos por partes lo toman en cada bloque)
+    """
+    url = urlsplit(objetivo)
+    segmentos = [segmento for segmento in url.path.split("/") if segmento]
+    parametros = {clave: valores[-1] for clave, valores in parse_qs(url.query).items()}
+
+    ruta = RUTAS.get(segmentos[0] if segmentos else "")
+    try:
+        if ruta is None:
+            return _no_encontrado("Ruta no encontrada")
+        with bloqueo:
+            estado, tipo, datos, etag, extra = ruta(controller, segmentos[1:], parametros)
+    except Exception as e:
+        print(f"Error al atender {objetivo}: {e}")
+        return _error(HTTPStatus.INTERNAL_SERVER_ERROR, "Error interno del servidor")
+
+    if not isinstance(datos, bytes):
+        datos = en_bloques(datos, bloqueo)
+    elif etag is not None and etag_coincide(si_no_coincide, etag):
+        return HTTPStatus.NOT_MODIFIED, tipo, b"", etag, extra
+    return estado, tipo, datos, etag, extra
+
+
+def cabeceras_respuesta(estado: int, tipo: str, datos: Cuerpo, etag: Optional[str],
+                        extra: Cabeceras = ()) -> List[Tuple[str, str]]:
+    """Cabeceras de contenido, de validación de caché y las propias de la respuesta"""
+    cabeceras = list(extra)
+    if estado != HTTPStatus.NOT_MODIFIED:
+        cabeceras.append(("Content-Type", tipo))
+        if isinstance(datos, bytes):
+            cabeceras.append(("Content-Length", str(len(datos))))
+        else:
+            cabeceras.append(("Transfer-Encoding", "chunked"))
+    if etag is not None:
+        # El cliente puede guardar la respuesta, pero debe revalidarla con el ETag
+        cabeceras.append(("ETag", etag))
+        cabeceras.append(("Cache-Control", "no-cache"))
+    return cabeceras
+
+
+class ManejadorTareas(BaseHTTPRequestHandler):
+    """
+    Manejador HTTP/1.1: la conexión queda abierta (keep-alive) mientras el
+    cliente la reutilice, así que cada respuesta lleva su Content-Length o
+    se envía fragmentada
+    """
+
+    protocol_version = "HTTP/1.1"
+    server_version = "TareasMVC/1.0"
+    # Cabeceras y cuerpo salen en escrituras separadas: sin Nagle no se espera el ACK
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        # Una conexión inactiva no retiene su hilo para siempre
+        self.timeout = self.server.timeout_keepalive
+        super().setup()
+
+    def do_GET(self):
+        self._responder(enviar_cuerpo=True)
+
+    def do_HEAD(self):
+        self._responder(enviar_cuerpo=False)
+
+    def _responder(self, enviar_cuerpo: bool):
+        """Resuelve la ruta y escribe la respuesta completa"""
+        estado, tipo, datos, etag, extra = resolver_peticion(
+            self.server.controller, self.server.bloqueo, self.path,
+            self.headers.get("If-None-Match"))
+        if not isinstance(datos, bytes) and self.request_version != "HTTP/1.1":
+            # HTTP/1.0 no admite fragmentos: se arma el cuerpo completo
+            datos = b"".join(datos)
+        self.send_response(estado)
+        for nombre, valor in cabeceras_respuesta(estado, tipo, datos, etag, extra):
+            self.send_header(nombre, valor)
+        self.end_headers()
+        if isinstance(datos, bytes):
+            if enviar_cuerpo and datos:
+                self.wfile.write(datos)
+        elif enviar_cuerpo:
+            self._enviar_fragmentado(datos)
+    
+    def _enviar_fragmentado(self, bloques: Iterator[bytes]):
+        """Escribe cada bloque en cuanto está listo; si el render falla, corta la conexión"""
+        try:
+            for bloque in bloques:
+                self.wfile.write(bloque_fragmentado(bloque))
+            self.wfile.write(FIN_FRAGMENTADO)
+        except ConnectionError:
+            self.close_connection = True
+        except Exception as e:
+            # Las cabeceras ya salieron: solo queda cerrar sin el bloque final
+            print(f"Error al enviar {self.path}: {e}")
+            self.close_connection = True
+
+    def log_message(self, formato: str, *args):
+        if self.server.registrar_peticiones:
+            super().log_message(formato, *args)
+
+
+class ServidorTareas(ThreadingHTTPServer):
+    """
+    Servidor HTTP de larga duración: un hilo por conexión y un único
+    WebController (y repositorio) compartido entre todas las peticiones
+    """
+
+    daemon_threads = True
+    # Cola de conexiones pendientes de aceptar (socketserver usa 5 por defecto)
+    request_queue_size = 1024
+
+    def __init__(self, controller: WebController, host: str = "127.0.0.1", puerto: int = 8000,
+                 timeout_keepalive: float = 15.0, registrar_peticiones: bool = False):
+        self.controller = controller
+        self.bloqueo = controller.repository.bloqueo
+        self.timeout_keepalive = timeout_keepalive
+        self.registrar_peticiones = registrar_peticiones
+        self._hilo: Optional[threading.Thread] = None
+        super().__init__((host, puerto), ManejadorTareas)
+
+    @property
+    def url(self) -> str:
+        """URL base en la que escucha el servidor (con el puerto real si se pidió el 0)"""
+        host, puerto = self.server_address[:2]
+        return f"http://{host}:{puerto}"
+
+    def iniciar_en_segundo_plano(self) -> threading.Thread:
+        """Atiende peticiones en otro hilo (para demos y pruebas de carga)"""
+        self._hilo = threading.Thread(target=self.serve_forever, name="servidor-web", daemon=True)
+        self._hilo.start()
+        return self._hilo
+
+    def detener(self):
+        """Deja de atender peticiones y libera el puerto"""
+        if self._hilo is not None:
+            self.shutdown()
+            self._hilo.join()
+            self._hilo = None
+        self.server_close()
@@ -5,10 +5,12 @@ No contiene lógica de negocio ni presentación
 """
 
 import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from models.tarea import Tarea, EstadoTarea, PrioridadTarea
 from models.tarea_repository import TareaRepository
+from models.importacion import leer_registros
 from views.tarea_view import TareaView
+from controllers.autoguardado import AutoGuardado
 
 class TareaController:
     """
@@ -16,9 +18,11 @@ class TareaController:
     Orquesta la comunicación entre Modelo y Vista
     """
     
-    def __init__(self, repository: TareaRepository, view: TareaView):
+    def __init__(self, repository: TareaRepository, view: TareaView,
+                 autoguardado: Optional[AutoGuardado] = None):
         self.repository = repository
         self.view = view
+        self.autoguardado = autoguardado
         self.usuario_actual = "usuario1"  # Usuario por defecto
     
     # ========== GESTIÓN DE USUARIO ==========
@@ -70,18 +74,21 @@ class TareaController:
             prioridad = list(PrioridadTarea)[prioridad_idx - 1]
             
             # Crear tarea usando el repositorio
-            tarea = self.repository.crear_tarea(
-                titulo=titulo,
-                descripcion=descripcion,
-                usuario_asignado=usuario_asignado,
-                prioridad=prioridad
-            )
+            with self.repository.bloqueo:
+                tarea = self.repository.crear_tarea(
+                    titulo=titulo,
+                    descripcion=descripcion,
+                    usuario_asignado=usuario_asignado,
+                    prioridad=prioridad
+                )
             
             # Preguntar por fecha de vencimiento (opcional)
             if self.view.confirmar_accion("¿Desea establecer fecha de vencimiento?"):
                 fecha_vencimiento = self.view.solicitar_fecha("Fecha de vencimiento")
                 if fecha_vencimiento:
-                    if not tarea.establecer_fecha_vencimiento(fecha_vencimiento):
+                    with self.repository.bloqueo:
+                        fecha_establecida = tarea.establecer_fecha_vencimiento(fecha_vencimiento)
+                    if not fecha_establecida:
                         self.view.mostrar_mensaje_advertencia("No se pudo establecer la fecha de vencimiento")
             
             # Preguntar por etiquetas (opcional)
@@ -89,8 +96,9 @@ class TareaController:
                 etiquetas_str = self.view.solicitar_entrada("Etiquetas (separadas por comas)", requerido=False)
                 if etiquetas_str:
                     etiquetas = [e.strip() for e in etiquetas_str.split(",") if e.strip()]
-                    for etiqueta in etiquetas:
-                        tarea.agregar_etiqueta(etiqueta)
+                    with self.repository.bloqueo:
+                        for etiqueta in etiquetas:
+                            tarea.agregar_etiqueta(etiqueta)
             
             # Mostrar tarea creada
             self.view.mostrar_mensaje_exito(f"Tarea '{titulo}' creada exitosamente con ID: {tarea.id}")
@@ -178,7 +186,8 @@ class TareaController:
                     break
             
             # Actualizar en repositorio
-            self.repository.actualizar_tarea(tarea)
+            with self.repository.bloqueo:
+                self.repository.actualizar_tarea(tarea)
             self.view.mostrar_mensaje_exito("Tarea actualizada exitosamente")
             
             return True
@@ -215,14 +224,18 @@ class TareaController:
             
             if tipo_eliminacion == 1:
                 # Marcar como cancelada
-                if self.repository.eliminar_tarea(tarea_id):
+                with self.repository.bloqueo:
+                    cancelada = self.repository.eliminar_tarea(tarea_id)
+                if cancelada:
                     self.view.mostrar_mensaje_exito(f"Tarea '{tarea.titulo}' marcada como cancelada")
                 else:
                     self.view.mostrar_mensaje_error("No se pudo cancelar la tarea")
                     return False
             else:
                 # Eliminar definitivamente
-                if self.repository.eliminar_definitivamente(tarea_id):
+                with self.repository.bloqueo:
+                    eliminada = self.repository.eliminar_definitivamente(tarea_id)
+                if eliminada:
                     self.view.mostrar_mensaje_exito(f"Tarea '{tarea.titulo}' eliminada definitivamente")
                 else:
                     self.view.mostrar_mensaje_error("No se pudo eliminar la tarea")
@@ -238,8 +251,8 @@ class TareaController:
     
     def listar_todas_tareas(self):
         """Lista todas las tareas"""
-        tareas = self.repository.obtener_todas_tareas()
-        tareas_ordenadas = self.repository.ordenar_por_prioridad(tareas)
+        # El repositorio mantiene el orden por prioridad: se lee sin reordenar
+        tareas_ordenadas = self.repository.ordenar_por_prioridad()
         self.view.mostrar_lista_tareas(tareas_ordenadas, "Todas las Tareas")
     
     def listar_mis_tareas(self):
@@ -332,12 +345,50 @@ class TareaController:
             self.view.mostrar_mensaje_error("Error al guardar datos")
             return False
     
+    def importar_tareas_interactiva(self) -> bool:
+        """Importa tareas en bloque desde un archivo JSON Lines o CSV"""
+        ruta = self.view.solicitar_entrada("Ruta del archivo (.jsonl o .csv)")
+        try:
+            resultado = self.repository.importar_tareas(leer_registros(ruta))
+        except (OSError, ValueError) as e:
+            self.view.mostrar_mensaje_error(f"Error al importar tareas: {e}")
+            return False
+        
+        if resultado.importadas:
+            self.view.mostrar_mensaje_exito(
+                f"Se importaron {resultado.importadas} tareas "
+                f"(IDs {resultado.primer_id} a {resultado.ultimo_id})")
+        else:
+            self.view.mostrar_mensaje_info("No se importó ninguna tarea")
+        
+        if resultado.total_rechazadas:
+            self.view.mostrar_mensaje_advertencia(
+                f"{resultado.total_rechazadas} registros rechazados")
+            for numero, mensaje in resultado.rechazadas[:10]:
+                print(f"   Registro {numero}: {mensaje}")
+        
+        return resultado.importadas > 0
+    
+    def detener_autoguardado(self) -> bool:
+        """Detiene el guardado automático (guarda antes lo pendiente); False si no había"""
+        if self.autoguardado is None:
+            return False
+        
+        if not self.autoguardado.detener():
+            self.view.mostrar_mensaje_advertencia("El guardado automático no terminó a tiempo")
+        return True
+    
+    def obtener_metricas_autoguardado(self) -> Optional[Dict[str, Any]]:
+        """Métricas del guardado automático (None si está desactivado)"""
+        return self.autoguardado.metricas() if self.autoguardado else None
+    
     def limpiar_tareas_canceladas(self) -> bool:
         """Limpia las tareas canceladas del sistema"""
         if not self.view.confirmar_accion("¿Desea eliminar definitivamente todas las tareas canceladas?"):
             return False
         
-        cantidad = self.repository.limpiar_tareas_canceladas()
+        with self.repository.bloqueo:
+            cantidad = self.repository.limpiar_tareas_canceladas()
         if cantidad > 0:
             self.view.mostrar_mensaje_exito(f"Se eliminaron {cantidad} tareas canceladas")
         else:
@@ -353,7 +404,9 @@ class TareaController:
         estado_idx = self.view.solicitar_numero("Nuevo estado", 1, len(EstadoTarea))
         nuevo_estado = list(EstadoTarea)[estado_idx - 1]
         
-        if tarea.cambiar_estado(nuevo_estado):
+        with self.repository.bloqueo:
+            cambiado = tarea.cambiar_estado(nuevo_estado)
+        if cambiado:
             self.view.mostrar_mensaje_exito(f"Estado cambiado a: {nuevo_estado.value}")
         else:
             self.view.mostrar_mensaje_error("No se puede cambiar a ese estado")
@@ -364,7 +417,9 @@ class TareaController:
         prioridad_idx = self.view.solicitar_numero("Nueva prioridad", 1, len(PrioridadTarea))
         nueva_prioridad = list(PrioridadTarea)[prioridad_idx - 1]
         
-        if tarea.cambiar_prioridad(nueva_prioridad):
+        with self.repository.bloqueo:
+            cambiada = tarea.cambiar_prioridad(nueva_prioridad)
+        if cambiada:
             self.view.mostrar_mensaje_exito(f"Prioridad cambiada a: {nueva_prioridad.value}")
         else:
             self.view.mostrar_mensaje_error("No se puede cambiar la prioridad")
@@ -373,7 +428,9 @@ class TareaController:
         """Modifica el usuario asignado de una tarea"""
         nuevo_usuario = self.view.solicitar_entrada("Nuevo usuario asignado")
         
-        if tarea.asignar_usuario(nuevo_usuario):
+        with self.repository.bloqueo:
+            asignado = tarea.asignar_usuario(nuevo_usuario)
+        if asignado:
             self.view.mostrar_mensaje_exito(f"Usuario asignado cambiado a: {nuevo_usuario}")
         else:
             self.view.mostrar_mensaje_error("No se puede cambiar el usuario asignado")
@@ -382,15 +439,19 @@ class TareaController:
         """Modifica el título de una tarea"""
         nuevo_titulo = self.view.solicitar_entrada("Nuevo título")
         
-        if nuevo_titulo:
-            tarea.titulo = nuevo_titulo
+        if not nuevo_titulo:
+            return
+        with self.repository.bloqueo:
+            cambiado = tarea.cambiar_titulo(nuevo_titulo)
+        if cambiado:
             self.view.mostrar_mensaje_exito("Título actualizado")
     
     def _modificar_descripcion_tarea(self, tarea: Tarea):
         """Modifica la descripción de una tarea"""
         nueva_descripcion = self.view.solicitar_entrada("Nueva descripción", requerido=False)
         
-        tarea.descripcion = nueva_descripcion or "Sin descripción"
+        with self.repository.bloqueo:
+            tarea.cambiar_descripcion(nueva_descripcion or "Sin descripción")
         self.view.mostrar_mensaje_exito("Descripción actualizada")
     
     def _modificar_fecha_vencimiento_tarea(self, tarea: Tarea):
@@ -398,19 +459,24 @@ class TareaController:
         fecha_vencimiento = self.view.solicitar_fecha("Nueva fecha de vencimiento")
         
         if fecha_vencimiento:
-            if tarea.establecer_fecha_vencimiento(fecha_vencimiento):
+            with self.repository.bloqueo:
+                establecida = tarea.establecer_fecha_vencimiento(fecha_vencimiento)
+            if establecida:
                 self.view.mostrar_mensaje_exito("Fecha de vencimiento actualizada")
             else:
                 self.view.mostrar_mensaje_error("No se pudo establecer la fecha de vencimiento")
         else:
-            tarea.fecha_vencimiento = None
+            with self.repository.bloqueo:
+                tarea.quitar_fecha_vencimiento()
             self.view.mostrar_mensaje_exito("Fecha de vencimiento eliminada")
     
     def _agregar_etiqueta_tarea(self, tarea: Tarea):
         """Agrega una etiqueta a una tarea"""
         etiqueta = self.view.solicitar_entrada("Nueva etiqueta")
         
-        if tarea.agregar_etiqueta(etiqueta):
+        with self.repository.bloqueo:
+            agregada = tarea.agregar_etiqueta(etiqueta)
+        if agregada:
             self.view.mostrar_mensaje_exito(f"Etiqueta '{etiqueta}' agregada")
         else:
             self.view.mostrar_mensaje_error("La etiqueta ya existe o es inválida")
@@ -424,7 +490,9 @@ class TareaController:
         self.view.mostrar_mensaje_info(f"Etiquetas actuales: {', '.join(tarea.etiquetas)}")
         etiqueta = self.view.solicitar_entrada("Etiqueta a remover")
         
-        if tarea.remover_etiqueta(etiqueta):
+        with self.repository.bloqueo:
+            removida = tarea.remover_etiqueta(etiqueta)
+        if removida:
             self.view.mostrar_mensaje_exito(f"Etiqueta '{etiqueta}' removida")
         else:
             self.view.mostrar_mensaje_error("Etiqueta no encontrada")
@@ -433,7 +501,9 @@ class TareaController:
         """Agrega un comentario a una tarea"""
         comentario = self.view.solicitar_entrada("Comentario")
         
-        if tarea.agregar_comentario(comentario, self.usuario_actual):
+        with self.repository.bloqueo:
+            agregado = tarea.agregar_comentario(comentario, self.usuario_actual)
+        if agregado:
             self.view.mostrar_mensaje_exito("Comentario agregado")
         else:
             self.view.mostrar_mensaje_error("No se pudo agregar el comentario")
@@ -443,7 +513,9 @@ class TareaController:
         try:
             horas = float(self.view.solicitar_entrada("Tiempo estimado en horas"))
             
-            if tarea.establecer_tiempo_estimado(horas):
+            with self.repository.bloqueo:
+                establecido = tarea.establecer_tiempo_estimado(horas)
+            if establecido:
                 self.view.mostrar_mensaje_exito(f"Tiempo estimado establecido: {horas} horas")
             else:
                 self.view.mostrar_mensaje_error("Tiempo inválido")
@@ -455,7 +527,9 @@ class TareaController:
         try:
             horas = float(self.view.solicitar_entrada("Horas trabajadas"))
             
-            if tarea.registrar_tiempo_real(horas):
+            with self.repository.bloqueo:
+                registrado = tarea.registrar_tiempo_real(horas)
+            if registrado:
                 total = tarea.tiempo_real_horas or 0
                 self.view.mostrar_mensaje_exito(f"Tiempo registrado. Total: {total} horas")
             else:
@@ -5,8 +5,22 @@ Demuestra MVC: mismo modelo, controlador adaptado, nueva vista
 
 import webbrowser
 import os
+from typing import Callable, Hashable, Iterator, List, Optional, Tuple
+from models.tarea import Tarea
 from models.tarea_repository import TareaRepository
 from views.web.tarea_web_view import TareaWebView
+from controllers.cache_respuestas import CacheRespuestas, EntradaCache, Cabeceras
+from config.settings import Settings
+
+# Filtros de la lista web y endpoints de la API JSON
+FILTROS_WEB = ("todas", "mis_tareas", "urgentes", "vencidas")
+ENDPOINTS_API = ("dashboard", "tareas", "urgentes")
+
+# Respuestas que cambian con el reloj (vencimientos, urgencias): TTL corto
+RESPUESTAS_TEMPORALES = {
+    ("dashboard", ""), ("lista", "urgentes"), ("lista", "vencidas"),
+    ("api", "dashboard"), ("api", "tareas"), ("api", "urgentes")
+}
 
 class WebController:
     """
@@ -14,12 +28,76 @@ class WebController:
     Reutiliza el mismo modelo, pero adapta la coordinación para web
     """
     
-    def __init__(self, repository: TareaRepository):
+    def __init__(self, repository: TareaRepository, cache: Optional[CacheRespuestas] = None):
         self.repository = repository
-        self.web_view = TareaWebView()
+        # El JSON de la API reutiliza el de cada tarea cacheado por el repositorio
+        self.web_view = TareaWebView(repository.fragmento_json)
         self.usuario_actual = "usuario1"
+        self.cache = cache if cache is not None else CacheRespuestas(Settings.WEB_CACHE_MAX_ENTRIES)
+    
+    # ========== RESPUESTAS CACHEADAS ==========
+    
+    def _cacheada(self, endpoint: str, filtro: str, generar: Callable,
+                  variante: Hashable = None) -> EntradaCache:
+        """
+        Respuesta de la caché para (endpoint, filtro, usuario) en la versión actual
+        `variante` distingue páginas de una misma respuesta
+        """
+        ttl = (Settings.WEB_CACHE_TTL_SHORT if (endpoint, filtro) in RESPUESTAS_TEMPORALES
+               else Settings.WEB_CACHE_TTL_LONG)
+        return self.cache.obtener((endpoint, filtro, variante, self.usuario_actual),
+                                  self.repository.version, ttl, generar)
+    
+    def respuesta_dashboard(self) -> EntradaCache:
+        """Dashboard HTML (cacheado)"""
+        return self._cacheada("dashboard", "", self._renderizar_dashboard)
+    
+    def respuesta_lista(self, filtro: str = "todas", pagina: Optional[int] = None) -> EntradaCache:
+        """
+        Lista de tareas HTML (cacheada); un filtro desconocido usa la lista completa
+        Con `pagina` (desde 1) solo se renderizan ITEMS_PER_PAGE tarjetas
+        """
+        if filtro not in FILTROS_WEB:
+            filtro = "otro"
+        if pagina is not None:
+            pagina = max(pagina, 1)
+        return self._cacheada("lista", filtro, lambda: self._renderizar_lista(filtro, pagina),
+                              pagina)
+    
+    def respuesta_api_tareas(self, limite: int = Settings.API_PAGE_SIZE, desde: int = 0,
+                             cursor: Optional[int] = None) -> EntradaCache:
+        """
+        Página de /api/tareas en orden de ID, por cursor (IDs mayores que `cursor`)
+        o por desplazamiento (`desde`); el total y el siguiente tramo van en cabeceras
+        """
+        limite = max(1, min(limite, Settings.API_MAX_PAGE_SIZE))
+        desde = max(desde, 0)
+        variante = ("cursor", cursor, limite) if cursor is not None else ("desde", desde, limite)
+        return self._cacheada("api", "tareas",
+                              lambda: self._renderizar_api_tareas(limite, desde, cursor), variante)
+    
+    def respuesta_api(self, endpoint: str) -> EntradaCache:
+        """Respuesta JSON de la API (cacheada salvo endpoints desconocidos)"""
+        if endpoint not in ENDPOINTS_API:
+            datos = self.web_view.renderizar_json_api({"error": "Endpoint no encontrado"})
+            return EntradaCache(datos, self.repository.version, 0.0)
+        return self._cacheada("api", endpoint, lambda: self._renderizar_api(endpoint))
     
     def generar_dashboard_web(self) -> str:
+        """Genera dashboard web completo"""
+        return self.respuesta_dashboard().texto
+    
+    def generar_lista_tareas_web(self, filtro: str = "todas", pagina: Optional[int] = None) -> str:
+        """Genera lista de tareas en formato web (todas, o una página)"""
+        return self.respuesta_lista(filtro, pagina).texto
+    
+    def generar_api_json(self, endpoint: str) -> str:
+        """Genera respuestas JSON para API REST"""
+        return self.respuesta_api(endpoint).texto
+    
+    # ========== RENDER ==========
+    
+    def _renderizar_dashboard(self) -> bytes:
         """Genera dashboard web completo"""
         # Usar el MISMO modelo que la versión consola
         estadisticas = self.repository.obtener_estadisticas_generales()
@@ -28,17 +106,25 @@ class WebController:
         tareas_proximas = self.repository.obtener_tareas_con_vencimiento_proximo(3)
         
         # Usar la NUEVA vista web
-        html = self.web_view.generar_dashboard_html(
+        html = self.web_view.renderizar_dashboard(
             estadisticas, tareas_urgentes, tareas_vencidas, tareas_proximas
         )
         
         return html
     
-    def generar_lista_tareas_web(self, filtro: str = "todas") -> str:
-        """Genera lista de tareas en formato web"""
+    def flujo_lista(self, filtro: str = "todas") -> Iterator[bytes]:
+        """
+        Lista completa de tareas HTML por fragmentos y sin caché: se envía a medida
+        que se genera, sin tener la página entera en memoria
+        """
+        tareas, titulo = self._tareas_de_lista(filtro)
+        return self.web_view.iterar_lista_tareas_html(tareas, titulo)
+    
+    def _filtro_de_lista(self, filtro: str) -> Tuple[Optional[List[Tarea]], str]:
+        """Tareas del filtro (None = todas, en el orden del repositorio) y título de la lista"""
         # Usar el MISMO modelo con diferentes filtros
         if filtro == "todas":
-            tareas = self.repository.obtener_todas_tareas()
+            tareas = None
             titulo = "Todas las Tareas"
         elif filtro == "mis_tareas":
             tareas = self.repository.obtener_tareas_por_usuario(self.usuario_actual)
@@ -50,33 +136,93 @@ class WebController:
             tareas = self.repository.obtener_tareas_vencidas()
             titulo = "Tareas Vencidas"
         else:
-            tareas = self.repository.obtener_todas_tareas()
+            tareas = None
             titulo = "Lista de Tareas"
+        return tareas, titulo
+    
+    def _tareas_de_lista(self, filtro: str) -> Tuple[List[Tarea], str]:
+        """Tareas del filtro ordenadas por prioridad y título de la lista"""
+        tareas, titulo = self._filtro_de_lista(filtro)
+        # Ordenar por prioridad (reutilizando lógica del modelo); sin filtro el
+        # repositorio ya mantiene ese orden
+        return self.repository.ordenar_por_prioridad(tareas), titulo
+    
+    def _renderizar_lista(self, filtro: str, pagina: Optional[int] = None) -> bytes:
+        """Genera lista de tareas en formato web"""
+        if pagina is None:
+            tareas_ordenadas, titulo = self._tareas_de_lista(filtro)
+            return self.web_view.renderizar_lista_tareas(tareas_ordenadas, titulo)
         
-        # Ordenar por prioridad (reutilizando lógica del modelo)
-        tareas_ordenadas = self.repository.ordenar_por_prioridad(tareas)
+        # Solo se obtienen y renderizan las tarjetas de la página pedida
+        tareas, titulo = self._filtro_de_lista(filtro)
+        total = len(self.repository) if tareas is None else len(tareas)
+        por_pagina = Settings.ITEMS_PER_PAGE
+        total_paginas = max(1, -(-total // por_pagina))
+        pagina = min(pagina, total_paginas)
+        inicio = (pagina - 1) * por_pagina
+        
+        if tareas is None:
+            # Tramo del orden mantenido por el repositorio
+            tareas_pagina = self.repository.obtener_tareas_ordenadas("prioridad", inicio, por_pagina)
+        else:
+            # Primeras inicio + por_pagina del filtro con un heap, sin ordenarlo entero
+            tareas_pagina = self.repository.obtener_primeras(
+                inicio + por_pagina, "prioridad", tareas)[inicio:]
         
         # Usar la NUEVA vista web
-        html = self.web_view.generar_lista_tareas_html(tareas_ordenadas, titulo)
+        html = self.web_view.renderizar_lista_tareas(
+            tareas_pagina, titulo,
+            pagina=pagina, total_paginas=total_paginas, total=total, enlace=f"/tareas/{filtro}"
+        )
         
         return html
     
-    def generar_api_json(self, endpoint: str) -> str:
+    def _renderizar_api_tareas(self, limite: int, desde: int,
+                               cursor: Optional[int]) -> Tuple[bytes, Cabeceras]:
+        """Página de tareas en JSON con X-Total-Count y, si hay más, el siguiente tramo"""
+        if cursor is not None:
+            tareas = self.repository.obtener_tareas_despues_de(cursor, limite)
+        else:
+            tareas = self.repository.obtener_tareas_pagina(desde, limite)
+        
+        total = len(self.repository)
+        cabeceras = [("X-Total-Count", str(total))]
+        if len(tareas) == limite:
+            siguiente = tareas[-1].id
+            cabeceras.append(("X-Next-Cursor", str(siguiente)))
+            if cursor is not None:
+                enlace = f"/api/tareas?cursor={siguiente}&limite={limite}"
+            else:
+                enlace = f"/api/tareas?desde={desde + limite}&limite={limite}"
+            cabeceras.append(("Link", f'<{enlace}>; rel="next"'))
+        
+        return self.web_view.renderizar_json_api(tareas), tuple(cabeceras)
+    
+    def flujo_api_tareas(self) -> Tuple[Iterator[bytes], Cabeceras]:
+        """
+        Todas las tareas en JSON por bloques y sin caché, con su X-Total-Count
+        El reloj se lee una vez para toda la respuesta
+        """
+        tareas = self.repository.obtener_todas_tareas()
+        return (self.web_view.serializador_json.iterar(tareas),
+                (("X-Total-Count", str(len(tareas))),))
+    
+    def _renderizar_api(self, endpoint: str) -> bytes:
         """Genera respuestas JSON para API REST"""
         if endpoint == "dashboard":
             estadisticas = self.repository.obtener_estadisticas_generales()
-            return self.web_view.generar_json_api(estadisticas)
+            return self.web_view.renderizar_json_api(estadisticas)
         
         elif endpoint == "tareas":
             tareas = self.repository.obtener_todas_tareas()
-            return self.web_view.generar_json_api(tareas)
+            return self.web_view.renderizar_json_api(tareas)
         
         elif endpoint == "urgentes":
             tareas = self.repository.obtener_tareas_urgentes()
-            return self.web_view.generar_json_api(tareas)
+            return self.web_view.renderizar_json_api(tareas)
         
         else:
-            return self.web_view.generar_json_api({"error": "Endpoint no encontrado"})
+            return self.web_view.renderizar_json_api({"error": "Endpoint no encontrado"})
     
     def abrir_en_navegador(self, contenido_html: str, nombre_archivo: str = "dashboard.html"):
         """Guarda HTML y lo abre en el navegador"""
@@ -10,7 +10,7 @@ import os
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from models.tarea_repository import TareaRepository
+from models.repositorios import crear_repositorio
 from controllers.web_controller import WebController
 from config.settings import Settings
 
@@ -24,7 +24,9 @@ def demo_automatica():
     Settings.ensure_data_dir()
     
     # REUTILIZAR EL MISMO MODELO que la versión consola
-    repository = TareaRepository(Settings.get_data_file_path())
+    repository = crear_repositorio(Settings.get_data_file_path(), Settings.REPOSITORY_BACKEND,
+                                   Settings.PERSISTENCE_MODE, Settings.WAL_FSYNC_POLICY,
+                                   Settings.DATA_PROCESSES)
     
     # NUEVO CONTROLADOR adaptado para web
     web_controller = WebController(repository)
@@ -10,9 +10,10 @@ import os
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from models.tarea_repository import TareaRepository
+from models.repositorios import crear_repositorio
 from views.tarea_view import TareaView
 from controllers.tarea_controller import TareaController
+from controllers.autoguardado import AutoGuardado
 from config.settings import Settings
 
 class AplicacionMVC:
@@ -25,9 +26,16 @@ class AplicacionMVC:
         Settings.ensure_data_dir()
         
         # Inicializar componentes MVC
-        self.repository = TareaRepository(Settings.get_data_file_path())
+        self.repository = crear_repositorio(Settings.get_data_file_path(), Settings.REPOSITORY_BACKEND,
+                                            Settings.PERSISTENCE_MODE, Settings.WAL_FSYNC_POLICY,
+                                            Settings.DATA_PROCESSES)
         self.view = TareaView()
-        self.controller = TareaController(self.repository, self.view)
+        self.autoguardado = None
+        if Settings.AUTOSAVE_ENABLED:
+            self.autoguardado = AutoGuardado(self.repository, Settings.AUTOSAVE_DELAY,
+                                             Settings.AUTOSAVE_MAX_WAIT)
+            self.autoguardado.iniciar()
+        self.controller = TareaController(self.repository, self.view, self.autoguardado)
         
         print(f"🏗️ {Settings.APP_NAME} v{Settings.APP_VERSION}")
         print("="*60)
@@ -203,10 +211,11 @@ class AplicacionMVC:
             print("3. Limpiar tareas canceladas")
             print("4. Guardar datos")
             print("5. Recargar datos")
-            print("6. Volver al menú principal")
+            print("6. Importar tareas (JSON Lines / CSV)")
+            print("7. Volver al menú principal")
             
             try:
-                opcion = self.view.solicitar_numero("Seleccione opción", 1, 6)
+                opcion = self.view.solicitar_numero("Seleccione opción", 1, 7)
                 
                 if opcion == 1:
                     self.cambiar_usuario()
@@ -224,9 +233,12 @@ class AplicacionMVC:
                     self.recargar_datos()
                     
                 elif opcion == 6:
+                    self.controller.importar_tareas_interactiva()
+                    
+                elif opcion == 7:
                     break
                 
-                if opcion != 6:
+                if opcion != 7:
                     self.view.pausar()
                     
             except Exception as e:
@@ -264,6 +276,16 @@ class AplicacionMVC:
         print(f"✅ Tareas completadas: {estadisticas['tareas_completadas']}")
         print(f"❌ Tareas canceladas: {estadisticas['por_estado'].get('cancelada', 0)}")
         print()
+        metricas = self.controller.obtener_metricas_autoguardado()
+        if metricas:
+            latencia = metricas['ultima_latencia_ms']
+            print(f"💾 Autoguardado: {metricas['guardados']} guardados, "
+                  f"{metricas['errores']} errores")
+            print(f"   Última latencia: {'-' if latencia is None else f'{latencia} ms'}")
+            print(f"   Cambios en cola: {metricas['cambios_en_cola']}")
+        else:
+            print("💾 Autoguardado: desactivado")
+        print()
         print("🏗️ ARQUITECTURA MVC:")
         print("   📦 Modelo: TareaRepository + Tarea")
         print("   👁️ Vista: TareaView")
@@ -277,23 +299,27 @@ class AplicacionMVC:
             print(f"\n💾 EXPORTAR DATOS")
             print("="*20)
             print("1. Exportar como JSON")
-            print("2. Cancelar")
+            print("2. Exportar como JSON Lines")
+            print("3. Exportar como CSV")
+            print("4. Cancelar")
             
-            opcion = self.view.solicitar_numero("Seleccione formato", 1, 2)
+            opcion = self.view.solicitar_numero("Seleccione formato", 1, 4)
             
-            if opcion == 1:
-                datos_json = self.repository.exportar_datos("json")
+            if opcion in (1, 2, 3):
+                formato = ("json", "jsonl", "csv")[opcion - 1]
                 
                 # Generar nombre de archivo con timestamp
                 import datetime
                 timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                nombre_archivo = f"tareas_export_{timestamp}.json"
+                nombre_archivo = f"tareas_export_{timestamp}.{formato}"
                 archivo_path = Settings.get_data_file_path(nombre_archivo)
                 
-                with open(archivo_path, 'w', encoding='utf-8') as f:
-                    f.write(datos_json)
+                # Se escribe tarea por tarea, sin armar todo el texto en memoria
+                with open(archivo_path, 'w', encoding='utf-8',
+                          newline='' if formato == "csv" else None) as f:
+                    cantidad = self.repository.exportar_a_archivo(f, formato)
                 
-                self.view.mostrar_mensaje_exito(f"Datos exportados a: {archivo_path}")
+                self.view.mostrar_mensaje_exito(f"{cantidad} tareas exportadas a: {archivo_path}")
             
         except Exception as e:
             self.view.mostrar_mensaje_error(f"Error al exportar datos: {e}")
@@ -302,7 +328,10 @@ class AplicacionMVC:
         """Recarga los datos desde archivo"""
         if self.view.confirmar_accion("¿Desea recargar los datos? Se perderán los cambios no guardados"):
             try:
-                if self.repository.cargar_datos():
+                # El autoguardado puede estar capturando las tareas desde su hilo
+                with self.repository.bloqueo:
+                    recargados = self.repository.cargar_datos()
+                if recargados:
                     self.view.mostrar_mensaje_exito("Datos recargados exitosamente")
                 else:
                     self.view.mostrar_mensaje_error("Error al recargar datos")
@@ -314,8 +343,12 @@ class AplicacionMVC:
         print(f"\n👋 FINALIZANDO {Settings.APP_NAME}")
         print("="*50)
         
-        # Preguntar si desea guardar antes de salir
-        if self.view.confirmar_accion("¿Desea guardar los datos antes de salir?"):
+        # El autoguardado escribe lo pendiente al detenerse; solo se pregunta
+        # si está desactivado o si algo quedó sin guardar
+        autoguardado = self.controller.detener_autoguardado()
+        if autoguardado and not self.repository.cambios_pendientes:
+            self.view.mostrar_mensaje_info("Cambios guardados automáticamente")
+        elif self.view.confirmar_accion("¿Desea guardar los datos antes de salir?"):
             if self.controller.guardar_datos():
                 self.view.mostrar_mensaje_exito("Datos guardados exitosamente")
             else:
@@ -326,6 +359,7 @@ class AplicacionMVC:
         print(f"\n📊 ESTADÍSTICAS DE LA SESIÓN:")
         print(f"   Total de tareas procesadas: {estadisticas['total_tareas']}")
         print(f"   Usuario: {self.controller.obtener_usuario_actual()}")
+        self.repository.cerrar()
         
         print(f"\n🏗️ DEMOSTRACIÓN MVC COMPLETADA:")
         print("✅ Modelo: Gestión de datos y lógica de negocio")
@@ -6,12 +6,15 @@ Demuestra la ventaja de MVC: cambiar la vista sin afectar modelo/controlador
 
 import sys
 import os
+import asyncio
 
 # Agregar el directorio raíz al path para imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from models.tarea_repository import TareaRepository
-from controllers.web_controller import WebController
+from models.repositorios import crear_repositorio
+from controllers.web_controller import WebController, FILTROS_WEB, ENDPOINTS_API
+from controllers.servidor_web import ServidorTareas
+from controllers.servidor_async import ServidorTareasAsync
 from config.settings import Settings
 
 class AplicacionMVCWeb:
@@ -24,7 +27,10 @@ class AplicacionMVCWeb:
         Settings.ensure_data_dir()
         
         # REUTILIZAR EL MISMO MODELO que la versión consola
-        self.repository = TareaRepository(Settings.get_data_file_path())
+        backend = Settings.WEB_REPOSITORY_BACKEND or Settings.REPOSITORY_BACKEND
+        self.repository = crear_repositorio(Settings.get_data_file_path(), backend,
+                                            Settings.PERSISTENCE_MODE, Settings.WAL_FSYNC_POLICY,
+                                            Settings.DATA_PROCESSES)
         
         # NUEVO CONTROLADOR adaptado para web
         self.web_controller = WebController(self.repository)
@@ -61,11 +67,12 @@ class AplicacionMVCWeb:
             print("6. 🔗 API JSON (dashboard)")
             print("7. 🔗 API JSON (todas las tareas)")
             print("8. 🎭 Demostración completa MVC")
-            print("9. 🚪 Salir")
+            print("9. 🖧 Servidor HTTP")
+            print("10. 🚪 Salir")
             print("-"*40)
             
             try:
-                opcion = input("Seleccione una opción (1-9): ").strip()
+                opcion = input("Seleccione una opción (1-10): ").strip()
                 
                 if opcion == "1":
                     self.generar_dashboard()
@@ -92,13 +99,16 @@ class AplicacionMVCWeb:
                     self.demostracion_completa()
                     
                 elif opcion == "9":
+                    self.servir()
+                    
+                elif opcion == "10":
                     print("👋 ¡Hasta luego!")
                     break
                     
                 else:
                     print("❌ Opción no válida")
                 
-                if opcion != "9":
+                if opcion != "10":
                     input("\nPresiona Enter para continuar...")
                     
             except Exception as e:
@@ -220,6 +230,39 @@ class AplicacionMVCWeb:
         except Exception as e:
             print(f"❌ Error generando API JSON: {e}")
     
+    def servir(self):
+        """Atiende las vistas web por HTTP hasta Ctrl+C"""
+        servidor = ServidorTareas(self.web_controller, Settings.WEB_HOST, Settings.WEB_PORT,
+                                  Settings.WEB_KEEPALIVE_TIMEOUT, Settings.WEB_LOG_REQUESTS)
+        
+        print(f"\n🖧 SERVIDOR HTTP en {servidor.url}")
+        print("-"*30)
+        print(f"   🏠 {servidor.url}/")
+        print(f"   📋 {servidor.url}/tareas/<filtro>  ({', '.join(FILTROS_WEB)})")
+        print(f"   🔗 {servidor.url}/api/<endpoint>   ({', '.join(ENDPOINTS_API)})")
+        print("   Ctrl+C para detener")
+        
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 Servidor detenido")
+        finally:
+            servidor.server_close()
+    
+    def servir_async(self):
+        """Atiende las vistas web con el servidor asyncio hasta Ctrl+C"""
+        servidor = ServidorTareasAsync(self.web_controller, Settings.WEB_HOST, Settings.WEB_PORT,
+                                       Settings.WEB_ASYNC_WORKERS, Settings.WEB_ASYNC_MAX_PENDING,
+                                       Settings.WEB_KEEPALIVE_TIMEOUT)
+        
+        print(f"\n⚡ SERVIDOR HTTP (asyncio) en {servidor.url}")
+        print(f"   Render en {Settings.WEB_ASYNC_WORKERS} hilos; Ctrl+C para detener")
+        
+        try:
+            asyncio.run(servidor.servir())
+        except KeyboardInterrupt:
+            print("\n🛑 Servidor detenido")
+    
     def demostracion_completa(self):
         """Demostración completa de las ventajas de MVC"""
         print("\n🎭 DEMOSTRACIÓN COMPLETA MVC WEB")
@@ -279,7 +322,12 @@ def main():
         
         # Crear y ejecutar aplicación web MVC
         app = AplicacionMVCWeb()
-        app.ejecutar()
+        if "--async" in sys.argv[1:]:
+            app.servir_async()
+        elif "--servidor" in sys.argv[1:]:
+            app.servir()
+        else:
+            app.ejecutar()
         
     except Exception as e:
         print(f"\n❌ Error crítico del sistema web: {e}")
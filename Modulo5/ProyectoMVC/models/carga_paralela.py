@@ -0,0 +1,175 @@
+"""
+📦 MODELO: Carga y guardado en paralelo de archivos de tareas grandes
+El archivo de datos (escribir_fragmentos) tiene una tarea por línea, así que se
+puede partir en segmentos de bytes alineados a líneas: cada proceso decodifica
+el suyo (y puede indexar su texto) y el proceso principal solo une los
+resultados en el orden del archivo, con lo que IDs y siguiente_id quedan
+igual que en la carga secuencial
+"""
+
+import os
+import json
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, repeat
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from models.tarea import Tarea
+from models.indices import IndiceTexto
+from models.lector_json import CallbackProgreso
+from models.snapshot_binario import recolector_pausado
+
+# Primera línea del formato de escribir_fragmentos
+CABECERA = b'{"tareas":[\n'
+
+# Por debajo de estos tamaños arrancar los procesos cuesta más de lo que ahorra
+TAMANO_MINIMO_PARALELO = 32 * 2**20   # bytes del archivo a cargar
+MINIMO_TAREAS_PARALELO = 50_000       # tareas sin fragmento a codificar
+
+# Segmentos por proceso: reparten mejor la carga y permiten informar el progreso
+SEGMENTOS_POR_PROCESO = 4
+
+# Tareas de un segmento y su índice de texto parcial (si se pidió)
+Segmento = Tuple[List[Tarea], Optional[IndiceTexto]]
+
+_codificar_compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def numero_de_procesos(procesos: Optional[int]) -> int:
+    """Procesos a usar: `None` o 0 = uno por núcleo"""
+    return procesos or os.cpu_count() or 1
+
+
+def _contexto():
+    """
+    fork donde existe: los procesos heredan las tareas a codificar sin copiarlas
+    por pickle y no vuelven a importar el programa principal
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+# ========== CARGA ==========
+
+def admite_carga_paralela(ruta: str, procesos: Optional[int]) -> bool:
+    """Hay más de un proceso y el archivo es grande y tiene una tarea por línea"""
+    if numero_de_procesos(procesos) < 2:
+        return False
+    try:
+        if os.path.getsize(ruta) < TAMANO_MINIMO_PARALELO:
+            return False
+        with open(ruta, 'rb') as f:
+            return f.readline() == CABECERA
+    except OSError:
+        return False
+
+
+def dividir_en_segmentos(ruta: str, partes: int) -> List[Tuple[int, int]]:
+    """Rangos de bytes [inicio, fin) de tamaño parecido que empiezan y terminan en un salto de línea"""
+    tamano = os.path.getsize(ruta)
+    cortes = [0]
+    with open(ruta, 'rb') as f:
+        for i in range(1, partes):
+            f.seek(max(tamano * i // partes, cortes[-1]))
+            f.readline()  # Avanzar hasta el comienzo de la línea siguiente
+            cortes.append(f.tell())
+    cortes.append(tamano)
+    return [(inicio, fin) for inicio, fin in zip(cortes, cortes[1:]) if fin > inicio]
+
+
+def _decodificar_segmento(ruta: str, inicio: int, fin: int,
+                          indexar_texto: bool) -> Tuple[List[Tarea], Optional[IndiceTexto],
+                                                        Optional[Dict[str, Any]]]:
+    """
+    (En un proceso del pool) tareas de las líneas del segmento, su índice de texto
+    y los metadatos si el segmento incluye el cierre del arreglo
+    """
+    cabecera = CABECERA.rstrip()
+    tareas = []
+    metadatos = None
+    with recolector_pausado(), open(ruta, 'rb') as f:
+        f.seek(inicio)
+        posicion = inicio
+        while posicion < fin:
+            linea = f.readline()
+            if not linea:
+                break
+            posicion += len(linea)
+            linea = linea.rstrip()
+            if linea.startswith(b"]"):
+                # '],"siguiente_id":N,...}' → '{"siguiente_id":N,...}'
+                metadatos = json.loads(b"{" + linea[2:])
+            elif linea and linea != cabecera:
+                tareas.append(Tarea.from_dict(json.loads(linea[:-1] if linea.endswith(b",") else linea)))
+
+        parcial = None
+        if indexar_texto:
+            parcial = IndiceTexto()
+            parcial.agregar_lote(tareas)
+    return tareas, parcial, metadatos
+
+
+def decodificar_en_paralelo(ruta: str, procesos: Optional[int] = None, indexar_texto: bool = False,
+                            progreso: Optional[CallbackProgreso] = None
+                            ) -> Tuple[List[Segmento], Dict[str, Any]]:
+    """
+    Decodifica el archivo de datos repartiendo sus segmentos entre procesos
+    Devuelve los segmentos en el orden del archivo y los metadatos de primer nivel
+    """
+    procesos = numero_de_procesos(procesos)
+    rangos = dividir_en_segmentos(ruta, procesos * SEGMENTOS_POR_PROCESO)
+    total = os.path.getsize(ruta)
+    segmentos: List[Segmento] = []
+    metadatos: Dict[str, Any] = {}
+    leidas = 0
+
+    with ProcessPoolExecutor(procesos, mp_context=_contexto()) as ejecutor:
+        resultados = ejecutor.map(_decodificar_segmento, repeat(ruta),
+                                  [inicio for inicio, _ in rangos], [fin for _, fin in rangos],
+                                  repeat(indexar_texto))
+        for (_, fin), (tareas, parcial, cierre) in zip(rangos, resultados):
+            segmentos.append((tareas, parcial))
+            if cierre is not None:
+                metadatos = cierre
+            leidas += len(tareas)
+            if progreso is not None:
+                progreso(leidas, fin, total)
+
+    return segmentos, metadatos
+
+
+# ========== GUARDADO ==========
+
+# Tareas que heredan los procesos creados con fork (solo durante codificar_en_paralelo)
+_compartidas: Sequence[Tarea] = ()
+
+
+def admite_codificacion_paralela(procesos: Optional[int], pendientes: int) -> bool:
+    """Hay más de un proceso, fork disponible y suficientes tareas por codificar"""
+    return (numero_de_procesos(procesos) > 1 and pendientes >= MINIMO_TAREAS_PARALELO
+            and _contexto() is not None)
+
+
+def _codificar_rango(inicio: int, fin: int) -> List[bytes]:
+    """(En un proceso del pool) fragmentos JSON de las tareas heredadas en [inicio, fin)"""
+    return [_codificar_compacto(tarea.to_dict(incluir_calculados=False)).encode('utf-8')
+            for tarea in _compartidas[inicio:fin]]
+
+
+def codificar_en_paralelo(tareas: Sequence[Tarea], procesos: Optional[int] = None) -> List[bytes]:
+    """
+    Fragmentos JSON compactos de las tareas (mismo orden), codificados en procesos
+    que heredan la lista por fork: solo los bytes resultantes viajan por pickle
+    """
+    global _compartidas
+    procesos = numero_de_procesos(procesos)
+    partes = procesos * SEGMENTOS_POR_PROCESO
+    cortes = [len(tareas) * i // partes for i in range(partes + 1)]
+
+    _compartidas = tareas
+    try:
+        with ProcessPoolExecutor(procesos, mp_context=_contexto()) as ejecutor:
+            return list(chain.from_iterable(ejecutor.map(_codificar_rango, cortes, cortes[1:])))
+    finally:
+        _compartidas = ()
@@ -0,0 +1,140 @@
+"""
+📦 MODELO: Estadísticas incrementales
+Mantiene los contadores del dashboard al día a medida que cambian las tareas
+"""
+
+import datetime
+from typing import Any, Dict, Iterable, List
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea
+from models.indices import IndiceSecundario, IndiceVencimientos
+
+# Campos que alteran el índice de vencimientos
+CAMPOS_VENCIMIENTO = ("estado", "prioridad", "fecha_vencimiento")
+
+UN_MICROSEGUNDO = datetime.timedelta(microseconds=1)
+
+class EstadisticasIncrementales:
+    """
+    Agregador de estadísticas - Se actualiza con cada alta, cambio o baja
+    Los contadores se leen en O(1); vencidas y urgentes se calculan al leer
+    con búsquedas binarias sobre el índice de vencimientos
+    """
+    
+    def __init__(self, indices: Dict[str, IndiceSecundario]):
+        # Reutiliza los índices secundarios del repositorio para los conteos
+        self.indices = indices
+        self.vencimientos = IndiceVencimientos()
+        self.total = 0
+        
+        # Duración (microsegundos) de cada tarea completada con tiempo registrado
+        self.duraciones: Dict[int, int] = {}
+        self.suma_duraciones = 0
+    
+    # ========== MANTENIMIENTO ==========
+    
+    def agregar(self, tarea: Tarea):
+        """Registra una tarea nueva"""
+        self.total += 1
+        self.vencimientos.agregar(tarea)
+        self._registrar_duracion(tarea)
+    
+    def agregar_lote(self, tareas: List[Tarea]):
+        """Registra varias tareas nuevas (importación masiva)"""
+        self.total += len(tareas)
+        self.vencimientos.agregar_lote(tareas)
+        for tarea in tareas:
+            self._registrar_duracion(tarea)
+    
+    def remover_id(self, tarea_id: int):
+        """Olvida una tarea eliminada"""
+        self.total -= 1
+        self.vencimientos.remover_id(tarea_id)
+        self._olvidar_duracion(tarea_id)
+    
+    def al_cambiar(self, tarea: Tarea, campo: str):
+        """Actualiza los agregados afectados por el cambio de un campo"""
+        if campo in CAMPOS_VENCIMIENTO:
+            self.vencimientos.reubicar(tarea)
+        
+        if campo == "estado":
+            self._olvidar_duracion(tarea.id)
+            self._registrar_duracion(tarea)
+    
+    def construir(self, tareas: Iterable[Tarea]):
+        """Recalcula todos los agregados desde cero"""
+        self.limpiar()
+        tareas = list(tareas)
+        self.total = len(tareas)
+        self.vencimientos.construir(tareas)
+        for tarea in tareas:
+            self._registrar_duracion(tarea)
+    
+    def limpiar(self):
+        """Vacía todos los agregados"""
+        self.total = 0
+        self.vencimientos.limpiar()
+        self.duraciones.clear()
+        self.suma_duraciones = 0
+    
+    def _registrar_duracion(self, tarea: Tarea):
+        """Suma la duración de una tarea completada"""
+        if tarea.estado != EstadoTarea.COMPLETADA:
+            return
+        
+        duracion = tarea.duracion_en_progreso()
+        if duracion:
+            microsegundos = duracion // UN_MICROSEGUNDO
+            self.duraciones[tarea.id] = microsegundos
+            self.suma_duraciones += microsegundos
+    
+    def _olvidar_duracion(self, tarea_id: int):
+        """Resta la duración registrada de una tarea"""
+        microsegundos = self.duraciones.pop(tarea_id, None)
+        if microsegundos is not None:
+            self.suma_duraciones -= microsegundos
+    
+    # ========== CONSULTAS ==========
+    
+    def contar_vencidas(self, ahora: datetime.datetime) -> int:
+        """Cuenta tareas vencidas a la fecha indicada"""
+        return self.vencimientos.contar_antes_de(ahora)
+    
+    def contar_urgentes(self, ahora: datetime.datetime) -> int:
+        """Cuenta tareas que necesitan atención (ver Tarea.necesita_atencion)"""
+        # Críticas: siempre urgentes, con o sin vencimiento
+        criticas = self.indices["prioridad"].contar(PrioridadTarea.CRITICA)
+        
+        # Baja y media: solo si están vencidas
+        vencidas = self.vencimientos.contar_antes_de(
+            ahora, (PrioridadTarea.BAJA, PrioridadTarea.MEDIA))
+        
+        # Alta: vencidas o con dias_para_vencimiento() <= 1, es decir, vencen antes de 2 días
+        altas = self.vencimientos.contar_antes_de(
+            ahora + datetime.timedelta(days=2), (PrioridadTarea.ALTA,))
+        
+        return criticas + vencidas + altas
+    
+    def obtener(self) -> Dict[str, Any]:
+        """Obtiene las estadísticas generales leyendo el reloj una sola vez"""
+        ahora = datetime.datetime.now()
+        por_estado = self.indices["estado"]
+        tareas_completadas = por_estado.contar(EstadoTarea.COMPLETADA)
+        
+        tiempo_promedio = None
+        if self.duraciones:
+            tiempo_promedio = datetime.timedelta(
+                microseconds=self.suma_duraciones / len(self.duraciones))
+        
+        return {
+            "total_tareas": self.total,
+            "tareas_activas": self.total - por_estado.contar(EstadoTarea.CANCELADA),
+            "tareas_completadas": tareas_completadas,
+            "tareas_vencidas": self.contar_vencidas(ahora),
+            "tareas_urgentes": self.contar_urgentes(ahora),
+            "tasa_completado": (tareas_completadas / self.total * 100) if self.total > 0 else 0,
+            "tiempo_promedio_completado": tiempo_promedio,
+            "por_estado": {estado.value: por_estado.contar(estado) for estado in EstadoTarea},
+            "por_prioridad": {prioridad.value: self.indices["prioridad"].contar(prioridad)
+                              for prioridad in PrioridadTarea},
+            "por_usuario": self.indices["usuario_asignado"].conteos()
+        }
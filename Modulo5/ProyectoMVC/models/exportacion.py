@@ -0,0 +1,166 @@
+"""
+📦 MODELO: Exportación de tareas en streaming
+Escribe tareas en JSON (legible), JSON Lines o CSV fila por fila sobre un
+archivo de texto; el buffer intermedio tiene un tamaño acotado, así que la
+memoria no depende de cuántas tareas se exporten
+"""
+
+import csv
+import json
+import datetime
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, TextIO, Tuple
+
+from models.tarea import Tarea
+from models.importacion import CAMPOS_CSV, SEPARADOR_ETIQUETAS
+
+FORMATOS_EXPORTACION = ("json", "jsonl", "csv")
+
+# Caracteres acumulados antes de escribir en el destino
+TAMANO_BUFFER_EXPORTACION = 64 * 1024
+
+_codificar_compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Escalares sin pasar por JSONEncoder.encode (json.dumps con indent usa el codificador
+# de Python puro); los tipos que no están aquí (floats, otros) sí pasan por él
+_codificar_valor = json.JSONEncoder(ensure_ascii=False).encode
+_ESCALARES = {
+    str: json.encoder.encode_basestring,
+    int: int.__repr__,
+    bool: lambda valor: "true" if valor else "false",
+    type(None): lambda valor: "null",
+}
+
+# (sangría, clave) → '<sangría>"clave": '
+_prefijos: Dict[Tuple[str, str], str] = {}
+
+
+class BufferAcotado:
+    """Acumula texto y lo escribe en el destino al llegar a `limite` caracteres"""
+
+    def __init__(self, destino: TextIO, limite: int = TAMANO_BUFFER_EXPORTACION):
+        self.destino = destino
+        self.limite = limite
+        self._partes = []
+        self._tamano = 0
+
+    def write(self, texto: str):
+        self._partes.append(texto)
+        self._tamano += len(texto)
+        if self._tamano >= self.limite:
+            self.vaciar()
+
+    def vaciar(self):
+        """Escribe lo acumulado"""
+        if self._partes:
+            self.destino.write("".join(self._partes))
+            self._partes = []
+            self._tamano = 0
+
+
+# ========== FORMATOS ==========
+
+def _indentado(valor: Any, sangria: str) -> str:
+    """Mismo texto que json.dumps(valor, indent=2, ensure_ascii=False) a partir de `sangria`"""
+    codificar = _ESCALARES.get(type(valor))
+    if codificar is not None:
+        return codificar(valor)
+    interior = sangria + "  "
+    if isinstance(valor, dict):
+        if not valor:
+            return "{}"
+        partes = []
+        for clave, v in valor.items():
+            prefijo = _prefijos.get((interior, clave))
+            if prefijo is None:
+                prefijo = _prefijos[(interior, clave)] = interior + _codificar_valor(clave) + ": "
+            partes.append(prefijo + _indentado(v, interior))
+        return "{\n" + ",\n".join(partes) + "\n" + sangria + "}"
+    if isinstance(valor, list):
+        if not valor:
+            return "[]"
+        return "[\n" + ",\n".join(interior + _indentado(v, interior) for v in valor) + "\n" + sangria + "]"
+    return _codificar_valor(valor)
+
+
+def escribir_json(tareas: Iterable[Tarea], salida: BufferAcotado,
+                  ahora: Optional[datetime.datetime] = None) -> int:
+    """
+    Arreglo JSON con indentación, igual que json.dumps(lista de to_dict(), indent=2)
+    pero tarea por tarea; los campos calculados usan un solo `ahora`
+    """
+    ahora = ahora or datetime.datetime.now()
+    cantidad = 0
+    for tarea in tareas:
+        salida.write(",\n  " if cantidad else "[\n  ")
+        salida.write(_indentado(tarea.to_dict(ahora=ahora), "  "))
+        cantidad += 1
+    salida.write("\n]" if cantidad else "[]")
+    return cantidad
+
+
+def escribir_jsonl(tareas: Iterable[Tarea], salida: BufferAcotado,
+                   fragmentos: Optional[Mapping[int, bytes]] = None) -> int:
+    """
+    Un objeto JSON compacto por línea con los datos propios de cada tarea
+    (formato de persistencia, importable con importar_tareas). Reutiliza los
+    fragmentos ya codificados sin agregar los que faltan a la caché
+    """
+    fragmentos = fragmentos or {}
+    cantidad = 0
+    for tarea in tareas:
+        fragmento = fragmentos.get(tarea.id)
+        if fragmento is not None:
+            salida.write(fragmento.decode("utf-8"))
+        else:
+            salida.write(_codificar_compacto(tarea.to_dict(incluir_calculados=False)))
+        salida.write("\n")
+        cantidad += 1
+    return cantidad
+
+
+def _iso(fecha: Optional[datetime.datetime]) -> str:
+    return fecha.isoformat() if fecha else ""
+
+
+def escribir_csv(tareas: Iterable[Tarea], salida: BufferAcotado) -> int:
+    """Una fila por tarea con las columnas de CAMPOS_CSV (sin comentarios)"""
+    escritor = csv.writer(salida, lineterminator="\n")
+    escritor.writerow(CAMPOS_CSV)
+    cantidad = 0
+    for tarea in tareas:
+        # Mismo orden que CAMPOS_CSV
+        escritor.writerow((
+            tarea.id, tarea.titulo, tarea.descripcion, tarea.usuario_asignado,
+            tarea.usuario_creador, tarea.prioridad.value, tarea.estado.value,
+            _iso(tarea.fecha_creacion), _iso(tarea.fecha_inicio),
+            _iso(tarea.fecha_completado), _iso(tarea.fecha_vencimiento),
+            SEPARADOR_ETIQUETAS.join(tarea.etiquetas),
+            "" if tarea.tiempo_estimado_horas is None else tarea.tiempo_estimado_horas,
+            "" if tarea.tiempo_real_horas is None else tarea.tiempo_real_horas,
+        ))
+        cantidad += 1
+    return cantidad
+
+
+def exportar_tareas(tareas: Iterable[Tarea], destino: TextIO, formato: str = "json",
+                    filtro: Optional[Callable[[Tarea], bool]] = None,
+                    fragmentos: Optional[Mapping[int, bytes]] = None,
+                    tamano_buffer: int = TAMANO_BUFFER_EXPORTACION) -> int:
+    """
+    Escribe las tareas (las que acepte `filtro`, si se indica) en `destino`
+    en el formato pedido; devuelve la cantidad exportada
+    """
+    if formato not in FORMATOS_EXPORTACION:
+        raise ValueError(f"Formato no soportado: {formato}")
+    if filtro is not None:
+        tareas = (tarea for tarea in tareas if filtro(tarea))
+
+    salida = BufferAcotado(destino, tamano_buffer)
+    if formato == "json":
+        cantidad = escribir_json(tareas, salida)
+    elif formato == "jsonl":
+        cantidad = escribir_jsonl(tareas, salida, fragmentos)
+    else:
+        cantidad = escribir_csv(tareas, salida)
+    salida.vaciar()
+    return cantidad
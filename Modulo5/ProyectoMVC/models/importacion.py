@@ -0,0 +1,209 @@
+"""
+📦 MODELO: Importación masiva de tareas
+Lee registros de tareas (formato de Tarea.to_dict) desde JSON Lines o CSV,
+los valida por lotes con TareaValidator y construye las tareas con IDs
+consecutivos, sin pasar por crear_tarea ni notificar cambio por cambio
+"""
+
+import os
+import csv
+import sys
+import json
+import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea, VACIO
+from utils.validators import TareaValidator, DateValidator
+
+FORMATOS_IMPORTACION = ("jsonl", "csv")
+
+# Registros por lote: se validan juntos y reciben un bloque de IDs consecutivos
+TAMANO_LOTE_IMPORTACION = 10_000
+
+# Columnas del CSV (encabezado); las etiquetas van en una celda separadas por comas
+CAMPOS_CSV = (
+    "id", "titulo", "descripcion", "usuario_asignado", "usuario_creador",
+    "prioridad", "estado", "fecha_creacion", "fecha_inicio", "fecha_completado",
+    "fecha_vencimiento", "etiquetas", "tiempo_estimado_horas", "tiempo_real_horas"
+)
+SEPARADOR_ETIQUETAS = ","
+
+# Rechazos que se conservan con su mensaje (el resto solo se cuenta)
+MAX_RECHAZOS_GUARDADOS = 1000
+
+PRIORIDAD_POR_VALOR = {prioridad.value: prioridad for prioridad in PrioridadTarea}
+ESTADO_POR_VALOR = {estado.value: estado for estado in EstadoTarea}
+
+
+class ResultadoImportacion:
+    """Resumen de una importación: tareas creadas, bloque de IDs y registros rechazados"""
+
+    def __init__(self, primer_id: int):
+        self.primer_id = primer_id
+        self.importadas = 0
+        self.total_rechazadas = 0
+        # (número de registro, empezando en 1; mensaje)
+        self.rechazadas: List[Tuple[int, str]] = []
+
+    @property
+    def ultimo_id(self) -> Optional[int]:
+        """ID de la última tarea importada (None si no se importó ninguna)"""
+        return self.primer_id + self.importadas - 1 if self.importadas else None
+
+    def rechazar(self, numero: int, mensaje: str):
+        """Registra un registro rechazado"""
+        self.total_rechazadas += 1
+        if len(self.rechazadas) < MAX_RECHAZOS_GUARDADOS:
+            self.rechazadas.append((numero, mensaje))
+
+
+# ========== LECTURA DE ARCHIVOS ==========
+
+def leer_registros(ruta: str, formato: Optional[str] = None) -> Iterator[Any]:
+    """
+    Registros de un archivo JSON Lines (.jsonl) o CSV (.csv), uno por línea
+    Una línea JSON mal formada se entrega como el error de decodificación
+    para que la importación la rechace sin detenerse
+    """
+    formato = (formato or os.path.splitext(ruta)[1].lstrip(".")).lower()
+    if formato == "jsonl":
+        return _leer_jsonl(ruta)
+    elif formato == "csv":
+        return _leer_csv(ruta)
+    raise ValueError(f"Formato de importación no soportado: {formato}")
+
+
+def _leer_jsonl(ruta: str) -> Iterator[Any]:
+    """Un objeto JSON por línea (las líneas vacías se ignoran)"""
+    decodificar = json.JSONDecoder().decode
+    with open(ruta, 'r', encoding='utf-8') as f:
+        for linea in f:
+            if not linea.strip():
+                continue
+            try:
+                yield decodificar(linea)
+            except json.JSONDecodeError as e:
+                yield e
+
+
+def _leer_csv(ruta: str) -> Iterator[Dict[str, Any]]:
+    """Filas CSV con encabezado (CAMPOS_CSV); las celdas vacías son None"""
+    with open(ruta, 'r', encoding='utf-8', newline='') as f:
+        for fila in csv.DictReader(f):
+            registro = {campo: (valor if valor != "" else None) for campo, valor in fila.items()}
+            etiquetas = registro.get("etiquetas")
+            registro["etiquetas"] = ([e for e in etiquetas.split(SEPARADOR_ETIQUETAS) if e.strip()]
+                                     if etiquetas else [])
+            for campo in ("tiempo_estimado_horas", "tiempo_real_horas"):
+                if registro.get(campo) is not None:
+                    try:
+                        registro[campo] = float(registro[campo])
+                    except ValueError:
+                        pass  # Lo rechaza la validación
+            yield registro
+
+
+# ========== CONSTRUCCIÓN DE TAREAS ==========
+
+def _fecha_iso(valor: str) -> datetime.datetime:
+    """
+    Fecha ISO 8601 como hora local sin zona: las tareas solo guardan fechas sin
+    zona y compararlas con una que la tenga lanza TypeError
+    """
+    fecha = datetime.datetime.fromisoformat(valor)
+    if fecha.tzinfo is not None:
+        fecha = fecha.astimezone().replace(tzinfo=None)
+    return fecha
+
+
+def _fecha(valor: Optional[str]) -> Optional[datetime.datetime]:
+    """Fecha ISO 8601 o en los formatos que acepta DateValidator.parsear_fecha"""
+    if not valor:
+        return None
+    try:
+        return _fecha_iso(valor)
+    except ValueError:
+        fecha = DateValidator.parsear_fecha(valor)
+        if fecha is None:
+            raise ValueError(f"Fecha no válida: {valor}")
+        return fecha
+
+
+def construir_tarea(registro: Dict[str, Any], tarea_id: int, ahora: datetime.datetime) -> Tarea:
+    """
+    Tarea de un registro ya validado, sin pasar por Tarea.__init__ (que lee el reloj)
+    Lanza ValueError si la prioridad, el estado o alguna fecha no son válidos
+    """
+    prioridad = PRIORIDAD_POR_VALOR.get(registro.get("prioridad") or "media")
+    if prioridad is None:
+        raise ValueError(f"Prioridad no válida: {registro.get('prioridad')}")
+    estado = ESTADO_POR_VALOR.get(registro.get("estado") or "pendiente")
+    if estado is None:
+        raise ValueError(f"Estado no válido: {registro.get('estado')}")
+
+    usuario = sys.intern(registro["usuario_asignado"].strip())
+    creador = registro.get("usuario_creador")
+
+    tarea = Tarea.__new__(Tarea)
+    tarea.id = tarea_id
+    tarea.titulo = registro["titulo"].strip()
+    tarea.descripcion = (registro.get("descripcion") or "").strip()
+    tarea.usuario_asignado = usuario
+    tarea.usuario_creador = sys.intern(creador) if creador else usuario
+    tarea.prioridad = prioridad
+    tarea.estado = estado
+    tarea.fecha_creacion = _fecha(registro.get("fecha_creacion")) or ahora
+    tarea.fecha_inicio = _fecha(registro.get("fecha_inicio"))
+    tarea.fecha_completado = _fecha(registro.get("fecha_completado"))
+    tarea.fecha_vencimiento = _fecha(registro.get("fecha_vencimiento"))
+    # Sin duplicados y conservando el orden, sin la búsqueda lineal de agregar_etiqueta
+    tarea.etiquetas = list(dict.fromkeys(
+        sys.intern(etiqueta.strip().lower()) for etiqueta in registro.get("etiquetas") or ())) or VACIO
+    # Solo los campos que guardan todos los formatos (JSON, WAL y binario); la
+    # estructura ya la comprobó TareaValidator.validar_comentario_registro
+    tarea.comentarios = [
+        {"id": comentario["id"], "texto": comentario["texto"], "usuario": comentario["usuario"],
+         "fecha": _fecha_iso(comentario["fecha"])}
+        for comentario in registro.get("comentarios") or ()
+    ] or VACIO
+    tarea.tiempo_estimado_horas = registro.get("tiempo_estimado_horas")
+    tarea.tiempo_real_horas = registro.get("tiempo_real_horas")
+    tarea._observador = None
+    return tarea
+
+
+def lotes_de_tareas(registros: Iterable[Any], primer_id: int, resultado: ResultadoImportacion,
+                    tamano_lote: int = TAMANO_LOTE_IMPORTACION) -> Iterator[List[Tarea]]:
+    """
+    Valida los registros por lotes y construye sus tareas con IDs consecutivos
+    a partir de `primer_id` (los rechazados no consumen ID); los rechazos y el
+    total importado quedan en `resultado`. El ID que traiga el registro se ignora
+    """
+    ahora = datetime.datetime.now()
+    siguiente_id = primer_id
+    numero = 1
+    iterador = iter(registros)
+    while True:
+        lote = list(islice(iterador, tamano_lote))
+        if not lote:
+            return
+
+        errores = TareaValidator.validar_lote(lote)
+        tareas = []
+        for posicion, registro in enumerate(lote):
+            mensaje = errores.get(posicion)
+            if mensaje is None:
+                try:
+                    tareas.append(construir_tarea(registro, siguiente_id, ahora))
+                    siguiente_id += 1
+                    continue
+                except KeyError as e:
+                    mensaje = f"Falta el campo {e}"
+                except (TypeError, ValueError) as e:
+                    mensaje = str(e)
+            resultado.rechazar(numero + posicion, mensaje)
+
+        numero += len(lote)
+        resultado.importadas += len(tareas)
+        yield tareas
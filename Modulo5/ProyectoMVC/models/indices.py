@@ -0,0 +1,476 @@
+"""
+📦 MODELO: Índices en memoria
+Estructuras auxiliares que usa el repositorio para evitar recorrer todas las tareas
+"""
+
+import re
+import datetime
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea
+
+class IndiceSecundario:
+    """
+    Índice de cubetas: valor de un campo → {id: Tarea}
+    Soporta campos simples (estado, prioridad, usuario) y multivalor (etiquetas)
+    """
+
+    def __init__(self, campo: str, multivalor: bool = False):
+        self.campo = campo
+        self.multivalor = multivalor
+        self.cubetas: Dict[Hashable, Dict[int, Tarea]] = {}
+
+    def _claves(self, valor: Any) -> Iterable[Hashable]:
+        """Normaliza el valor del campo a una colección de claves"""
+        return valor if self.multivalor else (valor,)
+
+    def agregar(self, tarea: Tarea):
+        """Indexa una tarea según el valor actual de su campo"""
+        for clave in self._claves(getattr(tarea, self.campo)):
+            self.cubetas.setdefault(clave, {})[tarea.id] = tarea
+
+    def agregar_lote(self, tareas: Iterable[Tarea]):
+        """Indexa varias tareas (mismo resultado que agregar una por una)"""
+        cubetas = self.cubetas
+        campo = self.campo
+        for tarea in tareas:
+            valor = getattr(tarea, campo)
+            for clave in (valor if self.multivalor else (valor,)):
+                cubeta = cubetas.get(clave)
+                if cubeta is None:
+                    cubeta = cubetas[clave] = {}
+                cubeta[tarea.id] = tarea
+
+    def remover(self, tarea: Tarea, valor: Any = None):
+        """Quita una tarea del índice (por defecto usando su valor actual)"""
+        if valor is None:
+            valor = getattr(tarea, self.campo)
+
+        for clave in self._claves(valor):
+            cubeta = self.cubetas.get(clave)
+            if cubeta is not None:
+                cubeta.pop(tarea.id, None)
+                if not cubeta:
+                    del self.cubetas[clave]
+
+    def mover(self, tarea: Tarea, valor_anterior: Any):
+        """Reubica una tarea cuyo campo cambió"""
+        self.remover(tarea, valor_anterior)
+        self.agregar(tarea)
+
+    def obtener(self, clave: Hashable) -> List[Tarea]:
+        """Obtiene las tareas de una cubeta ordenadas por ID"""
+        cubeta = self.cubetas.get(clave)
+        if not cubeta:
+            return []
+        return [cubeta[tarea_id] for tarea_id in sorted(cubeta)]
+
+    def ids(self, clave: Hashable) -> List[int]:
+        """Obtiene los IDs de una cubeta sin materializar las tareas"""
+        return list(self.cubetas.get(clave, ()))
+
+    def contar(self, clave: Hashable) -> int:
+        """Cuenta las tareas de una cubeta"""
+        return len(self.cubetas.get(clave, ()))
+
+    def conteos(self) -> Dict[Hashable, int]:
+        """Cuenta las tareas de cada cubeta"""
+        return {clave: len(cubeta) for clave, cubeta in self.cubetas.items()}
+
+    def limpiar(self):
+        """Vacía el índice"""
+        self.cubetas.clear()
+
+
+class IndiceVencimientos:
+    """
+    Índice de fechas de vencimiento ordenadas por prioridad
+    Solo contiene tareas no completadas (las únicas que pueden vencer)
+    """
+
+    def __init__(self):
+        self.fechas: Dict[PrioridadTarea, List[Tuple[datetime.datetime, int]]] = {
+            prioridad: [] for prioridad in PrioridadTarea
+        }
+        # ID → (prioridad, clave) para poder quitar sin conocer los valores anteriores
+        self.claves: Dict[int, Tuple[PrioridadTarea, Tuple[datetime.datetime, int]]] = {}
+
+    @staticmethod
+    def _aplica(tarea: Tarea) -> bool:
+        """Indica si la tarea puede vencer"""
+        return tarea.fecha_vencimiento is not None and tarea.estado != EstadoTarea.COMPLETADA
+
+    def agregar(self, tarea: Tarea):
+        """Indexa la fecha de vencimiento de una tarea"""
+        if not self._aplica(tarea):
+            return
+
+        clave = (tarea.fecha_vencimiento, tarea.id)
+        insort(self.fechas[tarea.prioridad], clave)
+        self.claves[tarea.id] = (tarea.prioridad, clave)
+
+    def remover_id(self, tarea_id: int):
+        """Quita una tarea del índice"""
+        entrada = self.claves.pop(tarea_id, None)
+        if entrada is None:
+            return
+
+        prioridad, clave = entrada
+        lista = self.fechas[prioridad]
+        del lista[bisect_left(lista, clave)]
+
+    def reubicar(self, tarea: Tarea):
+        """Reindexa una tarea cuyo estado, prioridad o vencimiento cambió"""
+        self.remover_id(tarea.id)
+        self.agregar(tarea)
+
+    def agregar_lote(self, tareas: Iterable[Tarea]):
+        """Indexa varias tareas ordenando cada lista una vez (insort por tarea es O(n))"""
+        modificadas = set()
+        for tarea in tareas:
+            if self._aplica(tarea):
+                clave = (tarea.fecha_vencimiento, tarea.id)
+                self.fechas[tarea.prioridad].append(clave)
+                self.claves[tarea.id] = (tarea.prioridad, clave)
+                modificadas.add(tarea.prioridad)
+
+        for prioridad in modificadas:
+            self.fechas[prioridad].sort()
+
+    def construir(self, tareas: Iterable[Tarea]):
+        """Reconstruye el índice completo ordenando una sola vez"""
+        self.limpiar()
+        for tarea in tareas:
+            if self._aplica(tarea):
+                clave = (tarea.fecha_vencimiento, tarea.id)
+                self.fechas[tarea.prioridad].append(clave)
+                self.claves[tarea.id] = (tarea.prioridad, clave)
+
+        for lista in self.fechas.values():
+            lista.sort()
+
+    def contar_antes_de(self, limite: datetime.datetime,
+                        prioridades: Optional[Iterable[PrioridadTarea]] = None) -> int:
+        """Cuenta tareas cuyo vencimiento es estrictamente anterior a `limite`"""
+        if prioridades is None:
+            prioridades = PrioridadTarea
+
+        # (limite,) ordena antes que cualquier (limite, id): deja fuera las fechas iguales
+        return sum(bisect_left(self.fechas[p], (limite,)) for p in prioridades)
+
+    def ids_en_rango(self, desde: Optional[datetime.datetime], hasta: datetime.datetime,
+                     prioridades: Optional[Iterable[PrioridadTarea]] = None) -> List[int]:
+        """IDs con vencimiento en [desde, hasta) (`desde=None` significa sin límite inferior)"""
+        if prioridades is None:
+            prioridades = PrioridadTarea
+
+        ids = []
+        for prioridad in prioridades:
+            lista = self.fechas[prioridad]
+            inicio = 0 if desde is None else bisect_left(lista, (desde,))
+            fin = bisect_left(lista, (hasta,))
+            ids.extend(tarea_id for _, tarea_id in lista[inicio:fin])
+        return ids
+
+    def limpiar(self):
+        """Vacía el índice"""
+        for lista in self.fechas.values():
+            lista.clear()
+        self.claves.clear()
+
+
+class IndiceOrdenado:
+    """
+    Vista de todas las tareas ordenadas por una clave: lista de (clave, id, Tarea)
+    mantenida con bisect, así que recorrer en orden o leer un tramo no requiere
+    ordenar. Los empates se resuelven por ID ascendente (el ID es único: nunca se
+    comparan tareas); con `descendente` se guarda -id y la lista se lee al revés
+    """
+
+    def __init__(self, clave: Callable[[Tarea], Any], descendente: bool = False):
+        self.clave = clave
+        self.descendente = descendente
+        self.entradas: List[Tuple[Any, int, Tarea]] = []
+        # ID → entrada, para poder quitar sin conocer los valores anteriores
+        self.claves: Dict[int, Tuple[Any, int, Tarea]] = {}
+
+    def _entrada(self, tarea: Tarea) -> Tuple[Any, int, Tarea]:
+        return (self.clave(tarea), -tarea.id if self.descendente else tarea.id, tarea)
+
+    def agregar(self, tarea: Tarea):
+        """Ubica una tarea en el orden"""
+        entrada = self._entrada(tarea)
+        insort(self.entradas, entrada)
+        self.claves[tarea.id] = entrada
+
+    def remover_id(self, tarea_id: int):
+        """Quita una tarea del orden"""
+        entrada = self.claves.pop(tarea_id, None)
+        if entrada is not None:
+            del self.entradas[bisect_left(self.entradas, entrada)]
+
+    def remover_lote(self, ids: Iterable[int]):
+        """Quita varias tareas recorriendo la lista una sola vez"""
+        quitadas = set()
+        for tarea_id in ids:
+            entrada = self.claves.pop(tarea_id, None)
+            if entrada is not None:
+                quitadas.add(entrada)
+        if quitadas:
+            self.entradas = [entrada for entrada in self.entradas if entrada not in quitadas]
+
+    def reubicar(self, tarea: Tarea):
+        """Reubica una tarea cuya clave cambió"""
+        self.remover_id(tarea.id)
+        self.agregar(tarea)
+
+    def agregar_lote(self, tareas: Iterable[Tarea]):
+        """Ubica varias tareas ordenando una sola vez (insort por tarea es O(n))"""
+        for tarea in tareas:
+            entrada = self._entrada(tarea)
+            self.entradas.append(entrada)
+            self.claves[tarea.id] = entrada
+        self.entradas.sort()
+
+    def construir(self, tareas: Iterable[Tarea]):
+        """Reconstruye el orden completo"""
+        self.limpiar()
+        self.agregar_lote(tareas)
+
+    def tareas(self, desde: int = 0, cantidad: Optional[int] = None) -> List[Tarea]:
+        """Tareas de las posiciones [desde, desde + cantidad) del orden (`None`: hasta el final)"""
+        total = len(self.entradas)
+        hasta = total if cantidad is None else min(total, desde + cantidad)
+        if desde >= hasta:
+            return []
+        if not self.descendente:
+            return [tarea for _, _, tarea in self.entradas[desde:hasta]]
+        return [tarea for _, _, tarea in reversed(self.entradas[total - hasta:total - desde])]
+
+    def __len__(self) -> int:
+        return len(self.entradas)
+
+    def limpiar(self):
+        """Vacía el índice"""
+        self.entradas.clear()
+        self.claves.clear()
+
+
+class IndiceTexto:
+    """
+    Índice invertido para búsqueda de texto en título, descripción y usuario
+    - Palabra → IDs de tareas que la contienen
+    - Trigrama → palabras del vocabulario que lo contienen
+    Las coincidencias se verifican contra el texto, así que la semántica
+    es exactamente la de `criterio in texto`
+    """
+
+    SEPARADOR = "\x00"
+    PALABRA = re.compile(r"\w+")
+
+    def __init__(self):
+        # ID → "titulo\x00descripcion\x00usuario" ya en minúsculas
+        self.textos: Dict[int, str] = {}
+        self.publicaciones: Dict[str, Set[int]] = {}
+        self.trigramas: Dict[str, Set[str]] = {}
+
+    @classmethod
+    def texto_de(cls, tarea: Tarea) -> str:
+        """Texto buscable de una tarea"""
+        return cls.SEPARADOR.join(
+            (tarea.titulo, tarea.descripcion, tarea.usuario_asignado)).lower()
+
+    @staticmethod
+    def _trigramas(palabra: str) -> Set[str]:
+        """Trigramas de una palabra"""
+        return {palabra[i:i + 3] for i in range(len(palabra) - 2)}
+
+    # ========== MANTENIMIENTO ==========
+
+    def agregar(self, tarea: Tarea):
+        """Indexa el texto de una tarea"""
+        texto = self.texto_de(tarea)
+        self.textos[tarea.id] = texto
+
+        for palabra in set(self.PALABRA.findall(texto)):
+            ids = self.publicaciones.get(palabra)
+            if ids is None:
+                ids = self.publicaciones[palabra] = set()
+                for trigrama in self._trigramas(palabra):
+                    self.trigramas.setdefault(trigrama, set()).add(palabra)
+            ids.add(tarea.id)
+
+    def agregar_lote(self, tareas: Iterable[Tarea]):
+        """
+        Indexa varias tareas; los trigramas se calculan al final, una vez por
+        cada palabra nueva del vocabulario
+        """
+        textos = self.textos
+        publicaciones = self.publicaciones
+        palabras_de = self.PALABRA.findall
+        nuevas = []
+        for tarea in tareas:
+            texto = textos[tarea.id] = self.texto_de(tarea)
+            for palabra in set(palabras_de(texto)):
+                ids = publicaciones.get(palabra)
+                if ids is None:
+                    publicaciones[palabra] = {tarea.id}
+                    nuevas.append(palabra)
+                else:
+                    ids.add(tarea.id)
+
+        trigramas = self.trigramas
+        for palabra in nuevas:
+            for trigrama in self._trigramas(palabra):
+                palabras = trigramas.get(trigrama)
+                if palabras is None:
+                    trigramas[trigrama] = {palabra}
+                else:
+                    palabras.add(palabra)
+
+    def fusionar(self, otro: 'IndiceTexto'):
+        """
+        Incorpora un índice construido aparte (p. ej. en otro proceso) sobre otras
+        tareas; equivale a agregarlas aquí. Adopta los conjuntos de `otro`, que no
+        debe seguir usándose
+        """
+        self.textos.update(otro.textos)
+        for propio, ajeno in ((self.publicaciones, otro.publicaciones),
+                              (self.trigramas, otro.trigramas)):
+            for clave, valores in ajeno.items():
+                actuales = propio.get(clave)
+                if actuales is None:
+                    propio[clave] = valores
+                else:
+                    actuales |= valores
+
+    def remover_id(self, tarea_id: int):
+        """Quita una tarea usando el texto que se indexó"""
+        texto = self.textos.pop(tarea_id, None)
+        if texto is None:
+            return
+
+        for palabra in set(self.PALABRA.findall(texto)):
+            ids = self.publicaciones[palabra]
+            ids.discard(tarea_id)
+            if not ids:
+                del self.publicaciones[palabra]
+                for trigrama in self._trigramas(palabra):
+                    palabras = self.trigramas[trigrama]
+                    palabras.discard(palabra)
+                    if not palabras:
+                        del self.trigramas[trigrama]
+
+    def reubicar(self, tarea: Tarea):
+        """Reindexa una tarea cuyo texto cambió"""
+        self.remover_id(tarea.id)
+        self.agregar(tarea)
+
+    def construir(self, tareas: Iterable[Tarea]):
+        """Reconstruye el índice completo"""
+        self.limpiar()
+        for tarea in tareas:
+            self.agregar(tarea)
+
+    def limpiar(self):
+        """Vacía el índice"""
+        self.textos.clear()
+        self.publicaciones.clear()
+        self.trigramas.clear()
+
+    # ========== CONSULTAS ==========
+
+    def _palabras_que_contienen(self, termino: str) -> Iterable[str]:
+        """Palabras del vocabulario que contienen el término"""
+        if len(termino) < 3:
+            return [p for p in self.publicaciones if termino in p]
+
+        conjuntos = []
+        for trigrama in self._trigramas(termino):
+            palabras = self.trigramas.get(trigrama)
+            if not palabras:
+                return []
+            conjuntos.append(palabras)
+
+        conjuntos.sort(key=len)
+        candidatas = conjuntos[0].intersection(*conjuntos[1:])
+        return [p for p in candidatas if termino in p]
+
+    def _candidatos(self, termino: str) -> Optional[Set[int]]:
+        """
+        Superconjunto de IDs cuyo texto puede contener el término
+        Devuelve None si el término no tiene palabras (no se puede usar el índice)
+        """
+        palabras_termino = self.PALABRA.findall(termino)
+        if not palabras_termino:
+            return None
+
+        # Publicaciones de cada palabra del término, de la más selectiva a la menos
+        grupos = []
+        for palabra_termino in set(palabras_termino):
+            publicaciones = [self.publicaciones[p]
+                             for p in self._palabras_que_contienen(palabra_termino)]
+            if not publicaciones:
+                return set()
+            grupos.append(publicaciones)
+        grupos.sort(key=lambda g: sum(len(ids) for ids in g))
+
+        resultado: Set[int] = set().union(*grupos[0])
+        for publicaciones in grupos[1:]:
+            # Filtrar el resultado parcial en vez de construir uniones grandes
+            resultado = {i for i in resultado if any(i in ids for ids in publicaciones)}
+            if not resultado:
+                break
+
+        return resultado
+
+    def buscar(self, criterio: str) -> List[int]:
+        """IDs cuyo texto contiene `criterio` (ya normalizado), en orden de ID"""
+        candidatos = self._candidatos(criterio)
+        if candidatos is None:
+            candidatos = self.textos.keys()
+
+        return sorted(i for i in candidatos if criterio in self.textos[i])
+
+    def buscar_terminos(self, terminos: List[str]) -> List[Tuple[int, int]]:
+        """
+        Búsqueda AND de varios términos (cada uno como subcadena)
+        Devuelve (puntaje, id) ordenado por relevancia
+        """
+        candidatos: Optional[Set[int]] = None
+        for termino in terminos:
+            ids = self._candidatos(termino)
+            if ids is None:
+                continue
+            candidatos = ids if candidatos is None else candidatos & ids
+
+        if candidatos is None:
+            candidatos = self.textos.keys()
+
+        resultados = []
+        for tarea_id in candidatos:
+            puntaje = self.puntuar(self.textos[tarea_id], terminos)
+            if puntaje:
+                resultados.append((puntaje, tarea_id))
+
+        resultados.sort(key=lambda r: (-r[0], r[1]))
+        return resultados
+
+    @classmethod
+    def puntuar(cls, texto: str, terminos: List[str]) -> int:
+        """Puntaje de relevancia de un texto buscable; 0 si algún término no aparece"""
+        titulo, descripcion, usuario = texto.split(cls.SEPARADOR)
+        palabras = set(cls.PALABRA.findall(texto))
+
+        puntaje = 0
+        for termino in terminos:
+            if termino not in texto:
+                return 0
+
+            # El título pesa más que la descripción y el usuario
+            puntaje += 3 * titulo.count(termino) + descripcion.count(termino)
+            puntaje += 2 if termino in usuario else 0
+            # Bonificación por palabra completa
+            puntaje += 2 if termino in palabras else 0
+
+        return puntaje
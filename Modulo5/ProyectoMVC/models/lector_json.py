@@ -0,0 +1,145 @@
+"""
+📦 MODELO: Lector incremental de archivos de tareas
+Recorre el arreglo "tareas" de un archivo JSON elemento a elemento,
+sin construir en memoria el árbol completo del documento
+"""
+
+import os
+import re
+import json
+from typing import Any, Callable, Dict, Iterator, Optional
+
+# Callback de progreso: (tareas leídas, bytes leídos, bytes totales)
+CallbackProgreso = Callable[[int, int, int], None]
+
+ESPACIOS = re.compile(r"[ \t\n\r]*")
+
+class LectorTareasJSON:
+    """
+    Lector en streaming del formato {"tareas": [...], "siguiente_id": N, ...}
+    - Itera los diccionarios de tareas a medida que se leen bloques del archivo
+    - El resto de claves de primer nivel quedan en `metadatos` al terminar
+    """
+
+    def __init__(self, archivo_datos: str, tamano_bloque: int = 1 << 20,
+                 progreso: Optional[CallbackProgreso] = None, cada: int = 10_000):
+        self.archivo_datos = archivo_datos
+        self.tamano_bloque = tamano_bloque
+        self.progreso = progreso
+        self.cada = cada
+        self.metadatos: Dict[str, Any] = {}
+        self.tareas_leidas = 0
+
+        self._decodificador = json.JSONDecoder()
+        self._archivo = None
+        self._buffer = ""
+        self._pos = 0
+        self._fin = False
+
+    # ========== LECTURA DEL BUFFER ==========
+
+    def _leer_bloque(self) -> bool:
+        """Agrega un bloque al buffer; devuelve False al llegar al final"""
+        bloque = self._archivo.read(self.tamano_bloque)
+        if not bloque:
+            self._fin = True
+            return False
+
+        # Descartar lo ya consumido para que el buffer no crezca
+        self._buffer = self._buffer[self._pos:] + bloque
+        self._pos = 0
+        return True
+
+    def _saltar_espacios(self):
+        """Avanza sobre espacios en blanco, leyendo más si hace falta"""
+        while True:
+            self._pos = ESPACIOS.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._leer_bloque():
+                return
+
+    def _esperar(self, *caracteres: str) -> str:
+        """Consume uno de los caracteres esperados"""
+        self._saltar_espacios()
+        if self._pos >= len(self._buffer):
+            raise ValueError(f"Fin de archivo inesperado; se esperaba {' o '.join(caracteres)}")
+
+        caracter = self._buffer[self._pos]
+        if caracter not in caracteres:
+            raise ValueError(f"Se esperaba {' o '.join(caracteres)} y se encontró {caracter!r} "
+                             f"en la posición {self._pos}")
+        self._pos += 1
+        return caracter
+
+    def _siguiente(self) -> str:
+        """Mira el siguiente carácter significativo sin consumirlo"""
+        self._saltar_espacios()
+        return self._buffer[self._pos] if self._pos < len(self._buffer) else ""
+
+    def _decodificar_valor(self) -> Any:
+        """Decodifica un valor JSON completo, leyendo bloques hasta tenerlo"""
+        self._saltar_espacios()
+        while True:
+            try:
+                valor, fin = self._decodificador.raw_decode(self._buffer, self._pos)
+                # Números y literales no se autodelimitan: exigir un carácter después
+                if fin < len(self._buffer) or self._fin:
+                    self._pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self._fin:
+                    raise
+
+            if not self._leer_bloque() and self._pos >= len(self._buffer):
+                raise ValueError("Fin de archivo inesperado al leer un valor")
+
+    # ========== ITERACIÓN ==========
+
+    def _bytes_leidos(self) -> int:
+        """Bytes consumidos del archivo (aproximado por el buffer de lectura)"""
+        return self._archivo.buffer.tell()
+
+    def _informar(self, total_bytes: int):
+        """Invoca el callback de progreso si está configurado"""
+        if self.progreso is not None:
+            self.progreso(self.tareas_leidas, self._bytes_leidos(), total_bytes)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        total_bytes = os.path.getsize(self.archivo_datos)
+
+        with open(self.archivo_datos, 'r', encoding='utf-8') as self._archivo:
+            self._leer_bloque()
+            self._esperar("{")
+
+            if self._siguiente() != "}":
+                while True:
+                    clave = self._decodificar_valor()
+                    self._esperar(":")
+
+                    if clave == "tareas":
+                        yield from self._iterar_arreglo(total_bytes)
+                    else:
+                        self.metadatos[clave] = self._decodificar_valor()
+
+                    if self._esperar(",", "}") == "}":
+                        break
+            else:
+                self._esperar("}")
+
+            self._informar(total_bytes)
+
+    def _iterar_arreglo(self, total_bytes: int) -> Iterator[Dict[str, Any]]:
+        """Itera los elementos del arreglo de tareas"""
+        self._esperar("[")
+        if self._siguiente() == "]":
+            self._esperar("]")
+            return
+
+        while True:
+            yield self._decodificar_valor()
+            self.tareas_leidas += 1
+
+            if self.tareas_leidas % self.cada == 0:
+                self._informar(total_bytes)
+
+            if self._esperar(",", "]") == "]":
+                return
@@ -0,0 +1,201 @@
+"""
+📦 MODELO: Persistencia con registro de escritura anticipada (WAL)
+Cada alta, cambio o baja se agrega al final de un log como un registro compacto;
+periódicamente el log se compacta en una instantánea que se escribe de forma atómica
+"""
+
+import os
+import json
+import time
+import zlib
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+# Políticas de sincronización a disco del log
+# - "siempre": fsync tras cada registro (ningún cambio confirmado se pierde)
+# - "lote": fsync como mucho una vez por intervalo; lo pendiente queda en el caché del SO
+# - "nunca": solo vaciar el buffer del proceso; el SO decide cuándo escribir
+POLITICAS_FSYNC = ("siempre", "lote", "nunca")
+
+def sincronizar_directorio(ruta: str):
+    """Hace durables las altas y renombrados de archivos dentro del directorio de `ruta`"""
+    if not hasattr(os, "O_DIRECTORY"):
+        return  # Windows no permite abrir directorios
+
+    descriptor = os.open(os.path.dirname(os.path.abspath(ruta)), os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+def escribir_instantanea(ruta: str, tareas: Iterable[Dict[str, Any]], metadatos: Dict[str, Any]):
+    """
+    Escribe una instantánea completa de forma atómica
+    Se escribe a un archivo temporal, se sincroniza y se renombra sobre el destino:
+    ante una caída queda la instantánea anterior o la nueva, nunca una a medias
+    """
+    compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    escribir_fragmentos(ruta, (compacto(tarea_data).encode('utf-8') for tarea_data in tareas),
+                        metadatos)
+
+def escribir_fragmentos(ruta: str, fragmentos: Iterable[bytes], metadatos: Dict[str, Any]):
+    """
+    Escribe una instantánea a partir de tareas ya codificadas (JSON compacto UTF-8)
+    Misma escritura atómica que escribir_instantanea; permite reutilizar fragmentos
+    de tareas que no cambiaron entre guardados
+    """
+    temporal = ruta + ".tmp"
+    compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    with open(temporal, 'wb', buffering=1 << 20) as f:
+        # Mismo formato {"tareas": [...], ...} que lee LectorTareasJSON, una tarea por línea
+        f.write(b'{"tareas":[')
+        separador = b"\n"
+        for fragmento in fragmentos:
+            f.write(separador)
+            f.write(fragmento)
+            separador = b",\n"
+        f.write(b"\n]")
+        for clave, valor in metadatos.items():
+            f.write(f",{compacto(clave)}:{compacto(valor)}".encode('utf-8'))
+        f.write(b"}\n")
+
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temporal, ruta)
+    sincronizar_directorio(ruta)
+
+
+class RegistroWAL:
+    """
+    Log de solo-agregar con un registro JSON compacto por línea
+    Cada línea lleva el CRC32 del registro: una escritura cortada por una caída
+    se detecta al reproducir y se descarta junto con lo que venga detrás
+    """
+
+    def __init__(self, ruta: str, politica_fsync: str = "lote",
+                 intervalo_fsync: float = 1.0, umbral_compactacion: int = 10_000):
+        if politica_fsync not in POLITICAS_FSYNC:
+            raise ValueError(f"Política de fsync no soportada: {politica_fsync}")
+
+        self.ruta = ruta
+        self.politica_fsync = politica_fsync
+        self.intervalo_fsync = intervalo_fsync
+        self.umbral_compactacion = umbral_compactacion
+        # Registros escritos desde la última instantánea
+        self.registros = 0
+
+        self._archivo = None
+        self._ultimo_fsync = time.monotonic()
+        self._codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+    # ========== ESCRITURA ==========
+
+    def abrir(self):
+        """Abre el log para agregar registros (lo crea si no existe)"""
+        if self._archivo is not None:
+            return
+
+        nuevo = not os.path.exists(self.ruta)
+        self._archivo = open(self.ruta, 'ab')
+        if nuevo and self.politica_fsync != "nunca":
+            sincronizar_directorio(self.ruta)
+
+    def agregar(self, registro: Dict[str, Any]) -> bool:
+        """
+        Agrega un registro al final del log
+        Devuelve True cuando el log alcanzó el umbral y conviene compactar
+        """
+        self.abrir()
+        cuerpo = self._codificar(registro).encode('utf-8')
+        self._archivo.write(b"%08x %s\n" % (zlib.crc32(cuerpo), cuerpo))
+        self._archivo.flush()
+
+        if self.politica_fsync == "siempre":
+            os.fsync(self._archivo.fileno())
+        elif self.politica_fsync == "lote":
+            ahora = time.monotonic()
+            if ahora - self._ultimo_fsync >= self.intervalo_fsync:
+                os.fsync(self._archivo.fileno())
+                self._ultimo_fsync = ahora
+
+        self.registros += 1
+        return self.registros >= self.umbral_compactacion
+
+    def sincronizar(self):
+        """Fuerza a disco los registros pendientes"""
+        if self._archivo is None:
+            return
+
+        self._archivo.flush()
+        if self.politica_fsync != "nunca":
+            os.fsync(self._archivo.fileno())
+            self._ultimo_fsync = time.monotonic()
+
+    def reiniciar(self):
+        """Vacía el log (llamar solo después de escribir una instantánea)"""
+        self.abrir()
+        self._archivo.truncate(0)
+        self._archivo.flush()
+        if self.politica_fsync != "nunca":
+            os.fsync(self._archivo.fileno())
+        self.registros = 0
+
+    def cerrar(self):
+        """Sincroniza y cierra el log"""
+        if self._archivo is None:
+            return
+
+        self.sincronizar()
+        self._archivo.close()
+        self._archivo = None
+
+    # ========== LECTURA ==========
+
+    def existe(self) -> bool:
+        """Indica si hay un log en disco"""
+        return os.path.exists(self.ruta)
+
+    def leer(self) -> Iterator[Dict[str, Any]]:
+        """
+        Itera los registros válidos del log en orden
+        Si el final está cortado o dañado, trunca el archivo en el último registro
+        válido para que las escrituras siguientes no queden detrás de basura
+        """
+        self.cerrar()
+        self.registros = 0
+        if not self.existe():
+            return
+
+        valido_hasta = 0
+        with open(self.ruta, 'rb') as f:
+            for linea in f:
+                registro = self._decodificar(linea)
+                if registro is None:
+                    break
+
+                valido_hasta += len(linea)
+                self.registros += 1
+                yield registro
+
+            cortado = valido_hasta < f.seek(0, os.SEEK_END)
+
+        if cortado:
+            with open(self.ruta, 'r+b') as f:
+                f.truncate(valido_hasta)
+                f.flush()
+                os.fsync(f.fileno())
+
+    @staticmethod
+    def _decodificar(linea: bytes) -> Optional[Dict[str, Any]]:
+        """Valida y decodifica una línea; None si está incompleta o dañada"""
+        if not linea.endswith(b"\n") or len(linea) < 10 or linea[8:9] != b" ":
+            return None
+
+        cuerpo = linea[9:-1]
+        try:
+            if int(linea[:8], 16) != zlib.crc32(cuerpo):
+                return None
+            return json.loads(cuerpo)
+        except ValueError:
+            return None
@@ -0,0 +1,27 @@
+"""
+📦 MODELO: Selección de repositorio
+Crea el repositorio de tareas según el backend configurado
+"""
+
+from models.tarea_repository import TareaRepository
+from models.tarea_repository_columnar import TareaRepositoryColumnar
+from models.tarea_repository_sqlite import TareaRepositorySQLite
+from models.tarea_repository_mmap import TareaRepositoryMmap
+
+# Backends disponibles: nombre → clase
+BACKENDS = {
+    "memoria": TareaRepository,
+    "columnar": TareaRepositoryColumnar,
+    "sqlite": TareaRepositorySQLite,
+    "mmap": TareaRepositoryMmap
+}
+
+def crear_repositorio(archivo_datos: str, backend: str = "memoria", persistencia: str = "json",
+                      politica_fsync: str = "lote", procesos: int = 1) -> TareaRepository:
+    """Crea un repositorio del backend y modo de persistencia indicados"""
+    try:
+        clase = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Backend de repositorio no soportado: {backend}")
+    
+    return clase(archivo_datos, persistencia, politica_fsync, procesos)
@@ -0,0 +1,421 @@
+"""
+📦 MODELO: Instantánea binaria de tareas
+Formato compacto (solo biblioteca estándar: struct + tabla de cadenas) para
+guardar y cargar todas las tareas sin pasar por JSON ni por isoformat()
+"""
+
+import gc
+import os
+import sys
+import math
+import mmap
+import struct
+import datetime
+from array import array
+from contextlib import contextmanager
+from itertools import accumulate
+from operator import itemgetter
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea, VACIO
+from models.persistencia_wal import sincronizar_directorio
+
+# Estructura del archivo (little-endian):
+#   cabecera | registros de tareas | índice por ID | índices de etiquetas
+#   | comentarios | fines de cadenas (bytes) | cadenas UTF-8 concatenadas
+# Todo tiene tamaño fijo o posición calculable: una tarea puede decodificarse
+# sin leer las demás (ver SnapshotMapeado)
+MAGICO = b"TAREABIN"
+VERSION = 2
+# mágico, versión, siguiente_id, cantidad de tareas, etiquetas, comentarios y
+# cadenas, conteos por estado (4) y por prioridad (4)
+CABECERA = struct.Struct("<8sHqIIII4I4I")
+# id, título, descripción, usuario, creador (índices en la tabla de cadenas),
+# prioridad, estado (bytes), 4 fechas (int64 µs), tiempos (float64, NaN = None),
+# cantidad de etiquetas y de comentarios, posición de la primera etiqueta y
+# del primer comentario
+REGISTRO = struct.Struct("<qIIIIbbqqqqddHHII")
+CAMPOS_REGISTRO = (
+    "id", "titulo", "descripcion", "usuario_asignado", "usuario_creador",
+    "prioridad", "estado", "fecha_creacion", "fecha_inicio", "fecha_completado",
+    "fecha_vencimiento", "tiempo_estimado_horas", "tiempo_real_horas",
+    "cantidad_etiquetas", "cantidad_comentarios", "primera_etiqueta", "primer_comentario"
+)
+# id, texto, usuario (índices en la tabla de cadenas), fecha (int64 µs)
+COMENTARIO = struct.Struct("<qIIq")
+# Elementos sueltos de las secciones de arreglos
+ENTERO = struct.Struct("<q")
+INDICE = struct.Struct("<I")
+FIN_CADENA = struct.Struct("<Q")
+
+ESTADOS = list(EstadoTarea)
+PRIORIDADES = list(PrioridadTarea)
+CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(ESTADOS)}
+CODIGO_PRIORIDAD = {prioridad: codigo for codigo, prioridad in enumerate(PRIORIDADES)}
+
+NULO = -2 ** 63    # Fecha ausente
+EPOCA = datetime.datetime(1970, 1, 1)
+UN_MICROSEGUNDO = datetime.timedelta(microseconds=1)
+
+
+def _a_bytes(arreglo: array) -> bytes:
+    """Serializa un array en little-endian"""
+    if sys.byteorder == "big":
+        arreglo = array(arreglo.typecode, arreglo)
+        arreglo.byteswap()
+    return arreglo.tobytes()
+
+
+def _desde_bytes(codigo: str, datos) -> array:
+    """Deserializa un array guardado en little-endian"""
+    arreglo = array(codigo)
+    arreglo.frombytes(datos)
+    if sys.byteorder == "big":
+        arreglo.byteswap()
+    return arreglo
+
+
+class TablaCadenas:
+    """Cadenas únicas → índice; usuarios y etiquetas repetidos se guardan una vez"""
+
+    def __init__(self):
+        self.indices: Dict[str, int] = {}
+        self.cadenas: List[str] = []
+
+    def indice(self, cadena: str) -> int:
+        """Obtiene (o asigna) el índice de una cadena"""
+        indice = self.indices.get(cadena)
+        if indice is None:
+            indice = self.indices[cadena] = len(self.cadenas)
+            self.cadenas.append(cadena)
+        return indice
+
+
+def escribir_snapshot_binario(ruta: str, tareas: Iterable[Tarea], siguiente_id: int):
+    """
+    Escribe todas las tareas en formato binario de forma atómica
+    (archivo temporal + fsync + renombrado, como las instantáneas del modo WAL)
+    """
+    tabla = TablaCadenas()
+    indice = tabla.indice
+    registros = bytearray()
+    ids = array('q')
+    etiquetas = array('I')
+    comentarios = bytearray()
+    conteos_estado = [0] * len(ESTADOS)
+    conteos_prioridad = [0] * len(PRIORIDADES)
+    empaquetar = REGISTRO.pack
+    empaquetar_comentario = COMENTARIO.pack
+
+    def microsegundos(fecha) -> int:
+        return NULO if fecha is None else (fecha - EPOCA) // UN_MICROSEGUNDO
+
+    total_comentarios = 0
+    for tarea in tareas:
+        estado = CODIGO_ESTADO[tarea.estado]
+        prioridad = CODIGO_PRIORIDAD[tarea.prioridad]
+        registros += empaquetar(
+            tarea.id, indice(tarea.titulo), indice(tarea.descripcion),
+            indice(tarea.usuario_asignado), indice(tarea.usuario_creador),
+            prioridad, estado,
+            microsegundos(tarea.fecha_creacion), microsegundos(tarea.fecha_inicio),
+            microsegundos(tarea.fecha_completado), microsegundos(tarea.fecha_vencimiento),
+            math.nan if tarea.tiempo_estimado_horas is None else tarea.tiempo_estimado_horas,
+            math.nan if tarea.tiempo_real_horas is None else tarea.tiempo_real_horas,
+            len(tarea.etiquetas), len(tarea.comentarios), len(etiquetas), total_comentarios)
+        ids.append(tarea.id)
+        conteos_estado[estado] += 1
+        conteos_prioridad[prioridad] += 1
+        etiquetas.extend(indice(e) for e in tarea.etiquetas)
+        for comentario in tarea.comentarios:
+            comentarios += empaquetar_comentario(
+                comentario["id"], indice(comentario["texto"]), indice(comentario["usuario"]),
+                microsegundos(comentario["fecha"]))
+        total_comentarios += len(tarea.comentarios)
+
+    # Índice por ID: IDs ordenados y la fila de cada uno (búsqueda binaria)
+    filas = sorted(range(len(ids)), key=ids.__getitem__)
+    ids_ordenados = array('q', map(ids.__getitem__, filas))
+
+    # Fines en bytes: permiten decodificar una cadena sin tocar las demás
+    codificadas = [c.encode('utf-8', 'surrogatepass') for c in tabla.cadenas]
+    fines = array('Q', accumulate(map(len, codificadas)))
+
+    temporal = ruta + ".tmp"
+    with open(temporal, 'wb') as f:
+        f.write(CABECERA.pack(MAGICO, VERSION, siguiente_id, len(ids), len(etiquetas),
+                              total_comentarios, len(fines),
+                              *conteos_estado, *conteos_prioridad))
+        f.write(registros)
+        f.write(_a_bytes(ids_ordenados))
+        f.write(_a_bytes(array('I', filas)))
+        f.write(_a_bytes(etiquetas))
+        f.write(comentarios)
+        f.write(_a_bytes(fines))
+        f.write(b"".join(codificadas))
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(temporal, ruta)
+    sincronizar_directorio(ruta)
+
+
+class Secciones:
+    """Posición de cada sección del archivo, calculada a partir de la cabecera"""
+
+    def __init__(self, datos, ruta: str):
+        (magico, version, self.siguiente_id, self.cantidad, self.total_etiquetas,
+         self.total_comentarios, self.total_cadenas, *conteos) = CABECERA.unpack_from(datos)
+        if magico != MAGICO or version != VERSION:
+            raise ValueError(f"Instantánea binaria no reconocida: {ruta}")
+
+        self.conteos_estado = conteos[:len(ESTADOS)]
+        self.conteos_prioridad = conteos[len(ESTADOS):]
+
+        self.registros = CABECERA.size
+        self.ids = self.registros + self.cantidad * REGISTRO.size
+        self.filas = self.ids + self.cantidad * ENTERO.size
+        self.etiquetas = self.filas + self.cantidad * INDICE.size
+        self.comentarios = self.etiquetas + self.total_etiquetas * INDICE.size
+        self.fines = self.comentarios + self.total_comentarios * COMENTARIO.size
+        self.texto = self.fines + self.total_cadenas * FIN_CADENA.size
+
+
+def _a_fecha(valor: int) -> datetime.datetime:
+    """Microsegundos desde la época → fecha (inversa exacta de a_microsegundos)"""
+    return EPOCA + datetime.timedelta(microseconds=valor)
+
+
+@contextmanager
+def recolector_pausado() -> Iterator[None]:
+    """
+    Pausa el recolector de ciclos durante una carga masiva
+    Se crean millones de objetos que no forman ciclos: sin la pausa, cada
+    umbral alcanzado recorre un heap cada vez más grande
+    """
+    activo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if activo:
+            gc.enable()
+
+
+def leer_snapshot_binario(ruta: str) -> Tuple[List[Tarea], Dict[str, Any]]:
+    """Carga todas las tareas de una instantánea binaria; devuelve (tareas, metadatos)"""
+    with recolector_pausado():
+        return _leer_snapshot_binario(ruta)
+
+
+def _leer_snapshot_binario(ruta: str) -> Tuple[List[Tarea], Dict[str, Any]]:
+    """Decodifica la instantánea (ver leer_snapshot_binario)"""
+    with open(ruta, 'rb') as f:
+        datos = memoryview(f.read())
+
+    secciones = Secciones(datos, ruta)
+
+    # Tabla de cadenas: cada una se decodifica entre su inicio y su fin en bytes
+    bloque = bytes(datos[secciones.texto:])
+    fines = _desde_bytes('Q', datos[secciones.fines:secciones.texto])
+    cadenas = [bloque[i:f].decode('utf-8', 'surrogatepass')
+               for i, f in zip([0, *fines[:-1]], fines)]
+
+    etiquetas = _desde_bytes('I', datos[secciones.etiquetas:secciones.comentarios])
+    comentarios = COMENTARIO.iter_unpack(datos[secciones.comentarios:secciones.fines])
+
+    # Búsquedas locales: este bucle se ejecuta una vez por tarea
+    nueva = Tarea.__new__
+    prioridades = PRIORIDADES
+    estados = ESTADOS
+    epoca = EPOCA
+    microsegundos = datetime.timedelta
+    a_fecha = _a_fecha
+    nulo = NULO
+    vacio = VACIO
+
+    tareas = []
+    posicion_etiquetas = 0
+    for (tarea_id, titulo, descripcion, usuario, creador, prioridad, estado,
+         creacion, inicio_, completado, vencimiento, estimado, real,
+         n_etiquetas, n_comentarios, _, _) in REGISTRO.iter_unpack(
+             datos[secciones.registros:secciones.ids]):
+        tarea = nueva(Tarea)
+        tarea.id = tarea_id
+        tarea.titulo = cadenas[titulo]
+        tarea.descripcion = cadenas[descripcion]
+        tarea.usuario_asignado = cadenas[usuario]
+        tarea.usuario_creador = cadenas[creador]
+        tarea.prioridad = prioridades[prioridad]
+        tarea.estado = estados[estado]
+        tarea.fecha_creacion = epoca + microsegundos(microseconds=creacion)
+        tarea.fecha_inicio = (None if inicio_ == nulo else
+                              epoca + microsegundos(microseconds=inicio_))
+        tarea.fecha_completado = (None if completado == nulo else
+                                  epoca + microsegundos(microseconds=completado))
+        tarea.fecha_vencimiento = (None if vencimiento == nulo else
+                                   epoca + microsegundos(microseconds=vencimiento))
+        # NaN es el único valor distinto de sí mismo
+        tarea.tiempo_estimado_horas = estimado if estimado == estimado else None
+        tarea.tiempo_real_horas = real if real == real else None
+        tarea._observador = None
+
+        if n_etiquetas:
+            tarea.etiquetas = [cadenas[i] for i in
+                               etiquetas[posicion_etiquetas:posicion_etiquetas + n_etiquetas]]
+            posicion_etiquetas += n_etiquetas
+        else:
+            tarea.etiquetas = vacio
+
+        if n_comentarios:
+            tarea.comentarios = [
+                {"id": comentario_id, "texto": cadenas[texto_c], "usuario": cadenas[autor],
+                 "fecha": a_fecha(fecha)}
+                for comentario_id, texto_c, autor, fecha in
+                (next(comentarios) for _ in range(n_comentarios))
+            ]
+        else:
+            tarea.comentarios = vacio
+
+        tareas.append(tarea)
+
+    return tareas, {"siguiente_id": secciones.siguiente_id}
+
+
+def _fecha_opcional(valor: int) -> Optional[datetime.datetime]:
+    """Microsegundos desde la época → fecha (None si es la marca de fecha ausente)"""
+    return None if valor == NULO else _a_fecha(valor)
+
+
+class SnapshotMapeado:
+    """
+    Acceso de solo lectura a una instantánea binaria mapeada en memoria
+    Al abrir solo se lee la cabecera; cada registro, cadena o tarea se decodifica
+    al pedirlo, así que el costo depende de lo que se lee y no del tamaño del archivo
+    """
+
+    def __init__(self, ruta: str):
+        with open(ruta, 'rb') as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._datos = memoryview(self._mapa)
+        self._secciones = Secciones(self._datos, ruta)
+
+        self.siguiente_id = self._secciones.siguiente_id
+        self.conteos_estado = dict(zip(ESTADOS, self._secciones.conteos_estado))
+        self.conteos_prioridad = dict(zip(PRIORIDADES, self._secciones.conteos_prioridad))
+
+    def __len__(self) -> int:
+        return self._secciones.cantidad
+
+    def cerrar(self):
+        """Libera el mapeo (no debe quedar ningún recorrido en curso)"""
+        self._datos.release()
+        self._mapa.close()
+
+    # ========== REGISTROS ==========
+
+    def registro(self, fila: int) -> Tuple:
+        """Campos crudos de una fila (ver CAMPOS_REGISTRO)"""
+        return REGISTRO.unpack_from(self._datos, self._secciones.registros + fila * REGISTRO.size)
+
+    def registros(self, desde: int = 0, hasta: Optional[int] = None) -> Iterator[Tuple]:
+        """Campos crudos de las filas [desde, hasta), en orden de archivo"""
+        hasta = self._secciones.cantidad if hasta is None else min(hasta, self._secciones.cantidad)
+        if desde >= hasta:
+            return iter(())
+        inicio = self._secciones.registros
+        return REGISTRO.iter_unpack(
+            self._datos[inicio + desde * REGISTRO.size:inicio + hasta * REGISTRO.size])
+
+    def columnas(self, *campos: str) -> Iterator:
+        """
+        Recorre solo algunos campos de todas las filas
+        Con un campo produce valores sueltos; con varios, tuplas en el orden pedido
+        """
+        return map(itemgetter(*map(CAMPOS_REGISTRO.index, campos)), self.registros())
+
+    def posicion_de_id(self, tarea_id: int) -> int:
+        """Primera posición del índice por ID cuyo ID es >= tarea_id (búsqueda binaria)"""
+        datos = self._datos
+        base = self._secciones.ids
+        bajo, alto = 0, self._secciones.cantidad
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if ENTERO.unpack_from(datos, base + medio * ENTERO.size)[0] < tarea_id:
+                bajo = medio + 1
+            else:
+                alto = medio
+        return bajo
+
+    def id_en_posicion(self, posicion: int) -> int:
+        """ID de la posición `posicion` del índice (IDs ordenados)"""
+        return ENTERO.unpack_from(self._datos, self._secciones.ids + posicion * ENTERO.size)[0]
+
+    def fila_en_posicion(self, posicion: int) -> int:
+        """Fila de la tarea en la posición `posicion` del índice por ID"""
+        return INDICE.unpack_from(self._datos, self._secciones.filas + posicion * INDICE.size)[0]
+
+    def fila_de_id(self, tarea_id: int) -> Optional[int]:
+        """Fila de una tarea por búsqueda binaria en el índice por ID"""
+        posicion = self.posicion_de_id(tarea_id)
+        if posicion == self._secciones.cantidad or self.id_en_posicion(posicion) != tarea_id:
+            return None
+        return self.fila_en_posicion(posicion)
+
+    def etiquetas(self, primera: int, cantidad: int) -> List[int]:
+        """Índices (en la tabla de cadenas) de las etiquetas de una fila"""
+        base = self._secciones.etiquetas
+        return [INDICE.unpack_from(self._datos, base + posicion * INDICE.size)[0]
+                for posicion in range(primera, primera + cantidad)]
+
+    # ========== DECODIFICACIÓN ==========
+
+    def cadena(self, indice: int) -> str:
+        """Decodifica una cadena de la tabla"""
+        fines = self._secciones.fines
+        inicio = FIN_CADENA.unpack_from(self._datos, fines + (indice - 1) * FIN_CADENA.size)[0] \
+            if indice else 0
+        fin = FIN_CADENA.unpack_from(self._datos, fines + indice * FIN_CADENA.size)[0]
+        texto = self._secciones.texto
+        return str(self._datos[texto + inicio:texto + fin], 'utf-8', 'surrogatepass')
+
+    def tarea(self, fila: int) -> Tarea:
+        """Decodifica la tarea de una fila (desconectada: no tiene observador)"""
+        return self.tarea_desde_registro(self.registro(fila))
+
+    def tarea_desde_registro(self, registro: Tuple) -> Tarea:
+        """Construye una Tarea a partir de los campos crudos de su fila"""
+        (tarea_id, titulo, descripcion, usuario, creador, prioridad, estado,
+         creacion, inicio, completado, vencimiento, estimado, real,
+         n_etiquetas, n_comentarios, primera_etiqueta, primer_comentario) = registro
+        cadena = self.cadena
+
+        tarea = Tarea.__new__(Tarea)
+        tarea.id = tarea_id
+        tarea.titulo = cadena(titulo)
+        tarea.descripcion = cadena(descripcion)
+        tarea.usuario_asignado = sys.intern(cadena(usuario))
+        tarea.usuario_creador = sys.intern(cadena(creador))
+        tarea.prioridad = PRIORIDADES[prioridad]
+        tarea.estado = ESTADOS[estado]
+        tarea.fecha_creacion = _a_fecha(creacion)
+        tarea.fecha_inicio = _fecha_opcional(inicio)
+        tarea.fecha_completado = _fecha_opcional(completado)
+        tarea.fecha_vencimiento = _fecha_opcional(vencimiento)
+        tarea.tiempo_estimado_horas = None if math.isnan(estimado) else estimado
+        tarea.tiempo_real_horas = None if math.isnan(real) else real
+        tarea._observador = None
+
+        tarea.etiquetas = [sys.intern(cadena(indice)) for indice in
+                           self.etiquetas(primera_etiqueta, n_etiquetas)] or VACIO
+
+        inicio_comentarios = self._secciones.comentarios + primer_comentario * COMENTARIO.size
+        tarea.comentarios = [
+            {"id": comentario_id, "texto": cadena(texto), "usuario": cadena(autor),
+             "fecha": _a_fecha(fecha)}
+            for comentario_id, texto, autor, fecha in COMENTARIO.iter_unpack(
+                self._datos[inicio_comentarios:
+                            inicio_comentarios + n_comentarios * COMENTARIO.size])
+        ] or VACIO
+
+        return tarea
@@ -3,9 +3,10 @@
 Representa una tarea individual con su lógica de negocio
 """
 
+import sys
 import datetime
 from enum import Enum
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Sequence
 
 class EstadoTarea(Enum):
     """Estados posibles de una tarea"""
@@ -21,19 +22,38 @@ class PrioridadTarea(Enum):
     ALTA = "alta"
     CRITICA = "critica"
 
+# Colección vacía compartida por todas las tareas sin etiquetas o comentarios
+VACIO: Sequence[Any] = ()
+
 class Tarea:
     """
     Modelo de Tarea - Solo contiene datos y lógica de negocio
     No maneja presentación ni coordinación
+    
+    Representación compacta: __slots__ en lugar de __dict__, una tupla vacía
+    compartida para etiquetas/comentarios vacíos y usuarios/etiquetas internados
+    
+    `etiquetas` y `comentarios` son secuencias de solo lectura (tupla vacía o
+    lista): se cambian con agregar_etiqueta, remover_etiqueta y agregar_comentario,
+    que las reemplazan y notifican al repositorio. Modificarlas en el lugar
+    (append, remove) no está soportado
     """
     
+    __slots__ = (
+        "id", "titulo", "descripcion", "usuario_asignado", "prioridad",
+        "estado", "fecha_creacion", "fecha_inicio", "fecha_completado", "fecha_vencimiento",
+        "usuario_creador", "etiquetas", "comentarios",
+        "tiempo_estimado_horas", "tiempo_real_horas", "_observador",
+        "__weakref__"  # Permite cachés débiles de tareas materializadas
+    )
+    
     def __init__(self, id: int, titulo: str, descripcion: str, 
                  usuario_asignado: str, prioridad: PrioridadTarea = PrioridadTarea.MEDIA):
         # Datos básicos
         self.id = id
         self.titulo = titulo
         self.descripcion = descripcion
-        self.usuario_asignado = usuario_asignado
+        self.usuario_asignado = sys.intern(usuario_asignado)
         self.prioridad = prioridad
         
         # Estado y fechas
@@ -44,11 +64,21 @@ class Tarea:
         self.fecha_vencimiento: Optional[datetime.datetime] = None
         
         # Metadatos
-        self.usuario_creador = usuario_asignado  # Por simplicidad
-        self.etiquetas = []
-        self.comentarios = []
+        self.usuario_creador = self.usuario_asignado  # Por simplicidad
+        self.etiquetas: Sequence[str] = VACIO
+        self.comentarios: Sequence[Dict[str, Any]] = VACIO
         self.tiempo_estimado_horas: Optional[float] = None
         self.tiempo_real_horas: Optional[float] = None
+        
+        # Observador de cambios (lo registra el repositorio para sus índices)
+        self._observador: Optional[Callable[['Tarea', str, Any], None]] = None
+    
+    # ========== NOTIFICACIÓN DE CAMBIOS ==========
+    
+    def _notificar_cambio(self, campo: str, valor_anterior: Any):
+        """Avisa al observador registrado que un campo cambió"""
+        if self._observador is not None:
+            self._observador(self, campo, valor_anterior)
     
     # ========== LÓGICA DE NEGOCIO ==========
     
@@ -82,6 +112,7 @@ class Tarea:
             if estado_anterior == EstadoTarea.COMPLETADA:
                 self.fecha_inicio = None
         
+        self._notificar_cambio("estado", estado_anterior)
         return True
     
     def asignar_usuario(self, nuevo_usuario: str) -> bool:
@@ -92,7 +123,26 @@ class Tarea:
         if self.estado == EstadoTarea.COMPLETADA:
             return False  # No se puede reasignar tarea completada
         
-        self.usuario_asignado = nuevo_usuario
+        usuario_anterior = self.usuario_asignado
+        self.usuario_asignado = sys.intern(nuevo_usuario)
+        self._notificar_cambio("usuario_asignado", usuario_anterior)
+        return True
+    
+    def cambiar_titulo(self, nuevo_titulo: str) -> bool:
+        """Lógica de negocio: Cambiar el título de la tarea"""
+        if not nuevo_titulo.strip():
+            return False
+        
+        titulo_anterior = self.titulo
+        self.titulo = nuevo_titulo
+        self._notificar_cambio("titulo", titulo_anterior)
+        return True
+    
+    def cambiar_descripcion(self, nueva_descripcion: str) -> bool:
+        """Lógica de negocio: Cambiar la descripción de la tarea"""
+        descripcion_anterior = self.descripcion
+        self.descripcion = nueva_descripcion
+        self._notificar_cambio("descripcion", descripcion_anterior)
         return True
     
     def cambiar_prioridad(self, nueva_prioridad: PrioridadTarea) -> bool:
@@ -100,7 +150,9 @@ class Tarea:
         if self.estado == EstadoTarea.COMPLETADA:
             return False  # No se puede cambiar prioridad de tarea completada
         
+        prioridad_anterior = self.prioridad
         self.prioridad = nueva_prioridad
+        self._notificar_cambio("prioridad", prioridad_anterior)
         return True
     
     def establecer_fecha_vencimiento(self, fecha_vencimiento: datetime.datetime) -> bool:
@@ -111,7 +163,17 @@ class Tarea:
         if self.estado == EstadoTarea.COMPLETADA:
             return False  # No se puede cambiar fecha de tarea completada
         
+        fecha_anterior = self.fecha_vencimiento
         self.fecha_vencimiento = fecha_vencimiento
+        self._notificar_cambio("fecha_vencimiento", fecha_anterior)
+        return True
+    
+    def quitar_fecha_vencimiento(self) -> bool:
+        """Lógica de negocio: Quitar la fecha de vencimiento"""
+        fecha_anterior = self.fecha_vencimiento
+        if fecha_anterior is not None:
+            self.fecha_vencimiento = None
+            self._notificar_cambio("fecha_vencimiento", fecha_anterior)
         return True
     
     def agregar_etiqueta(self, etiqueta: str) -> bool:
@@ -121,7 +183,9 @@ class Tarea:
             return False
         
         if etiqueta not in self.etiquetas:
-            self.etiquetas.append(etiqueta)
+            etiquetas_anteriores = tuple(self.etiquetas)
+            self.etiquetas = [*self.etiquetas, sys.intern(etiqueta)]
+            self._notificar_cambio("etiquetas", etiquetas_anteriores)
             return True
         
         return False  # Etiqueta ya existe
@@ -130,7 +194,9 @@ class Tarea:
         """Lógica de negocio: Remover etiqueta de la tarea"""
         etiqueta = etiqueta.strip().lower()
         if etiqueta in self.etiquetas:
-            self.etiquetas.remove(etiqueta)
+            etiquetas_anteriores = tuple(self.etiquetas)
+            self.etiquetas = [e for e in self.etiquetas if e != etiqueta] or VACIO
+            self._notificar_cambio("etiquetas", etiquetas_anteriores)
             return True
         return False
     
@@ -146,7 +212,9 @@ class Tarea:
             "fecha": datetime.datetime.now()
         }
         
-        self.comentarios.append(nuevo_comentario)
+        comentarios_anteriores = self.comentarios
+        self.comentarios = [*self.comentarios, nuevo_comentario]
+        self._notificar_cambio("comentarios", comentarios_anteriores)
         return True
     
     def establecer_tiempo_estimado(self, horas: float) -> bool:
@@ -154,7 +222,9 @@ class Tarea:
         if horas <= 0:
             return False
         
+        tiempo_anterior = self.tiempo_estimado_horas
         self.tiempo_estimado_horas = horas
+        self._notificar_cambio("tiempo_estimado_horas", tiempo_anterior)
         return True
     
     def registrar_tiempo_real(self, horas: float) -> bool:
@@ -162,29 +232,31 @@ class Tarea:
         if horas <= 0:
             return False
         
-        if self.tiempo_real_horas is None:
-            self.tiempo_real_horas = 0
-        
-        self.tiempo_real_horas += horas
+        tiempo_anterior = self.tiempo_real_horas
+        self.tiempo_real_horas = (tiempo_anterior or 0) + horas
+        self._notificar_cambio("tiempo_real_horas", tiempo_anterior)
         return True
     
     # ========== CONSULTAS DE NEGOCIO ==========
     
-    def esta_vencida(self) -> bool:
-        """Verifica si la tarea está vencida"""
+    def esta_vencida(self, ahora: Optional[datetime.datetime] = None) -> bool:
+        """
+        Verifica si la tarea está vencida
+        `ahora` permite evaluar muchas tareas con una sola lectura del reloj
+        """
         if self.fecha_vencimiento is None:
             return False
         
         if self.estado == EstadoTarea.COMPLETADA:
             return False
         
-        return datetime.datetime.now() > self.fecha_vencimiento
+        return (ahora or datetime.datetime.now()) > self.fecha_vencimiento
     
     def esta_en_plazo(self) -> bool:
         """Verifica si la tarea está en plazo"""
         return not self.esta_vencida()
     
-    def dias_para_vencimiento(self) -> Optional[int]:
+    def dias_para_vencimiento(self, ahora: Optional[datetime.datetime] = None) -> Optional[int]:
         """Calcula días restantes para vencimiento"""
         if self.fecha_vencimiento is None:
             return None
@@ -192,7 +264,7 @@ class Tarea:
         if self.estado == EstadoTarea.COMPLETADA:
             return None
         
-        diferencia = self.fecha_vencimiento - datetime.datetime.now()
+        diferencia = self.fecha_vencimiento - (ahora or datetime.datetime.now())
         return diferencia.days
     
     def duracion_en_progreso(self) -> Optional[datetime.timedelta]:
@@ -211,25 +283,32 @@ class Tarea:
         """Verifica si es crítica"""
         return self.prioridad == PrioridadTarea.CRITICA
     
-    def necesita_atencion(self) -> bool:
+    def necesita_atencion(self, ahora: Optional[datetime.datetime] = None) -> bool:
         """Determina si la tarea necesita atención urgente"""
         # Criterios de negocio para atención urgente
         if self.es_critica():
             return True
         
-        if self.esta_vencida():
+        if self.esta_vencida(ahora):
             return True
         
-        if self.es_alta_prioridad() and self.dias_para_vencimiento() is not None:
-            return self.dias_para_vencimiento() <= 1
+        if self.es_alta_prioridad():
+            dias = self.dias_para_vencimiento(ahora)
+            if dias is not None:
+                return dias <= 1
         
         return False
     
     # ========== SERIALIZACIÓN ==========
     
-    def to_dict(self) -> dict:
-        """Convierte la tarea a diccionario para serialización"""
-        return {
+    def to_dict(self, incluir_calculados: bool = True,
+                ahora: Optional[datetime.datetime] = None) -> dict:
+        """
+        Convierte la tarea a diccionario para serialización
+        Con `incluir_calculados=False` omite los campos derivados (formato de persistencia);
+        `ahora` fija el instante con que se calculan
+        """
+        datos = {
             "id": self.id,
             "titulo": self.titulo,
             "descripcion": self.descripcion,
@@ -241,7 +320,7 @@ class Tarea:
             "fecha_inicio": self.fecha_inicio.isoformat() if self.fecha_inicio else None,
             "fecha_completado": self.fecha_completado.isoformat() if self.fecha_completado else None,
             "fecha_vencimiento": self.fecha_vencimiento.isoformat() if self.fecha_vencimiento else None,
-            "etiquetas": self.etiquetas,
+            "etiquetas": list(self.etiquetas),
             "comentarios": [
                 {
                     **comentario,
@@ -250,12 +329,16 @@ class Tarea:
                 for comentario in self.comentarios
             ],
             "tiempo_estimado_horas": self.tiempo_estimado_horas,
-            "tiempo_real_horas": self.tiempo_real_horas,
-            # Campos calculados
-            "esta_vencida": self.esta_vencida(),
-            "dias_para_vencimiento": self.dias_para_vencimiento(),
-            "necesita_atencion": self.necesita_atencion()
+            "tiempo_real_horas": self.tiempo_real_horas
         }
+        
+        if incluir_calculados:
+            # Campos calculados
+            datos["esta_vencida"] = self.esta_vencida(ahora)
+            datos["dias_para_vencimiento"] = self.dias_para_vencimiento(ahora)
+            datos["necesita_atencion"] = self.necesita_atencion(ahora)
+        
+        return datos
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Tarea':
@@ -269,7 +352,7 @@ class Tarea:
         )
         
         # Restaurar datos adicionales
-        tarea.usuario_creador = data.get("usuario_creador", data["usuario_asignado"])
+        tarea.usuario_creador = sys.intern(data.get("usuario_creador", data["usuario_asignado"]))
         tarea.estado = EstadoTarea(data["estado"])
         tarea.fecha_creacion = datetime.datetime.fromisoformat(data["fecha_creacion"])
         
@@ -282,15 +365,17 @@ class Tarea:
         if data.get("fecha_vencimiento"):
             tarea.fecha_vencimiento = datetime.datetime.fromisoformat(data["fecha_vencimiento"])
         
-        tarea.etiquetas = data.get("etiquetas", [])
+        tarea.etiquetas = [sys.intern(e) for e in data.get("etiquetas", ())] or VACIO
         tarea.tiempo_estimado_horas = data.get("tiempo_estimado_horas")
         tarea.tiempo_real_horas = data.get("tiempo_real_horas")
         
         # Restaurar comentarios
-        for comentario_data in data.get("comentarios", []):
+        comentarios = []
+        for comentario_data in data.get("comentarios", ()):
             comentario = comentario_data.copy()
             comentario["fecha"] = datetime.datetime.fromisoformat(comentario["fecha"])
-            tarea.comentarios.append(comentario)
+            comentarios.append(comentario)
+        tarea.comentarios = comentarios or VACIO
         
         return tarea
     
@@ -4,10 +4,77 @@ Maneja la persistencia y consultas de tareas
 Simula una base de datos
 """
 
+import io
+import os
 import json
 import datetime
-from typing import List, Optional, Dict, Any
+import heapq
+import threading
+from itertools import chain, islice
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Callable, TextIO
 from models.tarea import Tarea, EstadoTarea, PrioridadTarea
+from models.indices import IndiceSecundario, IndiceOrdenado, IndiceTexto
+from models.estadisticas import EstadisticasIncrementales
+from models.lector_json import LectorTareasJSON, CallbackProgreso
+from models.importacion import ResultadoImportacion, lotes_de_tareas, TAMANO_LOTE_IMPORTACION
+from models.carga_paralela import (Segmento, admite_carga_paralela, decodificar_en_paralelo,
+                                   admite_codificacion_paralela, codificar_en_paralelo)
+from models.exportacion import exportar_tareas, TAMANO_BUFFER_EXPORTACION
+from models.persistencia_wal import RegistroWAL, escribir_fragmentos
+from models.snapshot_binario import (escribir_snapshot_binario, leer_snapshot_binario,
+                                     recolector_pausado)
+
+# Campos que alimentan la búsqueda de texto
+CAMPOS_TEXTO = ("titulo", "descripcion", "usuario_asignado")
+
+# Modos de persistencia: documento JSON completo, instantánea + log (WAL)
+# o instantánea binaria (archivo .bin junto al JSON)
+MODOS_PERSISTENCIA = ("json", "wal", "binario")
+
+
+def ruta_instantanea_lectura(archivo_datos: str, persistencia: str) -> str:
+    """
+    Instantánea binaria que abre el repositorio mapeado (solo lectura): en modo
+    "binario" es la propia fuente de los datos; en los demás, una copia derivada
+    con nombre propio para no confundirla con ella
+    """
+    base = os.path.splitext(archivo_datos)[0]
+    return base + (".bin" if persistencia == "binario" else ".lectura.bin")
+
+# Posición de cada prioridad en los listados (crítica primero)
+RANGO_PRIORIDAD = {
+    PrioridadTarea.CRITICA: 0,
+    PrioridadTarea.ALTA: 1,
+    PrioridadTarea.MEDIA: 2,
+    PrioridadTarea.BAJA: 3
+}
+
+# Criterios de orden que el repositorio mantiene sin reordenar en cada consulta
+CRITERIOS_ORDEN = ("prioridad", "fecha_vencimiento", "fecha_creacion")
+
+
+def _clave_prioridad(tarea: Tarea) -> int:
+    return RANGO_PRIORIDAD[tarea.prioridad]
+
+
+def _clave_vencimiento(tarea: Tarea) -> tuple:
+    """Próximas primero; las tareas sin vencimiento al final"""
+    fecha = tarea.fecha_vencimiento
+    return (fecha is None, fecha or datetime.datetime.min)
+
+
+def _clave_creacion(tarea: Tarea) -> datetime.datetime:
+    return tarea.fecha_creacion
+
+
+# Codificador del JSON de cada tarea (compacto, sin escapar acentos)
+_codificar_compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def _guardado_fallido() -> bool:
+    """Escritura de una captura que no se pudo tomar"""
+    return False
+
 
 class TareaRepository:
     """
@@ -15,11 +82,35 @@ class TareaRepository:
     No contiene lógica de presentación ni coordinación
     """
     
-    def __init__(self, archivo_datos: str = "tareas.json"):
+    # Los procesos de carga en paralelo también indexan el texto de su segmento
+    _texto_en_procesos = True
+    
+    def __init__(self, archivo_datos: str = "tareas.json", persistencia: str = "json",
+                 politica_fsync: str = "lote", procesos: int = 1):
         self.archivo_datos = archivo_datos
-        self.tareas: List[Tarea] = []
+        # Procesos para decodificar/codificar archivos de datos grandes (1 = secuencial)
+        self.procesos = procesos
+        self._inicializar_persistencia(persistencia, politica_fsync)
+        # Índice primario id → Tarea (conserva el orden de inserción)
+        self.tareas: Dict[int, Tarea] = {}
         self.siguiente_id = 1
         
+        # Índices secundarios campo → cubetas, sincronizados vía notificaciones
+        self._indices: Dict[str, IndiceSecundario] = {
+            "estado": IndiceSecundario("estado"),
+            "prioridad": IndiceSecundario("prioridad"),
+            "usuario_asignado": IndiceSecundario("usuario_asignado"),
+            "etiquetas": IndiceSecundario("etiquetas", multivalor=True)
+        }
+        self._estadisticas = EstadisticasIncrementales(self._indices)
+        self._indice_texto = IndiceTexto()
+        # Vistas ordenadas por criterio (clave = campo del que dependen)
+        self._ordenes: Dict[str, IndiceOrdenado] = {
+            "prioridad": IndiceOrdenado(_clave_prioridad),
+            "fecha_vencimiento": IndiceOrdenado(_clave_vencimiento),
+            "fecha_creacion": IndiceOrdenado(_clave_creacion, descendente=True)
+        }
+        
         # Cargar datos existentes
         self.cargar_datos()
     
@@ -36,33 +127,59 @@ class TareaRepository:
             prioridad=prioridad
         )
         
-        self.tareas.append(tarea)
+        self.tareas[tarea.id] = tarea
+        self._indexar(tarea)
         self.siguiente_id += 1
+        self._registrar_guardado(tarea)
         
         return tarea
     
     def obtener_tarea_por_id(self, tarea_id: int) -> Optional[Tarea]:
         """Obtiene una tarea por su ID"""
-        for tarea in self.tareas:
-            if tarea.id == tarea_id:
-                return tarea
-        return None
+        return self.tareas.get(tarea_id)
     
     def obtener_todas_tareas(self) -> List[Tarea]:
         """Obtiene todas las tareas"""
-        return self.tareas.copy()
+        return list(self.tareas.values())
+    
+    def obtener_tareas_pagina(self, desde: int, cantidad: int) -> List[Tarea]:
+        """Obtiene `cantidad` tareas a partir de la posición `desde` (orden de inserción)"""
+        return list(islice(self.tareas.values(), desde, desde + cantidad))
+    
+    def obtener_tareas_despues_de(self, cursor: int, cantidad: int) -> List[Tarea]:
+        """
+        Paginación por cursor (keyset): `cantidad` tareas con ID mayor que `cursor`,
+        en orden de ID. Es estable ante altas y bajas porque los IDs no se reutilizan;
+        recorre el rango de IDs, así que cuesta O(cantidad + IDs eliminados del tramo)
+        """
+        tareas = self.tareas
+        pagina = []
+        tarea_id = max(cursor, 0) + 1
+        while len(pagina) < cantidad and tarea_id < self.siguiente_id:
+            tarea = tareas.get(tarea_id)
+            if tarea is not None:
+                pagina.append(tarea)
+            tarea_id += 1
+        return pagina
     
     def obtener_tareas_activas(self) -> List[Tarea]:
         """Obtiene tareas que no están canceladas"""
-        return [t for t in self.tareas if t.estado != EstadoTarea.CANCELADA]
+        return [t for t in self.tareas.values() if t.estado != EstadoTarea.CANCELADA]
     
     def actualizar_tarea(self, tarea: Tarea) -> bool:
         """Actualiza una tarea existente"""
-        for i, t in enumerate(self.tareas):
-            if t.id == tarea.id:
-                self.tareas[i] = tarea
-                return True
-        return False
+        anterior = self.tareas.get(tarea.id)
+        if anterior is None:
+            return False
+        
+        # La misma instancia ya avisó cada cambio a los índices; un objeto sustituto
+        # se reindexa quitando el anterior por sus propios valores
+        if anterior is not tarea:
+            self._desindexar(anterior)
+            self.tareas[tarea.id] = tarea
+            self._indexar(tarea)
+        self._registrar_guardado(tarea)
+        return True
     
     def eliminar_tarea(self, tarea_id: int) -> bool:
         """Elimina una tarea (marca como cancelada)"""
@@ -73,39 +190,170 @@ class TareaRepository:
         return False
     
     def eliminar_definitivamente(self, tarea_id: int) -> bool:
-        """Elimina una tarea definitivamente de la lista"""
-        for i, tarea in enumerate(self.tareas):
-            if tarea.id == tarea_id:
-                del self.tareas[i]
-                return True
-        return False
+        """Elimina una tarea definitivamente del repositorio"""
+        tarea = self.tareas.pop(tarea_id, None)
+        if tarea is None:
+            return False
+        
+        self._desindexar(tarea)
+        self._registrar_eliminacion(tarea_id)
+        return True
+    
+    # ========== IMPORTACIÓN MASIVA ==========
+    
+    def importar_tareas(self, registros: Iterable[Any],
+                        tamano_lote: int = TAMANO_LOTE_IMPORTACION) -> ResultadoImportacion:
+        """
+        Importa tareas en bloque (registros con el formato de to_dict, p. ej. de
+        models.importacion.leer_registros). Cada lote se valida con TareaValidator y
+        recibe IDs consecutivos; índices, estadísticas, log y aviso de cambios se
+        actualizan una sola vez al terminar. Los registros inválidos se rechazan
+        sin detener la importación
+        """
+        with self.bloqueo, recolector_pausado():
+            resultado = ResultadoImportacion(self.siguiente_id)
+            try:
+                for tareas in lotes_de_tareas(registros, self.siguiente_id, resultado, tamano_lote):
+                    self._insertar_lote(tareas)
+                    self.siguiente_id += len(tareas)
+            finally:
+                # Aunque la lectura falle a mitad, lo ya insertado queda indexado
+                if self.siguiente_id > resultado.primer_id:
+                    self._registrar_importacion(range(resultado.primer_id, self.siguiente_id))
+        return resultado
+    
+    def _insertar_lote(self, tareas: List[Tarea]):
+        """Agrega un lote de tareas nuevas sin indexarlas"""
+        self.tareas.update((tarea.id, tarea) for tarea in tareas)
+    
+    def _indexar_importadas(self, ids: range):
+        """
+        Indexa de una vez las tareas importadas
+        Si falla a mitad, las descarta y reconstruye los índices: ninguna tarea
+        queda en `tareas` sin indexar del todo
+        """
+        tareas = [self.tareas[tarea_id] for tarea_id in ids]
+        try:
+            for indice in self._indices.values():
+                indice.agregar_lote(tareas)
+            self._estadisticas.agregar_lote(tareas)
+            self._indice_texto.agregar_lote(tareas)
+            for orden in self._ordenes.values():
+                orden.agregar_lote(tareas)
+        except Exception:
+            for tarea_id in ids:
+                del self.tareas[tarea_id]
+            self._reconstruir_indices()
+            raise
+        for tarea in tareas:
+            tarea._observador = self._al_cambiar_tarea
+    
+    def _registrar_importacion(self, ids: range):
+        """Indexa las tareas importadas, las marca sin guardar y avisa un único cambio"""
+        self._indexar_importadas(ids)
+        self._modificadas.update(ids)
+        # Modo WAL: una instantánea en lugar de un registro (y compactaciones) por tarea
+        if self._wal is not None and not self.compactar():
+            for tarea_id in ids:
+                self._escribir_registro({"op": "guardar", 
+                                         "tarea": self.tareas[tarea_id].to_dict(incluir_calculados=False)})
+        self._avisar_cambio()
+    
+    # ========== ÍNDICES ==========
+    
+    def _indexar(self, tarea: Tarea):
+        """Agrega una tarea a los índices y se suscribe a sus cambios"""
+        for indice in self._indices.values():
+            indice.agregar(tarea)
+        self._estadisticas.agregar(tarea)
+        self._indice_texto.agregar(tarea)
+        for orden in self._ordenes.values():
+            orden.agregar(tarea)
+        tarea._observador = self._al_cambiar_tarea
+    
+    def _desindexar(self, tarea: Tarea):
+        """Quita una tarea de los índices y cancela la suscripción"""
+        for indice in self._indices.values():
+            indice.remover(tarea)
+        self._estadisticas.remover_id(tarea.id)
+        self._indice_texto.remover_id(tarea.id)
+        for orden in self._ordenes.values():
+            orden.remover_id(tarea.id)
+        tarea._observador = None
+    
+    def _reconstruir_indices(self, textos: Optional[List[IndiceTexto]] = None):
+        """
+        Reconstruye todos los índices a partir de las tareas cargadas
+        `textos`: índices de texto parciales ya construidos (carga en paralelo) que
+        se fusionan en lugar de volver a indexar el texto
+        """
+        for indice in self._indices.values():
+            indice.limpiar()
+            indice.agregar_lote(self.tareas.values())
+        observador = self._al_cambiar_tarea
+        for tarea in self.tareas.values():
+            tarea._observador = observador
+        
+        self._estadisticas.construir(self.tareas.values())
+        for orden in self._ordenes.values():
+            orden.construir(self.tareas.values())
+        # Con IDs repetidos en el archivo los parciales tendrían textos de más
+        if textos is not None and sum(len(parcial.textos) for parcial in textos) == len(self.tareas):
+            self._indice_texto.limpiar()
+            for parcial in textos:
+                self._indice_texto.fusionar(parcial)
+        else:
+            self._indice_texto.construir(self.tareas.values())
+    
+    def _al_cambiar_tarea(self, tarea: Tarea, campo: str, valor_anterior: Any):
+        """Observador de tareas: mantiene los índices y estadísticas al día"""
+        indice = self._indices.get(campo)
+        if indice is not None:
+            indice.mover(tarea, valor_anterior)
+        self._estadisticas.al_cambiar(tarea, campo)
+        if campo in CAMPOS_TEXTO:
+            self._indice_texto.reubicar(tarea)
+        orden = self._ordenes.get(campo)
+        if orden is not None:
+            orden.reubicar(tarea)
+        self._registrar_guardado(tarea)
     
     # ========== CONSULTAS ESPECÍFICAS ==========
     
     def obtener_tareas_por_usuario(self, usuario: str) -> List[Tarea]:
         """Obtiene tareas asignadas a un usuario específico"""
-        return [t for t in self.tareas if t.usuario_asignado == usuario]
+        return self._indices["usuario_asignado"].obtener(usuario)
     
     def obtener_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
         """Obtiene tareas por estado"""
-        return [t for t in self.tareas if t.estado == estado]
+        return self._indices["estado"].obtener(estado)
     
     def obtener_tareas_por_prioridad(self, prioridad: PrioridadTarea) -> List[Tarea]:
         """Obtiene tareas por prioridad"""
-        return [t for t in self.tareas if t.prioridad == prioridad]
+        return self._indices["prioridad"].obtener(prioridad)
     
     def obtener_tareas_vencidas(self) -> List[Tarea]:
         """Obtiene tareas vencidas"""
-        return [t for t in self.tareas if t.esta_vencida()]
+        ahora = datetime.datetime.now()
+        ids = self._estadisticas.vencimientos.ids_en_rango(None, ahora)
+        return self._tareas_por_ids(ids)
     
     def obtener_tareas_urgentes(self) -> List[Tarea]:
         """Obtiene tareas que necesitan atención urgente"""
-        return [t for t in self.tareas if t.necesita_atencion()]
+        # Mismos criterios que Tarea.necesita_atencion, resueltos con rangos de fechas
+        ahora = datetime.datetime.now()
+        vencimientos = self._estadisticas.vencimientos
+        
+        ids = self._indices["prioridad"].ids(PrioridadTarea.CRITICA)
+        ids += vencimientos.ids_en_rango(None, ahora, (PrioridadTarea.BAJA, PrioridadTarea.MEDIA))
+        ids += vencimientos.ids_en_rango(None, ahora + datetime.timedelta(days=2),
+                                         (PrioridadTarea.ALTA,))
+        return self._tareas_por_ids(ids)
     
     def obtener_tareas_por_etiqueta(self, etiqueta: str) -> List[Tarea]:
         """Obtiene tareas que contienen una etiqueta específica"""
         etiqueta = etiqueta.lower().strip()
-        return [t for t in self.tareas if etiqueta in t.etiquetas]
+        return self._indices["etiquetas"].obtener(etiqueta)
     
     def buscar_tareas(self, criterio: str) -> List[Tarea]:
         """Busca tareas por título o descripción"""
@@ -113,20 +361,26 @@ class TareaRepository:
         if not criterio:
             return []
         
-        resultados = []
-        for tarea in self.tareas:
-            if (criterio in tarea.titulo.lower() or 
-                criterio in tarea.descripcion.lower() or
-                criterio in tarea.usuario_asignado.lower()):
-                resultados.append(tarea)
+        return self._tareas_por_ids(self._indice_texto.buscar(criterio))
+    
+    def buscar_tareas_por_relevancia(self, consulta: str, 
+                                     limite: Optional[int] = None) -> List[Tarea]:
+        """Busca tareas que contengan todos los términos, las más relevantes primero"""
+        terminos = consulta.lower().split()
+        if not terminos:
+            return []
         
-        return resultados
+        resultados = self._indice_texto.buscar_terminos(terminos)
+        if limite is not None:
+            resultados = resultados[:limite]
+        
+        return [self.tareas[tarea_id] for _, tarea_id in resultados]
     
     def obtener_tareas_por_fecha_creacion(self, fecha_inicio: datetime.date, 
                                          fecha_fin: datetime.date) -> List[Tarea]:
         """Obtiene tareas creadas en un rango de fechas"""
         resultados = []
-        for tarea in self.tareas:
+        for tarea in self.tareas.values():
             fecha_tarea = tarea.fecha_creacion.date()
             if fecha_inicio <= fecha_tarea <= fecha_fin:
                 resultados.append(tarea)
@@ -135,154 +389,258 @@ class TareaRepository:
     
     def obtener_tareas_con_vencimiento_proximo(self, dias: int = 3) -> List[Tarea]:
         """Obtiene tareas que vencen en los próximos N días"""
-        resultados = []
-        for tarea in self.tareas:
-            if tarea.estado in [EstadoTarea.PENDIENTE, EstadoTarea.EN_PROGRESO]:
-                dias_restantes = tarea.dias_para_vencimiento()
-                if dias_restantes is not None and 0 <= dias_restantes <= dias:
-                    resultados.append(tarea)
+        # 0 <= dias_para_vencimiento() <= dias  equivale a  ahora <= vencimiento < ahora + dias + 1
+        ahora = datetime.datetime.now()
+        ids = self._estadisticas.vencimientos.ids_en_rango(
+            ahora, ahora + datetime.timedelta(days=dias + 1))
         
-        return resultados
+        return [t for t in self._tareas_por_ids(ids) 
+                if t.estado in [EstadoTarea.PENDIENTE, EstadoTarea.EN_PROGRESO]]
+    
+    def _tareas_por_ids(self, ids: List[int]) -> List[Tarea]:
+        """Materializa tareas a partir de sus IDs, en orden de ID"""
+        return [self.tareas[tarea_id] for tarea_id in sorted(ids)]
     
     # ========== ESTADÍSTICAS ==========
     
     def contar_tareas_por_estado(self) -> Dict[str, int]:
         """Cuenta tareas agrupadas por estado"""
-        conteo = {}
-        for estado in EstadoTarea:
-            conteo[estado.value] = len(self.obtener_tareas_por_estado(estado))
-        return conteo
+        indice = self._indices["estado"]
+        return {estado.value: indice.contar(estado) for estado in EstadoTarea}
     
     def contar_tareas_por_prioridad(self) -> Dict[str, int]:
         """Cuenta tareas agrupadas por prioridad"""
-        conteo = {}
-        for prioridad in PrioridadTarea:
-            conteo[prioridad.value] = len(self.obtener_tareas_por_prioridad(prioridad))
-        return conteo
+        indice = self._indices["prioridad"]
+        return {prioridad.value: indice.contar(prioridad) for prioridad in PrioridadTarea}
     
     def contar_tareas_por_usuario(self) -> Dict[str, int]:
         """Cuenta tareas agrupadas por usuario"""
-        conteo = {}
-        for tarea in self.tareas:
-            usuario = tarea.usuario_asignado
-            conteo[usuario] = conteo.get(usuario, 0) + 1
-        return conteo
+        return self._indices["usuario_asignado"].conteos()
     
     def obtener_estadisticas_generales(self) -> Dict[str, Any]:
         """Obtiene estadísticas generales del sistema"""
-        total_tareas = len(self.tareas)
-        tareas_activas = len(self.obtener_tareas_activas())
-        tareas_completadas = len(self.obtener_tareas_por_estado(EstadoTarea.COMPLETADA))
-        tareas_vencidas = len(self.obtener_tareas_vencidas())
-        tareas_urgentes = len(self.obtener_tareas_urgentes())
-        
-        # Tiempo promedio de completado
-        tareas_con_tiempo = [t for t in self.tareas 
-                           if t.estado == EstadoTarea.COMPLETADA and t.duracion_en_progreso()]
-        
-        tiempo_promedio = None
-        if tareas_con_tiempo:
-            total_tiempo = sum(t.duracion_en_progreso().total_seconds() 
-                             for t in tareas_con_tiempo)
-            tiempo_promedio_segundos = total_tiempo / len(tareas_con_tiempo)
-            tiempo_promedio = datetime.timedelta(seconds=tiempo_promedio_segundos)
-        
-        return {
-            "total_tareas": total_tareas,
-            "tareas_activas": tareas_activas,
-            "tareas_completadas": tareas_completadas,
-            "tareas_vencidas": tareas_vencidas,
-            "tareas_urgentes": tareas_urgentes,
-            "tasa_completado": (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0,
-            "tiempo_promedio_completado": tiempo_promedio,
-            "por_estado": self.contar_tareas_por_estado(),
-            "por_prioridad": self.contar_tareas_por_prioridad(),
-            "por_usuario": self.contar_tareas_por_usuario()
-        }
+        return self._estadisticas.obtener()
     
     # ========== ORDENAMIENTO ==========
     
     def ordenar_por_prioridad(self, tareas: List[Tarea] = None) -> List[Tarea]:
-        """Ordena tareas por prioridad (crítica primero)"""
+        """Ordena tareas por prioridad (crítica primero); sin `tareas`, lee el orden mantenido"""
         if tareas is None:
-            tareas = self.tareas
-        
-        orden_prioridad = {
-            PrioridadTarea.CRITICA: 0,
-            PrioridadTarea.ALTA: 1,
-            PrioridadTarea.MEDIA: 2,
-            PrioridadTarea.BAJA: 3
-        }
-        
-        return sorted(tareas, key=lambda t: orden_prioridad[t.prioridad])
+            return self._tramo_ordenado("prioridad")
+        return sorted(tareas, key=_clave_prioridad)
     
     def ordenar_por_fecha_vencimiento(self, tareas: List[Tarea] = None) -> List[Tarea]:
-        """Ordena tareas por fecha de vencimiento (próximas primero)"""
+        """Ordena tareas por fecha de vencimiento (próximas primero, sin fecha al final)"""
         if tareas is None:
-            tareas = self.tareas
-        
-        # Separar tareas con y sin fecha de vencimiento
-        con_vencimiento = [t for t in tareas if t.fecha_vencimiento is not None]
-        sin_vencimiento = [t for t in tareas if t.fecha_vencimiento is None]
-        
-        # Ordenar las que tienen vencimiento
-        con_vencimiento.sort(key=lambda t: t.fecha_vencimiento)
-        
-        # Devolver primero las que vencen, luego las que no tienen fecha
-        return con_vencimiento + sin_vencimiento
+            return self._tramo_ordenado("fecha_vencimiento")
+        return sorted(tareas, key=_clave_vencimiento)
     
     def ordenar_por_fecha_creacion(self, tareas: List[Tarea] = None, 
                                   descendente: bool = True) -> List[Tarea]:
-        """Ordena tareas por fecha de creación"""
+        """Ordena tareas por fecha de creación (solo se mantiene el orden descendente)"""
         if tareas is None:
-            tareas = self.tareas
+            if descendente:
+                return self._tramo_ordenado("fecha_creacion")
+            tareas = self.tareas.values()
         
-        return sorted(tareas, key=lambda t: t.fecha_creacion, reverse=descendente)
+        return sorted(tareas, key=_clave_creacion, reverse=descendente)
+    
+    def obtener_tareas_ordenadas(self, criterio: str = "prioridad", desde: int = 0,
+                                 cantidad: Optional[int] = None) -> List[Tarea]:
+        """
+        Tramo [desde, desde + cantidad) de todas las tareas en el orden de `criterio`
+        (uno de CRITERIOS_ORDEN); solo se materializan las tareas del tramo
+        """
+        if criterio not in CRITERIOS_ORDEN:
+            raise ValueError(f"Criterio de orden no soportado: {criterio}")
+        return self._tramo_ordenado(criterio, desde, cantidad)
+    
+    def obtener_primeras(self, cantidad: int, criterio: str = "prioridad",
+                         tareas: Optional[Iterable[Tarea]] = None) -> List[Tarea]:
+        """
+        Las `cantidad` primeras tareas según `criterio` (mismo resultado que ordenar y
+        cortar). Sin `tareas` se leen del orden mantenido; con un subconjunto se
+        eligen con un heap en O(n log cantidad) en lugar de ordenarlo completo
+        """
+        if tareas is None:
+            return self.obtener_tareas_ordenadas(criterio, 0, cantidad)
+        if criterio == "prioridad":
+            return heapq.nsmallest(cantidad, tareas, key=_clave_prioridad)
+        if criterio == "fecha_vencimiento":
+            return heapq.nsmallest(cantidad, tareas, key=_clave_vencimiento)
+        if criterio == "fecha_creacion":
+            return heapq.nlargest(cantidad, tareas, key=_clave_creacion)
+        raise ValueError(f"Criterio de orden no soportado: {criterio}")
+    
+    def _tramo_ordenado(self, criterio: str, desde: int = 0,
+                        cantidad: Optional[int] = None) -> List[Tarea]:
+        """Tareas de un tramo del orden mantenido para `criterio`"""
+        return self._ordenes[criterio].tareas(desde, cantidad)
     
     # ========== PERSISTENCIA ==========
     
     def guardar_datos(self) -> bool:
-        """Guarda las tareas en archivo JSON"""
+        """
+        Guarda las tareas en archivo JSON
+        Es seguro llamarlo mientras el autoguardado escribe desde otro hilo: los
+        modos WAL y binario guardan con el bloqueo tomado y el JSON pasa por
+        preparar_guardado
+        """
+        if self._wal is not None:
+            # Cada cambio ya está en el log: basta con forzarlo a disco
+            with self.bloqueo:
+                try:
+                    self._wal.sincronizar()
+                    self._modificadas.clear()
+                except Exception as e:
+                    print(f"Error al guardar datos: {e}")
+                    return False
+                return True
+        
+        if self._archivo_binario is not None:
+            with self.bloqueo:
+                try:
+                    escribir_snapshot_binario(self._archivo_binario, self.tareas.values(), 
+                                              self.siguiente_id)
+                    self._modificadas.clear()
+                    return True
+                except Exception as e:
+                    print(f"Error al guardar datos: {e}")
+                    return False
+        
+        return self.preparar_guardado()()
+    
+    def preparar_guardado(self) -> Callable[[], bool]:
+        """
+        Captura con el bloqueo tomado un estado consistente y devuelve la función
+        que lo escribe. En modo JSON la captura solo codifica las tareas modificadas
+        y la escritura ocurre fuera del bloqueo; los demás modos guardan completo
+        con el bloqueo tomado al llamar a la función
+        """
+        if self._wal is not None or self._archivo_binario is not None:
+            return self.guardar_datos
+        
+        with self.bloqueo:
+            try:
+                fragmentos = list(self._fragmentos_json())
+            except Exception as e:
+                # Las modificadas todavía no se tomaron: siguen pendientes
+                print(f"Error al guardar datos: {e}")
+                return _guardado_fallido
+            metadatos = {"siguiente_id": self.siguiente_id,
+                         "fecha_guardado": datetime.datetime.now().isoformat()}
+            capturadas, self._modificadas = self._modificadas, set()
+            self._capturas += 1
+            captura = self._capturas
+        
+        def escribir() -> bool:
+            with self._bloqueo_escritura:
+                # Una captura posterior ya escrita incluye todos estos cambios
+                if captura < self._ultima_captura_escrita:
+                    return True
+                try:
+                    escribir_fragmentos(self.archivo_datos, fragmentos, metadatos)
+                    self._ultima_captura_escrita = captura
+                except Exception as e:
+                    with self.bloqueo:
+                        self._modificadas |= capturadas
+                    print(f"Error al guardar datos: {e}")
+                    return False
+                return True
+        
+        return escribir
+    
+    def _actualizar_instantanea_lectura(self):
+        """
+        Si un repositorio mapeado lee estos datos (su instantánea derivada existe),
+        la reescribe para que al abrirse no tenga que regenerarla desde el JSON.
+        Recodifica todas las tareas con el bloqueo tomado, así que solo se hace al
+        compactar y al cerrar; entre medio el lector la ve atrasada y la regenera
+        """
+        ruta = self._instantanea_lectura
+        if ruta is None or not os.path.exists(ruta):
+            return
         try:
-            data = {
-                "tareas": [tarea.to_dict() for tarea in self.tareas],
-                "siguiente_id": self.siguiente_id,
-                "fecha_guardado": datetime.datetime.now().isoformat()
-            }
-            
-            with open(self.archivo_datos, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
-            return True
-            
+            with self.bloqueo:
+                escribir_snapshot_binario(ruta, self.tareas.values(), self.siguiente_id)
         except Exception as e:
-            print(f"Error al guardar datos: {e}")
-            return False
-    
-    def cargar_datos(self) -> bool:
-        """Carga las tareas desde archivo JSON"""
+            print(f"Error al actualizar la instantánea de lectura: {e}")
+    
+    def _fragmentos_json(self) -> Iterator[bytes]:
+        """
+        JSON de cada tarea para el archivo de datos
+        Solo se codifican las tareas sin fragmento en caché (nuevas o modificadas
+        desde que se codificaron); el resto reutiliza los bytes ya generados
+        """
+        fragmentos = self._fragmentos
+        if admite_codificacion_paralela(self.procesos, len(self.tareas) - len(fragmentos)):
+            pendientes = [tarea for tarea_id, tarea in self.tareas.items() if tarea_id not in fragmentos]
+            fragmentos.update(zip((tarea.id for tarea in pendientes),
+                                  codificar_en_paralelo(pendientes, self.procesos)))
+        for tarea_id in self.tareas:
+            fragmento = fragmentos.get(tarea_id)
+            if fragmento is None:
+                fragmento = self.fragmento_json(self.tareas[tarea_id])
+            yield fragmento
+    
+    def fragmento_json(self, tarea: Tarea) -> bytes:
+        """
+        JSON compacto (UTF-8) de los datos propios de una tarea, sin campos calculados
+        Se guarda en caché hasta que la tarea cambie; lo comparten el archivo de
+        datos y la API
+        """
+        fragmento = self._fragmentos.get(tarea.id)
+        if fragmento is None:
+            fragmento = self._fragmentos[tarea.id] = _codificar_compacto(
+                tarea.to_dict(incluir_calculados=False)).encode('utf-8')
+        return fragmento
+    
+    @property
+    def cambios_pendientes(self) -> int:
+        """Cantidad de tareas creadas, modificadas o eliminadas desde el último guardado"""
+        return len(self._modificadas)
+    
+    def cargar_datos(self, progreso: Optional[CallbackProgreso] = None) -> bool:
+        """
+        Carga las tareas desde archivo JSON
+        Lee el arreglo de tareas en streaming: cada tarea se construye en cuanto
+        se decodifica, sin mantener el documento completo en memoria. Con más de
+        un proceso, los archivos grandes se decodifican por segmentos en paralelo.
+        Si el archivo está truncado o es inválido, las tareas cargadas no cambian
+        """
+        if self._wal is not None:
+            return self._cargar_con_wal(progreso)
+        
+        if self._archivo_binario is not None and os.path.exists(self._archivo_binario):
+            return self._cargar_binario()
+        
         try:
-            with open(self.archivo_datos, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Cargar tareas
-            self.tareas = []
-            for tarea_data in data.get("tareas", []):
-                tarea = Tarea.from_dict(tarea_data)
-                self.tareas.append(tarea)
+            if admite_carga_paralela(self.archivo_datos, self.procesos):
+                segmentos, metadatos = decodificar_en_paralelo(
+                    self.archivo_datos, self.procesos, self._texto_en_procesos, progreso)
+                self._reemplazar_segmentos(segmentos)
+            else:
+                lector = LectorTareasJSON(self.archivo_datos, progreso=progreso)
+                
+                # Cargar tareas
+                self._reemplazar_tareas(
+                    Tarea.from_dict(tarea_data) for tarea_data in lector)
+                # Las claves de primer nivel se conocen al terminar
+                metadatos = lector.metadatos
             
             # Cargar siguiente ID
-            self.siguiente_id = data.get("siguiente_id", 1)
+            self.siguiente_id = metadatos.get("siguiente_id", 1)
             
             # Asegurar que el siguiente_id sea mayor que cualquier ID existente
             if self.tareas:
-                max_id = max(tarea.id for tarea in self.tareas)
+                max_id = max(self.tareas)
                 self.siguiente_id = max(self.siguiente_id, max_id + 1)
             
             return True
             
         except FileNotFoundError:
             # Archivo no existe, inicializar con datos vacíos
+            self._descartar_seguimiento()
             self._inicializar_datos_ejemplo()
             return True
             
@@ -290,6 +648,194 @@ class TareaRepository:
             print(f"Error al cargar datos: {e}")
             return False
     
+    # ========== PERSISTENCIA WAL ==========
+    
+    def _inicializar_persistencia(self, persistencia: str, politica_fsync: str):
+        """Configura el modo de persistencia (antes de cargar datos)"""
+        if persistencia not in MODOS_PERSISTENCIA:
+            raise ValueError(f"Modo de persistencia no soportado: {persistencia}")
+        
+        self._wal: Optional[RegistroWAL] = None
+        if persistencia == "wal":
+            self._wal = RegistroWAL(self.archivo_datos + ".wal", politica_fsync)
+        
+        self._inicializar_seguimiento()
+        
+        # Sin instantánea binaria todavía, se importa el JSON y se guarda en binario
+        self._archivo_binario: Optional[str] = None
+        # Copia binaria derivada para lectores mapeados (ver _actualizar_instantanea_lectura)
+        self._instantanea_lectura: Optional[str] = None
+        if persistencia == "binario":
+            self._archivo_binario = ruta_instantanea_lectura(self.archivo_datos, persistencia)
+        else:
+            self._instantanea_lectura = ruta_instantanea_lectura(self.archivo_datos, persistencia)
+    
+    def _inicializar_seguimiento(self):
+        """
+        Seguimiento de cambios para el guardado incremental: fragmentos JSON ya
+        codificados por ID (se descartan al cambiar la tarea) e IDs sin guardar.
+        Quien modifique tareas mientras otro hilo guarda (autoguardado) debe
+        hacerlo con `bloqueo` tomado para que la captura sea consistente
+        """
+        self._fragmentos: Dict[int, bytes] = {}
+        self._modificadas: Set[int] = set()
+        self._suscriptores: List[Callable[[], None]] = []
+        # Versión de los datos: crece con cada cambio o recarga (invalida cachés)
+        self.version = 0
+        self.bloqueo = threading.RLock()
+        # Orden de las capturas: una escritura atrasada no pisa a una más nueva
+        self._bloqueo_escritura = threading.Lock()
+        self._capturas = 0
+        self._ultima_captura_escrita = 0
+    
+    def _descartar_seguimiento(self):
+        """Tras (re)cargar: nada queda sin guardar y las cachés de la versión anterior no sirven"""
+        self._fragmentos.clear()
+        self._modificadas.clear()
+        self.version += 1
+    
+    def suscribir_cambios(self, callback: Callable[[], None]):
+        """Registra una función que se llama tras cada alta, cambio o baja de una tarea"""
+        self._suscriptores.append(callback)
+    
+    def _avisar_cambio(self):
+        """Incrementa la versión y avisa a los suscriptores que hay cambios sin guardar"""
+        self.version += 1
+        for callback in self._suscriptores:
+            callback()
+    
+    def _registrar_guardado(self, tarea: Tarea):
+        """Marca una tarea como modificada y agrega al log su estado completo (alta o cambio)"""
+        self._fragmentos.pop(tarea.id, None)
+        self._modificadas.add(tarea.id)
+        if self._wal is not None:
+            self._escribir_registro({"op": "guardar", 
+                                     "tarea": tarea.to_dict(incluir_calculados=False)})
+        self._avisar_cambio()
+    
+    def _registrar_eliminacion(self, tarea_id: int):
+        """Marca la baja de una tarea y la agrega al log"""
+        self._fragmentos.pop(tarea_id, None)
+        self._modificadas.add(tarea_id)
+        if self._wal is not None:
+            self._escribir_registro({"op": "eliminar", "id": tarea_id})
+        self._avisar_cambio()
+    
+    def _escribir_registro(self, registro: Dict[str, Any]):
+        """Escribe un registro y compacta si el log creció demasiado"""
+        registro["siguiente_id"] = self.siguiente_id
+        if self._wal.agregar(registro):
+            self.compactar()
+    
+    def compactar(self) -> bool:
+        """
+        Modo WAL: escribe una instantánea atómica con todas las tareas y vacía el log
+        Los registros son idempotentes, así que una caída entre ambos pasos
+        solo provoca que se vuelvan a aplicar al cargar
+        """
+        if self._wal is None:
+            return False
+        
+        try:
+            escribir_fragmentos(
+                self.archivo_datos, self._fragmentos_json(),
+                {"siguiente_id": self.siguiente_id,
+                 "fecha_guardado": datetime.datetime.now().isoformat()})
+            self._wal.reiniciar()
+            
+        except OSError as e:
+            print(f"Error al compactar datos: {e}")
+            return False
+        
+        self._actualizar_instantanea_lectura()
+        return True
+    
+    def _cargar_con_wal(self, progreso: Optional[CallbackProgreso]) -> bool:
+        """Carga la última instantánea y reproduce encima los registros del log"""
+        try:
+            tareas: Dict[int, Tarea] = {}
+            siguiente_id = 1
+            
+            if admite_carga_paralela(self.archivo_datos, self.procesos):
+                # El log se aplica después: los índices de texto parciales no sirven
+                segmentos, metadatos = decodificar_en_paralelo(self.archivo_datos, self.procesos,
+                                                               progreso=progreso)
+                for lote, _ in segmentos:
+                    for tarea in lote:
+                        tareas[tarea.id] = tarea
+                siguiente_id = metadatos.get("siguiente_id", 1)
+            elif os.path.exists(self.archivo_datos):
+                lector = LectorTareasJSON(self.archivo_datos, progreso=progreso)
+                for tarea_data in lector:
+                    tarea = Tarea.from_dict(tarea_data)
+                    tareas[tarea.id] = tarea
+                siguiente_id = lector.metadatos.get("siguiente_id", 1)
+            elif not self._wal.existe():
+                # Primera ejecución: los datos de ejemplo quedan en el log
+                self._reemplazar_tareas(())
+                self._inicializar_datos_ejemplo()
+                return True
+            
+            for registro in self._wal.leer():
+                if registro["op"] == "guardar":
+                    tarea = Tarea.from_dict(registro["tarea"])
+                    tareas[tarea.id] = tarea
+                else:
+                    tareas.pop(registro["id"], None)
+                siguiente_id = max(siguiente_id, registro["siguiente_id"])
+            
+            self._reemplazar_tareas(tareas.values())
+            self.siguiente_id = max(siguiente_id, max(tareas, default=0) + 1)
+            self._wal.abrir()
+            return True
+            
+        except Exception as e:
+            print(f"Error al cargar datos: {e}")
+            return False
+    
+    def _cargar_binario(self) -> bool:
+        """Carga las tareas desde la instantánea binaria"""
+        try:
+            tareas, metadatos = leer_snapshot_binario(self._archivo_binario)
+            self._reemplazar_tareas(tareas)
+            self.siguiente_id = max(metadatos["siguiente_id"], 
+                                    max((t.id for t in tareas), default=0) + 1)
+            return True
+            
+        except Exception as e:
+            print(f"Error al cargar datos: {e}")
+            return False
+    
+    def _reemplazar_tareas(self, tareas: Iterable[Tarea],
+                           textos: Optional[List[IndiceTexto]] = None):
+        """
+        Sustituye todas las tareas en memoria y reconstruye los índices
+        Las nuevas se reúnen aparte: si `tareas` falla a mitad (archivo truncado),
+        las anteriores quedan intactas
+        """
+        with recolector_pausado():
+            nuevas: Dict[int, Tarea] = {}
+            for tarea in tareas:
+                nuevas[tarea.id] = tarea
+            
+            # Las tareas anteriores que alguien conserve ya no deben tocar los índices
+            for tarea in self.tareas.values():
+                tarea._observador = None
+            self.tareas = nuevas
+            self._descartar_seguimiento()
+            self._reconstruir_indices(textos)
+    
+    def _reemplazar_segmentos(self, segmentos: List[Segmento]):
+        """
+        Sustituye todas las tareas por las decodificadas en paralelo, en el orden
+        del archivo (ante IDs repetidos gana la última, como en la carga secuencial)
+        """
+        tareas = chain.from_iterable(lote for lote, _ in segmentos)
+        if self._texto_en_procesos:
+            self._reemplazar_tareas(tareas, [parcial for _, parcial in segmentos])
+        else:
+            self._reemplazar_tareas(tareas)
+    
     def _inicializar_datos_ejemplo(self):
         """Inicializa datos de ejemplo para demostración"""
         tareas_ejemplo = [
@@ -350,37 +896,66 @@ class TareaRepository:
                 tarea.agregar_etiqueta("qa")
         
         # Cambiar estado de algunas tareas para demostrar variedad
-        if len(self.tareas) >= 3:
-            self.tareas[0].cambiar_estado(EstadoTarea.EN_PROGRESO)  # Login en progreso
-            self.tareas[2].cambiar_estado(EstadoTarea.COMPLETADA)   # BD completada
+        tareas = list(self.tareas.values())
+        if len(tareas) >= 3:
+            tareas[0].cambiar_estado(EstadoTarea.EN_PROGRESO)  # Login en progreso
+            tareas[2].cambiar_estado(EstadoTarea.COMPLETADA)   # BD completada
         
         # Establecer fechas de vencimiento para algunas tareas
         fecha_futura = datetime.datetime.now() + datetime.timedelta(days=7)
         fecha_muy_futura = datetime.datetime.now() + datetime.timedelta(days=14)
         
-        if len(self.tareas) >= 2:
-            self.tareas[0].establecer_fecha_vencimiento(fecha_futura)
-            self.tareas[1].establecer_fecha_vencimiento(fecha_muy_futura)
-    
-    def exportar_datos(self, formato: str = "json") -> str:
-        """Exporta datos en diferentes formatos"""
-        if formato.lower() == "json":
-            return json.dumps([tarea.to_dict() for tarea in self.tareas], 
-                            indent=2, ensure_ascii=False)
-        elif formato.lower() == "csv":
-            # Implementar exportación CSV si se necesita
-            pass
-        else:
-            raise ValueError(f"Formato no soportado: {formato}")
+        if len(tareas) >= 2:
+            tareas[0].establecer_fecha_vencimiento(fecha_futura)
+            tareas[1].establecer_fecha_vencimiento(fecha_muy_futura)
+    
+    def exportar_datos(self, formato: str = "json",
+                       filtro: Optional[Callable[[Tarea], bool]] = None,
+                       tareas: Optional[Iterable[Tarea]] = None) -> str:
+        """Exporta datos en diferentes formatos (json, jsonl o csv) como texto"""
+        destino = io.StringIO()
+        self.exportar_a_archivo(destino, formato, filtro, tareas)
+        return destino.getvalue()
+    
+    def exportar_a_archivo(self, destino: TextIO, formato: str = "json",
+                           filtro: Optional[Callable[[Tarea], bool]] = None,
+                           tareas: Optional[Iterable[Tarea]] = None,
+                           tamano_buffer: int = TAMANO_BUFFER_EXPORTACION) -> int:
+        """
+        Escribe las tareas en un archivo de texto abierto, en json, jsonl o csv
+        (para csv, abierto con newline=''), tarea por tarea y con un buffer acotado
+        - `filtro`: predicado que decide qué tareas se exportan
+        - `tareas`: resultado de una consulta (p. ej. obtener_tareas_por_estado)
+          en lugar de todas las tareas
+        Retorna la cantidad de tareas exportadas
+        """
+        formato = formato.lower()
+        with self.bloqueo:
+            return exportar_tareas(self if tareas is None else tareas, destino, formato,
+                                   filtro, self._fragmentos, tamano_buffer)
     
     def limpiar_tareas_canceladas(self) -> int:
         """Elimina definitivamente las tareas canceladas"""
-        tareas_canceladas = [t for t in self.tareas if t.estado == EstadoTarea.CANCELADA]
-        count = len(tareas_canceladas)
+        ids_cancelados = [t.id for t in self.tareas.values() if t.estado == EstadoTarea.CANCELADA]
         
-        self.tareas = [t for t in self.tareas if t.estado != EstadoTarea.CANCELADA]
+        # Los órdenes se depuran en una pasada: quitar de a una desplaza la lista cada vez
+        for orden in self._ordenes.values():
+            orden.remover_lote(ids_cancelados)
+        for tarea_id in ids_cancelados:
+            self._desindexar(self.tareas.pop(tarea_id))
+            self._registrar_eliminacion(tarea_id)
         
-        return count
+        return len(ids_cancelados)
+    
+    def cerrar(self):
+        """
+        Libera los recursos del modo de persistencia (el log WAL abierto) y, si
+        todo está guardado, deja al día la instantánea de los lectores mapeados
+        """
+        if not self.cambios_pendientes:
+            self._actualizar_instantanea_lectura()
+        if self._wal is not None:
+            self._wal.cerrar()
     
     def __len__(self) -> int:
         """Retorna el número total de tareas"""
@@ -388,4 +963,4 @@ class TareaRepository:
     
     def __iter__(self):
         """Permite iterar sobre las tareas"""
-        return iter(self.tareas)
+        return iter(self.tareas.values())
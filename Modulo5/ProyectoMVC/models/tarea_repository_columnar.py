@@ -0,0 +1,635 @@
+"""
+📦 MODELO: Repositorio Columnar de Tareas
+Misma interfaz que TareaRepository, pero guarda las tareas por columnas
+(struct-of-arrays) para consultas analíticas sobre muchos datos
+"""
+
+import heapq
+import datetime
+import math
+import weakref
+from array import array
+from collections import Counter
+from collections.abc import Mapping
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea, VACIO
+from models.tarea_repository import TareaRepository
+from models.indices import IndiceTexto
+
+# Codificación de enums como enteros de 1 byte
+ESTADOS = list(EstadoTarea)
+PRIORIDADES = list(PrioridadTarea)
+CODIGO_ESTADO = {estado: codigo for codigo, estado in enumerate(ESTADOS)}
+CODIGO_PRIORIDAD = {prioridad: codigo for codigo, prioridad in enumerate(PRIORIDADES)}
+
+BORRADA = -1       # Código de estado/prioridad de filas eliminadas
+NULO = -2 ** 63    # Marca de fecha ausente en columnas de timestamps
+
+EPOCA = datetime.datetime(1970, 1, 1)
+UN_MICROSEGUNDO = datetime.timedelta(microseconds=1)
+DOS_DIAS = 2 * 24 * 3600 * 10 ** 6
+UN_DIA = 24 * 3600 * 10 ** 6
+
+
+def a_microsegundos(fecha: Optional[datetime.datetime]) -> int:
+    """Convierte una fecha a microsegundos desde la época (NULO si no hay fecha)"""
+    if fecha is None:
+        return NULO
+    return (fecha - EPOCA) // UN_MICROSEGUNDO
+
+
+def desde_microsegundos(valor: int) -> Optional[datetime.datetime]:
+    """Convierte microsegundos desde la época a fecha"""
+    if valor == NULO:
+        return None
+    return EPOCA + datetime.timedelta(microseconds=valor)
+
+
+class Diccionario:
+    """Codificación por diccionario: cadena ↔ entero"""
+
+    def __init__(self):
+        self.valores: List[str] = []
+        self.codigos: Dict[str, int] = {}
+
+    def codificar(self, valor: str) -> int:
+        """Obtiene (o asigna) el código de una cadena"""
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = self.codigos[valor] = len(self.valores)
+            self.valores.append(valor)
+        return codigo
+
+    def buscar(self, valor: str) -> Optional[int]:
+        """Obtiene el código de una cadena sin asignarlo"""
+        return self.codigos.get(valor)
+
+    def limpiar(self):
+        """Vacía el diccionario"""
+        self.valores.clear()
+        self.codigos.clear()
+
+
+class VistaTareas(Mapping):
+    """
+    Vista id → Tarea sobre las columnas
+    Permite que los métodos heredados que recorren `self.tareas` sigan funcionando
+    """
+
+    def __init__(self, repositorio: 'TareaRepositoryColumnar'):
+        self._repositorio = repositorio
+
+    def __getitem__(self, tarea_id: int) -> Tarea:
+        tarea = self._repositorio.obtener_tarea_por_id(tarea_id)
+        if tarea is None:
+            raise KeyError(tarea_id)
+        return tarea
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._repositorio._filas)
+
+    def __len__(self) -> int:
+        return len(self._repositorio._filas)
+
+    def __contains__(self, tarea_id: object) -> bool:
+        return tarea_id in self._repositorio._filas
+
+
+class TareaRepositoryColumnar(TareaRepository):
+    """
+    Repositorio de Tareas columnar
+    - Estado y prioridad como códigos int8, fechas como int64 (microsegundos)
+    - Usuarios y etiquetas codificados por diccionario
+    - Las tareas se materializan como objetos Tarea solo al pedirlas; los cambios
+      hechos sobre ellas se escriben de vuelta en las columnas vía el observador
+    """
+
+    # Columnas en el orden en que se compactan
+    COLUMNAS = (
+        "_ids", "_estado", "_prioridad", "_usuario", "_creador",
+        "_fecha_creacion", "_fecha_inicio", "_fecha_completado", "_fecha_vencimiento",
+        "_estimado", "_real", "_titulos", "_descripciones", "_etiquetas", "_comentarios"
+    )
+
+    # La búsqueda de texto recorre las columnas: no hay índice que construir al cargar
+    _texto_en_procesos = False
+
+    def __init__(self, archivo_datos: str = "tareas.json", persistencia: str = "json",
+                 politica_fsync: str = "lote", procesos: int = 1):
+        self.archivo_datos = archivo_datos
+        self.procesos = procesos
+        self._inicializar_persistencia(persistencia, politica_fsync)
+        self.siguiente_id = 1
+
+        self._inicializar_columnas()
+
+        # Vista compatible con la interfaz del repositorio en memoria
+        self.tareas = VistaTareas(self)
+
+        # Tareas ya materializadas: mientras alguien las use, se reutiliza el objeto
+        self._materializadas: 'weakref.WeakValueDictionary[int, Tarea]' = weakref.WeakValueDictionary()
+
+        # Cargar datos existentes
+        self.cargar_datos()
+
+    def _inicializar_columnas(self):
+        """Crea columnas vacías"""
+        self._ids = array('q')
+        self._estado = array('b')
+        self._prioridad = array('b')
+        self._usuario = array('i')
+        self._creador = array('i')
+        self._fecha_creacion = array('q')
+        self._fecha_inicio = array('q')
+        self._fecha_completado = array('q')
+        self._fecha_vencimiento = array('q')
+        self._estimado = array('d')
+        self._real = array('d')
+        self._titulos: List[str] = []
+        self._descripciones: List[str] = []
+        self._etiquetas: List[tuple] = []
+        self._comentarios: List[Any] = []
+
+        self._filas: Dict[int, int] = {}  # ID → fila
+        self._borradas = 0
+        self._usuarios = Diccionario()
+        self._diccionario_etiquetas = Diccionario()
+
+    # ========== CODIFICACIÓN DE FILAS ==========
+
+    def _agregar_fila(self, tarea: Tarea) -> int:
+        """Agrega una fila al final de las columnas"""
+        fila = len(self._ids)
+        self._ids.append(tarea.id)
+        self._estado.append(0)
+        self._prioridad.append(0)
+        self._usuario.append(0)
+        self._creador.append(0)
+        self._fecha_creacion.append(0)
+        self._fecha_inicio.append(0)
+        self._fecha_completado.append(0)
+        self._fecha_vencimiento.append(0)
+        self._estimado.append(0.0)
+        self._real.append(0.0)
+        self._titulos.append("")
+        self._descripciones.append("")
+        self._etiquetas.append(VACIO)
+        self._comentarios.append(VACIO)
+
+        self._escribir_fila(fila, tarea)
+        self._filas[tarea.id] = fila
+        return fila
+
+    def _escribir_fila(self, fila: int, tarea: Tarea):
+        """Codifica todos los campos de una tarea en su fila"""
+        self._estado[fila] = CODIGO_ESTADO[tarea.estado]
+        self._prioridad[fila] = CODIGO_PRIORIDAD[tarea.prioridad]
+        self._usuario[fila] = self._usuarios.codificar(tarea.usuario_asignado)
+        self._creador[fila] = self._usuarios.codificar(tarea.usuario_creador)
+        self._fecha_creacion[fila] = a_microsegundos(tarea.fecha_creacion)
+        self._fecha_inicio[fila] = a_microsegundos(tarea.fecha_inicio)
+        self._fecha_completado[fila] = a_microsegundos(tarea.fecha_completado)
+        self._fecha_vencimiento[fila] = a_microsegundos(tarea.fecha_vencimiento)
+        self._estimado[fila] = math.nan if tarea.tiempo_estimado_horas is None else tarea.tiempo_estimado_horas
+        self._real[fila] = math.nan if tarea.tiempo_real_horas is None else tarea.tiempo_real_horas
+        self._titulos[fila] = tarea.titulo
+        self._descripciones[fila] = tarea.descripcion
+        self._etiquetas[fila] = tuple(
+            self._diccionario_etiquetas.codificar(e) for e in tarea.etiquetas) or VACIO
+        self._comentarios[fila] = tuple(tarea.comentarios) or VACIO
+
+    def _borrar_fila(self, fila: int):
+        """Marca una fila como eliminada y libera sus valores"""
+        self._estado[fila] = BORRADA
+        self._prioridad[fila] = BORRADA
+        self._usuario[fila] = -1
+        self._fecha_vencimiento[fila] = NULO
+        self._titulos[fila] = ""
+        self._descripciones[fila] = ""
+        self._etiquetas[fila] = VACIO
+        self._comentarios[fila] = VACIO
+        self._borradas += 1
+
+        # Compactar cuando la mitad de las filas están borradas
+        if self._borradas > len(self._filas):
+            self._compactar()
+
+    def _compactar(self):
+        """Elimina físicamente las filas borradas"""
+        vivas = list(self._filas_vivas())
+        for nombre in self.COLUMNAS:
+            columna = getattr(self, nombre)
+            if isinstance(columna, array):
+                setattr(self, nombre, array(columna.typecode, (columna[f] for f in vivas)))
+            else:
+                setattr(self, nombre, [columna[f] for f in vivas])
+
+        self._filas = {tarea_id: fila for fila, tarea_id in enumerate(self._ids)}
+        self._borradas = 0
+
+    def _materializar(self, fila: int) -> Tarea:
+        """Construye (o reutiliza) el objeto Tarea de una fila"""
+        tarea_id = self._ids[fila]
+        tarea = self._materializadas.get(tarea_id)
+        if tarea is not None:
+            return tarea
+
+        usuarios = self._usuarios.valores
+        etiquetas = self._diccionario_etiquetas.valores
+        estimado = self._estimado[fila]
+        real = self._real[fila]
+
+        tarea = Tarea.__new__(Tarea)
+        tarea.id = tarea_id
+        tarea.titulo = self._titulos[fila]
+        tarea.descripcion = self._descripciones[fila]
+        tarea.usuario_asignado = usuarios[self._usuario[fila]]
+        tarea.usuario_creador = usuarios[self._creador[fila]]
+        tarea.prioridad = PRIORIDADES[self._prioridad[fila]]
+        tarea.estado = ESTADOS[self._estado[fila]]
+        tarea.fecha_creacion = desde_microsegundos(self._fecha_creacion[fila])
+        tarea.fecha_inicio = desde_microsegundos(self._fecha_inicio[fila])
+        tarea.fecha_completado = desde_microsegundos(self._fecha_completado[fila])
+        tarea.fecha_vencimiento = desde_microsegundos(self._fecha_vencimiento[fila])
+        tarea.etiquetas = [etiquetas[c] for c in self._etiquetas[fila]] or VACIO
+        tarea.comentarios = list(self._comentarios[fila]) or VACIO
+        tarea.tiempo_estimado_horas = None if math.isnan(estimado) else estimado
+        tarea.tiempo_real_horas = None if math.isnan(real) else real
+        tarea._observador = self._al_cambiar_tarea
+
+        self._materializadas[tarea_id] = tarea
+        return tarea
+
+    def _filas_vivas(self) -> Iterable[int]:
+        """Filas no eliminadas, en orden de inserción"""
+        if not self._borradas:
+            return range(len(self._ids))
+        return (f for f, codigo in enumerate(self._estado) if codigo != BORRADA)
+
+    def _materializar_filas(self, filas: Iterable[int]) -> List[Tarea]:
+        """Materializa varias filas"""
+        return [self._materializar(fila) for fila in filas]
+
+    def _filas_con_codigo(self, columna: array, codigo: int) -> List[int]:
+        """Filas cuya columna tiene un código dado"""
+        return [f for f, valor in enumerate(columna) if valor == codigo]
+
+    def _al_cambiar_tarea(self, tarea: Tarea, campo: str, valor_anterior: Any):
+        """Observador de tareas materializadas: escribe el cambio en las columnas"""
+        fila = self._filas.get(tarea.id)
+        if fila is not None:
+            self._escribir_fila(fila, tarea)
+            self._registrar_guardado(tarea)
+
+    # ========== OPERACIONES CRUD ==========
+
+    def crear_tarea(self, titulo: str, descripcion: str, usuario_asignado: str,
+                   prioridad: PrioridadTarea = PrioridadTarea.MEDIA) -> Tarea:
+        """Crea una nueva tarea"""
+        tarea = Tarea(
+            id=self.siguiente_id,
+            titulo=titulo,
+            descripcion=descripcion,
+            usuario_asignado=usuario_asignado,
+            prioridad=prioridad
+        )
+
+        self._agregar_fila(tarea)
+        tarea._observador = self._al_cambiar_tarea
+        self._materializadas[tarea.id] = tarea
+        self.siguiente_id += 1
+        self._registrar_guardado(tarea)
+
+        return tarea
+
+    def _insertar_lote(self, tareas: List[Tarea]):
+        """Codifica un lote de tareas importadas en filas nuevas"""
+        for tarea in tareas:
+            self._agregar_fila(tarea)
+
+    def _indexar_importadas(self, ids: range):
+        """Nada que indexar: las consultas recorren las columnas"""
+
+    def obtener_tarea_por_id(self, tarea_id: int) -> Optional[Tarea]:
+        """Obtiene una tarea por su ID"""
+        fila = self._filas.get(tarea_id)
+        if fila is None:
+            return None
+        return self._materializar(fila)
+
+    def obtener_todas_tareas(self) -> List[Tarea]:
+        """Obtiene todas las tareas"""
+        return self._materializar_filas(self._filas_vivas())
+
+    def obtener_tareas_pagina(self, desde: int, cantidad: int) -> List[Tarea]:
+        """Obtiene `cantidad` tareas a partir de la posición `desde`; solo materializa esas"""
+        return self._materializar_filas(islice(self._filas.values(), desde, desde + cantidad))
+
+    def obtener_tareas_activas(self) -> List[Tarea]:
+        """Obtiene tareas que no están canceladas"""
+        cancelada = CODIGO_ESTADO[EstadoTarea.CANCELADA]
+        return self._materializar_filas(
+            f for f, codigo in enumerate(self._estado) if codigo != cancelada and codigo != BORRADA)
+
+    def actualizar_tarea(self, tarea: Tarea) -> bool:
+        """Actualiza una tarea existente"""
+        fila = self._filas.get(tarea.id)
+        if fila is None:
+            return False
+
+        # Cubre asignaciones directas a los atributos y objetos sustitutos
+        anterior = self._materializadas.get(tarea.id)
+        if anterior is not None and anterior is not tarea:
+            anterior._observador = None
+
+        self._escribir_fila(fila, tarea)
+        tarea._observador = self._al_cambiar_tarea
+        self._materializadas[tarea.id] = tarea
+        self._registrar_guardado(tarea)
+        return True
+
+    def eliminar_definitivamente(self, tarea_id: int) -> bool:
+        """Elimina una tarea definitivamente del repositorio"""
+        fila = self._filas.pop(tarea_id, None)
+        if fila is None:
+            return False
+
+        tarea = self._materializadas.pop(tarea_id, None)
+        if tarea is not None:
+            tarea._observador = None
+
+        self._borrar_fila(fila)
+        self._registrar_eliminacion(tarea_id)
+        return True
+
+    # ========== CONSULTAS ESPECÍFICAS ==========
+
+    def obtener_tareas_por_usuario(self, usuario: str) -> List[Tarea]:
+        """Obtiene tareas asignadas a un usuario específico"""
+        codigo = self._usuarios.buscar(usuario)
+        if codigo is None:
+            return []
+        return self._materializar_filas(self._filas_con_codigo(self._usuario, codigo))
+
+    def obtener_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
+        """Obtiene tareas por estado"""
+        return self._materializar_filas(
+            self._filas_con_codigo(self._estado, CODIGO_ESTADO[estado]))
+
+    def obtener_tareas_por_prioridad(self, prioridad: PrioridadTarea) -> List[Tarea]:
+        """Obtiene tareas por prioridad"""
+        return self._materializar_filas(
+            self._filas_con_codigo(self._prioridad, CODIGO_PRIORIDAD[prioridad]))
+
+    def obtener_tareas_por_etiqueta(self, etiqueta: str) -> List[Tarea]:
+        """Obtiene tareas que contienen una etiqueta específica"""
+        codigo = self._diccionario_etiquetas.buscar(etiqueta.lower().strip())
+        if codigo is None:
+            return []
+        return self._materializar_filas(
+            f for f, codigos in enumerate(self._etiquetas) if codigo in codigos)
+
+    def _filas_vencidas(self, ahora: int) -> List[int]:
+        """Filas vencidas a un instante (microsegundos)"""
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        estados = self._estado
+        return [f for f, vencimiento in enumerate(self._fecha_vencimiento)
+                if NULO < vencimiento < ahora and estados[f] != completada]
+
+    def _filas_urgentes(self, ahora: int) -> List[int]:
+        """Filas que necesitan atención (ver Tarea.necesita_atencion)"""
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        critica = CODIGO_PRIORIDAD[PrioridadTarea.CRITICA]
+        alta = CODIGO_PRIORIDAD[PrioridadTarea.ALTA]
+        limite_alta = ahora + DOS_DIAS
+        estados = self._estado
+        vencimientos = self._fecha_vencimiento
+
+        filas = []
+        for f, prioridad in enumerate(self._prioridad):
+            if prioridad == critica:
+                filas.append(f)
+                continue
+
+            vencimiento = vencimientos[f]
+            if vencimiento == NULO or estados[f] == completada:
+                continue
+
+            if vencimiento < (limite_alta if prioridad == alta else ahora):
+                filas.append(f)
+
+        return filas
+
+    def obtener_tareas_vencidas(self) -> List[Tarea]:
+        """Obtiene tareas vencidas"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._materializar_filas(self._filas_vencidas(ahora))
+
+    def obtener_tareas_urgentes(self) -> List[Tarea]:
+        """Obtiene tareas que necesitan atención urgente"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._materializar_filas(self._filas_urgentes(ahora))
+
+    def buscar_tareas(self, criterio: str) -> List[Tarea]:
+        """Busca tareas por título o descripción"""
+        criterio = criterio.lower().strip()
+        if not criterio:
+            return []
+
+        usuarios = [u.lower() for u in self._usuarios.valores]
+        return self._materializar_filas(
+            f for f in self._filas_vivas()
+            if (criterio in self._titulos[f].lower() or
+                criterio in self._descripciones[f].lower() or
+                criterio in usuarios[self._usuario[f]]))
+
+    def buscar_tareas_por_relevancia(self, consulta: str,
+                                     limite: Optional[int] = None) -> List[Tarea]:
+        """Busca tareas que contengan todos los términos, las más relevantes primero"""
+        terminos = consulta.lower().split()
+        if not terminos:
+            return []
+
+        separador = IndiceTexto.SEPARADOR
+        resultados = []
+        for f in self._filas_vivas():
+            texto = separador.join((self._titulos[f], self._descripciones[f],
+                                    self._usuarios.valores[self._usuario[f]])).lower()
+            puntaje = IndiceTexto.puntuar(texto, terminos)
+            if puntaje:
+                resultados.append((-puntaje, self._ids[f], f))
+
+        resultados.sort()
+        if limite is not None:
+            resultados = resultados[:limite]
+
+        return self._materializar_filas(f for _, _, f in resultados)
+
+    def obtener_tareas_por_fecha_creacion(self, fecha_inicio: datetime.date,
+                                         fecha_fin: datetime.date) -> List[Tarea]:
+        """Obtiene tareas creadas en un rango de fechas"""
+        desde = a_microsegundos(datetime.datetime.combine(fecha_inicio, datetime.time()))
+        hasta = a_microsegundos(datetime.datetime.combine(fecha_fin, datetime.time())) + UN_DIA
+        estados = self._estado
+
+        return self._materializar_filas(
+            f for f, creacion in enumerate(self._fecha_creacion)
+            if desde <= creacion < hasta and estados[f] != BORRADA)
+
+    def obtener_tareas_con_vencimiento_proximo(self, dias: int = 3) -> List[Tarea]:
+        """Obtiene tareas que vencen en los próximos N días"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        hasta = ahora + (dias + 1) * UN_DIA
+        abiertas = (CODIGO_ESTADO[EstadoTarea.PENDIENTE], CODIGO_ESTADO[EstadoTarea.EN_PROGRESO])
+        estados = self._estado
+
+        return self._materializar_filas(
+            f for f, vencimiento in enumerate(self._fecha_vencimiento)
+            if ahora <= vencimiento < hasta and estados[f] in abiertas)
+
+    # ========== ESTADÍSTICAS ==========
+
+    def contar_tareas_por_estado(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por estado"""
+        return {estado.value: self._estado.count(codigo)
+                for estado, codigo in CODIGO_ESTADO.items()}
+
+    def contar_tareas_por_prioridad(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por prioridad"""
+        return {prioridad.value: self._prioridad.count(codigo)
+                for prioridad, codigo in CODIGO_PRIORIDAD.items()}
+
+    def contar_tareas_por_usuario(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por usuario"""
+        usuarios = self._usuarios.valores
+        return {usuarios[codigo]: cantidad
+                for codigo, cantidad in Counter(self._usuario).items() if codigo != -1}
+
+    def obtener_estadisticas_generales(self) -> Dict[str, Any]:
+        """Obtiene estadísticas generales del sistema"""
+        ahora = datetime.datetime.now()
+        ahora_us = a_microsegundos(ahora)
+        total_tareas = len(self._filas)
+        por_estado = self.contar_tareas_por_estado()
+        tareas_completadas = por_estado[EstadoTarea.COMPLETADA.value]
+
+        # Tiempo promedio de completado sobre las columnas de fechas
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        inicios = self._fecha_inicio
+        fines = self._fecha_completado
+        duraciones = [(fines[f] if fines[f] != NULO else ahora_us) - inicios[f]
+                      for f, codigo in enumerate(self._estado)
+                      if codigo == completada and inicios[f] != NULO]
+        duraciones = [d for d in duraciones if d]
+
+        tiempo_promedio = None
+        if duraciones:
+            tiempo_promedio = datetime.timedelta(microseconds=sum(duraciones) / len(duraciones))
+
+        return {
+            "total_tareas": total_tareas,
+            "tareas_activas": total_tareas - por_estado[EstadoTarea.CANCELADA.value],
+            "tareas_completadas": tareas_completadas,
+            "tareas_vencidas": len(self._filas_vencidas(ahora_us)),
+            "tareas_urgentes": len(self._filas_urgentes(ahora_us)),
+            "tasa_completado": (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0,
+            "tiempo_promedio_completado": tiempo_promedio,
+            "por_estado": por_estado,
+            "por_prioridad": self.contar_tareas_por_prioridad(),
+            "por_usuario": self.contar_tareas_por_usuario()
+        }
+
+    # ========== ORDENAMIENTO ==========
+
+    def _clave_de_fila(self, criterio: str) -> Callable[[int], Any]:
+        """Clave de orden de una fila (la fecha de creación, ascendente)"""
+        if criterio == "prioridad":
+            # Códigos en orden de enum: BAJA=0 ... CRITICA=3
+            prioridades = self._prioridad
+            return lambda f: -prioridades[f]
+        if criterio == "fecha_vencimiento":
+            # Las filas sin vencimiento (NULO) van al final
+            vencimientos = self._fecha_vencimiento
+            return lambda f: (vencimientos[f] == NULO, vencimientos[f])
+        return self._fecha_creacion.__getitem__
+
+    def _filas_ordenadas(self, criterio: str, cantidad: Optional[int] = None) -> List[int]:
+        """Filas vivas en el orden de `criterio`; con `cantidad`, solo las primeras (heap)"""
+        clave = self._clave_de_fila(criterio)
+        descendente = criterio == "fecha_creacion"
+        if cantidad is None:
+            return sorted(self._filas_vivas(), key=clave, reverse=descendente)
+        elegir = heapq.nlargest if descendente else heapq.nsmallest
+        return elegir(cantidad, self._filas_vivas(), key=clave)
+
+    def ordenar_por_prioridad(self, tareas: List[Tarea] = None) -> List[Tarea]:
+        """Ordena tareas por prioridad (crítica primero)"""
+        if tareas is not None:
+            return super().ordenar_por_prioridad(tareas)
+        return self._materializar_filas(self._filas_ordenadas("prioridad"))
+
+    def ordenar_por_fecha_vencimiento(self, tareas: List[Tarea] = None) -> List[Tarea]:
+        """Ordena tareas por fecha de vencimiento (próximas primero)"""
+        if tareas is not None:
+            return super().ordenar_por_fecha_vencimiento(tareas)
+        return self._materializar_filas(self._filas_ordenadas("fecha_vencimiento"))
+
+    def ordenar_por_fecha_creacion(self, tareas: List[Tarea] = None,
+                                  descendente: bool = True) -> List[Tarea]:
+        """Ordena tareas por fecha de creación"""
+        if tareas is not None:
+            return super().ordenar_por_fecha_creacion(tareas, descendente)
+
+        return self._materializar_filas(
+            sorted(self._filas_vivas(), key=self._fecha_creacion.__getitem__,
+                   reverse=descendente))
+
+    def _tramo_ordenado(self, criterio: str, desde: int = 0,
+                        cantidad: Optional[int] = None) -> List[Tarea]:
+        """
+        Tramo del orden calculado sobre las columnas; solo se materializan sus
+        tareas y, si es acotado, se eligen con un heap en lugar de ordenar todo
+        """
+        filas = self._filas_ordenadas(criterio, None if cantidad is None else desde + cantidad)
+        return self._materializar_filas(filas[desde:])
+
+    # ========== PERSISTENCIA ==========
+
+    def _reemplazar_tareas(self, tareas: Iterable[Tarea]):
+        """
+        Sustituye todas las tareas codificándolas en columnas nuevas; si `tareas`
+        falla a mitad (archivo truncado), se restauran las columnas anteriores
+        """
+        anteriores = {nombre: getattr(self, nombre)
+                      for nombre in (*self.COLUMNAS, "_filas", "_borradas",
+                                     "_usuarios", "_diccionario_etiquetas")}
+        self._inicializar_columnas()
+        try:
+            for tarea in tareas:
+                self._agregar_fila(tarea)
+        except BaseException:
+            for nombre, valor in anteriores.items():
+                setattr(self, nombre, valor)
+            raise
+
+        # Las tareas anteriores que alguien conserve ya no deben escribir en las columnas
+        for tarea in self._materializadas.values():
+            tarea._observador = None
+        self._materializadas = weakref.WeakValueDictionary()
+        self._descartar_seguimiento()
+
+    def limpiar_tareas_canceladas(self) -> int:
+        """Elimina definitivamente las tareas canceladas"""
+        cancelada = CODIGO_ESTADO[EstadoTarea.CANCELADA]
+        ids_cancelados = [self._ids[f] for f in self._filas_con_codigo(self._estado, cancelada)]
+
+        for tarea_id in ids_cancelados:
+            self.eliminar_definitivamente(tarea_id)
+
+        return len(ids_cancelados)
+
+    def __iter__(self) -> Iterator[Tarea]:
+        """Recorre las tareas materializándolas de a una, en orden de inserción"""
+        return (self._materializar(fila) for fila in self._filas_vivas())
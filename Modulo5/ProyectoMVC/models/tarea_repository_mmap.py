@@ -0,0 +1,444 @@
+"""
+📦 MODELO: Repositorio de Tareas mapeado en memoria (solo lectura)
+Misma interfaz de consulta que TareaRepository, pero las tareas se leen de la
+instantánea binaria mapeada con mmap y se decodifican solo cuando se piden
+"""
+
+import os
+import datetime
+import weakref
+from collections import Counter
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea
+from models.tarea_repository import TareaRepository, MODOS_PERSISTENCIA, ruta_instantanea_lectura
+from models.tarea_repository_columnar import a_microsegundos, NULO, UN_DIA, DOS_DIAS
+from models.indices import IndiceTexto
+from models.lector_json import CallbackProgreso
+from models.importacion import ResultadoImportacion, TAMANO_LOTE_IMPORTACION
+from models.snapshot_binario import (SnapshotMapeado, escribir_snapshot_binario,
+                                     CODIGO_ESTADO, CODIGO_PRIORIDAD)
+
+
+class VistaTareasMapeadas(Mapping):
+    """
+    Vista id → Tarea sobre la instantánea mapeada
+    Permite que los métodos heredados que recorren `self.tareas` sigan funcionando;
+    recorrer sus valores decodifica las tareas de a una
+    """
+
+    def __init__(self, repositorio: 'TareaRepositoryMmap'):
+        self._repositorio = repositorio
+
+    def __getitem__(self, tarea_id: int) -> Tarea:
+        tarea = self._repositorio.obtener_tarea_por_id(tarea_id)
+        if tarea is None:
+            raise KeyError(tarea_id)
+        return tarea
+
+    def __iter__(self) -> Iterator[int]:
+        return self._repositorio._snapshot.columnas("id")
+
+    def __len__(self) -> int:
+        return len(self._repositorio._snapshot)
+
+    def __contains__(self, tarea_id: object) -> bool:
+        return self._repositorio._snapshot.fila_de_id(tarea_id) is not None
+
+    def values(self) -> Iterator[Tarea]:
+        """Tareas en orden de archivo, decodificadas a medida que se recorren"""
+        return iter(self._repositorio)
+
+
+class TareaRepositoryMmap(TareaRepository):
+    """
+    Repositorio de Tareas de solo lectura para dashboards y listados
+    - Abre la instantánea binaria con mmap: al arrancar solo se lee
+      la cabecera, así que el tiempo de inicio no crece con el tamaño del archivo
+    - Registros de tamaño fijo e índice por ID: una tarea se decodifica sin leer
+      las demás; len(), el recorrido con corte temprano y las páginas solo tocan
+      los bytes que necesitan
+    - Los conteos por estado y prioridad vienen precalculados en la cabecera; el
+      resto de las consultas recorre los registros sin construir tareas
+    - En modo "binario" abre tareas.bin; en los demás, la copia derivada
+      tareas.lectura.bin, que el repositorio que escribe los datos reescribe al
+      guardar una vez que existe. Solo si falta o quedó más antigua que los datos
+      se regenera desde el archivo de datos (eso sí depende de su tamaño)
+    - Las tareas devueltas están desconectadas: modificarlas no cambia el archivo
+    """
+
+    def __init__(self, archivo_datos: str = "tareas.json", persistencia: str = "json",
+                 politica_fsync: str = "lote", procesos: int = 1):
+        self.archivo_datos = archivo_datos
+        self.procesos = procesos
+        self._inicializar_persistencia(persistencia, politica_fsync)
+        self.siguiente_id = 1
+        self._snapshot: Optional[SnapshotMapeado] = None
+
+        # Vista compatible con la interfaz del repositorio en memoria
+        self.tareas = VistaTareasMapeadas(self)
+
+        # Tareas ya decodificadas: mientras alguien las use, se reutiliza el objeto
+        self._materializadas: 'weakref.WeakValueDictionary[int, Tarea]' = weakref.WeakValueDictionary()
+        # Criterio → filas en ese orden (la instantánea no cambia: se calcula una vez)
+        self._ordenes: Dict[str, List[int]] = {}
+
+        # Cargar datos existentes
+        self.cargar_datos()
+
+    def _inicializar_persistencia(self, persistencia: str, politica_fsync: str):
+        """Guarda el modo de persistencia con el que se generará la instantánea"""
+        if persistencia not in MODOS_PERSISTENCIA:
+            raise ValueError(f"Modo de persistencia no soportado: {persistencia}")
+
+        self._wal = None
+        self._persistencia = persistencia
+        self._politica_fsync = politica_fsync
+        # Nunca hay cambios pendientes: nada se modifica
+        self._inicializar_seguimiento()
+        self._archivo_binario = ruta_instantanea_lectura(self.archivo_datos, persistencia)
+
+    # ========== DECODIFICACIÓN ==========
+
+    def _materializar(self, fila: int, registro: Optional[tuple] = None) -> Tarea:
+        """Decodifica (o reutiliza) la tarea de una fila"""
+        if registro is None:
+            registro = self._snapshot.registro(fila)
+        tarea = self._materializadas.get(registro[0])
+        if tarea is None:
+            tarea = self._snapshot.tarea_desde_registro(registro)
+            self._materializadas[tarea.id] = tarea
+        return tarea
+
+    def _materializar_filas(self, filas: Iterable[int]) -> List[Tarea]:
+        """Decodifica varias filas"""
+        return [self._materializar(fila) for fila in filas]
+
+    def _filtrar(self, campos: tuple, condicion: Callable[..., bool]) -> List[Tarea]:
+        """Decodifica solo las filas cuyos campos cumplen la condición"""
+        columnas = self._snapshot.columnas(*campos)
+        if len(campos) == 1:
+            columnas = zip(columnas)
+        return self._materializar_filas(
+            fila for fila, valores in enumerate(columnas) if condicion(*valores))
+
+    def _solo_lectura(self, operacion: str):
+        """Rechaza una operación que modificaría las tareas"""
+        raise PermissionError(f"Repositorio de solo lectura: no se puede {operacion}")
+
+    # ========== OPERACIONES CRUD ==========
+
+    def crear_tarea(self, titulo: str, descripcion: str, usuario_asignado: str,
+                   prioridad: PrioridadTarea = PrioridadTarea.MEDIA) -> Tarea:
+        """No disponible: el repositorio es de solo lectura"""
+        self._solo_lectura("crear tareas")
+
+    def importar_tareas(self, registros: Iterable[Any],
+                        tamano_lote: int = TAMANO_LOTE_IMPORTACION) -> ResultadoImportacion:
+        """No disponible: el repositorio es de solo lectura"""
+        self._solo_lectura("importar tareas")
+
+    def obtener_tarea_por_id(self, tarea_id: int) -> Optional[Tarea]:
+        """Obtiene una tarea por su ID (búsqueda binaria en el índice del archivo)"""
+        tarea = self._materializadas.get(tarea_id)
+        if tarea is not None:
+            return tarea
+        fila = self._snapshot.fila_de_id(tarea_id)
+        if fila is None:
+            return None
+        return self._materializar(fila)
+
+    def obtener_todas_tareas(self) -> List[Tarea]:
+        """Obtiene todas las tareas"""
+        return list(self)
+
+    def obtener_tareas_pagina(self, desde: int, cantidad: int) -> List[Tarea]:
+        """Obtiene `cantidad` tareas a partir de la posición `desde` (solo decodifica esas)"""
+        return [self._materializar(fila, registro) for fila, registro in
+                enumerate(self._snapshot.registros(desde, desde + cantidad), desde)]
+
+    def obtener_tareas_despues_de(self, cursor: int, cantidad: int) -> List[Tarea]:
+        """Paginación por cursor: búsqueda binaria en el índice por ID y solo esas filas"""
+        snapshot = self._snapshot
+        desde = snapshot.posicion_de_id(cursor + 1)
+        hasta = min(desde + cantidad, len(snapshot))
+        return [self._materializar(snapshot.fila_en_posicion(posicion))
+                for posicion in range(desde, hasta)]
+
+    def obtener_tareas_activas(self) -> List[Tarea]:
+        """Obtiene tareas que no están canceladas"""
+        cancelada = CODIGO_ESTADO[EstadoTarea.CANCELADA]
+        return self._filtrar(("estado",), lambda estado: estado != cancelada)
+
+    def actualizar_tarea(self, tarea: Tarea) -> bool:
+        """No disponible: el repositorio es de solo lectura"""
+        return False
+
+    def eliminar_tarea(self, tarea_id: int) -> bool:
+        """No disponible: el repositorio es de solo lectura"""
+        return False
+
+    def eliminar_definitivamente(self, tarea_id: int) -> bool:
+        """No disponible: el repositorio es de solo lectura"""
+        return False
+
+    # ========== CONSULTAS ESPECÍFICAS ==========
+
+    def _coincide_cadena(self, valor: str) -> Callable[[int], bool]:
+        """Compara un índice de la tabla de cadenas con un valor; cada índice se decodifica una vez"""
+        coincide: Dict[int, bool] = {}
+        cadena = self._snapshot.cadena
+
+        def es_igual(indice: int) -> bool:
+            resultado = coincide.get(indice)
+            if resultado is None:
+                resultado = coincide[indice] = cadena(indice) == valor
+            return resultado
+
+        return es_igual
+
+    def obtener_tareas_por_usuario(self, usuario: str) -> List[Tarea]:
+        """Obtiene tareas asignadas a un usuario específico"""
+        return self._filtrar(("usuario_asignado",), self._coincide_cadena(usuario))
+
+    def obtener_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
+        """Obtiene tareas por estado"""
+        codigo = CODIGO_ESTADO[estado]
+        return self._filtrar(("estado",), lambda valor: valor == codigo)
+
+    def obtener_tareas_por_prioridad(self, prioridad: PrioridadTarea) -> List[Tarea]:
+        """Obtiene tareas por prioridad"""
+        codigo = CODIGO_PRIORIDAD[prioridad]
+        return self._filtrar(("prioridad",), lambda valor: valor == codigo)
+
+    def obtener_tareas_vencidas(self) -> List[Tarea]:
+        """Obtiene tareas vencidas"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        return self._filtrar(("estado", "fecha_vencimiento"),
+                             lambda estado, vencimiento:
+                             NULO < vencimiento < ahora and estado != completada)
+
+    def _es_urgente(self, ahora: int) -> Callable[[int, int, int], bool]:
+        """Condición de Tarea.necesita_atencion sobre (prioridad, estado, vencimiento)"""
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        critica = CODIGO_PRIORIDAD[PrioridadTarea.CRITICA]
+        alta = CODIGO_PRIORIDAD[PrioridadTarea.ALTA]
+        limite_alta = ahora + DOS_DIAS
+
+        def es_urgente(prioridad: int, estado: int, vencimiento: int) -> bool:
+            if prioridad == critica:
+                return True
+            if vencimiento == NULO or estado == completada:
+                return False
+            return vencimiento < (limite_alta if prioridad == alta else ahora)
+
+        return es_urgente
+
+    def obtener_tareas_urgentes(self) -> List[Tarea]:
+        """Obtiene tareas que necesitan atención urgente"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._filtrar(("prioridad", "estado", "fecha_vencimiento"), self._es_urgente(ahora))
+
+    def obtener_tareas_por_etiqueta(self, etiqueta: str) -> List[Tarea]:
+        """Obtiene tareas que contienen una etiqueta específica"""
+        es_etiqueta = self._coincide_cadena(etiqueta.lower().strip())
+        etiquetas = self._snapshot.etiquetas
+        return self._filtrar(("primera_etiqueta", "cantidad_etiquetas"),
+                             lambda primera, cantidad: cantidad and
+                             any(map(es_etiqueta, etiquetas(primera, cantidad))))
+
+    def buscar_tareas(self, criterio: str) -> List[Tarea]:
+        """Busca tareas por título o descripción"""
+        criterio = criterio.lower().strip()
+        if not criterio:
+            return []
+
+        cadena = self._snapshot.cadena
+        return self._filtrar(("titulo", "descripcion", "usuario_asignado"),
+                             lambda *indices: any(criterio in cadena(i).lower() for i in indices))
+
+    def buscar_tareas_por_relevancia(self, consulta: str,
+                                     limite: Optional[int] = None) -> List[Tarea]:
+        """Busca tareas que contengan todos los términos, las más relevantes primero"""
+        terminos = consulta.lower().split()
+        if not terminos:
+            return []
+
+        cadena = self._snapshot.cadena
+        separador = IndiceTexto.SEPARADOR
+        resultados = []
+        for fila, (tarea_id, *indices) in enumerate(self._snapshot.columnas(
+                "id", "titulo", "descripcion", "usuario_asignado")):
+            puntaje = IndiceTexto.puntuar(separador.join(map(cadena, indices)).lower(), terminos)
+            if puntaje:
+                resultados.append((-puntaje, tarea_id, fila))
+
+        resultados.sort()
+        if limite is not None:
+            resultados = resultados[:limite]
+
+        return self._materializar_filas(fila for _, _, fila in resultados)
+
+    def obtener_tareas_por_fecha_creacion(self, fecha_inicio: datetime.date,
+                                         fecha_fin: datetime.date) -> List[Tarea]:
+        """Obtiene tareas creadas en un rango de fechas"""
+        desde = a_microsegundos(datetime.datetime.combine(fecha_inicio, datetime.time()))
+        hasta = a_microsegundos(datetime.datetime.combine(fecha_fin, datetime.time())) + UN_DIA
+        return self._filtrar(("fecha_creacion",), lambda creacion: desde <= creacion < hasta)
+
+    def obtener_tareas_con_vencimiento_proximo(self, dias: int = 3) -> List[Tarea]:
+        """Obtiene tareas que vencen en los próximos N días"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        hasta = ahora + (dias + 1) * UN_DIA
+        abiertas = (CODIGO_ESTADO[EstadoTarea.PENDIENTE], CODIGO_ESTADO[EstadoTarea.EN_PROGRESO])
+        return self._filtrar(("estado", "fecha_vencimiento"),
+                             lambda estado, vencimiento:
+                             ahora <= vencimiento < hasta and estado in abiertas)
+
+    # ========== ESTADÍSTICAS ==========
+
+    def contar_tareas_por_estado(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por estado (precalculado en la cabecera)"""
+        return {estado.value: cantidad
+                for estado, cantidad in self._snapshot.conteos_estado.items()}
+
+    def contar_tareas_por_prioridad(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por prioridad (precalculado en la cabecera)"""
+        return {prioridad.value: cantidad
+                for prioridad, cantidad in self._snapshot.conteos_prioridad.items()}
+
+    def contar_tareas_por_usuario(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por usuario"""
+        cadena = self._snapshot.cadena
+        return {cadena(indice): cantidad for indice, cantidad in
+                Counter(self._snapshot.columnas("usuario_asignado")).items()}
+
+    def obtener_estadisticas_generales(self) -> Dict[str, Any]:
+        """Obtiene estadísticas generales del sistema (un solo recorrido de los registros)"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        completada = CODIGO_ESTADO[EstadoTarea.COMPLETADA]
+        es_urgente = self._es_urgente(ahora)
+
+        vencidas = urgentes = 0
+        duraciones = []
+        for prioridad, estado, inicio, completado, vencimiento in self._snapshot.columnas(
+                "prioridad", "estado", "fecha_inicio", "fecha_completado", "fecha_vencimiento"):
+            if NULO < vencimiento < ahora and estado != completada:
+                vencidas += 1
+            if es_urgente(prioridad, estado, vencimiento):
+                urgentes += 1
+            if estado == completada and inicio != NULO:
+                duracion = (completado if completado != NULO else ahora) - inicio
+                if duracion:
+                    duraciones.append(duracion)
+
+        tiempo_promedio = None
+        if duraciones:
+            tiempo_promedio = datetime.timedelta(microseconds=sum(duraciones) / len(duraciones))
+
+        por_estado = self.contar_tareas_por_estado()
+        total_tareas = len(self._snapshot)
+        tareas_completadas = por_estado[EstadoTarea.COMPLETADA.value]
+
+        return {
+            "total_tareas": total_tareas,
+            "tareas_activas": total_tareas - por_estado[EstadoTarea.CANCELADA.value],
+            "tareas_completadas": tareas_completadas,
+            "tareas_vencidas": vencidas,
+            "tareas_urgentes": urgentes,
+            "tasa_completado": (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0,
+            "tiempo_promedio_completado": tiempo_promedio,
+            "por_estado": por_estado,
+            "por_prioridad": self.contar_tareas_por_prioridad(),
+            "por_usuario": self.contar_tareas_por_usuario()
+        }
+
+    # ========== ORDENAMIENTO ==========
+
+    def _filas_ordenadas(self, criterio: str) -> List[int]:
+        """Filas en el orden de `criterio` con empates por ID, calculadas una vez por apertura"""
+        filas = self._ordenes.get(criterio)
+        if filas is None:
+            valores = list(self._snapshot.columnas("id", criterio))
+            if criterio == "fecha_vencimiento":
+                # Las filas sin vencimiento (NULO) van al final
+                clave = lambda f: (valores[f][1] == NULO, valores[f][1], valores[f][0])
+            else:
+                # Prioridad (códigos BAJA=0 ... CRITICA=3) y creación: de mayor a menor
+                clave = lambda f: (-valores[f][1], valores[f][0])
+            filas = self._ordenes[criterio] = sorted(range(len(valores)), key=clave)
+        return filas
+
+    def _tramo_ordenado(self, criterio: str, desde: int = 0,
+                        cantidad: Optional[int] = None) -> List[Tarea]:
+        """Decodifica solo las filas del tramo pedido"""
+        hasta = None if cantidad is None else desde + cantidad
+        return self._materializar_filas(self._filas_ordenadas(criterio)[desde:hasta])
+
+    # ========== PERSISTENCIA ==========
+
+    def guardar_datos(self) -> bool:
+        """Nada que guardar: el repositorio es de solo lectura"""
+        return True
+
+    def cargar_datos(self, progreso: Optional[CallbackProgreso] = None) -> bool:
+        """
+        (Re)abre la instantánea binaria; solo se lee la cabecera
+        Si falta o quedó desactualizada, primero se genera desde el archivo de datos
+        """
+        try:
+            if self._instantanea_desactualizada():
+                origen = TareaRepository(self.archivo_datos, self._persistencia,
+                                         self._politica_fsync, self.procesos)
+                try:
+                    escribir_snapshot_binario(self._archivo_binario, origen.tareas.values(),
+                                              origen.siguiente_id)
+                finally:
+                    origen.cerrar()
+
+            anterior, self._snapshot = self._snapshot, SnapshotMapeado(self._archivo_binario)
+            if anterior is not None:
+                anterior.cerrar()
+            self._materializadas = weakref.WeakValueDictionary()
+            self._ordenes.clear()
+            self._fragmentos.clear()
+            self.siguiente_id = self._snapshot.siguiente_id
+            self.version += 1
+            return True
+
+        except Exception as e:
+            print(f"Error al cargar datos: {e}")
+            return False
+
+    def _instantanea_desactualizada(self) -> bool:
+        """La instantánea falta o es más antigua que el JSON/log de los que se deriva"""
+        if not os.path.exists(self._archivo_binario):
+            return True
+        if self._persistencia == "binario":
+            return False  # En este modo la instantánea es la fuente de los datos
+
+        fuentes = [self.archivo_datos]
+        if self._persistencia == "wal":
+            fuentes.append(self.archivo_datos + ".wal")
+        generada = os.path.getmtime(self._archivo_binario)
+        return any(os.path.exists(fuente) and os.path.getmtime(fuente) > generada
+                   for fuente in fuentes)
+
+    def limpiar_tareas_canceladas(self) -> int:
+        """No disponible: el repositorio es de solo lectura"""
+        self._solo_lectura("eliminar tareas")
+
+    def cerrar(self):
+        """Libera el mapeo del archivo"""
+        self._snapshot.cerrar()
+
+    def __len__(self) -> int:
+        """Retorna el número total de tareas (dato de la cabecera)"""
+        return len(self._snapshot)
+
+    def __iter__(self) -> Iterator[Tarea]:
+        """Recorre las tareas decodificándolas de a una"""
+        return (self._materializar(fila, registro)
+                for fila, registro in enumerate(self._snapshot.registros()))
@@ -0,0 +1,742 @@
+"""
+📦 MODELO: Repositorio de Tareas sobre SQLite
+Misma interfaz que TareaRepository, pero las tareas viven en una base de datos
+SQLite (módulo estándar sqlite3) y cada consulta se resuelve en SQL con índices
+"""
+
+import os
+import json
+import sqlite3
+import datetime
+import weakref
+from collections.abc import Mapping
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from models.tarea import Tarea, EstadoTarea, PrioridadTarea, VACIO
+from models.tarea_repository import TareaRepository, CAMPOS_TEXTO, MODOS_PERSISTENCIA, RANGO_PRIORIDAD
+from models.tarea_repository_columnar import a_microsegundos, desde_microsegundos
+from models.indices import IndiceTexto
+from models.lector_json import LectorTareasJSON, CallbackProgreso
+from models.carga_paralela import admite_carga_paralela, decodificar_en_paralelo
+
+# La prioridad se guarda como su rango (crítica primero) para ordenar con el índice
+PRIORIDAD_POR_RANGO = {rango: prioridad for prioridad, rango in RANGO_PRIORIDAD.items()}
+ESTADO_POR_VALOR = {estado.value: estado for estado in EstadoTarea}
+
+# ORDER BY de cada criterio de orden (empates por ID, como en el repositorio en memoria)
+ORDEN_SQL = {
+    "prioridad": "t.prioridad, t.id",
+    "fecha_vencimiento": "t.fecha_vencimiento IS NULL, t.fecha_vencimiento, t.id",
+    "fecha_creacion": "t.fecha_creacion DESC, t.id",
+}
+
+UN_DIA = 24 * 3600 * 10 ** 6
+DOS_DIAS = 2 * UN_DIA
+
+# Política de fsync del modo WAL → PRAGMA synchronous
+SINCRONIZACION = {"siempre": "FULL", "lote": "NORMAL", "nunca": "OFF"}
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS tareas (
+    id INTEGER PRIMARY KEY,
+    titulo TEXT NOT NULL,
+    descripcion TEXT NOT NULL,
+    usuario_asignado TEXT NOT NULL,
+    usuario_creador TEXT NOT NULL,
+    prioridad INTEGER NOT NULL,
+    estado TEXT NOT NULL,
+    fecha_creacion INTEGER NOT NULL,
+    fecha_inicio INTEGER,
+    fecha_completado INTEGER,
+    fecha_vencimiento INTEGER,
+    tiempo_estimado_horas REAL,
+    tiempo_real_horas REAL
+);
+CREATE TABLE IF NOT EXISTS etiquetas (
+    tarea_id INTEGER NOT NULL REFERENCES tareas(id) ON DELETE CASCADE,
+    posicion INTEGER NOT NULL,
+    etiqueta TEXT NOT NULL,
+    PRIMARY KEY (tarea_id, posicion)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS comentarios (
+    tarea_id INTEGER NOT NULL REFERENCES tareas(id) ON DELETE CASCADE,
+    posicion INTEGER NOT NULL,
+    comentario_id INTEGER,
+    texto TEXT NOT NULL,
+    usuario TEXT NOT NULL,
+    fecha INTEGER NOT NULL,
+    PRIMARY KEY (tarea_id, posicion)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS metadatos (
+    clave TEXT PRIMARY KEY,
+    valor
+);
+CREATE INDEX IF NOT EXISTS idx_tareas_estado ON tareas(estado);
+CREATE INDEX IF NOT EXISTS idx_tareas_prioridad ON tareas(prioridad);
+CREATE INDEX IF NOT EXISTS idx_tareas_usuario ON tareas(usuario_asignado);
+CREATE INDEX IF NOT EXISTS idx_tareas_vencimiento ON tareas(fecha_vencimiento);
+CREATE INDEX IF NOT EXISTS idx_tareas_creacion ON tareas(fecha_creacion);
+CREATE INDEX IF NOT EXISTS idx_etiquetas_etiqueta ON etiquetas(etiqueta);
+CREATE VIRTUAL TABLE IF NOT EXISTS tareas_fts USING fts5(
+    titulo, descripcion, usuario_asignado,
+    content='tareas', content_rowid='id', tokenize='trigram'
+);
+"""
+
+# Sincronizan el índice FTS (tabla de contenido externo) con la tabla de tareas
+DISPARADORES = """
+CREATE TRIGGER IF NOT EXISTS tareas_fts_alta AFTER INSERT ON tareas BEGIN
+    INSERT INTO tareas_fts(rowid, titulo, descripcion, usuario_asignado)
+    VALUES (new.id, new.titulo, new.descripcion, new.usuario_asignado);
+END;
+CREATE TRIGGER IF NOT EXISTS tareas_fts_baja AFTER DELETE ON tareas BEGIN
+    INSERT INTO tareas_fts(tareas_fts, rowid, titulo, descripcion, usuario_asignado)
+    VALUES ('delete', old.id, old.titulo, old.descripcion, old.usuario_asignado);
+END;
+CREATE TRIGGER IF NOT EXISTS tareas_fts_cambio
+AFTER UPDATE OF titulo, descripcion, usuario_asignado ON tareas BEGIN
+    INSERT INTO tareas_fts(tareas_fts, rowid, titulo, descripcion, usuario_asignado)
+    VALUES ('delete', old.id, old.titulo, old.descripcion, old.usuario_asignado);
+    INSERT INTO tareas_fts(rowid, titulo, descripcion, usuario_asignado)
+    VALUES (new.id, new.titulo, new.descripcion, new.usuario_asignado);
+END;
+"""
+
+SIN_DISPARADORES = """
+DROP TRIGGER IF EXISTS tareas_fts_alta;
+DROP TRIGGER IF EXISTS tareas_fts_baja;
+DROP TRIGGER IF EXISTS tareas_fts_cambio;
+"""
+
+# Etiquetas y comentarios viajan con cada fila como arreglos JSON (NULL si no hay)
+SELECCIONAR_TAREAS = """
+SELECT t.id, t.titulo, t.descripcion, t.usuario_asignado, t.usuario_creador,
+       t.prioridad, t.estado, t.fecha_creacion, t.fecha_inicio, t.fecha_completado,
+       t.fecha_vencimiento, t.tiempo_estimado_horas, t.tiempo_real_horas,
+       (SELECT NULLIF(json_group_array(etiqueta), '[]') FROM
+            (SELECT etiqueta FROM etiquetas WHERE tarea_id = t.id ORDER BY posicion)),
+       (SELECT NULLIF(json_group_array(json_array(comentario_id, texto, usuario, fecha)), '[]') FROM
+            (SELECT * FROM comentarios WHERE tarea_id = t.id ORDER BY posicion))
+FROM tareas t
+"""
+
+INSERTAR_TAREA = "INSERT INTO tareas VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+ACTUALIZAR_TAREA = """
+UPDATE tareas SET titulo = ?, descripcion = ?, usuario_asignado = ?, usuario_creador = ?,
+       prioridad = ?, estado = ?, fecha_creacion = ?, fecha_inicio = ?, fecha_completado = ?,
+       fecha_vencimiento = ?, tiempo_estimado_horas = ?, tiempo_real_horas = ?
+WHERE id = ?
+"""
+
+# Variante sin columnas de texto: no dispara la reindexación FTS
+ACTUALIZAR_SIN_TEXTO = """
+UPDATE tareas SET usuario_creador = ?, prioridad = ?, estado = ?, fecha_creacion = ?,
+       fecha_inicio = ?, fecha_completado = ?, fecha_vencimiento = ?,
+       tiempo_estimado_horas = ?, tiempo_real_horas = ?
+WHERE id = ?
+"""
+
+# Coincidencia exacta de subcadena (misma semántica que `criterio in texto.lower()`)
+CONTIENE = ("(instr(minusculas(t.titulo), ?) > 0 OR instr(minusculas(t.descripcion), ?) > 0 "
+            "OR instr(minusculas(t.usuario_asignado), ?) > 0)")
+
+
+def a_entero(fecha: Optional[datetime.datetime]) -> Optional[int]:
+    """Fecha → microsegundos desde la época (NULL si no hay fecha)"""
+    return None if fecha is None else a_microsegundos(fecha)
+
+
+def a_fecha(valor: Optional[int]) -> Optional[datetime.datetime]:
+    """Microsegundos desde la época → fecha"""
+    return None if valor is None else desde_microsegundos(valor)
+
+
+def frase_fts(termino: str) -> str:
+    """Escapa un término como frase FTS5"""
+    return '"' + termino.replace('"', '""') + '"'
+
+
+class VistaTareasSQLite(Mapping):
+    """
+    Vista id → Tarea sobre la tabla de tareas
+    Permite que los métodos heredados que recorren `self.tareas` sigan funcionando
+    """
+
+    def __init__(self, repositorio: 'TareaRepositorySQLite'):
+        self._repositorio = repositorio
+
+    def __getitem__(self, tarea_id: int) -> Tarea:
+        tarea = self._repositorio.obtener_tarea_por_id(tarea_id)
+        if tarea is None:
+            raise KeyError(tarea_id)
+        return tarea
+
+    def __iter__(self) -> Iterator[int]:
+        filas = self._repositorio._conexion.execute("SELECT id FROM tareas ORDER BY id")
+        return (tarea_id for tarea_id, in filas)
+
+    def __len__(self) -> int:
+        return self._repositorio._conexion.execute("SELECT COUNT(*) FROM tareas").fetchone()[0]
+
+    def __contains__(self, tarea_id: object) -> bool:
+        return self._repositorio._conexion.execute(
+            "SELECT 1 FROM tareas WHERE id = ?", (tarea_id,)).fetchone() is not None
+
+    def values(self) -> List[Tarea]:
+        """Todas las tareas con una sola consulta"""
+        return self._repositorio.obtener_todas_tareas()
+
+
+class TareaRepositorySQLite(TareaRepository):
+    """
+    Repositorio de Tareas sobre SQLite
+    - Tablas de tareas, etiquetas y comentarios; índices por estado, prioridad,
+      usuario, vencimiento y creación; búsqueda de texto con FTS5 (trigramas)
+    - La base de datos se guarda junto al archivo JSON con extensión .db; si está
+      vacía se importa el JSON existente
+    - Modo "json": los cambios se acumulan en una transacción que confirma guardar_datos
+    - Modo "wal": journal WAL de SQLite y confirmación inmediata de cada cambio
+    """
+
+    # El texto lo indexa FTS5 dentro de la base de datos
+    _texto_en_procesos = False
+
+    def __init__(self, archivo_datos: str = "tareas.json", persistencia: str = "json",
+                 politica_fsync: str = "lote", procesos: int = 1):
+        self.archivo_datos = archivo_datos
+        self.procesos = procesos
+        self.archivo_bd = os.path.splitext(archivo_datos)[0] + ".db"
+        self._inicializar_persistencia(persistencia, politica_fsync)
+        self.siguiente_id = 1
+
+        # Vista compatible con la interfaz del repositorio en memoria
+        self.tareas = VistaTareasSQLite(self)
+
+        # Tareas ya materializadas: mientras alguien las use, se reutiliza el objeto
+        self._materializadas: 'weakref.WeakValueDictionary[int, Tarea]' = weakref.WeakValueDictionary()
+
+        self._conectar()
+
+        # Cargar datos existentes
+        self.cargar_datos()
+
+    def _inicializar_persistencia(self, persistencia: str, politica_fsync: str):
+        """Traduce el modo de persistencia a la configuración de SQLite"""
+        if persistencia not in MODOS_PERSISTENCIA or persistencia == "binario":
+            raise ValueError(f"Modo de persistencia no soportado por SQLite: {persistencia}")
+        if politica_fsync not in SINCRONIZACION:
+            raise ValueError(f"Política de fsync no soportada: {politica_fsync}")
+
+        # El log propio del repositorio no se usa: SQLite ya tiene su journal
+        self._wal = None
+        # IDs con cambios sin confirmar (el JSON no se escribe: no hay fragmentos)
+        self._inicializar_seguimiento()
+        self._confirmar_cada_cambio = persistencia == "wal"
+        self._politica_fsync = politica_fsync
+
+    def _conectar(self):
+        """Abre la base de datos y crea el esquema si hace falta"""
+        self._conexion = sqlite3.connect(
+            self.archivo_bd, isolation_level=None if self._confirmar_cada_cambio else "",
+            check_same_thread=False)  # el autoguardado confirma desde otro hilo (con bloqueo)
+        self._conexion.execute("PRAGMA foreign_keys = ON")
+        self._conexion.execute("PRAGMA cache_size = -65536")  # 64 MiB de páginas en caché
+        if self._confirmar_cada_cambio:
+            self._conexion.execute("PRAGMA journal_mode = WAL")
+            self._conexion.execute(f"PRAGMA synchronous = {SINCRONIZACION[self._politica_fsync]}")
+
+        # str.lower de Python para conservar la semántica exacta de la búsqueda
+        self._conexion.create_function("minusculas", 1, str.lower, deterministic=True)
+
+        self._conexion.executescript(ESQUEMA + DISPARADORES)
+
+    # ========== CONVERSIÓN DE FILAS ==========
+
+    @staticmethod
+    def _valores(tarea: Tarea) -> Tuple:
+        """Valores de las columnas de la tabla de tareas (sin el ID)"""
+        return (tarea.titulo, tarea.descripcion, tarea.usuario_asignado, tarea.usuario_creador,
+                RANGO_PRIORIDAD[tarea.prioridad], tarea.estado.value,
+                a_entero(tarea.fecha_creacion), a_entero(tarea.fecha_inicio),
+                a_entero(tarea.fecha_completado), a_entero(tarea.fecha_vencimiento),
+                tarea.tiempo_estimado_horas, tarea.tiempo_real_horas)
+
+    def _materializar(self, fila: Tuple) -> Tarea:
+        """Construye (o reutiliza) el objeto Tarea de una fila"""
+        tarea_id = fila[0]
+        tarea = self._materializadas.get(tarea_id)
+        if tarea is not None:
+            return tarea
+
+        (_, titulo, descripcion, usuario, creador, prioridad, estado, creacion, inicio,
+         completado, vencimiento, estimado, real, etiquetas, comentarios) = fila
+
+        tarea = Tarea.__new__(Tarea)
+        tarea.id = tarea_id
+        tarea.titulo = titulo
+        tarea.descripcion = descripcion
+        tarea.usuario_asignado = usuario
+        tarea.usuario_creador = creador
+        tarea.prioridad = PRIORIDAD_POR_RANGO[prioridad]
+        tarea.estado = ESTADO_POR_VALOR[estado]
+        tarea.fecha_creacion = a_fecha(creacion)
+        tarea.fecha_inicio = a_fecha(inicio)
+        tarea.fecha_completado = a_fecha(completado)
+        tarea.fecha_vencimiento = a_fecha(vencimiento)
+        tarea.etiquetas = VACIO if etiquetas is None else json.loads(etiquetas)
+        tarea.comentarios = VACIO if comentarios is None else [
+            {"id": comentario_id, "texto": texto, "usuario": autor, "fecha": a_fecha(fecha)}
+            for comentario_id, texto, autor, fecha in json.loads(comentarios)
+        ]
+        tarea.tiempo_estimado_horas = estimado
+        tarea.tiempo_real_horas = real
+        tarea._observador = self._al_cambiar_tarea
+
+        self._materializadas[tarea_id] = tarea
+        return tarea
+
+    def _consultar(self, condicion: str = "", parametros: Iterable[Any] = (),
+                   orden: str = "t.id", limite: Optional[int] = None,
+                   desplazamiento: int = 0) -> List[Tarea]:
+        """Ejecuta SELECT sobre las tareas y materializa el resultado"""
+        consulta = SELECCIONAR_TAREAS
+        if condicion:
+            consulta += f"WHERE {condicion} "
+        consulta += f"ORDER BY {orden}"
+        if limite is not None:
+            consulta += " LIMIT ? OFFSET ?"
+            parametros = (*parametros, limite, desplazamiento)
+        return [self._materializar(fila) for fila in self._conexion.execute(consulta, tuple(parametros))]
+
+    # ========== ESCRITURA ==========
+
+    def _insertar(self, tarea: Tarea):
+        """Inserta una tarea con sus etiquetas y comentarios"""
+        self._conexion.execute(INSERTAR_TAREA, (tarea.id, *self._valores(tarea)))
+        self._escribir_etiquetas(tarea, borrar=False)
+        self._escribir_comentarios(tarea, borrar=False)
+
+    def _escribir_etiquetas(self, tarea: Tarea, borrar: bool = True):
+        """Reescribe las etiquetas de una tarea"""
+        if borrar:
+            self._conexion.execute("DELETE FROM etiquetas WHERE tarea_id = ?", (tarea.id,))
+        self._conexion.executemany(
+            "INSERT INTO etiquetas VALUES (?, ?, ?)",
+            ((tarea.id, posicion, etiqueta) for posicion, etiqueta in enumerate(tarea.etiquetas)))
+
+    def _escribir_comentarios(self, tarea: Tarea, borrar: bool = True):
+        """Reescribe los comentarios de una tarea"""
+        if borrar:
+            self._conexion.execute("DELETE FROM comentarios WHERE tarea_id = ?", (tarea.id,))
+        self._conexion.executemany(
+            "INSERT INTO comentarios VALUES (?, ?, ?, ?, ?, ?)",
+            ((tarea.id, posicion, c.get("id"), c["texto"], c["usuario"], a_entero(c["fecha"]))
+             for posicion, c in enumerate(tarea.comentarios)))
+
+    def _insertar_filas(self, tareas: Iterable[Tarea]):
+        """Inserta tareas nuevas con sus etiquetas y comentarios mediante executemany"""
+        etiquetas = []
+        comentarios = []
+        def filas():
+            for tarea in tareas:
+                etiquetas.extend((tarea.id, posicion, etiqueta)
+                                 for posicion, etiqueta in enumerate(tarea.etiquetas))
+                comentarios.extend((tarea.id, posicion, c.get("id"), c["texto"], c["usuario"],
+                                    a_entero(c["fecha"]))
+                                   for posicion, c in enumerate(tarea.comentarios))
+                yield (tarea.id, *self._valores(tarea))
+
+        self._conexion.executemany(INSERTAR_TAREA, filas())
+        self._conexion.executemany("INSERT INTO etiquetas VALUES (?, ?, ?)", etiquetas)
+        self._conexion.executemany("INSERT INTO comentarios VALUES (?, ?, ?, ?, ?, ?)", comentarios)
+
+    def _escribir_siguiente_id(self):
+        """Guarda el próximo ID (los IDs de tareas borradas no se reutilizan)"""
+        self._conexion.execute(
+            "INSERT OR REPLACE INTO metadatos VALUES ('siguiente_id', ?)", (self.siguiente_id,))
+
+    def _al_cambiar_tarea(self, tarea: Tarea, campo: str, valor_anterior: Any):
+        """Observador de tareas materializadas: escribe el cambio en la base de datos"""
+        if campo in CAMPOS_TEXTO:
+            self._conexion.execute(ACTUALIZAR_TAREA, (*self._valores(tarea), tarea.id))
+        else:
+            self._conexion.execute(ACTUALIZAR_SIN_TEXTO, (*self._valores(tarea)[3:], tarea.id))
+
+        if campo == "etiquetas":
+            self._escribir_etiquetas(tarea)
+        elif campo == "comentarios":
+            self._escribir_comentarios(tarea)
+        self._registrar_guardado(tarea)
+
+    # ========== OPERACIONES CRUD ==========
+
+    def crear_tarea(self, titulo: str, descripcion: str, usuario_asignado: str,
+                   prioridad: PrioridadTarea = PrioridadTarea.MEDIA) -> Tarea:
+        """Crea una nueva tarea"""
+        tarea = Tarea(
+            id=self.siguiente_id,
+            titulo=titulo,
+            descripcion=descripcion,
+            usuario_asignado=usuario_asignado,
+            prioridad=prioridad
+        )
+
+        self._insertar(tarea)
+        tarea._observador = self._al_cambiar_tarea
+        self._materializadas[tarea.id] = tarea
+        self.siguiente_id += 1
+        self._escribir_siguiente_id()
+        self._registrar_guardado(tarea)
+
+        return tarea
+
+    def _insertar_lote(self, tareas: List[Tarea]):
+        """Inserta un lote de tareas importadas (en modo WAL, una transacción por lote)"""
+        if self._confirmar_cada_cambio:
+            self._conexion.execute("BEGIN")
+            self._insertar_filas(tareas)
+            self._conexion.execute("COMMIT")
+        else:
+            self._insertar_filas(tareas)
+
+    def _indexar_importadas(self, ids: range):
+        """SQLite mantiene sus índices al insertar; solo falta guardar el próximo ID"""
+        self._escribir_siguiente_id()
+
+    def obtener_tarea_por_id(self, tarea_id: int) -> Optional[Tarea]:
+        """Obtiene una tarea por su ID"""
+        tarea = self._materializadas.get(tarea_id)
+        if tarea is not None:
+            return tarea
+
+        fila = self._conexion.execute(SELECCIONAR_TAREAS + "WHERE t.id = ?", (tarea_id,)).fetchone()
+        return None if fila is None else self._materializar(fila)
+
+    def obtener_todas_tareas(self) -> List[Tarea]:
+        """Obtiene todas las tareas"""
+        return self._consultar()
+
+    def obtener_tareas_pagina(self, desde: int, cantidad: int) -> List[Tarea]:
+        """Obtiene `cantidad` tareas a partir de la posición `desde` (LIMIT/OFFSET)"""
+        return self._consultar(limite=cantidad, desplazamiento=desde)
+
+    def obtener_tareas_despues_de(self, cursor: int, cantidad: int) -> List[Tarea]:
+        """Paginación por cursor sobre la clave primaria"""
+        return self._consultar("t.id > ?", (cursor,), limite=cantidad)
+
+    def obtener_tareas_activas(self) -> List[Tarea]:
+        """Obtiene tareas que no están canceladas"""
+        return self._consultar("t.estado != ?", (EstadoTarea.CANCELADA.value,))
+
+    def actualizar_tarea(self, tarea: Tarea) -> bool:
+        """Actualiza una tarea existente"""
+        cursor = self._conexion.execute(ACTUALIZAR_TAREA, (*self._valores(tarea), tarea.id))
+        if cursor.rowcount == 0:
+            return False
+
+        # Cubre asignaciones directas a los atributos y objetos sustitutos
+        anterior = self._materializadas.get(tarea.id)
+        if anterior is not None and anterior is not tarea:
+            anterior._observador = None
+
+        self._escribir_etiquetas(tarea)
+        self._escribir_comentarios(tarea)
+        tarea._observador = self._al_cambiar_tarea
+        self._materializadas[tarea.id] = tarea
+        self._registrar_guardado(tarea)
+        return True
+
+    def eliminar_definitivamente(self, tarea_id: int) -> bool:
+        """Elimina una tarea definitivamente del repositorio"""
+        cursor = self._conexion.execute("DELETE FROM tareas WHERE id = ?", (tarea_id,))
+        if cursor.rowcount == 0:
+            return False
+
+        tarea = self._materializadas.pop(tarea_id, None)
+        if tarea is not None:
+            tarea._observador = None
+        self._registrar_eliminacion(tarea_id)
+        return True
+
+    # ========== CONSULTAS ESPECÍFICAS ==========
+
+    def obtener_tareas_por_usuario(self, usuario: str) -> List[Tarea]:
+        """Obtiene tareas asignadas a un usuario específico"""
+        return self._consultar("t.usuario_asignado = ?", (usuario,))
+
+    def obtener_tareas_por_estado(self, estado: EstadoTarea) -> List[Tarea]:
+        """Obtiene tareas por estado"""
+        return self._consultar("t.estado = ?", (estado.value,))
+
+    def obtener_tareas_por_prioridad(self, prioridad: PrioridadTarea) -> List[Tarea]:
+        """Obtiene tareas por prioridad"""
+        return self._consultar("t.prioridad = ?", (RANGO_PRIORIDAD[prioridad],))
+
+    def obtener_tareas_por_etiqueta(self, etiqueta: str) -> List[Tarea]:
+        """Obtiene tareas que contienen una etiqueta específica"""
+        return self._consultar(
+            "t.id IN (SELECT tarea_id FROM etiquetas WHERE etiqueta = ?)",
+            (etiqueta.lower().strip(),))
+
+    @staticmethod
+    def _condicion_urgente() -> str:
+        """Criterios de Tarea.necesita_atencion (parámetros: ahora + 2 días para las de
+        prioridad alta, ahora para el resto)"""
+        return ("(t.prioridad = 0 OR (t.estado != 'completada' AND t.fecha_vencimiento < "
+                "CASE t.prioridad WHEN 1 THEN ? ELSE ? END))")
+
+    def obtener_tareas_vencidas(self) -> List[Tarea]:
+        """Obtiene tareas vencidas"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._consultar("t.fecha_vencimiento < ? AND t.estado != 'completada'", (ahora,))
+
+    def obtener_tareas_urgentes(self) -> List[Tarea]:
+        """Obtiene tareas que necesitan atención urgente"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._consultar(self._condicion_urgente(), (ahora + DOS_DIAS, ahora))
+
+    def buscar_tareas(self, criterio: str) -> List[Tarea]:
+        """Busca tareas por título o descripción"""
+        criterio = criterio.lower().strip()
+        if not criterio:
+            return []
+
+        # FTS5 con trigramas acota los candidatos; instr verifica la subcadena exacta
+        if len(criterio) >= 3:
+            return self._consultar(
+                f"t.id IN (SELECT rowid FROM tareas_fts WHERE tareas_fts MATCH ?) AND {CONTIENE}",
+                (frase_fts(criterio), criterio, criterio, criterio))
+
+        return self._consultar(CONTIENE, (criterio, criterio, criterio))
+
+    def buscar_tareas_por_relevancia(self, consulta: str,
+                                     limite: Optional[int] = None) -> List[Tarea]:
+        """Busca tareas que contengan todos los términos, las más relevantes primero"""
+        terminos = consulta.lower().split()
+        if not terminos:
+            return []
+
+        consulta_sql = "SELECT t.id, t.titulo, t.descripcion, t.usuario_asignado FROM tareas t"
+        parametros = ()
+        largos = [frase_fts(t) for t in terminos if len(t) >= 3]
+        if largos:
+            consulta_sql += " WHERE t.id IN (SELECT rowid FROM tareas_fts WHERE tareas_fts MATCH ?)"
+            parametros = (" AND ".join(largos),)
+
+        # El puntaje es el mismo que usa el índice en memoria
+        separador = IndiceTexto.SEPARADOR
+        resultados = []
+        for tarea_id, *textos in self._conexion.execute(consulta_sql, parametros):
+            puntaje = IndiceTexto.puntuar(separador.join(textos).lower(), terminos)
+            if puntaje:
+                resultados.append((-puntaje, tarea_id))
+
+        resultados.sort()
+        if limite is not None:
+            resultados = resultados[:limite]
+
+        return [self.obtener_tarea_por_id(tarea_id) for _, tarea_id in resultados]
+
+    def obtener_tareas_por_fecha_creacion(self, fecha_inicio: datetime.date,
+                                         fecha_fin: datetime.date) -> List[Tarea]:
+        """Obtiene tareas creadas en un rango de fechas"""
+        desde = a_microsegundos(datetime.datetime.combine(fecha_inicio, datetime.time()))
+        hasta = a_microsegundos(datetime.datetime.combine(fecha_fin, datetime.time())) + UN_DIA
+        return self._consultar("t.fecha_creacion >= ? AND t.fecha_creacion < ?", (desde, hasta))
+
+    def obtener_tareas_con_vencimiento_proximo(self, dias: int = 3) -> List[Tarea]:
+        """Obtiene tareas que vencen en los próximos N días"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        return self._consultar(
+            "t.fecha_vencimiento >= ? AND t.fecha_vencimiento < ? "
+            "AND t.estado IN ('pendiente', 'en_progreso')",
+            (ahora, ahora + (dias + 1) * UN_DIA))
+
+    # ========== ESTADÍSTICAS ==========
+
+    def contar_tareas_por_estado(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por estado"""
+        conteos = dict(self._conexion.execute(
+            "SELECT estado, COUNT(*) FROM tareas GROUP BY estado"))
+        return {estado.value: conteos.get(estado.value, 0) for estado in EstadoTarea}
+
+    def contar_tareas_por_prioridad(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por prioridad"""
+        conteos = dict(self._conexion.execute(
+            "SELECT prioridad, COUNT(*) FROM tareas GROUP BY prioridad"))
+        return {prioridad.value: conteos.get(RANGO_PRIORIDAD[prioridad], 0)
+                for prioridad in PrioridadTarea}
+
+    def contar_tareas_por_usuario(self) -> Dict[str, int]:
+        """Cuenta tareas agrupadas por usuario"""
+        return dict(self._conexion.execute(
+            "SELECT usuario_asignado, COUNT(*) FROM tareas GROUP BY usuario_asignado"))
+
+    def obtener_estadisticas_generales(self) -> Dict[str, Any]:
+        """Obtiene estadísticas generales del sistema"""
+        ahora = a_microsegundos(datetime.datetime.now())
+        vencidas, urgentes = self._conexion.execute(
+            "SELECT "
+            "  (SELECT COUNT(*) FROM tareas t WHERE t.fecha_vencimiento < ? "
+            "   AND t.estado != 'completada'), "
+            f" (SELECT COUNT(*) FROM tareas t WHERE {self._condicion_urgente()})",
+            (ahora, ahora + DOS_DIAS, ahora)).fetchone()
+
+        # Promedio de (fin o ahora) - inicio de las completadas, ignorando duraciones nulas
+        promedio, = self._conexion.execute(
+            "SELECT AVG(duracion) FROM ("
+            "  SELECT COALESCE(fecha_completado, ?) - fecha_inicio AS duracion FROM tareas "
+            "  WHERE estado = 'completada' AND fecha_inicio IS NOT NULL"
+            ") WHERE duracion != 0", (ahora,)).fetchone()
+
+        por_estado = self.contar_tareas_por_estado()
+        total_tareas = sum(por_estado.values())
+        tareas_completadas = por_estado[EstadoTarea.COMPLETADA.value]
+
+        return {
+            "total_tareas": total_tareas,
+            "tareas_activas": total_tareas - por_estado[EstadoTarea.CANCELADA.value],
+            "tareas_completadas": tareas_completadas,
+            "tareas_vencidas": vencidas,
+            "tareas_urgentes": urgentes,
+            "tasa_completado": (tareas_completadas / total_tareas * 100) if total_tareas > 0 else 0,
+            "tiempo_promedio_completado": (
+                None if promedio is None else datetime.timedelta(microseconds=promedio)),
+            "por_estado": por_estado,
+            "por_prioridad": self.contar_tareas_por_prioridad(),
+            "por_usuario": self.contar_tareas_por_usuario()
+        }
+
+    # ========== ORDENAMIENTO ==========
+
+    def ordenar_por_prioridad(self, tareas: List[Tarea] = None) -> List[Tarea]:
+        """Ordena tareas por prioridad (crítica primero)"""
+        if tareas is not None:
+            return super().ordenar_por_prioridad(tareas)
+        return self._tramo_ordenado("prioridad")
+
+    def ordenar_por_fecha_vencimiento(self, tareas: List[Tarea] = None) -> List[Tarea]:
+        """Ordena tareas por fecha de vencimiento (próximas primero)"""
+        if tareas is not None:
+            return super().ordenar_por_fecha_vencimiento(tareas)
+        return self._tramo_ordenado("fecha_vencimiento")
+
+    def ordenar_por_fecha_creacion(self, tareas: List[Tarea] = None,
+                                  descendente: bool = True) -> List[Tarea]:
+        """Ordena tareas por fecha de creación"""
+        if tareas is not None:
+            return super().ordenar_por_fecha_creacion(tareas, descendente)
+        return self._consultar(orden=f"t.fecha_creacion {'DESC' if descendente else 'ASC'}, t.id")
+
+    def _tramo_ordenado(self, criterio: str, desde: int = 0,
+                        cantidad: Optional[int] = None) -> List[Tarea]:
+        """Tramo del orden resuelto por SQLite con LIMIT/OFFSET (LIMIT -1: sin límite)"""
+        return self._consultar(orden=ORDEN_SQL[criterio], desplazamiento=desde,
+                               limite=-1 if cantidad is None else cantidad)
+
+    # ========== PERSISTENCIA ==========
+
+    @property
+    def cambios_pendientes(self) -> int:
+        """Tareas con cambios sin confirmar (en modo WAL cada cambio se confirma al instante)"""
+        return 0 if self._confirmar_cada_cambio else len(self._modificadas)
+
+    def guardar_datos(self) -> bool:
+        """Confirma los cambios pendientes en la base de datos (con el bloqueo tomado)"""
+        with self.bloqueo:
+            try:
+                self._conexion.commit()
+                self._modificadas.clear()
+                return True
+            except sqlite3.Error as e:
+                print(f"Error al guardar datos: {e}")
+                return False
+
+    def preparar_guardado(self) -> Callable[[], bool]:
+        """La confirmación no se puede separar de la captura: se hace con el bloqueo tomado"""
+        return self.guardar_datos
+
+    def cargar_datos(self, progreso: Optional[CallbackProgreso] = None) -> bool:
+        """
+        Descarta los cambios no confirmados y relee la base de datos
+        La primera vez (base vacía) importa el archivo JSON o crea los datos de ejemplo
+        """
+        try:
+            self._conexion.rollback()
+            self._fragmentos.clear()
+            self._modificadas.clear()
+            self.version += 1
+            for tarea in self._materializadas.values():
+                tarea._observador = None
+            self._materializadas = weakref.WeakValueDictionary()
+
+            fila = self._conexion.execute(
+                "SELECT valor FROM metadatos WHERE clave = 'siguiente_id'").fetchone()
+            if fila is not None:
+                maximo, = self._conexion.execute("SELECT MAX(id) FROM tareas").fetchone()
+                self.siguiente_id = max(fila[0], (maximo or 0) + 1)
+                return True
+
+            if admite_carga_paralela(self.archivo_datos, self.procesos):
+                segmentos, metadatos = decodificar_en_paralelo(self.archivo_datos, self.procesos,
+                                                               progreso=progreso)
+                self._reemplazar_segmentos(segmentos)
+                maximo, = self._conexion.execute("SELECT MAX(id) FROM tareas").fetchone()
+                self.siguiente_id = max(metadatos.get("siguiente_id", 1), (maximo or 0) + 1)
+                self._escribir_siguiente_id()
+            elif os.path.exists(self.archivo_datos):
+                lector = LectorTareasJSON(self.archivo_datos, progreso=progreso)
+                self._reemplazar_tareas(Tarea.from_dict(tarea_data) for tarea_data in lector)
+                maximo, = self._conexion.execute("SELECT MAX(id) FROM tareas").fetchone()
+                self.siguiente_id = max(lector.metadatos.get("siguiente_id", 1), (maximo or 0) + 1)
+                self._escribir_siguiente_id()
+            else:
+                self.siguiente_id = 1
+                self._escribir_siguiente_id()
+                self._inicializar_datos_ejemplo()
+
+            self._conexion.commit()
+            self._modificadas.clear()
+            return True
+
+        except Exception as e:
+            print(f"Error al cargar datos: {e}")
+            return False
+
+    def _reemplazar_tareas(self, tareas: Iterable[Tarea]):
+        """Sustituye todas las tareas con inserciones masivas y un solo rebuild del FTS"""
+        self._conexion.executescript(SIN_DISPARADORES)
+        self._conexion.execute("BEGIN")
+        try:
+            self._conexion.execute("DELETE FROM tareas")
+            self._insertar_filas(tareas)
+            self._conexion.execute("INSERT INTO tareas_fts(tareas_fts) VALUES ('rebuild')")
+        except BaseException:
+            # Archivo truncado a mitad de la importación: no queda nada a medias
+            self._conexion.rollback()
+            raise
+        finally:
+            self._conexion.executescript(DISPARADORES)
+
+    def limpiar_tareas_canceladas(self) -> int:
+        """Elimina definitivamente las tareas canceladas"""
+        for tarea_id, in self._conexion.execute(
+                "SELECT id FROM tareas WHERE estado = ?", (EstadoTarea.CANCELADA.value,)).fetchall():
+            tarea = self._materializadas.pop(tarea_id, None)
+            if tarea is not None:
+                tarea._observador = None
+            self._registrar_eliminacion(tarea_id)
+
+        cursor = self._conexion.execute(
+            "DELETE FROM tareas WHERE estado = ?", (EstadoTarea.CANCELADA.value,))
+        return cursor.rowcount
+
+    def cerrar(self):
+        """Cierra la conexión (los cambios no confirmados se descartan)"""
+        self._conexion.close()
+
+    def __iter__(self) -> Iterator[Tarea]:
+        """Recorre las tareas materializándolas fila por fila desde el cursor"""
+        filas = self._conexion.execute(SELECCIONAR_TAREAS + "ORDER BY t.id")
+        return (self._materializar(fila) for fila in filas)
@@ -5,7 +5,12 @@ Funciones de validación reutilizables
 
 import re
 import datetime
-from typing import Tuple, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+# Patrones compilados una vez (se usan por cada registro en las importaciones)
+PATRON_TITULO = re.compile(r'^[a-zA-Z0-9\s\-_.,!?áéíóúñÁÉÍÓÚÑ]+$')
+PATRON_USUARIO = re.compile(r'^[a-zA-Z0-9_]+$')
+PATRON_ETIQUETA = re.compile(r'^[a-z0-9\-]+$')
 
 class TareaValidator:
     """Validadores específicos para tareas"""
@@ -25,7 +30,7 @@ class TareaValidator:
             return False, "El título no puede exceder 100 caracteres"
         
         # Verificar caracteres válidos
-        if not re.match(r'^[a-zA-Z0-9\s\-_.,!?áéíóúñÁÉÍÓÚÑ]+$', titulo):
+        if not PATRON_TITULO.match(titulo):
             return False, "El título contiene caracteres no válidos"
         
         return True, "Título válido"
@@ -58,7 +63,7 @@ class TareaValidator:
             return False, "El usuario no puede exceder 50 caracteres"
         
         # Solo letras, números y guiones bajos
-        if not re.match(r'^[a-zA-Z0-9_]+$', usuario):
+        if not PATRON_USUARIO.match(usuario):
             return False, "El usuario solo puede contener letras, números y guiones bajos"
         
         return True, "Usuario válido"
@@ -78,7 +83,7 @@ class TareaValidator:
             return False, "La etiqueta no puede exceder 20 caracteres"
         
         # Solo letras, números y guiones
-        if not re.match(r'^[a-z0-9\-]+$', etiqueta):
+        if not PATRON_ETIQUETA.match(etiqueta):
             return False, "La etiqueta solo puede contener letras, números y guiones"
         
         return True, "Etiqueta válida"
@@ -99,6 +104,36 @@ class TareaValidator:
         
         return True, "Comentario válido"
     
+    @staticmethod
+    def validar_comentario_registro(comentario: Any) -> Tuple[bool, str]:
+        """
+        Valida la estructura de un comentario importado (formato de Tarea.to_dict):
+        id entero positivo, texto y usuario de texto y fecha ISO 8601 (con zona
+        horaria, la importación la convierte a hora local)
+        """
+        if not isinstance(comentario, dict):
+            return False, f"Comentario inválido: {comentario!r}"
+        
+        comentario_id = comentario.get("id")
+        # Positivo y dentro de 64 bits (la instantánea binaria lo guarda como int64)
+        if (not isinstance(comentario_id, int) or isinstance(comentario_id, bool)
+                or not 0 < comentario_id < 2 ** 63):
+            return False, "El comentario debe tener un id entero positivo"
+        
+        for campo in ("texto", "usuario"):
+            if not isinstance(comentario.get(campo), str):
+                return False, f"El campo {campo} del comentario debe ser texto"
+        
+        fecha = comentario.get("fecha")
+        if not isinstance(fecha, str):
+            return False, "El comentario debe tener una fecha"
+        try:
+            datetime.datetime.fromisoformat(fecha)
+        except ValueError:
+            return False, f"Fecha de comentario no válida: {fecha}"
+        
+        return True, "Comentario válido"
+    
     @staticmethod
     def validar_tiempo_horas(horas: float) -> Tuple[bool, str]:
         """Valida tiempo en horas"""
@@ -109,6 +144,85 @@ class TareaValidator:
             return False, "El tiempo no puede exceder 1000 horas"
         
         return True, "Tiempo válido"
+    
+    @staticmethod
+    def validar_registro(registro: Dict[str, Any],
+                         memo: Optional[Dict[Tuple[str, str], str]] = None) -> Tuple[bool, str]:
+        """
+        Valida un registro de importación (formato de Tarea.to_dict)
+        `memo` guarda el resultado de usuarios y etiquetas ya vistos: se repiten mucho
+        """
+        if not isinstance(registro, dict):
+            return False, f"Registro inválido: {registro}"
+        
+        for campo in ("titulo", "descripcion", "usuario_asignado"):
+            valor = registro.get(campo)
+            if valor is not None and not isinstance(valor, str):
+                return False, f"El campo {campo} debe ser texto"
+        
+        valido, mensaje = TareaValidator.validar_titulo(registro.get("titulo"))
+        if not valido:
+            return False, mensaje
+        
+        valido, mensaje = TareaValidator.validar_descripcion(registro.get("descripcion"))
+        if not valido:
+            return False, mensaje
+        
+        memo = {} if memo is None else memo
+        valores = [("usuario", registro.get("usuario_asignado") or "")]
+        etiquetas = registro.get("etiquetas") or ()
+        if not isinstance(etiquetas, (list, tuple)):
+            return False, "Las etiquetas deben ser una lista"
+        valores.extend(("etiqueta", etiqueta) for etiqueta in etiquetas)
+        for clave in valores:
+            mensaje = memo.get(clave)
+            if mensaje is None:
+                tipo, valor = clave
+                if not isinstance(valor, str):
+                    mensaje = f"Valor no válido para {tipo}: {valor!r}"
+                else:
+                    validar = (TareaValidator.validar_usuario if tipo == "usuario"
+                               else TareaValidator.validar_etiqueta)
+                    valido, mensaje = validar(valor)
+                    mensaje = "" if valido else mensaje
+                memo[clave] = mensaje
+            if mensaje:
+                return False, mensaje
+        
+        comentarios = registro.get("comentarios") or ()
+        if not isinstance(comentarios, (list, tuple)):
+            return False, "Los comentarios deben ser una lista"
+        for comentario in comentarios:
+            valido, mensaje = TareaValidator.validar_comentario_registro(comentario)
+            if not valido:
+                return False, mensaje
+        
+        for campo in ("tiempo_estimado_horas", "tiempo_real_horas"):
+            horas = registro.get(campo)
+            if horas is None:
+                continue
+            if not isinstance(horas, (int, float)) or isinstance(horas, bool):
+                return False, f"El campo {campo} debe ser numérico"
+            valido, mensaje = TareaValidator.validar_tiempo_horas(horas)
+            if not valido:
+                return False, mensaje
+        
+        return True, "Registro válido"
+    
+    @staticmethod
+    def validar_lote(registros: Sequence[Any]) -> Dict[int, str]:
+        """
+        Valida un lote de registros de importación
+        Devuelve posición → mensaje de los inválidos (vacío si todos son válidos);
+        cada usuario y etiqueta distinto del lote se valida una sola vez
+        """
+        memo: Dict[Tuple[str, str], str] = {}
+        errores = {}
+        for posicion, registro in enumerate(registros):
+            valido, mensaje = TareaValidator.validar_registro(registro, memo)
+            if not valido:
+                errores[posicion] = mensaje
+        return errores
 
 class DateValidator:
     """Validadores para fechas"""
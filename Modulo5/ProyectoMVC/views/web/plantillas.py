@@ -0,0 +1,72 @@
+"""
+🌐 VISTA WEB: Plantillas HTML precompiladas
+Cada plantilla se divide una sola vez (al importar la vista) en tramos
+estáticos, ya codificados en UTF-8, y campos; con ellos se genera una
+función que solo une bytes: renderizar no vuelve a recorrer la plantilla
+"""
+
+import keyword
+import re
+from html import escape
+from typing import Any, Callable, Tuple
+
+# {{campo}} se escapa como HTML; {{!campo}} se inserta tal cual (HTML ya generado)
+_MARCADOR = re.compile(r"\{\{\s*(!?)(\w+)\s*\}\}")
+
+
+def escapar(valor: Any) -> bytes:
+    """Valor como texto HTML seguro (escapa & < > \" ') en UTF-8"""
+    if isinstance(valor, int):
+        return b"%d" % valor
+    return escape(str(valor)).encode("utf-8")
+
+
+def crudo(valor: Any) -> bytes:
+    """Valor insertado sin escapar: bytes tal cual, el resto como texto UTF-8"""
+    if isinstance(valor, bytes):
+        return valor
+    return str(valor).encode("utf-8")
+
+
+class Plantilla:
+    """
+    Plantilla compilada
+    - Los tramos estáticos (CSS, JS, maquetación) se codifican una vez y
+      quedan como constantes de la función generada
+    - `renderizar(**valores)` rellena los campos y devuelve bytes UTF-8
+    """
+
+    __slots__ = ("campos", "renderizar")
+
+    def __init__(self, texto: str):
+        partes = _MARCADOR.split(texto)
+        # split alterna: estático, "!" o "", nombre, estático, ...
+        expresiones = []
+        campos = []
+        for indice in range(0, len(partes), 3):
+            if partes[indice]:
+                expresiones.append(repr(partes[indice].encode("utf-8")))
+            if indice + 2 < len(partes):
+                nombre = partes[indice + 2]
+                if keyword.iskeyword(nombre) or nombre.startswith("_"):
+                    raise ValueError(f"Nombre de campo inválido en la plantilla: {nombre}")
+                if nombre not in campos:
+                    campos.append(nombre)
+                if partes[indice + 1] == "!":
+                    # Los bytes (fragmentos ya renderizados) pasan sin llamar a nada
+                    expresiones.append(f"({nombre} if {nombre}.__class__ is _bytes else _crudo({nombre}))")
+                else:
+                    expresiones.append(f"_escapar({nombre})")
+
+        self.campos: Tuple[str, ...] = tuple(campos)
+        self.renderizar: Callable[..., bytes] = self._compilar(campos, expresiones)
+
+    @staticmethod
+    def _compilar(campos: list, expresiones: list) -> Callable[..., bytes]:
+        """Genera `renderizar(*, campo1, campo2, ...)` que une tramos y valores"""
+        parametros = f"*, {', '.join(campos)}" if campos else ""
+        codigo = (f"def renderizar({parametros}):\n"
+                  f"    return b''.join(({', '.join(expresiones)},))\n")
+        espacio = {"_escapar": escapar, "_crudo": crudo, "_bytes": bytes}
+        exec(compile(codigo, "<plantilla>", "exec"), espacio)
+        return espacio["renderizar"]
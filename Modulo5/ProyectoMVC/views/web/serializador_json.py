@@ -0,0 +1,94 @@
+"""
+🌐 VISTA WEB: Serialización JSON de tareas para la API
+Une el JSON ya codificado de los datos propios de cada tarea (que el
+repositorio guarda en caché hasta que la tarea cambia) con los campos
+calculados, evaluados con una sola lectura del reloj por respuesta
+"""
+
+import datetime
+import json
+from typing import BinaryIO, Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+from models.tarea import Tarea
+
+# Tarea → JSON compacto (UTF-8) de sus datos propios, sin campos calculados
+FragmentoJSON = Callable[[Tarea], bytes]
+
+_codificar_compacto = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def fragmento_sin_cache(tarea: Tarea) -> bytes:
+    """Fragmento de una tarea codificado en el momento (sin repositorio que lo guarde)"""
+    return _codificar_compacto(tarea.to_dict(incluir_calculados=False)).encode("utf-8")
+
+
+class SerializadorTareasJSON:
+    """
+    JSON de tareas con los mismos campos y orden que Tarea.to_dict()
+    - Datos propios: el fragmento cacheado, sin volver a pasar por to_dict()
+    - Campos calculados: `ahora` se lee una vez y vale para toda la respuesta
+    - Salida compacta, entera (`serializar`) o por bloques (`iterar`, `escribir`)
+    """
+
+    def __init__(self, fragmento: Optional[FragmentoJSON] = None,
+                 tamano_bloque: int = 16 * 1024):
+        self._fragmento = fragmento or fragmento_sin_cache
+        self.tamano_bloque = tamano_bloque
+        # Cola de campos calculados por combinación (vencida, días, atención): hay pocas
+        self._colas: Dict[Tuple[bool, Optional[int], bool], bytes] = {}
+
+    def _cola(self, tarea: Tarea, ahora: datetime.datetime) -> bytes:
+        """Campos calculados y cierre del objeto JSON de una tarea"""
+        clave = (tarea.esta_vencida(ahora), tarea.dias_para_vencimiento(ahora),
+                 tarea.necesita_atencion(ahora))
+        cola = self._colas.get(clave)
+        if cola is None:
+            vencida, dias, atencion = clave
+            cola = self._colas[clave] = (
+                ',"esta_vencida":%s,"dias_para_vencimiento":%s,"necesita_atencion":%s}'
+                % (json.dumps(vencida), json.dumps(dias), json.dumps(atencion))
+            ).encode("utf-8")
+        return cola
+
+    def serializar_tarea(self, tarea: Tarea, ahora: Optional[datetime.datetime] = None) -> bytes:
+        """Objeto JSON de una tarea (fragmento sin su '}' final + campos calculados)"""
+        return self._fragmento(tarea)[:-1] + self._cola(tarea, ahora or datetime.datetime.now())
+
+    def iterar(self, tareas: Iterable[Tarea],
+               ahora: Optional[datetime.datetime] = None) -> Iterator[bytes]:
+        """Arreglo JSON de las tareas en bloques de unos `tamano_bloque` bytes"""
+        ahora = ahora or datetime.datetime.now()
+        fragmento, cola = self._fragmento, self._cola
+        bloque = [b"["]
+        tamano = 1
+        separador = b""
+        for tarea in tareas:
+            datos = fragmento(tarea)
+            final = cola(tarea, ahora)
+            bloque.append(separador)
+            bloque.append(datos[:-1])
+            bloque.append(final)
+            separador = b","
+            tamano += len(datos) + len(final)
+            if tamano >= self.tamano_bloque:
+                yield b"".join(bloque)
+                bloque, tamano = [], 0
+        bloque.append(b"]")
+        yield b"".join(bloque)
+
+    def serializar(self, tareas: Iterable[Tarea],
+                   ahora: Optional[datetime.datetime] = None) -> bytes:
+        """Arreglo JSON completo de las tareas"""
+        return b"".join(self.iterar(tareas, ahora))
+
+    def escribir(self, tareas: Iterable[Tarea], destino: BinaryIO,
+                 ahora: Optional[datetime.datetime] = None) -> int:
+        """
+        Escribe el arreglo JSON en un archivo binario (o socket.makefile("wb"))
+        bloque a bloque, sin armarlo entero en memoria; devuelve los bytes escritos
+        """
+        escritos = 0
+        for bloque in self.iterar(tareas, ahora):
+            destino.write(bloque)
+            escritos += len(bloque)
+        return escritos
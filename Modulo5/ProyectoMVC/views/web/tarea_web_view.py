@@ -3,54 +3,17 @@
 Demuestra la ventaja de MVC: cambiar la vista sin afectar modelo/controlador
 """
 
-import datetime
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Sequence
 from models.tarea import Tarea, EstadoTarea, PrioridadTarea
+from views.web.plantillas import Plantilla, crudo
+from views.web.serializador_json import SerializadorTareasJSON, FragmentoJSON
 
-class TareaWebView:
-    """
-    Vista Web de Tareas - Genera HTML dinámico
-    Misma funcionalidad que TareaView pero con interfaz web
-    """
-    
-    def __init__(self):
-        # Configuración de iconos y colores para web
-        self.iconos_estado = {
-            EstadoTarea.PENDIENTE: "⏳",
-            EstadoTarea.EN_PROGRESO: "🔄",
-            EstadoTarea.COMPLETADA: "✅",
-            EstadoTarea.CANCELADA: "❌"
-        }
-        
-        self.iconos_prioridad = {
-            PrioridadTarea.BAJA: "🟢",
-            PrioridadTarea.MEDIA: "🟡",
-            PrioridadTarea.ALTA: "🔴",
-            PrioridadTarea.CRITICA: "🚨"
-        }
-        
-        self.colores_estado = {
-            EstadoTarea.PENDIENTE: "#6c757d",
-            EstadoTarea.EN_PROGRESO: "#007bff",
-            EstadoTarea.COMPLETADA: "#28a745",
-            EstadoTarea.CANCELADA: "#dc3545"
-        }
-        
-        self.colores_prioridad = {
-            PrioridadTarea.BAJA: "#28a745",
-            PrioridadTarea.MEDIA: "#ffc107",
-            PrioridadTarea.ALTA: "#fd7e14",
-            PrioridadTarea.CRITICA: "#dc3545"
-        }
-    
-    def generar_dashboard_html(self, estadisticas: Dict[str, Any], 
-                              tareas_urgentes: List[Tarea],
-                              tareas_vencidas: List[Tarea], 
-                              tareas_proximas: List[Tarea]) -> str:
-        """Genera dashboard completo en HTML"""
-        
-        html = f"""
+# ========== PLANTILLAS (se compilan al importar) ==========
+# {{campo}} se escapa como HTML; {{!campo}} recibe HTML ya generado
+
+# Dashboard: cada sección repetida (estado, panel, usuario) es su propia plantilla
+_DASHBOARD_INICIO = Plantilla("""
         <!DOCTYPE html>
         <html lang="es">
         <head>
@@ -60,88 +23,88 @@ class TareaWebView:
             <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
             <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
             <style>
-                body {{
+                body {
                     background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                     min-height: 100vh;
                     font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-                }}
-                .dashboard-container {{
+                }
+                .dashboard-container {
                     padding: 20px;
-                }}
-                .card {{
+                }
+                .card {
                     border: none;
                     border-radius: 15px;
                     box-shadow: 0 8px 25px rgba(0,0,0,0.1);
                     transition: transform 0.3s ease, box-shadow 0.3s ease;
-                }}
-                .card:hover {{
+                }
+                .card:hover {
                     transform: translateY(-5px);
                     box-shadow: 0 15px 35px rgba(0,0,0,0.2);
-                }}
-                .stat-card {{
+                }
+                .stat-card {
                     text-align: center;
                     padding: 20px;
                     margin-bottom: 20px;
-                }}
-                .stat-number {{
+                }
+                .stat-number {
                     font-size: 2.5rem;
                     font-weight: bold;
                     margin-bottom: 10px;
-                }}
-                .stat-label {{
+                }
+                .stat-label {
                     font-size: 0.9rem;
                     text-transform: uppercase;
                     letter-spacing: 1px;
                     opacity: 0.8;
-                }}
-                .priority-badge {{
+                }
+                .priority-badge {
                     padding: 5px 10px;
                     border-radius: 20px;
                     font-size: 0.8rem;
                     font-weight: bold;
-                }}
-                .status-badge {{
+                }
+                .status-badge {
                     padding: 5px 10px;
                     border-radius: 20px;
                     font-size: 0.8rem;
                     font-weight: bold;
-                }}
-                .task-card {{
+                }
+                .task-card {
                     margin-bottom: 15px;
                     border-left: 4px solid;
-                }}
-                .task-title {{
+                }
+                .task-title {
                     font-weight: 600;
                     margin-bottom: 8px;
-                }}
-                .task-meta {{
+                }
+                .task-meta {
                     font-size: 0.85rem;
                     color: #6c757d;
-                }}
-                .chart-container {{
+                }
+                .chart-container {
                     height: 300px;
                     display: flex;
                     align-items: center;
                     justify-content: center;
-                }}
-                .progress-ring {{
+                }
+                .progress-ring {
                     width: 120px;
                     height: 120px;
                     position: relative;
-                }}
-                .navbar {{
+                }
+                .navbar {
                     background: rgba(255,255,255,0.95) !important;
                     backdrop-filter: blur(10px);
-                }}
-                .btn-primary {{
+                }
+                .btn-primary {
                     background: linear-gradient(45deg, #667eea, #764ba2);
                     border: none;
                     border-radius: 25px;
                     padding: 10px 25px;
-                }}
-                .btn-primary:hover {{
+                }
+                .btn-primary:hover {
                     background: linear-gradient(45deg, #764ba2, #667eea);
-                }}
+                }
             </style>
         </head>
         <body>
@@ -178,7 +141,7 @@ class TareaWebView:
                     <div class="row mb-4">
                         <div class="col-md-3">
                             <div class="card stat-card bg-primary text-white">
-                                <div class="stat-number">{estadisticas['total_tareas']}</div>
+                                <div class="stat-number">{{total_tareas}}</div>
                                 <div class="stat-label">
                                     <i class="fas fa-list me-1"></i>
                                     Total Tareas
@@ -187,7 +150,7 @@ class TareaWebView:
                         </div>
                         <div class="col-md-3">
                             <div class="card stat-card bg-info text-white">
-                                <div class="stat-number">{estadisticas['tareas_activas']}</div>
+                                <div class="stat-number">{{tareas_activas}}</div>
                                 <div class="stat-label">
                                     <i class="fas fa-play me-1"></i>
                                     Activas
@@ -196,7 +159,7 @@ class TareaWebView:
                         </div>
                         <div class="col-md-3">
                             <div class="card stat-card bg-success text-white">
-                                <div class="stat-number">{estadisticas['tareas_completadas']}</div>
+                                <div class="stat-number">{{tareas_completadas}}</div>
                                 <div class="stat-label">
                                     <i class="fas fa-check me-1"></i>
                                     Completadas
@@ -205,7 +168,7 @@ class TareaWebView:
                         </div>
                         <div class="col-md-3">
                             <div class="card stat-card bg-warning text-white">
-                                <div class="stat-number">{estadisticas['tareas_urgentes']}</div>
+                                <div class="stat-number">{{tareas_urgentes}}</div>
                                 <div class="stat-label">
                                     <i class="fas fa-exclamation me-1"></i>
                                     Urgentes
@@ -225,8 +188,8 @@ class TareaWebView:
                                     </h5>
                                     <div class="progress" style="height: 25px;">
                                         <div class="progress-bar bg-success progress-bar-striped progress-bar-animated" 
-                                             style="width: {estadisticas['tasa_completado']:.1f}%">
-                                            {estadisticas['tasa_completado']:.1f}%
+                                             style="width: {{tasa_completado}}%">
+                                            {{tasa_completado}}%
                                         </div>
                                     </div>
                                 </div>
@@ -240,27 +203,21 @@ class TareaWebView:
                                         Distribución por Estado
                                     </h5>
                                     <div class="row">
-        """
-        
-        # Agregar distribución por estado
-        for estado, cantidad in estadisticas['por_estado'].items():
-            porcentaje = (cantidad / estadisticas['total_tareas'] * 100) if estadisticas['total_tareas'] > 0 else 0
-            color = self.colores_estado.get(EstadoTarea(estado), "#6c757d")
-            icono = self.iconos_estado.get(EstadoTarea(estado), "📋")
-            
-            html += f"""
+        """)
+
+_DASHBOARD_ESTADO = Plantilla("""
                                         <div class="col-6 mb-2">
-                                            <small class="text-muted">{icono} {estado.title()}</small>
+                                            <small class="text-muted">{{icono}} {{estado}}</small>
                                             <div class="progress" style="height: 8px;">
                                                 <div class="progress-bar" 
-                                                     style="width: {porcentaje:.1f}%; background-color: {color}">
+                                                     style="width: {{porcentaje}}%; background-color: {{color}}">
                                                 </div>
                                             </div>
-                                            <small>{cantidad} ({porcentaje:.1f}%)</small>
+                                            <small>{{cantidad}} ({{porcentaje}}%)</small>
                                         </div>
-            """
-        
-        html += """
+            """)
+
+_DASHBOARD_ESTADOS_FIN = Plantilla("""
                                     </div>
                                 </div>
                             </div>
@@ -268,10 +225,9 @@ class TareaWebView:
                     </div>
                     
                     <!-- Tareas que requieren atención -->
-        """
-        
-        if tareas_urgentes or tareas_vencidas or tareas_proximas:
-            html += """
+        """)
+
+_ATENCION_INICIO = Plantilla("""
                     <div class="row mb-4">
                         <div class="col-12">
                             <h3 class="text-white mb-3">
@@ -281,82 +237,29 @@ class TareaWebView:
                         </div>
                     </div>
                     <div class="row mb-4">
-            """
-            
-            # Tareas urgentes
-            if tareas_urgentes:
-                html += f"""
-                        <div class="col-md-4">
-                            <div class="card">
-                                <div class="card-header bg-danger text-white">
-                                    <h6 class="mb-0">
-                                        <i class="fas fa-fire me-2"></i>
-                                        Urgentes ({len(tareas_urgentes)})
-                                    </h6>
-                                </div>
-                                <div class="card-body p-2">
-                """
-                
-                for tarea in tareas_urgentes[:5]:  # Mostrar máximo 5
-                    html += self._generar_tarea_compacta_html(tarea)
-                
-                html += """
-                                </div>
-                            </div>
-                        </div>
-                """
-            
-            # Tareas vencidas
-            if tareas_vencidas:
-                html += f"""
-                        <div class="col-md-4">
-                            <div class="card">
-                                <div class="card-header bg-warning text-dark">
-                                    <h6 class="mb-0">
-                                        <i class="fas fa-clock me-2"></i>
-                                        Vencidas ({len(tareas_vencidas)})
-                                    </h6>
-                                </div>
-                                <div class="card-body p-2">
-                """
-                
-                for tarea in tareas_vencidas[:5]:  # Mostrar máximo 5
-                    html += self._generar_tarea_compacta_html(tarea)
-                
-                html += """
-                                </div>
-                            </div>
-                        </div>
-                """
-            
-            # Tareas próximas
-            if tareas_proximas:
-                html += f"""
+            """)
+
+_PANEL_ATENCION = Plantilla("""
                         <div class="col-md-4">
                             <div class="card">
-                                <div class="card-header bg-info text-white">
+                                <div class="card-header {{clase}}">
                                     <h6 class="mb-0">
-                                        <i class="fas fa-calendar me-2"></i>
-                                        Vencen Pronto ({len(tareas_proximas)})
+                                        <i class="fas {{icono}} me-2"></i>
+                                        {{titulo}} ({{cantidad}})
                                     </h6>
                                 </div>
                                 <div class="card-body p-2">
-                """
-                
-                for tarea in tareas_proximas[:5]:  # Mostrar máximo 5
-                    html += self._generar_tarea_compacta_html(tarea)
-                
-                html += """
+                {{!tareas}}
                                 </div>
                             </div>
                         </div>
-                """
-            
-            html += """
+                """)
+
+_ATENCION_FIN = Plantilla("""
                     </div>
-            """
-        else:
-            html += """
+            """)
+
+_TODO_BAJO_CONTROL = Plantilla("""
                     <div class="row mb-4">
                         <div class="col-12">
                             <div class="card bg-success text-white">
@@ -368,11 +271,9 @@ class TareaWebView:
                             </div>
                         </div>
                     </div>
-            """
-        
-        # Distribución por usuario
-        if estadisticas['por_usuario']:
-            html += """
+            """)
+
+_USUARIOS_INICIO = Plantilla("""
                     <div class="row mb-4">
                         <div class="col-12">
                             <div class="card">
@@ -384,38 +285,33 @@ class TareaWebView:
                                 </div>
                                 <div class="card-body">
                                     <div class="row">
-            """
-            
-            for usuario, cantidad in sorted(estadisticas['por_usuario'].items(), 
-                                          key=lambda x: x[1], reverse=True):
-                porcentaje = (cantidad / estadisticas['total_tareas'] * 100) if estadisticas['total_tareas'] > 0 else 0
-                
-                html += f"""
+            """)
+
+_DASHBOARD_USUARIO = Plantilla("""
                                         <div class="col-md-6 mb-3">
                                             <div class="d-flex justify-content-between align-items-center">
                                                 <span>
                                                     <i class="fas fa-user me-2"></i>
-                                                    {usuario}
+                                                    {{usuario}}
                                                 </span>
-                                                <span class="badge bg-primary">{cantidad}</span>
+                                                <span class="badge bg-primary">{{cantidad}}</span>
                                             </div>
                                             <div class="progress mt-1" style="height: 8px;">
-                                                <div class="progress-bar" style="width: {porcentaje:.1f}%"></div>
+                                                <div class="progress-bar" style="width: {{porcentaje}}%"></div>
                                             </div>
-                                            <small class="text-muted">{porcentaje:.1f}% del total</small>
+                                            <small class="text-muted">{{porcentaje}}% del total</small>
                                         </div>
-                """
-            
-            html += """
+                """)
+
+_USUARIOS_FIN = Plantilla("""
                                     </div>
                                 </div>
                             </div>
                         </div>
                     </div>
-            """
-        
-        # Botones de acción
-        html += """
+            """)
+
+_DASHBOARD_FIN = Plantilla("""
                     <div class="row mb-4">
                         <div class="col-12 text-center">
                             <a href="#" class="btn btn-primary btn-lg me-3" onclick="mostrarTodasTareas()">
@@ -466,51 +362,47 @@ class TareaWebView:
             </script>
         </body>
         </html>
-        """
-        
-        return html
-    
-    def generar_lista_tareas_html(self, tareas: List[Tarea], titulo: str = "Lista de Tareas") -> str:
-        """Genera lista de tareas en HTML con diseño moderno"""
-        
-        html = f"""
+        """)
+
+# Lista de tareas
+_LISTA_INICIO = Plantilla("""
         <!DOCTYPE html>
         <html lang="es">
         <head>
             <meta charset="UTF-8">
             <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>📋 {titulo} - Sistema MVC</title>
+            <title>📋 {{titulo}} - Sistema MVC</title>
             <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
             <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
             <style>
-                body {{
+                body {
                     background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
                     min-height: 100vh;
-                }}
-                .task-card {{
+                }
+                .task-card {
                     border: none;
                     border-radius: 15px;
                     margin-bottom: 15px;
                     transition: all 0.3s ease;
                     border-left: 5px solid;
-                }}
-                .task-card:hover {{
+                }
+                .task-card:hover {
                     transform: translateY(-3px);
                     box-shadow: 0 10px 25px rgba(0,0,0,0.15);
-                }}
-                .priority-badge, .status-badge {{
+                }
+                .priority-badge, .status-badge {
                     border-radius: 20px;
                     padding: 5px 12px;
                     font-size: 0.8rem;
                     font-weight: 600;
-                }}
-                .task-actions {{
+                }
+                .task-actions {
                     opacity: 0;
                     transition: opacity 0.3s ease;
-                }}
-                .task-card:hover .task-actions {{
+                }
+                .task-card:hover .task-actions {
                     opacity: 1;
-                }}
+                }
             </style>
         </head>
         <body>
@@ -520,18 +412,17 @@ class TareaWebView:
                         <div class="d-flex justify-content-between align-items-center mb-4">
                             <h1 class="text-white">
                                 <i class="fas fa-tasks me-2"></i>
-                                {titulo}
+                                {{titulo}}
                             </h1>
                             <span class="badge bg-light text-dark fs-6">
-                                {len(tareas)} tareas
+                                {{total}} tareas
                             </span>
                         </div>
                     </div>
                 </div>
-        """
-        
-        if not tareas:
-            html += """
+        """)
+
+_LISTA_VACIA = Plantilla("""
                 <div class="row">
                     <div class="col-12">
                         <div class="card text-center">
@@ -547,62 +438,31 @@ class TareaWebView:
                         </div>
                     </div>
                 </div>
-            """
-        else:
-            html += '<div class="row">'
-            
-            for tarea in tareas:
-                html += f'<div class="col-md-6 col-lg-4">'
-                html += self._generar_tarea_card_html(tarea)
-                html += '</div>'
-            
-            html += '</div>'
-        
-        html += """
+            """)
+
+_LISTA_FIN = Plantilla("""
             </div>
             <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
         </body>
         </html>
-        """
-        
-        return html
-    
-    def _generar_tarea_card_html(self, tarea: Tarea) -> str:
-        """Genera una tarjeta HTML para una tarea"""
-        
-        # Colores y estilos
-        color_estado = self.colores_estado[tarea.estado]
-        color_prioridad = self.colores_prioridad[tarea.prioridad]
-        icono_estado = self.iconos_estado[tarea.estado]
-        icono_prioridad = self.iconos_prioridad[tarea.prioridad]
-        
-        # Fecha de vencimiento
-        fecha_venc_html = ""
-        if tarea.fecha_vencimiento:
-            dias_restantes = tarea.dias_para_vencimiento()
-            if dias_restantes is not None:
-                if dias_restantes < 0:
-                    fecha_venc_html = f'<span class="text-danger"><i class="fas fa-exclamation-triangle me-1"></i>Vencida hace {abs(dias_restantes)} días</span>'
-                elif dias_restantes == 0:
-                    fecha_venc_html = f'<span class="text-warning"><i class="fas fa-clock me-1"></i>Vence hoy</span>'
-                elif dias_restantes <= 3:
-                    fecha_venc_html = f'<span class="text-warning"><i class="fas fa-calendar me-1"></i>Vence en {dias_restantes} días</span>'
-                else:
-                    fecha_venc_html = f'<span class="text-success"><i class="fas fa-calendar me-1"></i>Vence en {dias_restantes} días</span>'
-        
-        # Etiquetas
-        etiquetas_html = ""
-        if tarea.etiquetas:
-            etiquetas_html = "".join([
-                f'<span class="badge bg-secondary me-1">#{etiqueta}</span>'
-                for etiqueta in tarea.etiquetas[:3]  # Máximo 3 etiquetas
-            ])
-        
-        return f"""
-        <div class="card task-card" style="border-left-color: {color_estado};">
+        """)
+
+_PAGINACION = Plantilla("""
+                <nav aria-label="Paginación" class="mt-4">
+                    <ul class="pagination justify-content-center">
+                        {{!anterior}}
+                        <li class="page-item active"><span class="page-link">Página {{pagina}} de {{total_paginas}}</span></li>
+                        {{!siguiente}}
+                    </ul>
+                </nav>
+        """)
+
+# Tarjetas de tarea
+_TARJETA = Plantilla("""
+        <div class="card task-card" style="border-left-color: {{!color_estado}};">
             <div class="card-body">
                 <div class="d-flex justify-content-between align-items-start mb-2">
-                    <h6 class="card-title mb-0">{tarea.titulo}</h6>
+                    <h6 class="card-title mb-0">{{titulo}}</h6>
                     <div class="task-actions">
                         <button class="btn btn-sm btn-outline-primary me-1" title="Editar">
                             <i class="fas fa-edit"></i>
@@ -614,61 +474,329 @@ class TareaWebView:
                 </div>
                 
                 <p class="card-text text-muted small mb-3">
-                    {tarea.descripcion[:100]}{'...' if len(tarea.descripcion) > 100 else ''}
+                    {{descripcion}}
                 </p>
                 
                 <div class="d-flex justify-content-between align-items-center mb-2">
-                    <span class="status-badge text-white" style="background-color: {color_estado};">
-                        {icono_estado} {tarea.estado.value.title()}
+                    <span class="status-badge text-white" style="background-color: {{!color_estado}};">
+                        {{!icono_estado}} {{!estado}}
                     </span>
-                    <span class="priority-badge text-white" style="background-color: {color_prioridad};">
-                        {icono_prioridad} {tarea.prioridad.value.title()}
+                    <span class="priority-badge text-white" style="background-color: {{!color_prioridad}};">
+                        {{!icono_prioridad}} {{!prioridad}}
                     </span>
                 </div>
                 
                 <div class="d-flex justify-content-between align-items-center mb-2">
                     <small class="text-muted">
                         <i class="fas fa-user me-1"></i>
-                        {tarea.usuario_asignado}
+                        {{usuario}}
                     </small>
                     <small class="text-muted">
-                        ID: {tarea.id}
+                        ID: {{id}}
                     </small>
                 </div>
                 
-                {f'<div class="mb-2">{fecha_venc_html}</div>' if fecha_venc_html else ''}
+                {{!vencimiento}}
                 
-                {f'<div class="mb-2">{etiquetas_html}</div>' if etiquetas_html else ''}
+                {{!etiquetas}}
                 
-                {f'<div><small class="text-muted"><i class="fas fa-comments me-1"></i>{len(tarea.comentarios)} comentarios</small></div>' if tarea.comentarios else ''}
+                {{!comentarios}}
             </div>
         </div>
+        """)
+
+_TAREA_COMPACTA = Plantilla("""
+        <div class="d-flex justify-content-between align-items-center py-2 border-bottom">
+            <div>
+                <span class="me-2">{{icono_estado}}</span>
+                <span class="me-2">{{icono_prioridad}}</span>
+                <strong>{{id}}.</strong>
+                <span class="ms-1">{{titulo}}</span>
+                {{!alerta}}
+            </div>
+            <small class="text-muted">{{usuario}}</small>
+        </div>
+        """)
+
+# Fragmentos fijos de vistas y etiquetas
+_SIN_ALERTA = b""
+_ALERTA_ATENCION = b' <i class="fas fa-exclamation-triangle text-danger"></i>'
+_ALERTA_VENCIDA = b' <i class="fas fa-clock text-warning"></i>'
+_FILA_INICIO = b'<div class="row">'
+_FILA_FIN = b'</div>'
+_COLUMNA_INICIO = b'<div class="col-md-6 col-lg-4">'
+_COLUMNA_FIN = b'</div>'
+
+_VENCIDA_HACE = Plantilla('<span class="text-danger"><i class="fas fa-exclamation-triangle me-1"></i>Vencida hace {{dias}} días</span>')
+_VENCE_HOY = Plantilla('<span class="text-warning"><i class="fas fa-clock me-1"></i>Vence hoy</span>')
+_VENCE_PRONTO = Plantilla('<span class="text-warning"><i class="fas fa-calendar me-1"></i>Vence en {{dias}} días</span>')
+_VENCE_EN = Plantilla('<span class="text-success"><i class="fas fa-calendar me-1"></i>Vence en {{dias}} días</span>')
+_BLOQUE = Plantilla('<div class="mb-2">{{!contenido}}</div>')
+_ETIQUETA = Plantilla('<span class="badge bg-secondary me-1">#{{etiqueta}}</span>')
+_COMENTARIOS = Plantilla('<div><small class="text-muted"><i class="fas fa-comments me-1"></i>{{cantidad}} comentarios</small></div>')
+_BOTON_PAGINA = Plantilla('<li class="page-item"><a class="page-link" href="{{enlace}}?pagina={{destino}}">{{!texto}}</a></li>')
+_BOTON_INACTIVO = Plantilla('<li class="page-item disabled"><span class="page-link">{{!texto}}</span></li>')
+
+
+class TareaWebView:
+    """
+    Vista Web de Tareas - Genera HTML dinámico
+    Misma funcionalidad que TareaView pero con interfaz web
+    Las páginas se arman con las plantillas precompiladas del módulo; los
+    textos de las tareas (títulos, descripciones, etiquetas) se escapan
+    """
+    
+    def __init__(self, fragmento_json: Optional[FragmentoJSON] = None):
+        # JSON de tareas para la API: `fragmento_json` da los datos propios ya
+        # codificados (p. ej. la caché del repositorio)
+        self.serializador_json = SerializadorTareasJSON(fragmento_json)
+        
+        # Configuración de iconos y colores para web
+        self.iconos_estado = {
+            EstadoTarea.PENDIENTE: "⏳",
+            EstadoTarea.EN_PROGRESO: "🔄",
+            EstadoTarea.COMPLETADA: "✅",
+            EstadoTarea.CANCELADA: "❌"
+        }
+        
+        self.iconos_prioridad = {
+            PrioridadTarea.BAJA: "🟢",
+            PrioridadTarea.MEDIA: "🟡",
+            PrioridadTarea.ALTA: "🔴",
+            PrioridadTarea.CRITICA: "🚨"
+        }
+        
+        self.colores_estado = {
+            EstadoTarea.PENDIENTE: "#6c757d",
+            EstadoTarea.EN_PROGRESO: "#007bff",
+            EstadoTarea.COMPLETADA: "#28a745",
+            EstadoTarea.CANCELADA: "#dc3545"
+        }
+        
+        self.colores_prioridad = {
+            PrioridadTarea.BAJA: "#28a745",
+            PrioridadTarea.MEDIA: "#ffc107",
+            PrioridadTarea.ALTA: "#fd7e14",
+            PrioridadTarea.CRITICA: "#dc3545"
+        }
+        
+        # Color, icono y nombre ya codificados, para no escaparlos en cada tarjeta
+        self._estilos_estado = {
+            estado: (crudo(self.colores_estado[estado]), crudo(self.iconos_estado[estado]),
+                     crudo(estado.value.title()))
+            for estado in EstadoTarea
+        }
+        self._estilos_prioridad = {
+            prioridad: (crudo(self.colores_prioridad[prioridad]), crudo(self.iconos_prioridad[prioridad]),
+                        crudo(prioridad.value.title()))
+            for prioridad in PrioridadTarea
+        }
+    
+    def generar_dashboard_html(self, estadisticas: Dict[str, Any], 
+                              tareas_urgentes: List[Tarea],
+                              tareas_vencidas: List[Tarea], 
+                              tareas_proximas: List[Tarea]) -> str:
+        """Genera dashboard completo en HTML"""
+        return self.renderizar_dashboard(
+            estadisticas, tareas_urgentes, tareas_vencidas, tareas_proximas
+        ).decode("utf-8")
+    
+    def renderizar_dashboard(self, estadisticas: Dict[str, Any],
+                             tareas_urgentes: List[Tarea],
+                             tareas_vencidas: List[Tarea],
+                             tareas_proximas: List[Tarea]) -> bytes:
+        """Dashboard completo en HTML, en bytes UTF-8"""
+        total = estadisticas['total_tareas']
+        partes = [_DASHBOARD_INICIO.renderizar(
+            total_tareas=total,
+            tareas_activas=estadisticas['tareas_activas'],
+            tareas_completadas=estadisticas['tareas_completadas'],
+            tareas_urgentes=estadisticas['tareas_urgentes'],
+            tasa_completado=f"{estadisticas['tasa_completado']:.1f}"
+        )]
+        
+        # Agregar distribución por estado
+        for estado, cantidad in estadisticas['por_estado'].items():
+            porcentaje = (cantidad / total * 100) if total > 0 else 0
+            partes.append(_DASHBOARD_ESTADO.renderizar(
+                icono=self.iconos_estado.get(EstadoTarea(estado), "📋"),
+                estado=estado.title(),
+                porcentaje=f"{porcentaje:.1f}",
+                color=self.colores_estado.get(EstadoTarea(estado), "#6c757d"),
+                cantidad=cantidad
+            ))
+        
+        partes.append(_DASHBOARD_ESTADOS_FIN.renderizar())
+        
+        # Tareas que requieren atención (máximo 5 por panel)
+        if tareas_urgentes or tareas_vencidas or tareas_proximas:
+            partes.append(_ATENCION_INICIO.renderizar())
+            paneles = (
+                (tareas_urgentes, "bg-danger text-white", "fa-fire", "Urgentes"),
+                (tareas_vencidas, "bg-warning text-dark", "fa-clock", "Vencidas"),
+                (tareas_proximas, "bg-info text-white", "fa-calendar", "Vencen Pronto")
+            )
+            for tareas, clase, icono, titulo in paneles:
+                if tareas:
+                    partes.append(_PANEL_ATENCION.renderizar(
+                        clase=clase, icono=icono, titulo=titulo, cantidad=len(tareas),
+                        tareas=b"".join(self._generar_tarea_compacta_html(tarea)
+                                        for tarea in tareas[:5])
+                    ))
+            partes.append(_ATENCION_FIN.renderizar())
+        else:
+            partes.append(_TODO_BAJO_CONTROL.renderizar())
+        
+        # Distribución por usuario
+        if estadisticas['por_usuario']:
+            partes.append(_USUARIOS_INICIO.renderizar())
+            for usuario, cantidad in sorted(estadisticas['por_usuario'].items(), 
+                                          key=lambda x: x[1], reverse=True):
+                porcentaje = (cantidad / total * 100) if total > 0 else 0
+                partes.append(_DASHBOARD_USUARIO.renderizar(
+                    usuario=usuario, cantidad=cantidad, porcentaje=f"{porcentaje:.1f}"
+                ))
+            partes.append(_USUARIOS_FIN.renderizar())
+        
+        # Botones de acción y scripts
+        partes.append(_DASHBOARD_FIN.renderizar())
+        
+        return b"".join(partes)
+    
+    def generar_lista_tareas_html(self, tareas: List[Tarea], titulo: str = "Lista de Tareas",
+                                  pagina: int = 1, total_paginas: int = 1,
+                                  total: Optional[int] = None, enlace: str = "") -> str:
         """
+        Genera lista de tareas en HTML con diseño moderno
+        Si `tareas` es una página de una lista mayor, `total` es el tamaño de la
+        lista y se añaden enlaces `{enlace}?pagina=N` entre páginas
+        """
+        return self.renderizar_lista_tareas(tareas, titulo, pagina, total_paginas,
+                                            total, enlace).decode("utf-8")
     
-    def _generar_tarea_compacta_html(self, tarea: Tarea) -> str:
-        """Genera una vista compacta de tarea para listas pequeñas"""
+    def renderizar_lista_tareas(self, tareas: Sequence[Tarea], titulo: str = "Lista de Tareas",
+                                pagina: int = 1, total_paginas: int = 1,
+                                total: Optional[int] = None, enlace: str = "") -> bytes:
+        """Lista de tareas HTML completa, en bytes UTF-8"""
+        return b"".join(self.iterar_lista_tareas_html(tareas, titulo, pagina, total_paginas,
+                                                      total, enlace))
+    
+    def iterar_lista_tareas_html(self, tareas: Sequence[Tarea], titulo: str = "Lista de Tareas",
+                                 pagina: int = 1, total_paginas: int = 1,
+                                 total: Optional[int] = None, enlace: str = "") -> Iterator[bytes]:
+        """
+        Lista de tareas HTML por fragmentos: cabecera, una tarjeta por tarea y pie
+        Permite enviar la página a medida que se genera (sin tenerla entera en memoria)
+        """
+        if total is None:
+            total = len(tareas)
         
-        icono_estado = self.iconos_estado[tarea.estado]
-        icono_prioridad = self.iconos_prioridad[tarea.prioridad]
+        yield _LISTA_INICIO.renderizar(titulo=titulo, total=total)
         
-        alerta = ""
+        if not tareas:
+            yield _LISTA_VACIA.renderizar()
+        else:
+            yield _FILA_INICIO
+            
+            for tarea in tareas:
+                yield _COLUMNA_INICIO + self._generar_tarea_card_html(tarea) + _COLUMNA_FIN
+            
+            yield _FILA_FIN
+        
+        if total_paginas > 1:
+            yield self._generar_paginacion_html(pagina, total_paginas, enlace)
+        
+        yield _LISTA_FIN.renderizar()
+    
+    def _generar_paginacion_html(self, pagina: int, total_paginas: int, enlace: str) -> bytes:
+        """Navegación anterior/siguiente entre páginas de una lista"""
+        
+        def boton(destino: int, texto: str, habilitado: bool) -> bytes:
+            if not habilitado:
+                return _BOTON_INACTIVO.renderizar(texto=texto)
+            return _BOTON_PAGINA.renderizar(enlace=enlace, destino=destino, texto=texto)
+        
+        return _PAGINACION.renderizar(
+            anterior=boton(pagina - 1, '&laquo; Anterior', pagina > 1),
+            pagina=pagina,
+            total_paginas=total_paginas,
+            siguiente=boton(pagina + 1, 'Siguiente &raquo;', pagina < total_paginas)
+        )
+    
+    def _generar_tarea_card_html(self, tarea: Tarea) -> bytes:
+        """Genera una tarjeta HTML para una tarea"""
+        
+        # Fecha de vencimiento
+        vencimiento = b""
+        if tarea.fecha_vencimiento:
+            dias_restantes = tarea.dias_para_vencimiento()
+            if dias_restantes is not None:
+                if dias_restantes < 0:
+                    fecha_venc_html = _VENCIDA_HACE.renderizar(dias=abs(dias_restantes))
+                elif dias_restantes == 0:
+                    fecha_venc_html = _VENCE_HOY.renderizar()
+                elif dias_restantes <= 3:
+                    fecha_venc_html = _VENCE_PRONTO.renderizar(dias=dias_restantes)
+                else:
+                    fecha_venc_html = _VENCE_EN.renderizar(dias=dias_restantes)
+                vencimiento = _BLOQUE.renderizar(contenido=fecha_venc_html)
+        
+        # Etiquetas
+        etiquetas = b""
+        if tarea.etiquetas:
+            etiquetas = _BLOQUE.renderizar(contenido=b"".join([
+                _ETIQUETA.renderizar(etiqueta=etiqueta)
+                for etiqueta in tarea.etiquetas[:3]  # Máximo 3 etiquetas
+            ]))
+        
+        comentarios = b""
+        if tarea.comentarios:
+            comentarios = _COMENTARIOS.renderizar(cantidad=len(tarea.comentarios))
+        
+        descripcion = tarea.descripcion
+        if len(descripcion) > 100:
+            descripcion = descripcion[:100] + '...'
+        
+        color_estado, icono_estado, estado = self._estilos_estado[tarea.estado]
+        color_prioridad, icono_prioridad, prioridad = self._estilos_prioridad[tarea.prioridad]
+        
+        return _TARJETA.renderizar(
+            color_estado=color_estado,
+            titulo=tarea.titulo,
+            descripcion=descripcion,
+            color_prioridad=color_prioridad,
+            icono_estado=icono_estado,
+            estado=estado,
+            icono_prioridad=icono_prioridad,
+            prioridad=prioridad,
+            usuario=tarea.usuario_asignado,
+            id=tarea.id,
+            vencimiento=vencimiento,
+            etiquetas=etiquetas,
+            comentarios=comentarios
+        )
+    
+    def _generar_tarea_compacta_html(self, tarea: Tarea) -> bytes:
+        """Genera una vista compacta de tarea para listas pequeñas"""
+        
+        alerta = _SIN_ALERTA
         if tarea.necesita_atencion():
-            alerta = ' <i class="fas fa-exclamation-triangle text-danger"></i>'
+            alerta = _ALERTA_ATENCION
         elif tarea.esta_vencida():
-            alerta = ' <i class="fas fa-clock text-warning"></i>'
+            alerta = _ALERTA_VENCIDA
         
-        return f"""
-        <div class="d-flex justify-content-between align-items-center py-2 border-bottom">
-            <div>
-                <span class="me-2">{icono_estado}</span>
-                <span class="me-2">{icono_prioridad}</span>
-                <strong>{tarea.id}.</strong>
-                <span class="ms-1">{tarea.titulo[:30]}{'...' if len(tarea.titulo) > 30 else ''}</span>
-                {alerta}
-            </div>
-            <small class="text-muted">{tarea.usuario_asignado}</small>
-        </div>
-        """
+        titulo = tarea.titulo
+        if len(titulo) > 30:
+            titulo = titulo[:30] + '...'
+        
+        return _TAREA_COMPACTA.renderizar(
+            icono_estado=self.iconos_estado[tarea.estado],
+            icono_prioridad=self.iconos_prioridad[tarea.prioridad],
+            id=tarea.id,
+            titulo=titulo,
+            alerta=alerta,
+            usuario=tarea.usuario_asignado
+        )
     
     def guardar_html(self, contenido_html: str, nombre_archivo: str) -> str:
         """Guarda el HTML en un archivo"""
@@ -681,13 +809,30 @@ class TareaWebView:
         except Exception as e:
             return f"Error al guardar: {e}"
     
-    def generar_json_api(self, datos: Any) -> str:
-        """Genera respuesta JSON para API REST"""
+    def generar_json_api(self, datos: Any, indentar: Optional[int] = None) -> str:
+        """Genera respuesta JSON para API REST (compacta; `indentar` la formatea)"""
+        if indentar is None:
+            return self.renderizar_json_api(datos).decode("utf-8")
+        
+        return json.dumps(self._a_diccionarios(datos), indent=indentar, ensure_ascii=False, default=str)
+    
+    def renderizar_json_api(self, datos: Any) -> bytes:
+        """
+        Respuesta JSON compacta en bytes UTF-8
+        Tareas y listas de tareas van por el serializador rápido
+        """
+        if isinstance(datos, Tarea):
+            return self.serializador_json.serializar_tarea(datos)
+        if isinstance(datos, list) and all(isinstance(item, Tarea) for item in datos):
+            return self.serializador_json.serializar(datos)
+        
+        return json.dumps(self._a_diccionarios(datos), ensure_ascii=False, default=str,
+                          separators=(",", ":")).encode("utf-8")
+    
+    def _a_diccionarios(self, datos: Any) -> Any:
+        """Convierte tareas (sueltas o en lista) a diccionarios serializables"""
         if hasattr(datos, 'to_dict'):
-            datos_dict = datos.to_dict()
+            return datos.to_dict()
         elif isinstance(datos, list):
-            datos_dict = [item.to_dict() if hasattr(item, 'to_dict') else item for item in datos]
-        else:
-            datos_dict = datos
-        
-        return json.dumps(datos_dict, indent=2, ensure_ascii=False, default=str)
+            return [item.to_dict() if hasattr(item, 'to_dict') else item for item in datos]
+        return datos